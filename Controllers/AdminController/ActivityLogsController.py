@@ -1,10 +1,15 @@
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QMessageBox, QApplication, QTableWidgetItem, QHeaderView
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtCore import QDate
+from PySide6.QtWidgets import QMessageBox, QApplication, QAbstractItemView, QHeaderView
 
 from Controllers.BaseFileController import BaseFileController
 from Views.Admin.AdminActivityLogsView import AdminActivityLogsView
-from Models.AdminModels.ActivityLogsModel import ActivityLogsModel
+from Models.AdminModels.ActivityLogArchive import maintain as maintain_activity_log
+from Models.AdminModels.ActivityLogsModel import (ACTION_TYPES, ActivityLogFilters, ActivityLogListModel,
+                                                  fetch_activity_log_filter_options)
+from Utils.util_query_executor import QueryExecutor
+
+# The date filters show "Any" at this minimum, meaning no bound.
+NO_DATE = QDate(2000, 1, 1)
 
 
 class ActivityLogsController(BaseFileController):
@@ -16,7 +21,10 @@ class ActivityLogsController(BaseFileController):
         self.user_role = user_role
         self.stack = stack
 
-        self.model = ActivityLogsModel()
+        self.executor = QueryExecutor.instance()
+        self.log_model = ActivityLogListModel(self)
+        self.log_model.on_error = self.show_log_error
+        self.log_model.on_loaded = self.show_loaded_count
         self.view = AdminActivityLogsView(self)
         # Initialize the view
         self.activity_logs_screen = self.load_ui("Resources/UIs/AdminPages/ActivityLogs/activitylogs.ui")
@@ -24,37 +32,90 @@ class ActivityLogsController(BaseFileController):
         self.view.setup_activity_logs_ui(self.activity_logs_screen)
         self.activity_logs_screen.setWindowTitle("Activity Logs - MaPro")
 
-        self._refresh()
+        self.setup_log_table()
+        self.setup_filters()
+        self.refresh()
 
+        # Creates the coming months' partitions and archives expired ones.
+        self.executor.submit(
+            "activity_log_maintenance", maintain_activity_log,
+            on_error=lambda e: print(f"Activity log maintenance failed: {e}")
+        )
 
-    def populate_activity_logs_table(self):
-        try:
-            result = self.model.get_activity_logs()
-            if not result or not result['data']:
-                return
-            self.model.account_rows = result['data']
-            self._populate_table(
-                self.view.activity_logs_screen.table_logs_create,
-                result['columns'],
-                result['data']
-            )
-        except Exception as e:
-            self.show_error_message("System Account Data Error", "Could not load system user accounts.")
-            print(f"Error loading system user accounts: {e}")
-
-    def _refresh(self):
-        try:
-            self.populate_activity_logs_table()
-
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Manage Accounts Error",
-                "Error refreshing Manage Accounts",
-                QMessageBox.Ok
-            )
-            print(f"Error refreshing Manage Accounts: {e}")
+    def setup_log_table(self):
+        table = self.activity_logs_screen.table_logs_create
+        table.setModel(self.log_model)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+        table.setColumnWidth(0, 200)
+        table.setColumnWidth(1, 70)
+        table.setColumnWidth(2, 180)
+        table.setColumnWidth(3, 80)
+        table.setColumnWidth(4, 160)
+        table.horizontalHeader().setSectionResizeMode(5, QHeaderView.Stretch)
+
+    def setup_filters(self):
+        screen = self.activity_logs_screen
+        screen.filter_user.addItem("All Users", None)
+        screen.filter_action.addItem("All Actions", None)
+        for action in ACTION_TYPES:
+            screen.filter_action.addItem(action, action)
+        screen.filter_table.addItem("All Tables", None)
+
+        for date_edit in (screen.filter_date_min, screen.filter_date_max):
+            date_edit.setDisplayFormat("yyyy-MM-dd")
+            date_edit.setMinimumDate(NO_DATE)
+            date_edit.setSpecialValueText("Any")
+            date_edit.setDate(NO_DATE)
+
+        self.executor.submit(
+            "activity_log_filters", fetch_activity_log_filter_options,
+            on_result=self.populate_filter_options,
+            on_error=self.show_log_error
+        )
+
+    def populate_filter_options(self, options):
+        users, tables = options
+        screen = self.activity_logs_screen
+        for user_id, name in users:
+            screen.filter_user.addItem(f"{user_id} - {name}", user_id)
+        for table_name in tables:
+            screen.filter_table.addItem(table_name, table_name)
+
+    def current_filters(self):
+        screen = self.activity_logs_screen
+        from_date = screen.filter_date_min.date()
+        to_date = screen.filter_date_max.date()
+        return ActivityLogFilters(
+            user_id=screen.filter_user.currentData(),
+            action_type=screen.filter_action.currentData(),
+            table_name=screen.filter_table.currentData(),
+            from_date=None if from_date == NO_DATE else from_date.toPython(),
+            to_date=None if to_date == NO_DATE else to_date.toPython()
+        )
+
+    def apply_filters(self):
+        self.log_model.set_filters(self.current_filters())
+
+    def clear_filters(self):
+        screen = self.activity_logs_screen
+        for combo in (screen.filter_user, screen.filter_action, screen.filter_table):
+            combo.setCurrentIndex(0)
+        screen.filter_date_min.setDate(NO_DATE)
+        screen.filter_date_max.setDate(NO_DATE)
+        self.apply_filters()
+
+    def show_loaded_count(self, loaded, has_more):
+        more = " - scroll for more" if has_more else ""
+        self.activity_logs_screen.logs_labelLoaded.setText(f"Showing {loaded:,} entries{more}")
 
+    def show_log_error(self, error):
+        self.show_error_message("Activity Log Error", "Could not load the activity log.")
+        print(f"Error loading activity log: {error}")
+
+    def refresh(self):
+        """Reloads the log from the newest entry with the current filters."""
+        self.apply_filters()
 
     def show_error_message(self, title, message):
         QMessageBox.critical(
@@ -64,31 +125,9 @@ class ActivityLogsController(BaseFileController):
             QMessageBox.Ok
         )
 
-    def _populate_table(self, table, headers, data):
-        table.setRowCount(len(data))
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-
-        for row_idx, row_data in enumerate(data):
-            for col_idx, cell_data in enumerate(row_data):
-                item = QTableWidgetItem(str(cell_data))
-                item.setForeground(Qt.black)
-                if col_idx > 0:
-                    item.setTextAlignment(Qt.AlignCenter)
-                table.setItem(row_idx, col_idx, item)
-
-        table.resizeColumnsToContents()
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
     def goto_admin_panel(self):
         print("-- Navigating to Admin Panel")
-        if not hasattr(self, 'admin_panel'):
-            from Controllers.AdminController.AdminPanelController import AdminPanelController
-            self.admin_panel = AdminPanelController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.admin_panel.admin_panel_screen)
-        self.stack.setCurrentWidget(self.admin_panel.admin_panel_screen)
+        self.stack.navigation.goto("admin_panel")
 
     def goto_manage_accounts(self):
         print("-- Navigating to Manage Accounts")
@@ -118,63 +157,31 @@ class ActivityLogsController(BaseFileController):
     def goto_citizen_panel(self):
         """Handle navigation to Citizen Panel screen."""
         print("-- Navigating to Citizen Panel")
-        if not hasattr(self, 'citizen_panel'):
-            from Controllers.UserController.CitizenPanelController import CitizenPanelController
-            self.citizen_panel = CitizenPanelController(self.login_window, self.emp_first_name, self.sys_user_id,
-                                                        self.user_role, self.stack)
-            self.stack.addWidget(self.citizen_panel.citizen_panel_screen)
-        self.stack.setCurrentWidget(self.citizen_panel.citizen_panel_screen)
+        self.stack.navigation.goto("citizen_panel")
 
     def goto_statistics_panel(self):
         """Handle navigation to Statistics Panel screen."""
         print("-- Navigating to Statistics")
-        if not hasattr(self, 'statistics_panel'):
-            from Controllers.UserController.StatisticsController import StatisticsController
-            self.statistics_panel = StatisticsController(self.login_window, self.emp_first_name, self.sys_user_id,
-                                                         self.user_role, self.stack)
-            self.stack.addWidget(self.statistics_panel.statistics_screen)
-        self.stack.setCurrentWidget(self.statistics_panel.statistics_screen)
+        self.stack.navigation.goto("statistics_panel")
 
     def goto_institutions_panel(self):
         """Handle navigation to Institutions Panel screen."""
         print("-- Navigating to Institutions")
-        if not hasattr(self, 'institutions_panel'):
-            from Controllers.UserController.InstitutionController import InstitutionsController
-            self.institutions_panel = InstitutionsController(self.login_window, self.emp_first_name, self.sys_user_id,
-                                                             self.user_role, self.stack)
-            self.stack.addWidget(self.institutions_panel.institutions_screen)
-        self.stack.setCurrentWidget(self.institutions_panel.institutions_screen)
+        self.stack.navigation.goto("institutions_panel")
 
     def goto_transactions_panel(self):
         """Handle navigation to Transactions Panel screen."""
         print("-- Navigating to Transactions")
-        if not hasattr(self, 'transactions_panel'):
-            from Controllers.UserController.TransactionController import TransactionController
-            self.transactions_panel = TransactionController(self.login_window, self.emp_first_name, self.sys_user_id,
-                                                            self.user_role, self.stack)
-            self.stack.addWidget(self.transactions_panel.transactions_screen)
-        self.stack.setCurrentWidget(self.transactions_panel.transactions_screen)
+        self.stack.navigation.goto("transactions_panel")
 
     def goto_history_panel(self):
         """Handle navigation to History Records Panel screen."""
         print("-- Navigating to History Records")
-        if not hasattr(self, 'history_panel'):
-            from Controllers.UserController.HistoryRecordsController import HistoryRecordsController
-            self.history_panel = HistoryRecordsController(self.login_window, self.emp_first_name, self.sys_user_id,
-                                                          self.user_role, self.stack)
-            self.stack.addWidget(self.history_panel.history_screen)
-        self.stack.setCurrentWidget(self.history_panel.history_screen)
+        self.stack.navigation.goto("history_panel")
 
     def goto_trashbin_panel(self):
         print("-- Navigating to AdmiTrashhbin Panel")
-
-        if not hasattr(self, 'trashbin_panel'):
-            from Controllers.AdminController.AdminBinController import AdminBinController
-            self.trashbin_panel = AdminBinController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.trashbin_panel.trashbin_screen)
-        self.stack.setCurrentWidget(self.trashbin_panel.trashbin_screen)
+        self.stack.navigation.goto("trashbin_panel")
 
 
 
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import (QMessageBox, QPushButton, QLabel, QFileDialog,
                                QButtonGroup, QRadioButton, QTableWidgetItem)
 from Utils.util_popup import load_popup
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class BusinessBinController(BaseFileController):
@@ -15,17 +16,22 @@ class BusinessBinController(BaseFileController):
         self.stack = stack
         self.inst_businessbin_screen = self.load_ui("Resources/UIs/AdminPages/TrashBin/BinBusiness/bin_business.ui")
         self.setup_business_ui()
+        self.business_bin_search = DebouncedSearch(
+            self.inst_businessbin_screen.inst_BusinessName_fieldSearch,
+            self.fetch_business_bin_search, self.show_business_bin_search_results,
+            key="business_bin_search",
+            on_empty=self.load_business_data,
+            on_error=self.show_business_bin_search_error,
+            match_columns=[0, 1, 2]
+        )
         self.center_on_screen()
         self.load_business_data()
 
     def perform_business_search(self):
-        search_text = self.inst_businessbin_screen.inst_BusinessName_fieldSearch.text().strip()
-
-        if not search_text:
-            # If empty, reload all businesses
-            self.load_business_data()
-            return
+        self.business_bin_search.run()
 
+    @staticmethod
+    def fetch_business_bin_search(db, search_text):
         query = """
             SELECT 
                 BI.BS_ID,
@@ -46,33 +52,28 @@ class BusinessBinController(BaseFileController):
             ORDER BY BI.BS_ID ASC
             LIMIT 50;
         """
+        cursor = db.get_cursor()
+        search_pattern = f"%{search_text}%"
+        cursor.execute(query, (search_pattern, search_pattern, search_pattern))
+        return cursor.fetchall()
 
-        try:
-            db = Database()
-            cursor = db.get_cursor()
-            search_pattern = f"%{search_text}%"
-            cursor.execute(query, (search_pattern, search_pattern, search_pattern))
-            rows = cursor.fetchall()
-
-            table = self.inst_businessbin_screen.inst_tableView_List_RegBusiness
-            table.setRowCount(len(rows))
-            table.setColumnCount(4)
-            table.setHorizontalHeaderLabels(["ID", "Business Name", "Owner", "Date Registered"])
-            table.setColumnWidth(0, 50)
-            table.setColumnWidth(1, 200)
-            table.setColumnWidth(2, 200)
-            table.setColumnWidth(3, 200)
+    def show_business_bin_search_results(self, rows):
+        table = self.inst_businessbin_screen.inst_tableView_List_RegBusiness
+        table.setRowCount(len(rows))
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["ID", "Business Name", "Owner", "Date Registered"])
+        table.setColumnWidth(0, 50)
+        table.setColumnWidth(1, 200)
+        table.setColumnWidth(2, 200)
+        table.setColumnWidth(3, 200)
 
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate([row_data[0], row_data[1], row_data[2], row_data[3]]):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
+        for row_idx, row_data in enumerate(rows):
+            for col_idx, value in enumerate([row_data[0], row_data[1], row_data[2], row_data[3]]):
+                item = QTableWidgetItem(str(value))
+                table.setItem(row_idx, col_idx, item)
 
-        except Exception as e:
-            QMessageBox.critical(self.inst_businessbin_screen, "Database Error", str(e))
-        finally:
-            if db:
-                db.close()
+    def show_business_bin_search_error(self, error):
+        QMessageBox.critical(self.inst_businessbin_screen, "Database Error", str(error))
 
     def setup_business_ui(self):
         """Setup the Business Views layout."""
@@ -1,6 +1,5 @@
 from datetime import date
 
-import cv2
 from PySide6.QtCore import QDate
 from PySide6.QtWidgets import (QMessageBox, QPushButton, QLabel, QFileDialog,
                                QButtonGroup, QRadioButton, QTableWidgetItem)
@@ -10,6 +9,7 @@ from Controllers.BaseFileController import BaseFileController
 from Models.CitizenModel import CitizenModel
 from Views.CitizenPanel.CitizenView import CitizenView
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class CitizenBinController(BaseFileController):
@@ -27,6 +27,14 @@ class CitizenBinController(BaseFileController):
 
         self.cp_citizenbin_screen = self.load_ui("Resources/UIs/AdminPages/TrashBin/BinCitizens/bin_cp_citizenprofile.ui")
         self.setup_citizenbin_ui(self.cp_citizenbin_screen)
+        self.citizen_bin_search = DebouncedSearch(
+            self.cp_citizenbin_screen.cp_CitizenName_fieldSearch,
+            self.fetch_citizen_bin_search, self.show_citizen_bin_search_results,
+            key="citizen_bin_search",
+            on_empty=self.load_citizen_data,
+            on_error=self.show_citizen_bin_search_error,
+            match_columns=[0, 1, 2, 5]
+        )
         self.load_citizen_data()
 
 
@@ -318,13 +326,10 @@ class CitizenBinController(BaseFileController):
 
 
     def perform_citizen_search(self):
-        search_text = self.cp_citizenbin_screen.cp_CitizenName_fieldSearch.text().strip()
-
-        if not search_text:
-            # If search field is empty, reload all citizens
-            self.load_citizen_data()
-            return
+        self.citizen_bin_search.run()
 
+    @staticmethod
+    def fetch_citizen_bin_search(db, search_text):
         query = """
             SELECT DISTINCT ON (C.CTZ_ID)
                 C.CTZ_ID,
@@ -346,34 +351,29 @@ class CitizenBinController(BaseFileController):
             ORDER BY C.CTZ_ID, COALESCE(C.CTZ_LAST_UPDATED, C.CTZ_DATE_ENCODED) DESC
             LIMIT 50;
         """
+        cursor = db.get_cursor()
+        search_pattern = f"%{search_text}%"
+        cursor.execute(query, (search_pattern, search_pattern, search_pattern, search_pattern))
+        return cursor.fetchall()
 
-        try:
-            db = Database()
-            cursor = db.get_cursor()
-            search_pattern = f"%{search_text}%"
-            cursor.execute(query, (search_pattern, search_pattern, search_pattern, search_pattern))
-            rows = cursor.fetchall()
-
-            table = self.cp_citizenbin_screen.cp_tableView_List_RegCitizens
-            table.setRowCount(len(rows))
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(["ID", "Family Name", "First Name", "Sitio", "Last Updated"])
-            table.setColumnWidth(0, 50)
-            table.setColumnWidth(1, 150)
-            table.setColumnWidth(2, 150)
-            table.setColumnWidth(3, 150)
-            table.setColumnWidth(4, 200)
-
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate([row_data[0], row_data[1], row_data[2], row_data[5], row_data[6]]):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
-
-        except Exception as e:
-            QMessageBox.critical(self.cp_citizenbin_screen, "Database Error", str(e))
-        finally:
-            if db:
-                db.close()
+    def show_citizen_bin_search_results(self, rows):
+        table = self.cp_citizenbin_screen.cp_tableView_List_RegCitizens
+        table.setRowCount(len(rows))
+        table.setColumnCount(5)
+        table.setHorizontalHeaderLabels(["ID", "Family Name", "First Name", "Sitio", "Last Updated"])
+        table.setColumnWidth(0, 50)
+        table.setColumnWidth(1, 150)
+        table.setColumnWidth(2, 150)
+        table.setColumnWidth(3, 150)
+        table.setColumnWidth(4, 200)
+
+        for row_idx, row_data in enumerate(rows):
+            for col_idx, value in enumerate([row_data[0], row_data[1], row_data[2], row_data[5], row_data[6]]):
+                item = QTableWidgetItem(str(value))
+                table.setItem(row_idx, col_idx, item)
+
+    def show_citizen_bin_search_error(self, error):
+        QMessageBox.critical(self.cp_citizenbin_screen, "Database Error", str(error))
 
 
     def clear_display_fields(self):
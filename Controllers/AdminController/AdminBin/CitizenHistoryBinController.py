@@ -6,6 +6,7 @@ from Models.HistoryModel import HistoryModel
 from Utils.util_popup import load_popup
 from Views.HistoryRecords.CitizenHistoryView import CitizenHistoryView
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class CitizenHistoryBinController(BaseFileController):
@@ -20,6 +21,13 @@ class CitizenHistoryBinController(BaseFileController):
 
         self.hist_citizen_history_bin_screen = self.load_ui("Resources/UIs/AdminPages/TrashBin/BinHistory/bin_citizen_history.ui")
         self.setup_citizen_history_ui(self.hist_citizen_history_bin_screen)
+        self.citizen_history_bin_search = DebouncedSearch(
+            self.hist_citizen_history_bin_screen.histrec_HistoryID_fieldSearch,
+            self.fetch_citizen_history_bin_search, self._populate_citizen_history_table,
+            key="citizen_history_bin_search",
+            on_empty=self.load_citizen_history_data,
+            on_error=self.show_citizen_history_bin_search_error
+        )
 
         # self.view.setup_history_ui(self.hist_citizen_history_bin_screen)
         self.center_on_screen()
@@ -185,59 +193,50 @@ LIMIT 50;
                 connection.close()
 
     def search_citizen_history_data(self):
-        search_term = self.hist_citizen_history_bin_screen.histrec_HistoryID_fieldSearch.text().strip()
-
-        if not search_term:
-            self.load_citizen_history_data()
-            return
+        self.citizen_history_bin_search.run()
 
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
-            query = """
-                SELECT 
-                    H.CIHI_ID,
-                    C.CTZ_FIRST_NAME,
-                    C.CTZ_LAST_NAME,
-                    H.CIHI_DESCRIPTION,
-                    TO_CHAR(H.CIHI_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_RECORDED,
-                    C.CTZ_ID,
-                    TO_CHAR(H.CIHI_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED,
-                    TO_CHAR(H.CIHI_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED,
-                    CASE 
-                        WHEN SA.SYS_FNAME IS NULL THEN 'System'
-                        ELSE SA.SYS_FNAME || ' ' || 
-                             COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || 
-                             SA.SYS_LNAME
-                    END AS ENCODED_BY,
-                    CASE 
-                        WHEN SUA.SYS_FNAME IS NULL THEN 'System'
-                        ELSE SUA.SYS_FNAME || ' ' || 
-                             COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || 
-                             SUA.SYS_LNAME
-                    END AS UPDATED_BY
-                FROM CITIZEN_HISTORY H
-                JOIN CITIZEN C ON H.CTZ_ID = C.CTZ_ID
-                LEFT JOIN SYSTEM_ACCOUNT SA ON H.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
-                LEFT JOIN SYSTEM_ACCOUNT SUA ON H.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
-                WHERE H.CIHI_IS_DELETED = TRUE AND CAST(H.CIHI_ID AS TEXT) ILIKE %s OR
-                      C.CTZ_FIRST_NAME ILIKE %s OR
-                      C.CTZ_LAST_NAME ILIKE %s OR
-                      H.CIHI_DESCRIPTION ILIKE %s
-                ORDER BY H.CIHI_DATE_ENCODED DESC
-                LIMIT 50;
-            """
-            search_param = f"%{search_term}%"
-            cursor.execute(query, (search_param, search_param, search_param, search_param))
-            rows = cursor.fetchall()
-            self._populate_citizen_history_table(rows)
-
-        except Exception as e:
-            QMessageBox.critical(self.hist_citizen_history_bin_screen, "Database Error", str(e))
-        finally:
-            if connection:
-                connection.close()
+    @staticmethod
+    def fetch_citizen_history_bin_search(db, search_text):
+        query = """
+            SELECT 
+                H.CIHI_ID,
+                C.CTZ_FIRST_NAME,
+                C.CTZ_LAST_NAME,
+                H.CIHI_DESCRIPTION,
+                TO_CHAR(H.CIHI_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_RECORDED,
+                C.CTZ_ID,
+                TO_CHAR(H.CIHI_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED,
+                TO_CHAR(H.CIHI_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED,
+                CASE 
+                    WHEN SA.SYS_FNAME IS NULL THEN 'System'
+                    ELSE SA.SYS_FNAME || ' ' || 
+                         COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || 
+                         SA.SYS_LNAME
+                END AS ENCODED_BY,
+                CASE 
+                    WHEN SUA.SYS_FNAME IS NULL THEN 'System'
+                    ELSE SUA.SYS_FNAME || ' ' || 
+                         COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || 
+                         SUA.SYS_LNAME
+                END AS UPDATED_BY
+            FROM CITIZEN_HISTORY H
+            JOIN CITIZEN C ON H.CTZ_ID = C.CTZ_ID
+            LEFT JOIN SYSTEM_ACCOUNT SA ON H.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
+            LEFT JOIN SYSTEM_ACCOUNT SUA ON H.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
+            WHERE H.CIHI_IS_DELETED = TRUE AND CAST(H.CIHI_ID AS TEXT) ILIKE %s OR
+                  C.CTZ_FIRST_NAME ILIKE %s OR
+                  C.CTZ_LAST_NAME ILIKE %s OR
+                  H.CIHI_DESCRIPTION ILIKE %s
+            ORDER BY H.CIHI_DATE_ENCODED DESC
+            LIMIT 50;
+        """
+        cursor = db.get_cursor()
+        search_param = f"%{search_text}%"
+        cursor.execute(query, (search_param, search_param, search_param, search_param))
+        return cursor.fetchall()
+
+    def show_citizen_history_bin_search_error(self, error):
+        QMessageBox.critical(self.hist_citizen_history_bin_screen, "Database Error", str(error))
 
 
 
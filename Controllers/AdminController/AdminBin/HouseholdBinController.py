@@ -1,6 +1,5 @@
 from datetime import date
 
-import cv2
 from PySide6.QtCore import QDate
 from PySide6.QtWidgets import (QMessageBox, QPushButton, QLabel, QFileDialog,
                                QButtonGroup, QRadioButton, QTableWidgetItem)
@@ -10,6 +9,7 @@ from Controllers.BaseFileController import BaseFileController
 from Models.CitizenModel import CitizenModel
 from Views.CitizenPanel.CitizenView import CitizenView
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class HouseholdBinController(BaseFileController):
@@ -23,6 +23,14 @@ class HouseholdBinController(BaseFileController):
         # Load UI
         self.cp_householdbin_screen = self.load_ui("Resources/UIs/AdminPages/TrashBin/BinHousehold/bin_cp_household.ui")
         self.setup_household_ui(self.cp_householdbin_screen)
+        self.household_bin_search = DebouncedSearch(
+            self.cp_householdbin_screen.cp_HouseholdName_fieldSearch,
+            self.fetch_household_bin_search, self.show_household_bin_search_results,
+            key="household_bin_search",
+            on_empty=self.load_household_data,
+            on_error=self.show_household_bin_search_error,
+            match_columns=[0]
+        )
         self.center_on_screen()
         self.load_household_data()
 
@@ -50,13 +58,10 @@ class HouseholdBinController(BaseFileController):
         ui_screen.cp_HouseholdName_buttonSearch.clicked.connect(self.perform_household_search)
 
     def perform_household_search(self):
-        search_text = self.cp_householdbin_screen.cp_HouseholdName_fieldSearch.text().strip()
-
-        if not search_text:
-            # If empty, reload all households
-            self.load_household_data()
-            return
+        self.household_bin_search.run()
 
+    @staticmethod
+    def fetch_household_bin_search(db, search_text):
         query = """
             SELECT 
                 HH.HH_ID,
@@ -110,33 +115,28 @@ class HouseholdBinController(BaseFileController):
             ORDER BY HH.HH_ID ASC
             LIMIT 50;
         """
+        cursor = db.get_cursor()
+        search_pattern = f"%{search_text}%"
+        cursor.execute(query, (search_pattern,))
+        return cursor.fetchall()
 
-        try:
-            db = Database()
-            cursor = db.get_cursor()
-            search_pattern = f"%{search_text}%"
-            cursor.execute(query, (search_pattern,))
-            rows = cursor.fetchall()
-
-            table = self.cp_householdbin_screen.inst_tableView_List_RegHousehold
-            table.setRowCount(len(rows))
-            table.setColumnCount(4)
-            table.setHorizontalHeaderLabels(["ID", "Total Members", "Sitio", "Date Encoded"])
-            table.setColumnWidth(0, 50)
-            table.setColumnWidth(1, 150)
-            table.setColumnWidth(2, 200)
-            table.setColumnWidth(3, 200)
-
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate([row_data[0], row_data[14], row_data[2], row_data[9]]):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
-
-        except Exception as e:
-            QMessageBox.critical(self.cp_householdbin_screen, "Database Error", str(e))
-        finally:
-            if db:
-                db.close()
+    def show_household_bin_search_results(self, rows):
+        table = self.cp_householdbin_screen.inst_tableView_List_RegHousehold
+        table.setRowCount(len(rows))
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["ID", "Total Members", "Sitio", "Date Encoded"])
+        table.setColumnWidth(0, 50)
+        table.setColumnWidth(1, 150)
+        table.setColumnWidth(2, 200)
+        table.setColumnWidth(3, 200)
+
+        for row_idx, row_data in enumerate(rows):
+            for col_idx, value in enumerate([row_data[0], row_data[14], row_data[2], row_data[9]]):
+                item = QTableWidgetItem(str(value))
+                table.setItem(row_idx, col_idx, item)
+
+    def show_household_bin_search_error(self, error):
+        QMessageBox.critical(self.cp_householdbin_screen, "Database Error", str(error))
 
     def restore_selected_household(self):
         if not self.selected_household_id:
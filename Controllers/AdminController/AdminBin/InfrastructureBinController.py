@@ -3,6 +3,7 @@ from PySide6.QtWidgets import QMessageBox, QPushButton, QButtonGroup, QRadioButt
 from Controllers.BaseFileController import BaseFileController
 from Utils.util_popup import load_popup
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class InfrastructureBinController(BaseFileController):
@@ -14,6 +15,14 @@ class InfrastructureBinController(BaseFileController):
         self.stack = stack
         self.inst_infrastructurebin_screen = self.load_ui("Resources/UIs/AdminPages/TrashBin/BinInfrastructure/bin_infrastructure.ui")
         self.setup_infrastructure_ui()
+        self.infrastructure_bin_search = DebouncedSearch(
+            self.inst_infrastructurebin_screen.inst_InfraName_fieldSearch,
+            self.fetch_infrastructure_bin_search, self.show_infrastructure_bin_search_results,
+            key="infrastructure_bin_search",
+            on_empty=self.load_data_infrastructure,
+            on_error=self.show_infrastructure_bin_search_error,
+            match_columns=[0, 1, 2]
+        )
         self.center_on_screen()
         self.load_data_infrastructure()
         self.inst_infrastructurebin_screen.inst_tableView_List_RegInfra.cellClicked.connect(self.handle_row_click_infrastructure)
@@ -45,10 +54,10 @@ class InfrastructureBinController(BaseFileController):
 
 
     def perform_infrastructure_search(self):
-        search_text = self.inst_infrastructurebin_screen.inst_InfraName_fieldSearch.text().strip()
-        if not search_text:
-            self.load_data_infrastructure()
-            return
+        self.infrastructure_bin_search.run()
+
+    @staticmethod
+    def fetch_infrastructure_bin_search(db, search_text):
         query = """
             SELECT 
                 INF.INF_ID,
@@ -66,29 +75,27 @@ class InfrastructureBinController(BaseFileController):
             ORDER BY INF.INF_DATE_ENCODED DESC
             LIMIT 50;
         """
-        try:
-            connection = Database()
-            cursor = connection.cursor
-            search_pattern = f"%{search_text}%"
-            cursor.execute(query, (search_pattern, search_pattern, search_pattern))
-            rows = cursor.fetchall()
-            table = self.inst_infrastructurebin_screen.inst_tableView_List_RegInfra
-            table.setRowCount(len(rows))
-            table.setColumnCount(4)
-            table.setHorizontalHeaderLabels(["ID", "Name", "Owner", "Date Registered"])
-            table.setColumnWidth(0, 50)
-            table.setColumnWidth(1, 200)
-            table.setColumnWidth(2, 200)
-            table.setColumnWidth(3, 200)
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate(row_data):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
-        except Exception as e:
-            QMessageBox.critical(self.inst_infrastructurebin_screen, "Database Error", str(e))
-        finally:
-            if connection:
-                connection.close()
+        cursor = db.get_cursor()
+        search_pattern = f"%{search_text}%"
+        cursor.execute(query, (search_pattern, search_pattern, search_pattern))
+        return cursor.fetchall()
+
+    def show_infrastructure_bin_search_results(self, rows):
+        table = self.inst_infrastructurebin_screen.inst_tableView_List_RegInfra
+        table.setRowCount(len(rows))
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["ID", "Name", "Owner", "Date Registered"])
+        table.setColumnWidth(0, 50)
+        table.setColumnWidth(1, 200)
+        table.setColumnWidth(2, 200)
+        table.setColumnWidth(3, 200)
+        for row_idx, row_data in enumerate(rows):
+            for col_idx, value in enumerate(row_data):
+                item = QTableWidgetItem(str(value))
+                table.setItem(row_idx, col_idx, item)
+
+    def show_infrastructure_bin_search_error(self, error):
+        QMessageBox.critical(self.inst_infrastructurebin_screen, "Database Error", str(error))
 
     def load_data_infrastructure(self):
         try:
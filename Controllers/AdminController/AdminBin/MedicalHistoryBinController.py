@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QMessageBox, QPushButton, QTableWidgetItem, QLabel
 from Controllers.BaseFileController import BaseFileController
 from Utils.util_popup import load_popup
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class MedicalHistoryBinController(BaseFileController):
@@ -15,6 +16,13 @@ class MedicalHistoryBinController(BaseFileController):
         self.stack = stack
         self.hist_medical_history_bin_screen = self.load_ui("Resources/UIs/AdminPages/TrashBin/BinHistory/bin_medical_history.ui")
         self.setup_medical_history_ui()
+        self.medical_history_bin_search = DebouncedSearch(
+            self.hist_medical_history_bin_screen.histrec_HistoryID_fieldSearch,
+            self.fetch_medical_history_bin_search, self._populate_medical_history_table,
+            key="medical_history_bin_search",
+            on_empty=self.load_medical_history_data,
+            on_error=self.show_medical_history_bin_search_error
+        )
         self.center_on_screen()
         self.load_medical_history_data()
 
@@ -104,61 +112,52 @@ class MedicalHistoryBinController(BaseFileController):
                 widget.setText("N/A")
 
     def search_medical_history_data(self):
-        search_term = self.hist_medical_history_bin_screen.histrec_HistoryID_fieldSearch.text().strip()
-
-        if not search_term:
-            self.load_medical_history_data()
-            return
-
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
-            query = """
-                SELECT 
-                    MH.MH_ID,
-                    C.CTZ_FIRST_NAME,
-                    C.CTZ_LAST_NAME,
-                    MHT.MHT_TYPE_NAME AS MEDICAL_TYPE,
-                    MH.MH_DESCRIPTION,
-                    TO_CHAR(MH.MH_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_RECORDED,
-                    C.CTZ_ID,
-                    TO_CHAR(MH.MH_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED,
-                    TO_CHAR(MH.MH_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED,
-                    CASE 
-                        WHEN SA.SYS_FNAME IS NULL THEN 'System'
-                        ELSE SA.SYS_FNAME || ' ' || 
-                             COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || 
-                             SA.SYS_LNAME
-                    END AS ENCODED_BY,
-                    CASE 
-                        WHEN SUA.SYS_FNAME IS NULL THEN 'System'
-                        ELSE SUA.SYS_FNAME || ' ' || 
-                             COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || 
-                             SUA.SYS_LNAME
-                    END AS UPDATED_BY
-                FROM MEDICAL_HISTORY MH
-                JOIN CITIZEN C ON MH.CTZ_ID = C.CTZ_ID
-                JOIN MEDICAL_HISTORY_TYPE MHT ON MH.MHT_ID = MHT.MHT_ID
-                LEFT JOIN SYSTEM_ACCOUNT SA ON MH.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
-                LEFT JOIN SYSTEM_ACCOUNT SUA ON MH.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
-                WHERE MH.MH_IS_DELETED = TRUE AND CAST(MH.MH_ID AS TEXT) ILIKE %s OR
-                      C.CTZ_FIRST_NAME ILIKE %s OR
-                      C.CTZ_LAST_NAME ILIKE %s OR
-                      MHT.MHT_TYPE_NAME ILIKE %s
-                ORDER BY MH.MH_DATE_ENCODED DESC
-                LIMIT 50;
-            """
-            search_param = f"%{search_term}%"
-            cursor.execute(query, (search_param, search_param, search_param, search_param))
-            rows = cursor.fetchall()
-            self._populate_medical_history_table(rows)
-
-        except Exception as e:
-            QMessageBox.critical(self.hist_medical_history_bin_screen, "Database Error", str(e))
-        finally:
-            if connection:
-                connection.close()
+        self.medical_history_bin_search.run()
+
+    @staticmethod
+    def fetch_medical_history_bin_search(db, search_text):
+        query = """
+            SELECT 
+                MH.MH_ID,
+                C.CTZ_FIRST_NAME,
+                C.CTZ_LAST_NAME,
+                MHT.MHT_TYPE_NAME AS MEDICAL_TYPE,
+                MH.MH_DESCRIPTION,
+                TO_CHAR(MH.MH_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_RECORDED,
+                C.CTZ_ID,
+                TO_CHAR(MH.MH_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED,
+                TO_CHAR(MH.MH_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED,
+                CASE 
+                    WHEN SA.SYS_FNAME IS NULL THEN 'System'
+                    ELSE SA.SYS_FNAME || ' ' || 
+                         COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || 
+                         SA.SYS_LNAME
+                END AS ENCODED_BY,
+                CASE 
+                    WHEN SUA.SYS_FNAME IS NULL THEN 'System'
+                    ELSE SUA.SYS_FNAME || ' ' || 
+                         COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || 
+                         SUA.SYS_LNAME
+                END AS UPDATED_BY
+            FROM MEDICAL_HISTORY MH
+            JOIN CITIZEN C ON MH.CTZ_ID = C.CTZ_ID
+            JOIN MEDICAL_HISTORY_TYPE MHT ON MH.MHT_ID = MHT.MHT_ID
+            LEFT JOIN SYSTEM_ACCOUNT SA ON MH.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
+            LEFT JOIN SYSTEM_ACCOUNT SUA ON MH.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
+            WHERE MH.MH_IS_DELETED = TRUE AND CAST(MH.MH_ID AS TEXT) ILIKE %s OR
+                  C.CTZ_FIRST_NAME ILIKE %s OR
+                  C.CTZ_LAST_NAME ILIKE %s OR
+                  MHT.MHT_TYPE_NAME ILIKE %s
+            ORDER BY MH.MH_DATE_ENCODED DESC
+            LIMIT 50;
+        """
+        cursor = db.get_cursor()
+        search_param = f"%{search_text}%"
+        cursor.execute(query, (search_param, search_param, search_param, search_param))
+        return cursor.fetchall()
+
+    def show_medical_history_bin_search_error(self, error):
+        QMessageBox.critical(self.hist_medical_history_bin_screen, "Database Error", str(error))
     def load_medical_history_data(self):
         connection = None
         try:
@@ -5,6 +5,7 @@ from PySide6.QtWidgets import QMessageBox, QPushButton, QTableWidgetItem, QLabel
 
 from Controllers.BaseFileController import BaseFileController
 from Utils.util_popup import load_popup
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class ServicesBinController(BaseFileController):
@@ -16,6 +17,14 @@ class ServicesBinController(BaseFileController):
         self.stack = stack
         self.trans_servicesbin_screen = self.load_ui("Resources/UIs/AdminPages/TrashBin/BinServices/bin_services.ui")
         self.setup_services_ui()
+        self.transaction_bin_search = DebouncedSearch(
+            self.trans_servicesbin_screen.trans_TransactionID_fieldSearch,
+            self.fetch_transaction_bin_search, self._populate_table,
+            key="transaction_bin_search",
+            on_empty=self.load_transaction_data,
+            on_error=self.show_transaction_bin_search_error,
+            match_columns=[0, 1, 2]
+        )
         self.center_on_screen()
         self.load_transaction_data()
 
@@ -104,56 +113,48 @@ class ServicesBinController(BaseFileController):
 
     def search_transaction_data(self):
         """Filter transaction data based on ID or Name."""
-        search_term = self.trans_servicesbin_screen.trans_TransactionID_fieldSearch.text().strip()
-        if not search_term:
-            self.load_transaction_data()
-            return
-
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
-            query = """
-                SELECT 
-                    TL.tl_id,
-                    TL.tl_fname,
-                    TL.tl_lname,
-                    TO_CHAR(TL.tl_date_requested, 'FMMonth FMDD, YYYY') AS tl_date_requested_formatted,
-                    TL.tl_status,
-                    TT.tt_type_name,
-                    TL.tl_purpose,
-                    TO_CHAR(TL.tl_date_encoded, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS tl_date_encoded_formatted,
-                    SA.SYS_FNAME || ' ' || COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || SA.SYS_LNAME AS ENCODED_BY,
-                    TO_CHAR(TL.tl_last_updated, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS tl_last_updated_formatted,
-                    CASE 
-                        WHEN SUA.SYS_FNAME IS NULL THEN 'System'
-                        ELSE SUA.SYS_FNAME || ' ' ||
-                             COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') ||
-                             SUA.SYS_LNAME
-                    END AS LAST_UPDATED_BY_NAME
-                FROM TRANSACTION_LOG TL
-                LEFT JOIN TRANSACTION_TYPE TT ON TL.tt_id = TT.tt_id
-                LEFT JOIN SYSTEM_ACCOUNT SA ON TL.ENCODED_BY_sys_id = SA.SYS_USER_ID
-                LEFT JOIN SYSTEM_ACCOUNT SUA ON TL.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
-                WHERE TL.tl_is_deleted = TRUE
-                  AND (
-                    CAST(TL.tl_id AS TEXT) ILIKE %s OR
-                    TL.tl_fname ILIKE %s OR
-                    TL.tl_lname ILIKE %s
-                  )
-                ORDER BY TL.tl_id ASC
-                LIMIT 50;
-            """
-            search_param = f"%{search_term}%"
-            cursor.execute(query, (search_param, search_param, search_param))
-            rows = cursor.fetchall()
-            self._populate_table(rows)
-
-        except Exception as e:
-            QMessageBox.critical(self.trans_servicesbin_screen, "Database Error", str(e))
-        finally:
-            if connection:
-                connection.close()
+        self.transaction_bin_search.run()
+
+    @staticmethod
+    def fetch_transaction_bin_search(db, search_text):
+        query = """
+            SELECT 
+                TL.tl_id,
+                TL.tl_fname,
+                TL.tl_lname,
+                TO_CHAR(TL.tl_date_requested, 'FMMonth FMDD, YYYY') AS tl_date_requested_formatted,
+                TL.tl_status,
+                TT.tt_type_name,
+                TL.tl_purpose,
+                TO_CHAR(TL.tl_date_encoded, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS tl_date_encoded_formatted,
+                SA.SYS_FNAME || ' ' || COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || SA.SYS_LNAME AS ENCODED_BY,
+                TO_CHAR(TL.tl_last_updated, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS tl_last_updated_formatted,
+                CASE 
+                    WHEN SUA.SYS_FNAME IS NULL THEN 'System'
+                    ELSE SUA.SYS_FNAME || ' ' ||
+                         COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') ||
+                         SUA.SYS_LNAME
+                END AS LAST_UPDATED_BY_NAME
+            FROM TRANSACTION_LOG TL
+            LEFT JOIN TRANSACTION_TYPE TT ON TL.tt_id = TT.tt_id
+            LEFT JOIN SYSTEM_ACCOUNT SA ON TL.ENCODED_BY_sys_id = SA.SYS_USER_ID
+            LEFT JOIN SYSTEM_ACCOUNT SUA ON TL.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
+            WHERE TL.tl_is_deleted = TRUE
+              AND (
+                CAST(TL.tl_id AS TEXT) ILIKE %s OR
+                TL.tl_fname ILIKE %s OR
+                TL.tl_lname ILIKE %s
+              )
+            ORDER BY TL.tl_id ASC
+            LIMIT 50;
+        """
+        cursor = db.get_cursor()
+        search_param = f"%{search_text}%"
+        cursor.execute(query, (search_param, search_param, search_param))
+        return cursor.fetchall()
+
+    def show_transaction_bin_search_error(self, error):
+        QMessageBox.critical(self.trans_servicesbin_screen, "Database Error", str(error))
 
 
 
@@ -0,0 +1,116 @@
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QApplication, QHeaderView, QTableWidgetItem
+
+from Utils.util_popup import load_popup
+from Utils.util_query_stats import STATEMENT_PREVIEW_LENGTH, QueryStats
+from database import get_pool_stats
+
+REFRESH_INTERVAL_MS = 5000
+TOP_OFFENDERS = 25
+
+OFFENDER_COLUMNS = ["Caller", "Statement", "Calls", "Total ms", "p50 ms", "p95 ms", "Max ms", "Avg rows", "Slow"]
+
+
+class QueryDiagnosticsController:
+    """Admin-only popup over QueryStats: the slowest callers and the latency histogram.
+
+    Refreshes every REFRESH_INTERVAL_MS while it is open. Only reads the
+    in-memory window, so it adds no database load of its own.
+    """
+
+    def __init__(self, parent):
+        self.stats = QueryStats.instance()
+        self.popup = load_popup("Resources/UIs/AdminPages/AdminPanel/QueryDiagnostics/query_diagnostics.ui", parent)
+        self.popup.setWindowTitle("Query Diagnostics - MaPro")
+        self.popup.setWindowModality(Qt.ApplicationModal)
+        self.popup.setFixedSize(self.popup.size())
+        self.offenders = []
+
+        table = self.popup.diag_tableWidget_Offenders
+        table.setColumnCount(len(OFFENDER_COLUMNS))
+        table.setHorizontalHeaderLabels(OFFENDER_COLUMNS)
+        table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        table.setColumnWidth(0, 200)
+        table.cellDoubleClicked.connect(self.copy_statement)
+
+        histogram = self.popup.diag_tableWidget_Histogram
+        histogram.setColumnCount(2)
+        histogram.setHorizontalHeaderLabels(["Latency", "Statements"])
+        histogram.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        histogram.verticalHeader().setVisible(False)
+
+        self.timer = QTimer(self.popup)
+        self.timer.setInterval(REFRESH_INTERVAL_MS)
+        self.timer.timeout.connect(self.refresh)
+        self.popup.finished.connect(self.timer.stop)
+
+        self.popup.diag_buttonRefresh.clicked.connect(self.refresh)
+        self.popup.diag_buttonReset.clicked.connect(self.reset)
+        self.popup.diag_buttonClose.clicked.connect(self.popup.close)
+
+    def show(self):
+        self.refresh()
+        self.timer.start()
+        self.popup.show()
+
+    def refresh(self):
+        samples = self.stats.samples()
+        self.offenders = self.stats.top_offenders(TOP_OFFENDERS, samples)
+        self.populate_summary(samples)
+        self.populate_offenders()
+        self.populate_histogram(samples)
+
+    def reset(self):
+        self.stats.reset()
+        self.refresh()
+
+    def populate_summary(self, samples):
+        count, total_ms, p95_ms, slow = self.stats.summary(samples)
+        pool = get_pool_stats()
+        pool_text = f" | pool: {pool['in_use']} in use, {pool['idle']} idle" if "in_use" in pool else ""
+        self.popup.diag_labelSummary.setText(
+            f"Last {self.stats.window_seconds // 60} min: {count} statements, {total_ms:,.0f} ms total, "
+            f"p95 {p95_ms:.1f} ms, {slow} at or above {self.stats.slow_query_ms} ms "
+            f"(logged to {self.stats.slow_log_path}){pool_text}"
+        )
+
+    def populate_offenders(self):
+        table = self.popup.diag_tableWidget_Offenders
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(self.offenders))
+            for row, offender in enumerate(self.offenders):
+                statement = offender["statement"]
+                if len(statement) > STATEMENT_PREVIEW_LENGTH:
+                    statement = statement[:STATEMENT_PREVIEW_LENGTH] + "..."
+                avg_rows = "" if offender["avg_rows"] is None else f"{offender['avg_rows']:.0f}"
+                values = [
+                    offender["caller"], statement, str(offender["calls"]),
+                    f"{offender['total_ms']:.1f}", f"{offender['p50_ms']:.1f}", f"{offender['p95_ms']:.1f}",
+                    f"{offender['max_ms']:.1f}", avg_rows, str(offender["slow"])
+                ]
+                for column, value in enumerate(values):
+                    item = QTableWidgetItem(value)
+                    if column > 1:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    if column == 1:
+                        item.setToolTip(offender["statement"])
+                    if offender["slow"]:
+                        item.setForeground(Qt.red)
+                    table.setItem(row, column, item)
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def populate_histogram(self, samples):
+        table = self.popup.diag_tableWidget_Histogram
+        buckets = self.stats.histogram(samples)
+        table.setRowCount(len(buckets))
+        for row, (label, count) in enumerate(buckets):
+            table.setItem(row, 0, QTableWidgetItem(label))
+            item = QTableWidgetItem(str(count))
+            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            table.setItem(row, 1, item)
+
+    def copy_statement(self, row, _column):
+        if row < len(self.offenders):
+            QApplication.clipboard().setText(self.offenders[row]["statement"])
@@ -1,6 +1,7 @@
+import os
+
 from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile
+from Utils.util_ui_loader import load_ui_file
 
 class BaseFileController(QMainWindow):
     def __init__(self, login_window, emp_first_name, sys_user_id):
@@ -10,7 +11,6 @@ class BaseFileController(QMainWindow):
         self.sys_user_id = sys_user_id
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
-        self.loader = QUiLoader()
 
     def center_on_screen(self):
         """Center the window on the primary screen"""
@@ -22,17 +22,15 @@ class BaseFileController(QMainWindow):
         )
 
     def load_ui(self, ui_path):
-        """Load a UI file from the given path"""
-        file = QFile(ui_path)
-        if not file.exists():
+        """Load a UI file from the given path (its compiled module when built)"""
+        if not os.path.exists(ui_path):
             print(f"Error: UI file not found: {ui_path}")
             return None
-        if not file.open(QFile.ReadOnly):
-            print(f"Error: Cannot open {ui_path}: {file.errorString()}")
+        try:
+            return load_ui_file(ui_path, None)
+        except IOError as e:
+            print(f"Error: {e}")
             return None
-        ui = self.loader.load(file, None)
-        file.close()
-        return ui
 
     def show(self):
         """Override show method to center the window"""
@@ -1,18 +1,14 @@
 from PySide6.QtWidgets import QMainWindow, QMessageBox
 from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile
-from Controllers.UserController.DashboardController import DashboardController
 from Controllers.BaseFileController import BaseFileController
 from database import Database
+from Utils.util_ui_loader import load_ui_file
 from Utils.utils_corner import applyRoundedCorners
-from passlib.hash import bcrypt
 
 
 class LoginWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.loader = QUiLoader()
         self.login_screen = self.load_ui("Resources/UIs/AuthPages/login.ui")
         self.setCentralWidget(self.login_screen)
 
@@ -32,12 +28,7 @@ class LoginWindow(QMainWindow):
         self.clear_fields()
 
     def load_ui(self, ui_path):
-        file = QFile(ui_path)
-        if not file.open(QFile.ReadOnly):
-            raise IOError(f"Cannot open {ui_path}: {file.errorString()}")
-        ui = self.loader.load(file, None)
-        file.close()
-        return ui
+        return load_ui_file(ui_path, None)
 
     def setup_images(self):
         self.login_screen.login_imageLogo.setPixmap(QPixmap("Resources/Images/General_Images/logo_brgyClear.png"))
@@ -91,6 +82,8 @@ class LoginWindow(QMainWindow):
 
 
     def authenticate_user(self, user_id, user_pin):
+        from passlib.hash import bcrypt  # deferred so it is not on the startup path
+
         print(f"-- Login Attempt\nSystem User ID: {user_id}\nSystem User PIN: {user_pin}")
         connection = None
 
@@ -126,6 +119,8 @@ class LoginWindow(QMainWindow):
                 connection.close()
 
     def grant_access(self, first_name, user_role=None):
+        from Controllers.UserController.DashboardController import DashboardController
+
         self.setWindowIcon(QIcon("Resources/Icons/AppIcons/appicon_active_u.ico"))
         user_id = int(self.login_screen.login_fieldEmp_id.text())
         self.dashboard = DashboardController(self, first_name, user_id, user_role)
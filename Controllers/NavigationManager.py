@@ -0,0 +1,188 @@
+import importlib
+import time
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+# Top-level panels reachable from every screen's navigation bar:
+# name -> (module, controller class, attribute holding its screen widget).
+PANELS = {
+    "citizen_panel": ("Controllers.UserController.CitizenPanelController", "CitizenPanelController",
+                      "citizen_panel_screen"),
+    "statistics_panel": ("Controllers.UserController.StatisticsController", "StatisticsController",
+                         "statistics_screen"),
+    "institutions_panel": ("Controllers.UserController.InstitutionController", "InstitutionsController",
+                           "institutions_screen"),
+    "transactions_panel": ("Controllers.UserController.TransactionController", "TransactionController",
+                           "transactions_screen"),
+    "history_panel": ("Controllers.UserController.HistoryRecordsController", "HistoryRecordsController",
+                      "history_screen"),
+    "admin_panel": ("Controllers.AdminController.AdminPanelController", "AdminPanelController",
+                    "admin_panel_screen"),
+    "trashbin_panel": ("Controllers.AdminController.AdminBinController", "AdminBinController",
+                       "trashbin_screen"),
+    "activity_logs": ("Controllers.AdminController.ActivityLogsController", "ActivityLogsController",
+                      "activity_logs_screen"),
+}
+
+ADMIN_PANELS = {"admin_panel", "trashbin_panel", "activity_logs"}
+
+# The panels most sessions open first; built ahead while the user is idle.
+PREFETCH_PANELS = ("citizen_panel", "transactions_panel")
+PREFETCH_IDLE_MS = 700      # quiet time (no clicks or keys) before building the next one
+
+_INPUT_EVENTS = {QEvent.Type.MouseButtonPress, QEvent.Type.KeyPress, QEvent.Type.Wheel}
+
+
+class NavigationMetrics:
+    """Navigation timings in ms, kept for the session and printed as they happen.
+
+    Events per screen: "build" (controller construction), "first_paint" (from the
+    request to the screen's first paint) and, for the dashboard, "data" (from the
+    request until its figures arrived from the query executor).
+    """
+
+    def __init__(self):
+        self.records = []   # (screen, event, ms, prefetched)
+
+    def record(self, screen, event, elapsed_ms, prefetched=False):
+        self.records.append((screen, event, elapsed_ms, prefetched))
+        note = " (prefetched)" if prefetched else ""
+        print(f"[NAV] {screen} {event}: {elapsed_ms:.1f} ms{note}")
+
+    def summary(self):
+        """{screen: {event: [ms, ...]}} for everything recorded so far."""
+        summary = {}
+        for screen, event, elapsed_ms, _ in self.records:
+            summary.setdefault(screen, {}).setdefault(event, []).append(elapsed_ms)
+        return summary
+
+
+class _FirstPaintProbe(QObject):
+    """Calls back once, on the first paint event the widget receives."""
+
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self.callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and self.callback is not None:
+            callback, self.callback = self.callback, None
+            watched.removeEventFilter(self)
+            callback()
+            self.deleteLater()
+        return False
+
+
+class NavigationManager(QObject):
+    """Builds, caches and switches to the top-level panels of one window's stack.
+
+    Every controller on the stack reaches it as stack.navigation, so a panel is
+    built once per session whichever screen navigates to it first. Panels in
+    PREFETCH_PANELS are built ahead of time, one per idle period, after the
+    dashboard has painted. Qt widgets can only be created on the UI thread, so
+    "background" here means between user input rather than on a worker.
+    """
+
+    def __init__(self, dashboard, stack, login_window, emp_first_name, sys_user_id, user_role):
+        super().__init__(dashboard)
+        self.dashboard = dashboard
+        self.stack = stack
+        self.controller_args = (login_window, emp_first_name, sys_user_id, user_role, stack)
+        self.user_role = user_role
+        self.panels = {}
+        self.prefetched = set()
+        self.metrics = NavigationMetrics()
+
+        self._prefetch_queue = []
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self._prefetch_next)
+        self._watching_input = False
+
+        stack.navigation = self
+        stack.currentChanged.connect(self._on_current_changed)
+
+    # --- navigation ---
+
+    def panel(self, name):
+        """The controller for a panel, built (and added to the stack) on first use."""
+        if name not in self.panels:
+            module_name, class_name, screen_attr = PANELS[name]
+            started = time.perf_counter()
+            controller_class = getattr(importlib.import_module(module_name), class_name)
+            controller = controller_class(*self.controller_args)
+            self.stack.addWidget(getattr(controller, screen_attr))
+            self.panels[name] = controller
+            self.metrics.record(name, "build", (time.perf_counter() - started) * 1000)
+        return self.panels[name]
+
+    def screen(self, name):
+        return getattr(self.panel(name), PANELS[name][2])
+
+    def goto(self, name):
+        started = time.perf_counter()
+        # Only the first visit of a prefetched panel is reported as prefetched.
+        prefetched = name in self.prefetched
+        self.prefetched.discard(name)
+        if name in self._prefetch_queue:
+            self._prefetch_queue.remove(name)
+        screen = self.screen(name)
+        if self.stack.currentWidget() is not screen:
+            self.track_first_paint(name, screen, started, prefetched)
+        self.stack.setCurrentWidget(screen)
+        return self.panels[name]
+
+    def track_first_paint(self, name, widget, started, prefetched=False, on_painted=None):
+        """Records the time from `started` (perf_counter) to the widget's next paint."""
+        def painted():
+            self.metrics.record(name, "first_paint", (time.perf_counter() - started) * 1000, prefetched)
+            if on_painted:
+                on_painted()
+
+        _FirstPaintProbe(widget, painted)
+
+    def _on_current_changed(self, index):
+        # Back on the dashboard: refresh its figures without blocking the switch.
+        if self.stack.widget(index) is self.dashboard.dashboard_screen:
+            self.dashboard.refresh_dashboard_data()
+
+    # --- prefetch ---
+
+    def prefetch(self, names=PREFETCH_PANELS):
+        for name in names:
+            if name in ADMIN_PANELS and self.user_role not in ['Admin', 'Super Admin']:
+                continue
+            if name not in self.panels and name not in self._prefetch_queue:
+                self._prefetch_queue.append(name)
+        if self._prefetch_queue:
+            if not self._watching_input:
+                QApplication.instance().installEventFilter(self)
+                self._watching_input = True
+            self._prefetch_timer.start(PREFETCH_IDLE_MS)
+
+    def eventFilter(self, watched, event):
+        # Any input pushes the next build back, so it never lands mid-interaction.
+        if event.type() in _INPUT_EVENTS and self._prefetch_timer.isActive():
+            self._prefetch_timer.start(PREFETCH_IDLE_MS)
+        return False
+
+    def _prefetch_next(self):
+        while self._prefetch_queue:
+            name = self._prefetch_queue.pop(0)
+            if name in self.panels:
+                continue
+            try:
+                self.panel(name)
+                self.prefetched.add(name)
+            except Exception as e:
+                # The click will build it (and show the error) the normal way.
+                print(f"[NAV] Prefetch of {name} failed: {e}")
+            break
+
+        if self._prefetch_queue:
+            self._prefetch_timer.start(PREFETCH_IDLE_MS)
+        elif self._watching_input:
+            QApplication.instance().removeEventFilter(self)
+            self._watching_input = False
@@ -1,15 +1,25 @@
 from datetime import date
 
-import cv2
-from PySide6.QtCore import QDate
+from PySide6.QtCore import QDate, QTimer
+from psycopg2.extras import Json
 from PySide6.QtWidgets import (QMessageBox, QPushButton, QLabel, QFileDialog,
-                               QButtonGroup, QRadioButton, QTableWidgetItem)
+                               QButtonGroup, QRadioButton, QTableWidgetItem, QAbstractItemView)
 from PySide6.QtGui import QPixmap, QIcon, Qt, QImage
 from PySide6.QtWidgets import QMessageBox, QPushButton, QFileDialog, QButtonGroup, QRadioButton, QStackedWidget
 from Controllers.BaseFileController import BaseFileController
 from Models.CitizenModel import CitizenModel
+from Models.CitizenListModel import CitizenListModel, search_citizens
+from Models.CitizenProfileLoader import CitizenProfileLoader
+from Models.DuplicateCitizenModel import (can_check, describe_candidate, find_duplicate_candidates,
+                                          find_exact_duplicate)
+from Models.CensusImport import run_census_import
+from Models.ExportService import export_citizens
+from Models.LookupCache import LookupCache
 from Views.CitizenPanel.CitizenView import CitizenView
+from Utils.util_debounced_search import DebouncedSearch, SEARCH_DELAY_MS
+from Utils.util_export import start_export
 from Utils.util_popup import load_popup
+from Utils.util_query_executor import QueryExecutor
 from database import Database
 
 
@@ -31,11 +41,14 @@ class CitizenController(BaseFileController):
         self.sex_group = None
         self.stack = stack
         self.model = CitizenModel()
+        self.executor = QueryExecutor.instance()
+        self.profile_loader = CitizenProfileLoader.instance()
         self.view = CitizenView(self)
         print(self.sys_user_id)
 
         self.cp_profile_screen = self.load_ui("Resources/UIs/MainPages/CitizenPanelPages/cp_citizenprofile.ui")
         self.view.setup_profile_ui(self.cp_profile_screen)
+        self.setup_citizen_list()
         self.load_citizen_data()
 
         # self.part1_popup = load_popup("Resources/UIs/PopUp/Screen_CitizenPanel/ScreenCitizenProfile/register_citizen_part_01.ui")
@@ -67,12 +80,10 @@ class CitizenController(BaseFileController):
         self.part1_popup = self.view.show_register_citizen_part_01_popup(self)
         self.part2_popup = self.view.show_register_citizen_part_02_popup(self)
         self.part3_popup = self.view.show_register_citizen_part_03_popup(self)
+        self.setup_duplicate_hints()
 
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT fpm_id, fpm_method FROM family_planning_method ORDER BY fpm_method ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("family_planning_method")
 
             combo = self.part3_popup.register_citizen_comboBox_FamilyPlanningMethod
             for fpm_id, fpm_method in results:
@@ -80,14 +91,9 @@ class CitizenController(BaseFileController):
 
         except Exception as e:
             print(f"Failed to load fpm meyhofd: {e}")
-        finally:
-            db.close()
 
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT fpms_id, fpms_status_name FROM fpm_status ORDER BY fpms_status_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("fpm_status")
 
             combo = self.part3_popup.register_citizen_comboBox_FamPlanStatus
             for fpms_id, fpms_status_name in results:
@@ -95,8 +101,6 @@ class CitizenController(BaseFileController):
 
         except Exception as e:
             print(f"Failed to load fpm status: {e}")
-        finally:
-            db.close()
 
         self.gov_group = QButtonGroup()
         self.sex_group = QButtonGroup()
@@ -128,10 +132,7 @@ class CitizenController(BaseFileController):
 
         # initialize data
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT sitio_id, sitio_name FROM sitio ORDER BY sitio_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("sitio")
 
             combo = self.part1_popup.register_citizen_comboBox_Sitio
             combo.clear()
@@ -140,8 +141,6 @@ class CitizenController(BaseFileController):
 
         except Exception as e:
             print(f"Failed to load sitios: {e}")
-        finally:
-            db.close()
         # self.stacked_widget.addWidget(self.part1_popup)
         # self.stacked_widget.addWidget(self.part2_popup)
         #
@@ -155,12 +154,7 @@ class CitizenController(BaseFileController):
     def show_register_citizen_part_02_initialize(self):
         print("-- Register New Citizen Part 2 Popup")
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            # During setup (show_update_citizen_part_02_initialize or wherever you're filling the combo box):
-            cursor.execute(
-                "SELECT rth_id, rth_relationship_name FROM relationship_type ORDER BY rth_relationship_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("relationship_type")
 
             combo = self.part2_popup.register_citizen_comboBox_Relationship
             # combo.clear()
@@ -170,8 +164,6 @@ class CitizenController(BaseFileController):
 
         except Exception as e:
             print(f"Failed to load sitios: {e}")
-        finally:
-            db.close()
         self.part2_popup.show()
 
         # self.part2_popup = self.view.show_register_citizen_part_02_popup(self)
@@ -186,11 +178,7 @@ class CitizenController(BaseFileController):
         self.part3_popup.show()
 
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute(
-                "SELECT clah_id, clah_classification_name FROM classification_health_risk ORDER BY clah_classification_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("classification_health_risk")
 
             combo = self.part3_popup.register_citizen_health_classification
             # combo.clear()
@@ -199,8 +187,6 @@ class CitizenController(BaseFileController):
 
         except Exception as e:
             print(f"Failed to load classitiofat: {e}")
-        finally:
-            db.close()
 
         self.deceased_group.addButton(self.part3_popup.register_citizen_Deceased_Yes)
         self.deceased_group.addButton(self.part3_popup.register_citizen_Deceased_No)
@@ -268,10 +254,7 @@ class CitizenController(BaseFileController):
 
         # initialize data
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT sitio_id, sitio_name FROM sitio ORDER BY sitio_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("sitio")
 
             combo = self.part1_popup_update.register_citizen_comboBox_Sitio
             combo.clear()
@@ -280,8 +263,6 @@ class CitizenController(BaseFileController):
 
         except Exception as e:
             print(f"Failed to load sitios: {e}")
-        finally:
-            db.close()
         # self.stacked_widget.addWidget(self.part1_popup)
         # self.stacked_widget.addWidget(self.part2_popup)
         #
@@ -610,114 +591,69 @@ class CitizenController(BaseFileController):
     from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
     from datetime import date
 
+    def setup_citizen_list(self):
+        self.citizen_list_model = CitizenListModel(self.cp_profile_screen)
+        self.citizen_list_model.on_error = self.show_citizen_list_error
+
+        table = self.cp_profile_screen.cp_tableView_List_RegCitizens
+        table.setModel(self.citizen_list_model)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+
+        table.setColumnWidth(0, 50)
+        table.setColumnWidth(1, 150)
+        table.setColumnWidth(2, 150)
+        table.setColumnWidth(3, 150)
+        table.setColumnWidth(4, 200)
+
+        # Name searches narrow locally on last, first, "first last" and sitio.
+        # ID lookups are exact, so they always go to the server. Searches use
+        # their own key: cancelling the model's page fetch ("citizen_list")
+        # would leave it loading forever.
+        self.citizen_search = DebouncedSearch(
+            self.cp_profile_screen.cp_CitizenName_fieldSearch,
+            search_citizens, self.citizen_list_model.set_rows,
+            key="citizen_search",
+            on_empty=self.load_citizen_data,
+            on_error=self.show_citizen_list_error,
+            match_columns=[1, 2, (2, 1), 3],
+            can_narrow=lambda text: not text.isdigit()
+        )
+
     def load_citizen_data(self):
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
-            cursor.execute("""
-    SELECT DISTINCT ON (C.CTZ_ID)
-        C.CTZ_ID, --0
-        C.CTZ_LAST_NAME,
-        C.CTZ_FIRST_NAME,
-        C.CTZ_MIDDLE_NAME,
-        C.CTZ_SUFFIX,
-        S.SITIO_NAME, --5
-        TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS LAST_UPDATED,
-        C.CTZ_DATE_OF_BIRTH,
-        C.CTZ_SEX,
-        C.CTZ_CIVIL_STATUS,
-        COALESCE(CON.CON_EMAIL, '') AS EMAIL, --10
-        COALESCE(CON.CON_PHONE, '') AS CONTACT_NUM,
-        C.CTZ_PLACE_OF_BIRTH,
-        HH.HH_ADDRESS,
-        SES.SOEC_STATUS,
-        SES.SOEC_NUMBER, --15
-        ES.ES_STATUS_NAME AS EMPLOYMENT_STATUS,
-        EMP.EMP_OCCUPATION AS OCCUPATION,
-        EMP.EMP_IS_GOV_WORKER,
-        HH.HH_ID, --19
-        RT.RTH_RELATIONSHIP_NAME AS RELATIONSHIP_NAME,
-        PHC.PC_CATEGORY_NAME AS PHILHEALTH_CATEGORY_NAME,
-        PH.PHEA_MEMBERSHIP_TYPE, --22
-        R.REL_NAME AS RELIGION,
-        C.CTZ_BLOOD_TYPE,
-        EDU.EDU_IS_CURRENTLY_STUDENT AS IS_STUDENT,
-        EDU.EDU_INSTITUTION_NAME AS SCHOOL_NAME, --26
-        EDAT.EDAT_LEVEL AS EDUCATIONAL_ATTAINMENT, --27
-        CHR.CLAH_CLASSIFICATION_NAME AS CLASSIFICATION_HEALTH_RISK_NAME, --28
-        C.CTZ_IS_REGISTERED_VOTER, --29
-        NOT C.CTZ_IS_ALIVE AS IS_DECEASED, --30
-        C.CTZ_IS_IP,
-        PH.PHEA_ID_NUMBER,
-        TO_CHAR(C.CTZ_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED_FORMATTED, --33
-
-        CASE 
-            WHEN SA.SYS_FNAME IS NULL THEN 'System'
-            ELSE SA.SYS_FNAME || ' ' || COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || SA.SYS_LNAME
-        END AS ENCODED_BY, --34
-
-        TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED_FORMATTED, --35
-
-        CASE 
-            WHEN SUA.SYS_FNAME IS NULL THEN 'System'
-            ELSE SUA.SYS_FNAME || ' ' || COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || SUA.SYS_LNAME
-        END AS LAST_UPDATED_BY_NAME, --36
-
-        C.CTZ_REASON_OF_DEATH, --37
-        TO_CHAR(C.CTZ_DATE_OF_DEATH, 'FMMonth FMDD, YYYY'), --38
-        FP.fp_start_date AS FAM_PLAN_START_DATE,
-        FP.fp_end_date AS FAM_PLAN_END_DATE,
-        FPM.FPM_METHOD AS FAM_PLAN_METHOD,
-        FPS.FPMS_STATUS_NAME AS FAM_PLAN_STATUS
-
-    FROM CITIZEN C
-    LEFT JOIN CONTACT CON ON C.CON_ID = CON.CON_ID
-    LEFT JOIN EMPLOYMENT EMP ON C.CTZ_ID = EMP.CTZ_ID
-    LEFT JOIN EMPLOYMENT_STATUS ES ON EMP.ES_ID = ES.ES_ID
-    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
-    JOIN HOUSEHOLD_INFO HH ON C.HH_ID = HH.HH_ID
-    LEFT JOIN SOCIO_ECONOMIC_STATUS SES ON C.SOEC_ID = SES.SOEC_ID
-    LEFT JOIN RELATIONSHIP_TYPE RT ON C.RTH_ID = RT.RTH_ID
-    LEFT JOIN PHILHEALTH PH ON C.PHEA_ID = PH.PHEA_ID
-    LEFT JOIN PHILHEALTH_CATEGORY PHC ON PH.PC_ID = PHC.PC_ID
-    LEFT JOIN RELIGION R ON C.REL_ID = R.REL_ID
-    LEFT JOIN EDUCATION_STATUS EDU ON C.EDU_ID = EDU.EDU_ID
-    LEFT JOIN EDUCATIONAL_ATTAINMENT EDAT ON EDU.EDAT_ID = EDAT.EDAT_ID
-    LEFT JOIN CLASSIFICATION_HEALTH_RISK CHR ON C.CLAH_ID = CHR.CLAH_ID
-    LEFT JOIN SYSTEM_ACCOUNT SA ON C.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
-    LEFT JOIN SYSTEM_ACCOUNT SUA ON C.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
-    LEFT JOIN FAMILY_PLANNING FP ON C.CTZ_ID = FP.CTZ_ID
-    LEFT JOIN FAMILY_PLANNING_METHOD FPM ON FP.FPM_METHOD = FPM.FPM_ID
-    LEFT JOIN FPM_STATUS FPS ON FP.FPMS_STATUS = FPS.FPMS_ID
-    WHERE C.CTZ_IS_DELETED = FALSE
-    ORDER BY C.CTZ_ID DESC
-    LIMIT 50;
-            """)
-            rows = cursor.fetchall()
-            self.rows = rows
-
-            table = self.cp_profile_screen.cp_tableView_List_RegCitizens
-            table.setRowCount(len(rows))
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(["ID", "Family Name", "First Name", "Sitio", "Last Updated"])
-
-            table.setColumnWidth(0, 50)
-            table.setColumnWidth(1, 150)
-            table.setColumnWidth(2, 150)
-            table.setColumnWidth(3, 150)
-            table.setColumnWidth(4, 200)
-
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate([row_data[0], row_data[1], row_data[2], row_data[5], row_data[6]]):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
+        self.citizen_list_model.reload()
 
-        except Exception as e:
-            QMessageBox.critical(self.cp_profile_screen, "Database Error", str(e))
-        finally:
-            if connection:
-                connection.close()
+    def show_citizen_list_error(self, error):
+        QMessageBox.critical(self.cp_profile_screen, "Database Error", str(error))
+
+    def import_census_file(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self.cp_profile_screen, "Import Census File", "", "Census Files (*.csv *.xlsx)"
+        )
+        if not path:
+            return
+
+        self.cp_profile_screen.cp_citizen_button_import.setEnabled(False)
+        self.executor.submit(
+            "census_import", run_census_import, path, self.sys_user_id,
+            on_result=self.show_census_import_result,
+            on_error=self.show_census_import_error
+        )
+
+    def show_census_import_result(self, report):
+        self.cp_profile_screen.cp_citizen_button_import.setEnabled(True)
+        message = report.summary()
+        if report.report_path:
+            message += f"\n\nRow errors were written to:\n{report.report_path}"
+        QMessageBox.information(self.cp_profile_screen, "Census Import", message)
+        self.load_citizen_data()
+
+    def show_census_import_error(self, error):
+        self.cp_profile_screen.cp_citizen_button_import.setEnabled(True)
+        QMessageBox.critical(self.cp_profile_screen, "Census Import Failed", str(error))
+
+    def export_citizens(self):
+        start_export(self.cp_profile_screen, "export_citizens", "Citizens", export_citizens)
 
     # def load_citizen_part2_data_for_update(self):
     #     if not self.selected_citizen_id:
@@ -944,148 +880,97 @@ class CitizenController(BaseFileController):
     #         db.close()
 
     def handle_row_click_citizen(self, row, column):
-        table = self.cp_profile_screen.cp_tableView_List_RegCitizens
-        selected_item = table.item(row, 0)
-        if not selected_item:
+        citizen_id = self.citizen_list_model.citizen_id(row)
+        if citizen_id is None:
             return
 
-        selected_id = selected_item.text()
-        self.selected_citizen_id = selected_id  # Store selected ID here
-
-        for record in self.rows:
-            if str(record[0]) == selected_id:
-                self.cp_profile_screen.cp_displayCItizenID.setText(str(record[0]))
-                self.cp_profile_screen.cp_displayLastName.setText(record[1])
-                self.cp_profile_screen.cp_displayFirstName.setText(record[2])
-                self.cp_profile_screen.cp_displayMiddleName.setText(record[3] or "None")
-                self.cp_profile_screen.cp_displaySuffix.setText(record[4] or "None")
-                self.cp_profile_screen.cp_displaySitio.setText(record[5])
-                self.cp_profile_screen.display_DateUpdated.setText(record[6])
-
-                dob = record[7]
-                if dob:
-                    try:
-                        today = date.today()
-                        age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
-                        self.cp_profile_screen.cp_displayAge.setText(
-                            dob.strftime('%B %d, %Y | ') + str(age) + " years old")
-                    except Exception:
-                        self.cp_profile_screen.cp_displayAge.setText("")
-                else:
-                    self.cp_profile_screen.cp_displayAge.setText("")
-
-                self.cp_profile_screen.cp_displayCivilStatus.setText(
-                    "Male | " + record[9] if record[8] == 'M' else "Female | " + record[9])
-                self.cp_profile_screen.cp_displayEmail.setText(record[10] or "None")
-                self.cp_profile_screen.cp_displayContactNum.setText(record[11] or "None")
-                self.cp_profile_screen.cp_displayPlaceOfBirth.setText(record[12] or "None")
-                self.cp_profile_screen.cp_displayFullAddress.setText(record[13] or "None")
-                self.cp_profile_screen.cp_displaySocioEcoStatus.setText(record[14] or "None")
-                self.cp_profile_screen.cp_displayNHTSNum.setText(record[15] or "None")
-                self.cp_profile_screen.cp_displayEmploymentStatus.setText(record[16] or "None")
-                self.cp_profile_screen.cp_displayOccupation.setText(record[17] or "None")
-                self.cp_profile_screen.cp_displayGovWorker.setText("Yes" if record[18] == True else "No")
-                self.cp_profile_screen.cp_displayHouseholdID.setText(str(record[19]) if record[19] else "")
-                self.cp_profile_screen.cp_displayRelationship.setText(record[20] or "None")
-                self.cp_profile_screen.cp_displayPhilCat.setText(record[21] or "None")
-                self.cp_profile_screen.cp_displayPhilID.setText(record[32] or "None")
-                self.cp_profile_screen.cp_displayMembershipType.setText(record[22] or "None")
-                self.cp_profile_screen.cp_displayReligion.setText(record[23] or "None")
-                self.cp_profile_screen.cp_displayBloodType.setText(record[24] or "None")
-                self.cp_profile_screen.cp_displayStudent.setText("Yes" if record[25] == True else "No")
-                self.cp_profile_screen.cp_displaySchoolName.setText(record[26] or "None")
-                self.cp_profile_screen.cp_displayEducationalAttainment.setText(record[27] or "None")
-                self.cp_profile_screen.cp_display_health_classification.setText(record[28] or "None")
-                self.cp_profile_screen.cp_displayRegisteredVoter.setText("Yes" if record[29] == True else "No")
-                self.cp_profile_screen.cp_displayDeceased.setText("Yes" if record[30] == True else "No")
-                self.cp_profile_screen.cp_displayPartOfIndigenousGroup.setText("Yesss" if record[31] == True else "No")
-                self.cp_profile_screen.display_DateEncoded.setText(record[33] or "None")
-                self.cp_profile_screen.display_EncodedBy.setText(record[34] or "None")
-                self.cp_profile_screen.display_DateUpdated.setText(record[35] or "None")
-                self.cp_profile_screen.display_UpdatedBy.setText(record[36] or "None")
-                self.cp_profile_screen.cp_displayReasonOfDeath.setText(record[37] or "None")
-                self.cp_profile_screen.cp_displayDoD.setText(record[38] or "None")
-                # --- Family Planning Info ---
-                # Safely extract family planning fields
-                fam_plan_method = str(record[41]) if len(record) > 41 and record[41] is not None else "None"
-                fam_plan_status = str(record[42]) if len(record) > 42 and record[42] is not None else "None"
-                fam_plan_start = record[39] if len(record) > 39 else None
-                fam_plan_end = record[40] if len(record) > 40 else None
-
-                # Set method and status (always strings)
-                self.cp_profile_screen.cp_displayFamPlanMethod.setText(fam_plan_method)
-                self.cp_profile_screen.cp_displayFamPlanStatus.setText(fam_plan_status)
-
-                # Format dates if valid
-                self.cp_profile_screen.display_DateStarted.setText(
-                    fam_plan_start.strftime("%B %d, %Y") if isinstance(fam_plan_start, date) else "None"
-                )
-                self.cp_profile_screen.display_DateEnded.setText(
-                    fam_plan_end.strftime("%B %d, %Y") if isinstance(fam_plan_end, date) else "None"
-                )
-                break
+        self.selected_citizen_id = str(citizen_id)  # Store selected ID here
+        self.executor.submit(
+            "citizen_profile", self.profile_loader.load, citizen_id,
+            on_result=self.display_citizen_profile,
+            on_error=self.show_citizen_list_error
+        )
+
+    def display_citizen_profile(self, record):
+        if not record:
+            return
+
+        self.cp_profile_screen.cp_displayCItizenID.setText(str(record[0]))
+        self.cp_profile_screen.cp_displayLastName.setText(record[1])
+        self.cp_profile_screen.cp_displayFirstName.setText(record[2])
+        self.cp_profile_screen.cp_displayMiddleName.setText(record[3] or "None")
+        self.cp_profile_screen.cp_displaySuffix.setText(record[4] or "None")
+        self.cp_profile_screen.cp_displaySitio.setText(record[5])
+        self.cp_profile_screen.display_DateUpdated.setText(record[6])
+
+        dob = record[7]
+        if dob:
+            try:
+                today = date.today()
+                age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
+                self.cp_profile_screen.cp_displayAge.setText(
+                    dob.strftime('%B %d, %Y | ') + str(age) + " years old")
+            except Exception:
+                self.cp_profile_screen.cp_displayAge.setText("")
+        else:
+            self.cp_profile_screen.cp_displayAge.setText("")
+
+        self.cp_profile_screen.cp_displayCivilStatus.setText(
+            "Male | " + record[9] if record[8] == 'M' else "Female | " + record[9])
+        self.cp_profile_screen.cp_displayEmail.setText(record[10] or "None")
+        self.cp_profile_screen.cp_displayContactNum.setText(record[11] or "None")
+        self.cp_profile_screen.cp_displayPlaceOfBirth.setText(record[12] or "None")
+        self.cp_profile_screen.cp_displayFullAddress.setText(record[13] or "None")
+        self.cp_profile_screen.cp_displaySocioEcoStatus.setText(record[14] or "None")
+        self.cp_profile_screen.cp_displayNHTSNum.setText(record[15] or "None")
+        self.cp_profile_screen.cp_displayEmploymentStatus.setText(record[16] or "None")
+        self.cp_profile_screen.cp_displayOccupation.setText(record[17] or "None")
+        self.cp_profile_screen.cp_displayGovWorker.setText("Yes" if record[18] == True else "No")
+        self.cp_profile_screen.cp_displayHouseholdID.setText(str(record[19]) if record[19] else "")
+        self.cp_profile_screen.cp_displayRelationship.setText(record[20] or "None")
+        self.cp_profile_screen.cp_displayPhilCat.setText(record[21] or "None")
+        self.cp_profile_screen.cp_displayPhilID.setText(record[32] or "None")
+        self.cp_profile_screen.cp_displayMembershipType.setText(record[22] or "None")
+        self.cp_profile_screen.cp_displayReligion.setText(record[23] or "None")
+        self.cp_profile_screen.cp_displayBloodType.setText(record[24] or "None")
+        self.cp_profile_screen.cp_displayStudent.setText("Yes" if record[25] == True else "No")
+        self.cp_profile_screen.cp_displaySchoolName.setText(record[26] or "None")
+        self.cp_profile_screen.cp_displayEducationalAttainment.setText(record[27] or "None")
+        self.cp_profile_screen.cp_display_health_classification.setText(record[28] or "None")
+        self.cp_profile_screen.cp_displayRegisteredVoter.setText("Yes" if record[29] == True else "No")
+        self.cp_profile_screen.cp_displayDeceased.setText("Yes" if record[30] == True else "No")
+        self.cp_profile_screen.cp_displayPartOfIndigenousGroup.setText("Yesss" if record[31] == True else "No")
+        self.cp_profile_screen.display_DateEncoded.setText(record[33] or "None")
+        self.cp_profile_screen.display_EncodedBy.setText(record[34] or "None")
+        self.cp_profile_screen.display_DateUpdated.setText(record[35] or "None")
+        self.cp_profile_screen.display_UpdatedBy.setText(record[36] or "None")
+        self.cp_profile_screen.cp_displayReasonOfDeath.setText(record[37] or "None")
+        self.cp_profile_screen.cp_displayDoD.setText(record[38] or "None")
+        # --- Family Planning Info ---
+        # Safely extract family planning fields
+        fam_plan_method = str(record[41]) if len(record) > 41 and record[41] is not None else "None"
+        fam_plan_status = str(record[42]) if len(record) > 42 and record[42] is not None else "None"
+        fam_plan_start = record[39] if len(record) > 39 else None
+        fam_plan_end = record[40] if len(record) > 40 else None
+
+        # Set method and status (always strings)
+        self.cp_profile_screen.cp_displayFamPlanMethod.setText(fam_plan_method)
+        self.cp_profile_screen.cp_displayFamPlanStatus.setText(fam_plan_status)
+
+        # Format dates if valid
+        self.cp_profile_screen.display_DateStarted.setText(
+            fam_plan_start.strftime("%B %d, %Y") if isinstance(fam_plan_start, date) else "None"
+        )
+        self.cp_profile_screen.display_DateEnded.setText(
+            fam_plan_end.strftime("%B %d, %Y") if isinstance(fam_plan_end, date) else "None"
+        )
 
     #
     # BUTTON FUNCTIONS
     #
 
     def perform_citizen_search(self):
-        search_text = self.cp_profile_screen.cp_CitizenName_fieldSearch.text().strip()
-
-        if not search_text:
-            # If search field is empty, reload all citizens
-            self.load_citizen_data()
-            return
-
-        query = """
-            SELECT DISTINCT ON (C.CTZ_ID)
-                C.CTZ_ID,
-                C.CTZ_LAST_NAME,
-                C.CTZ_FIRST_NAME,
-                C.CTZ_MIDDLE_NAME,
-                C.CTZ_SUFFIX,
-                S.SITIO_NAME,
-                TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS LAST_UPDATED
-            FROM CITIZEN C
-            JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
-            WHERE C.CTZ_IS_DELETED = FALSE
-              AND (
-                  CAST(C.CTZ_ID AS TEXT) ILIKE %s OR
-                  C.CTZ_LAST_NAME ILIKE %s OR
-                  C.CTZ_FIRST_NAME ILIKE %s OR
-                  S.SITIO_NAME ILIKE %s
-              )
-            ORDER BY C.CTZ_ID, COALESCE(C.CTZ_LAST_UPDATED, C.CTZ_DATE_ENCODED) DESC
-            LIMIT 50;
-        """
-
-        try:
-            db = Database()
-            cursor = db.get_cursor()
-            search_pattern = f"%{search_text}%"
-            cursor.execute(query, (search_pattern, search_pattern, search_pattern, search_pattern))
-            rows = cursor.fetchall()
-
-            table = self.cp_profile_screen.cp_tableView_List_RegCitizens
-            table.setRowCount(len(rows))
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(["ID", "Family Name", "First Name", "Sitio", "Last Updated"])
-            table.setColumnWidth(0, 50)
-            table.setColumnWidth(1, 150)
-            table.setColumnWidth(2, 150)
-            table.setColumnWidth(3, 150)
-            table.setColumnWidth(4, 200)
-
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate([row_data[0], row_data[1], row_data[2], row_data[5], row_data[6]]):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
-
-        except Exception as e:
-            QMessageBox.critical(self.cp_profile_screen, "Database Error", str(e))
-        finally:
-            if db:
-                db.close()
+        self.citizen_search.run()
 
     def radio_button_sex_result(self):
         if self.part1_popup.radioButton_male.isChecked():
@@ -1258,18 +1143,17 @@ class CitizenController(BaseFileController):
                 "border: 1px solid gray; border-radius: 5px; padding: 5px; background-color: #f2efff"
             )
 
-        # Check if first name + last name already exist in the database
+        # Same name (any case) and same birth date as a living record is a duplicate.
+        # Near-matches were already shown while typing; see setup_duplicate_hints.
         if form_data_part_1['first_name'] and form_data_part_1['last_name']:
+            db = Database()
             try:
-                db = Database()
-                cursor = db.get_cursor()
-                cursor.execute("""
-                    SELECT COUNT(*) FROM citizen 
-                    WHERE C.CTZ_IS_DELETED = FALSE AND LOWER(ctz_first_name) = LOWER(%s) AND LOWER(ctz_last_name) = LOWER(%s)
-                """, (form_data_part_1['first_name'], form_data_part_1['last_name']))
-                result = cursor.fetchone()
-                if result[0] > 0:
-                    errors_part_1.append("A citizen with the same first and last name already exists.")
+                existing_id = find_exact_duplicate(db, form_data_part_1['first_name'],
+                                                   form_data_part_1['last_name'], form_data_part_1['birth_date'])
+                if existing_id is not None:
+                    errors_part_1.append(
+                        f"A citizen with the same name and date of birth already exists (ID {existing_id})."
+                    )
                     self.part1_popup.register_citizen_firstname.setStyleSheet(
                         "border: 1px solid red; border-radius: 5px; padding: 5px; background-color: #f2efff"
                     )
@@ -1325,6 +1209,67 @@ class CitizenController(BaseFileController):
             self.part1_popup.close()
             self.show_register_citizen_part_02_initialize()
 
+    # Likely duplicates, shown under the form while the encoder types. The
+    # birth date only counts once it has been changed from the form's default.
+    def setup_duplicate_hints(self):
+        popup = self.part1_popup
+        popup.register_citizen_labelDuplicates.hide()
+        self.dob_edited = False
+
+        self.duplicate_timer = QTimer(popup)
+        self.duplicate_timer.setSingleShot(True)
+        self.duplicate_timer.setInterval(SEARCH_DELAY_MS)
+        self.duplicate_timer.timeout.connect(self.check_duplicate_candidates)
+
+        popup.register_citizen_firstname.textChanged.connect(self.schedule_duplicate_check)
+        popup.register_citizen_lastname.textChanged.connect(self.schedule_duplicate_check)
+        popup.register_citizen_date_dob.dateChanged.connect(self.on_register_dob_changed)
+
+    def on_register_dob_changed(self, _date):
+        self.dob_edited = True
+        self.schedule_duplicate_check()
+
+    def schedule_duplicate_check(self, *_):
+        self.executor.cancel("citizen_duplicates")
+        self.duplicate_timer.start()
+
+    def duplicate_check_input(self):
+        return (
+            self.part1_popup.register_citizen_firstname.text().strip(),
+            self.part1_popup.register_citizen_lastname.text().strip(),
+            self.part1_popup.register_citizen_date_dob.date().toString("yyyy-MM-dd") if self.dob_edited else None,
+            self.part2_popup.register_citizen_HouseholdID.text().strip() if self.part2_popup else None,
+        )
+
+    def check_duplicate_candidates(self):
+        checked = self.duplicate_check_input()
+        if not can_check(checked[0], checked[1]):
+            self.executor.cancel("citizen_duplicates")
+            self.part1_popup.register_citizen_labelDuplicates.hide()
+            return
+
+        self.executor.submit(
+            "citizen_duplicates", find_duplicate_candidates, *checked,
+            on_result=lambda rows: self.show_duplicate_candidates(checked, rows),
+            on_error=self.hide_duplicate_candidates
+        )
+
+    def show_duplicate_candidates(self, checked, rows):
+        if checked != self.duplicate_check_input():
+            return  # the form changed while this check was running
+        label = self.part1_popup.register_citizen_labelDuplicates
+        if not rows:
+            label.hide()
+            return
+        label.setText("Possible existing records - check before registering:\n" +
+                      "\n".join(describe_candidate(row) for row in rows))
+        label.show()
+
+    def hide_duplicate_candidates(self, error):
+        # Over budget or failed: the hint is optional, submit still runs the exact check.
+        print(f"Duplicate check skipped: {error}")
+        self.part1_popup.register_citizen_labelDuplicates.hide()
+
     def validate_part3_fields(self):
         form_data_part_3 = self.get_form_data()
         errors_part_3 = []
@@ -1984,6 +1929,7 @@ class CitizenController(BaseFileController):
             ))
 
             db.commit()
+            self.profile_loader.invalidate(self.selected_citizen_id)
 
             QMessageBox.information(self.part3_popup_update, "Success", "Citizen information updated successfully.")
 
@@ -2055,6 +2001,8 @@ class CitizenController(BaseFileController):
             image_label.setPixmap(pixmap.scaled(image_label.width(), image_label.height(), Qt.KeepAspectRatio))
 
     def capture_photo(self, image_label):
+        import cv2  # OpenCV takes a while to import; only the camera needs it
+
         cap = cv2.VideoCapture(0)
         if not cap.isOpened():
             QMessageBox.warning(self.part1_popup, "Error", "Could not open webcam")
@@ -2297,242 +2245,115 @@ class CitizenController(BaseFileController):
             QMessageBox.critical(self.part3_popup, "Error", "No data to save.")
             return
 
+        lookups = LookupCache.instance()
         db = Database()
         connection = db.conn
         cursor = connection.cursor()
 
-        # --- GET rth_id FROM RELATIONSHIP_TYPE ---
-        relationship_name = form_data['relationship']
-        cursor.execute("SELECT rth_id FROM relationship_type WHERE rth_relationship_name = %s", (relationship_name,))
-        rth_result = cursor.fetchone()
-
-        if not rth_result:
-            raise Exception(f"Relationship '{relationship_name}' not found in relationship_type table.")
-        rth_id = rth_result[0]
-
-        # --- Validate/Insert CLASSIFICATION_HEALTH_RISK ---
-        health_class = form_data.get('health_class')
-        clah_id = None
-
-        if health_class not in ['None', '', None]:
-            cursor.execute("SELECT clah_id FROM classification_health_risk WHERE clah_classification_name = %s",
-                           (health_class,))
-            clah_result = cursor.fetchone()
-            if not clah_result:
-                raise Exception(f"Health classification '{health_class}' not found.")
-            clah_id = clah_result[0]
-
         try:
-            # --- Validate & Insert CONTACT ---
-            email = form_data['email_address']
-            phone = form_data['contact_number']
-
-            contact_query = """
-                INSERT INTO contact (con_email, con_phone)
-                VALUES (%s, %s)
-                RETURNING con_id;
-            """
-            cursor.execute(contact_query, (email, phone))
-            contact_result = cursor.fetchone()
-            if not contact_result:
-                raise Exception("Failed to insert into CONTACT table")
-            contact_id = contact_result[0]
-
-            # --- Validate SITIO ---
-            cursor.execute("SELECT sitio_id FROM sitio WHERE sitio_name = %s", (form_data['sitio'],))
-            sitio_result = cursor.fetchone()
-            if not sitio_result:
+            # --- Resolve reference IDs (in memory, see LookupCache) ---
+            relationship_name = form_data['relationship']
+            rth_id = lookups.id_for("relationship_type", relationship_name)
+            if rth_id is None:
+                raise Exception(f"Relationship '{relationship_name}' not found in relationship_type table.")
+
+            health_class = form_data.get('health_class')
+            clah_id = None
+            if health_class not in ['None', '', None]:
+                clah_id = lookups.id_for("classification_health_risk", health_class)
+                if clah_id is None:
+                    raise Exception(f"Health classification '{health_class}' not found.")
+
+            sitio_id = lookups.id_for("sitio", form_data['sitio'])
+            if sitio_id is None:
                 raise Exception(f"Sitio '{form_data['sitio']}' not found in database.")
-            sitio_id = sitio_result[0]
 
-            # --- Validate/Insert EDUCATION_LEVEL ---
             edu_level = form_data['educ_level']
             edat_id = None
             if edu_level not in ['None', '', None]:
-                cursor.execute("SELECT edat_id FROM educational_attainment WHERE edat_level = %s", (edu_level,))
-                edu_level_result = cursor.fetchone()
-                if not edu_level_result:
+                edat_id = lookups.id_for("educational_attainment", edu_level)
+                if edat_id is None:
                     raise Exception(f"Educational level '{edu_level}' not found.")
-                edat_id = edu_level_result[0]
-
-            # --- Insert EDUCATION_STATUS ---
-            cursor.execute("""
-                INSERT INTO education_status (edu_is_currently_student, edu_institution_name, edat_id)
-                VALUES (%s, %s, %s)
-                RETURNING edu_id;
-            """, (
-                True if form_data['is_student'] == 'Yes' else False,
-                form_data['school_name'] if form_data['school_name'] not in ['', 'None'] else None,
-                edat_id
-            ))
-            edu_result = cursor.fetchone()
-            if not edu_result:
-                raise Exception("Failed to insert into EDUCATION_STATUS")
-            edu_id = edu_result[0]
-
-            # --- Insert SOCIO_ECONOMIC_STATUS ---
-            socio_status = form_data['socio_eco_status']
-            nhts_num = form_data['nhts_number'] if socio_status in ['NHTS 4Ps', 'NHTS Non-4Ps'] else None
-
-            cursor.execute("""
-                INSERT INTO socio_economic_status (soec_status, soec_number)
-                VALUES (%s, %s)
-                RETURNING soec_id;
-            """, (socio_status, nhts_num))
-            soec_result = cursor.fetchone()
-            if not soec_result:
-                raise Exception("Failed to insert into SOCIO_ECONOMIC_STATUS")
-            soec_id = soec_result[0]
-
-            # --- Validate RELIGION ---
-            religion = form_data['religion']
-            cursor.execute("SELECT rel_id FROM religion WHERE rel_name = %s", (religion,))
-            rel_result = cursor.fetchone()
-            if not rel_result:
-                cursor.execute("INSERT INTO religion (rel_name) VALUES (%s) RETURNING rel_id", (religion,))
-                rel_insert_result = cursor.fetchone()
-                if not rel_insert_result:
-                    raise Exception("Failed to insert new religion")
-                rel_id = rel_insert_result[0]
-            else:
-                rel_id = rel_result[0]
 
-            # --- Validate PHILHEALTH CATEGORY ---
             phil_category = form_data['phil_category']
-            cursor.execute("SELECT pc_id FROM philhealth_category WHERE pc_category_name = %s", (phil_category,))
-            pc_result = cursor.fetchone()
-            if not pc_result:
+            pc_id = lookups.id_for("philhealth_category", phil_category)
+            if pc_id is None:
                 raise Exception(f"Philhealth category '{phil_category}' not found.")
-            pc_id = pc_result[0]
 
-            # --- Insert PHILHEALTH ---
-            phil_id = form_data['phil_id'].strip() if form_data['phil_id'] and form_data['phil_id'].strip() else None
             membership_type = form_data['membership_type']
-            phil_category = pc_id  # Already retrieved earlier
-
-            # Always insert PHILHEALTH if category & membership type are present
             if not membership_type:
                 raise Exception("Membership type cannot be empty")
 
-            cursor.execute("""
-                INSERT INTO philhealth (phea_id_number, pc_id, phea_membership_type)
-                VALUES (%s, %s, %s)
-                RETURNING phea_id;
-            """, (phil_id, phil_category, membership_type))
-
-            phea_result = cursor.fetchone()
-            if not phea_result:
-                raise Exception("Failed to insert into PHILHEALTH")
-            phea_id = phea_result[0]
-
-            # --- Insert CITIZEN ---
-            # --- Insert CITIZEN ---
-            citizen_query = """
-            INSERT INTO citizen (
-                ctz_first_name, ctz_middle_name, ctz_last_name, ctz_suffix,
-                ctz_date_of_birth, ctz_sex, ctz_civil_status, ctz_place_of_birth,
-                ctz_blood_type, ctz_is_registered_voter, ctz_is_alive, ctz_date_of_death,
-                ctz_reason_of_death, ctz_date_encoded, con_id, sitio_id, edu_id, soec_id,
-                phea_id, rel_id, rth_id, hh_id, encoded_by_sys_id, last_updated_by_sys_id,
-                clah_id
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING ctz_id;
-            """
-
-            date_of_death = form_data['date_of_death'] if form_data['is_deceased'] == 'Yes' else None
-            reason_of_death = form_data['reason_of_death'] if form_data['is_deceased'] == 'Yes' else None
-            is_alive = not (form_data['is_deceased'] == 'Yes')
-
-            cursor.execute("SET LOCAL app.current_user_id TO %s", (str(self.sys_user_id),))
-            cursor.execute(citizen_query, (
-                form_data['first_name'],
-                form_data['middle_name'] or None,
-                form_data['last_name'],
-                form_data['suffix'] or None,
-                form_data['birth_date'],
-                'M' if form_data['sex'] == 'Male' else 'F',
-                form_data['civil_status'],
-                form_data['place_of_birth'],
-                form_data['blood_type'],
-                True if form_data['is_voter'] == 'Yes' else False,
-                is_alive,
-                date_of_death,
-                reason_of_death,
-                contact_id,
-                sitio_id,
-                edu_id,
-                soec_id,
-                phea_id,
-                rel_id,
-                rth_id,
-                int(form_data['household_id']),
-                self.sys_user_id,
-                self.sys_user_id,
-                clah_id
-            ))
-            citizen_result = cursor.fetchone()
-            if not citizen_result:
-                raise Exception("Failed to insert into CITIZEN")
-            citizen_id = citizen_result[0]
-
-            # --- FAMILY PLANNING INSERTION ---
             fam_plan_method = form_data.get('fam_plan_method')
             fam_plan_stat = form_data.get('fam_plan_stat')
-
+            fpm_id = fpms_id = None
             if fam_plan_method not in ['None', '', None] and fam_plan_stat not in ['None', '', None]:
-                # Retrieve FPM_ID from family_planning_method
-                cursor.execute("SELECT FPM_ID FROM family_planning_method WHERE FPM_METHOD = %s", (fam_plan_method,))
-                fpm_result = cursor.fetchone()
-                if not fpm_result:
+                fpm_id = lookups.id_for("family_planning_method", fam_plan_method)
+                if fpm_id is None:
                     raise Exception(f"Family planning method '{fam_plan_method}' not found.")
-                fpm_id = fpm_result[0]
 
-                # Retrieve FPMS_ID from fpm_status
-                cursor.execute("SELECT FPMS_ID FROM fpm_status WHERE FPMS_STATUS_NAME = %s", (fam_plan_stat,))
-                fpms_result = cursor.fetchone()
-                if not fpms_result:
+                fpms_id = lookups.id_for("fpm_status", fam_plan_stat)
+                if fpms_id is None:
                     raise Exception(f"Family planning status '{fam_plan_stat}' not found.")
-                fpms_id = fpms_result[0]
-
-                fp_start_date = form_data.get('fam_plan_start_date')
-                fp_end_date = form_data.get('fam_plan_end_date')
-
-                # Use citizen_id here, NOT ctz_id
-                cursor.execute("""
-                    INSERT INTO family_planning (
-                        FP_START_DATE, FP_END_DATE, CTZ_ID, FPMS_STATUS, FPM_METHOD
-                    ) VALUES (%s, %s, %s, %s, %s)
-                """, (
-                    fp_start_date,
-                    fp_end_date,
-                    citizen_id,  # ← Correct variable
-                    fpms_id,
-                    fpm_id
-                ))
             else:
                 print("-- Skipping Family Planning insertion due to missing data")
 
-            # --- Insert EMPLOYMENT ---
             employment_status = form_data['employment_status']
-            cursor.execute("SELECT es_id FROM employment_status WHERE es_status_name = %s", (employment_status,))
-            es_result = cursor.fetchone()
-            if not es_result:
+            es_id = lookups.id_for("employment_status", employment_status)
+            if es_id is None:
                 raise Exception(f"Employment status '{employment_status}' not found")
-            es_id = es_result[0]
 
-            cursor.execute("""
-                INSERT INTO employment (emp_occupation, emp_is_gov_worker, es_id, ctz_id)
-                VALUES (%s, %s, %s, %s);
-            """, (
-                form_data['occupation'],
-                True if form_data['gov_worker'] == 'Yes' else False,
-                es_id,
-                citizen_id
-            ))
+            # --- Register everything in one call (register_citizen in mnhs_barangay_new_query.sql) ---
+            is_deceased = form_data['is_deceased'] == 'Yes'
+            socio_status = form_data['socio_eco_status']
+            religion = form_data['religion']
+            citizen = {
+                'email_address': form_data['email_address'],
+                'contact_number': form_data['contact_number'],
+                'is_student': form_data['is_student'] == 'Yes',
+                'school_name': form_data['school_name'] if form_data['school_name'] not in ['', 'None'] else None,
+                'edat_id': edat_id,
+                'socio_eco_status': socio_status,
+                'nhts_number': form_data['nhts_number'] if socio_status in ['NHTS 4Ps', 'NHTS Non-4Ps'] else None,
+                'religion': religion,
+                'phil_id': form_data['phil_id'].strip() if form_data['phil_id'] and form_data['phil_id'].strip() else None,
+                'pc_id': pc_id,
+                'membership_type': membership_type,
+                'first_name': form_data['first_name'],
+                'middle_name': form_data['middle_name'] or None,
+                'last_name': form_data['last_name'],
+                'suffix': form_data['suffix'] or None,
+                'birth_date': form_data['birth_date'],
+                'sex': 'M' if form_data['sex'] == 'Male' else 'F',
+                'civil_status': form_data['civil_status'],
+                'place_of_birth': form_data['place_of_birth'],
+                'blood_type': form_data['blood_type'],
+                'is_voter': form_data['is_voter'] == 'Yes',
+                'is_alive': not is_deceased,
+                'date_of_death': form_data['date_of_death'] if is_deceased else None,
+                'reason_of_death': form_data['reason_of_death'] if is_deceased else None,
+                'sitio_id': sitio_id,
+                'rth_id': rth_id,
+                'household_id': int(form_data['household_id']),
+                'clah_id': clah_id,
+                'fpm_id': fpm_id,
+                'fpms_id': fpms_id,
+                'fam_plan_start_date': form_data.get('fam_plan_start_date'),
+                'fam_plan_end_date': form_data.get('fam_plan_end_date'),
+                'occupation': form_data['occupation'],
+                'gov_worker': form_data['gov_worker'] == 'Yes',
+                'es_id': es_id
+            }
+
+            cursor.execute("SELECT register_citizen(%s, %s);", (Json(citizen), self.sys_user_id))
+            citizen_result = cursor.fetchone()
+            if not citizen_result:
+                raise Exception("Failed to insert into CITIZEN")
 
             # --- Commit transaction ---
             connection.commit()
+            if lookups.id_for("religion", religion) is None:
+                lookups.bump("religion")  # register_citizen added it
             QMessageBox.information(self.part3_popup, "Success", "Citizen successfully registered!")
 
             # Close popup and refresh UI
@@ -2544,7 +2365,7 @@ class CitizenController(BaseFileController):
             QMessageBox.critical(self.part3_popup, "Database Error", f"Failed to register citizen: {e}")
         finally:
             cursor.close()
-            connection.close()
+            db.close()
 
     def reset_citizen_profile_display(self):
         # Reset basic info
@@ -2645,6 +2466,7 @@ class CitizenController(BaseFileController):
                 WHERE ctz_id = %s;
             """, (citizen_id,))
             db.conn.commit()
+            self.profile_loader.invalidate(citizen_id)
 
             QMessageBox.information(self.cp_profile_screen, "Success", f"Citizen {citizen_id} has been deleted.")
             self.load_citizen_data()  # Refresh table
@@ -2665,12 +2487,7 @@ class CitizenController(BaseFileController):
             return
         print(self.selected_citizen_id)
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute(
-                "SELECT rth_id, rth_relationship_name FROM relationship_type ORDER BY rth_relationship_name ASC;"
-            )
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("relationship_type")
 
             # print()
 
@@ -2681,8 +2498,6 @@ class CitizenController(BaseFileController):
 
         except Exception as e:
             pass
-        finally:
-            db.close()
 
         try:
             db = Database()
@@ -2952,10 +2767,7 @@ class CitizenController(BaseFileController):
                 # ])
 
                 try:
-                    db = Database()
-                    cursor = db.get_cursor()
-                    cursor.execute("SELECT fpm_id, fpm_method FROM family_planning_method ORDER BY fpm_method ASC;")
-                    results = cursor.fetchall()
+                    results = LookupCache.instance().rows("family_planning_method")
 
                     combo = self.part3_popup_update.register_citizen_comboBox_FamilyPlanningMethod
                     for fpm_id, fpm_method in results:
@@ -2963,14 +2775,9 @@ class CitizenController(BaseFileController):
 
                 except Exception as e:
                     print(f"Failed to load fpm meyhofd: {e}")
-                finally:
-                    db.close()
 
                 try:
-                    db = Database()
-                    cursor = db.get_cursor()
-                    cursor.execute("SELECT fpms_id, fpms_status_name FROM fpm_status ORDER BY fpms_status_name ASC;")
-                    results = cursor.fetchall()
+                    results = LookupCache.instance().rows("fpm_status")
 
                     combo = self.part3_popup_update.register_citizen_comboBox_FamPlanStatus
                     for fpms_id, fpms_status_name in results:
@@ -2978,8 +2785,6 @@ class CitizenController(BaseFileController):
 
                 except Exception as e:
                     print(f"Failed to load fpm status: {e}")
-                finally:
-                    db.close()
                 # Family Planning Method
                 fam_plan_method = result_part3[3] or "-- None --"
                 index_fam_method = self.part3_popup_update.register_citizen_comboBox_FamilyPlanningMethod.findText(
@@ -2,9 +2,12 @@ from PySide6.QtCore import QDate
 from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
 
 from Controllers.BaseFileController import BaseFileController
+from Models.ExportService import export_households
 from Models.HouseholdModel import HouseholdModel
 from Views.CitizenPanel.HouseholdView import HouseholdView
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
+from Utils.util_export import start_export
 
 
 class HouseholdController(BaseFileController):
@@ -20,6 +23,14 @@ class HouseholdController(BaseFileController):
         # Load UI
         self.cp_household_screen = self.load_ui("Resources/Uis/MainPages/CitizenPanelPages/cp_household.ui")
         self.view.setup_household_ui(self.cp_household_screen)
+        self.household_search = DebouncedSearch(
+            self.cp_household_screen.cp_HouseholdName_fieldSearch,
+            self.fetch_household_search, self.show_household_search_results,
+            key="household_search",
+            on_empty=self.load_household_data,
+            on_error=self.show_household_search_error,
+            match_columns=[0]
+        )
         self.center_on_screen()
         self.load_household_data()
 
@@ -268,13 +279,10 @@ class HouseholdController(BaseFileController):
             self.save_household_data(form_data)
 
     def perform_household_search(self):
-        search_text = self.cp_household_screen.cp_HouseholdName_fieldSearch.text().strip()
-
-        if not search_text:
-            # If empty, reload all households
-            self.load_household_data()
-            return
+        self.household_search.run()
 
+    @staticmethod
+    def fetch_household_search(db, search_text):
         query = """
             SELECT 
                 HH.HH_ID,
@@ -328,33 +336,31 @@ class HouseholdController(BaseFileController):
             ORDER BY HH.HH_ID ASC
             LIMIT 50;
         """
+        cursor = db.get_cursor()
+        search_pattern = f"%{search_text}%"
+        cursor.execute(query, (search_pattern,))
+        return cursor.fetchall()
 
-        try:
-            db = Database()
-            cursor = db.get_cursor()
-            search_pattern = f"%{search_text}%"
-            cursor.execute(query, (search_pattern,))
-            rows = cursor.fetchall()
-
-            table = self.cp_household_screen.inst_tableView_List_RegHousehold
-            table.setRowCount(len(rows))
-            table.setColumnCount(4)
-            table.setHorizontalHeaderLabels(["ID", "Total Members", "Sitio", "Date Encoded"])
-            table.setColumnWidth(0, 50)
-            table.setColumnWidth(1, 150)
-            table.setColumnWidth(2, 200)
-            table.setColumnWidth(3, 200)
-
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate([row_data[0], row_data[14], row_data[2], row_data[9]]):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
-
-        except Exception as e:
-            QMessageBox.critical(self.cp_household_screen, "Database Error", str(e))
-        finally:
-            if db:
-                db.close()
+    def show_household_search_results(self, rows):
+        table = self.cp_household_screen.inst_tableView_List_RegHousehold
+        table.setRowCount(len(rows))
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["ID", "Total Members", "Sitio", "Date Encoded"])
+        table.setColumnWidth(0, 50)
+        table.setColumnWidth(1, 150)
+        table.setColumnWidth(2, 200)
+        table.setColumnWidth(3, 200)
+
+        for row_idx, row_data in enumerate(rows):
+            for col_idx, value in enumerate([row_data[0], row_data[14], row_data[2], row_data[9]]):
+                item = QTableWidgetItem(str(value))
+                table.setItem(row_idx, col_idx, item)
+
+    def show_household_search_error(self, error):
+        QMessageBox.critical(self.cp_household_screen, "Database Error", str(error))
+
+    def export_households(self):
+        start_export(self.cp_household_screen, "export_households", "Households", export_households)
 
     from PySide6.QtCore import QDate
     from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
@@ -81,63 +81,31 @@ class CitizenPanelController(BaseFileController):
 
     def goto_admin_panel(self):
         print("-- Navigating to Admin Panel")
-        if not hasattr(self, 'admin_panel'):
-            from Controllers.AdminController.AdminPanelController import AdminPanelController
-            self.admin_panel = AdminPanelController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.admin_panel.admin_panel_screen)
-        self.stack.setCurrentWidget(self.admin_panel.admin_panel_screen)
+        self.stack.navigation.goto("admin_panel")
 
     def goto_activity_logs(self):
         print("-- Navigating to Activity Logs")
-        if not hasattr(self, 'activity_logs'):
-            from Controllers.AdminController.ActivityLogsController import ActivityLogsController
-            self.activity_logs = ActivityLogsController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.activity_logs.activity_logs_screen)
-        self.stack.setCurrentWidget(self.activity_logs.activity_logs_screen)
+        self.stack.navigation.goto("activity_logs")
 
     def goto_statistics_panel(self):
         """Handle navigation to Statistics Panel screen."""
         print("-- Navigating to Statistics")
-        if not hasattr(self, 'statistics_panel'):
-            from Controllers.UserController.StatisticsController import StatisticsController
-            self.statistics_panel = StatisticsController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.statistics_panel.statistics_screen)
-
-        self.stack.setCurrentWidget(self.statistics_panel.statistics_screen)
+        self.stack.navigation.goto("statistics_panel")
 
     def goto_institutions_panel(self):
         """Handle navigation to Institutions Panel screen."""
         print("-- Navigating to Institutions")
-        if not hasattr(self, 'institutions_panel'):
-            from Controllers.UserController.InstitutionController import InstitutionsController
-            self.institutions_panel = InstitutionsController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.institutions_panel.institutions_screen)
-
-        self.stack.setCurrentWidget(self.institutions_panel.institutions_screen)
+        self.stack.navigation.goto("institutions_panel")
 
     def goto_transactions_panel(self):
         """Handle navigation to Transactions Panel screen."""
         print("-- Navigating to Transactions")
-        if not hasattr(self, 'transactions_panel'):
-            from Controllers.UserController.TransactionController import TransactionController
-            self.transactions_panel = TransactionController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.transactions_panel.transactions_screen)
-
-        self.stack.setCurrentWidget(self.transactions_panel.transactions_screen)
+        self.stack.navigation.goto("transactions_panel")
 
     def goto_history_panel(self):
         """Handle navigation to History Records Panel screen."""
         print("-- Navigating to History Records")
-        if not hasattr(self, 'history_panel'):
-            from Controllers.UserController.HistoryRecordsController import HistoryRecordsController
-            self.history_panel = HistoryRecordsController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.history_panel.history_screen)
-
-        self.stack.setCurrentWidget(self.history_panel.history_screen)
+        self.stack.navigation.goto("history_panel")
     # def goto_statistics_panel(self):
     #     """Handle navigation to Statistics Panel screen."""
     #     print("-- Navigating to Statistics")
@@ -182,14 +150,7 @@ class CitizenPanelController(BaseFileController):
 
     def goto_trashbin_panel(self):
         print("-- Navigating to AdmiTrashhbin Panel")
-
-        if not hasattr(self, 'trashbin_panel'):
-            from Controllers.AdminController.AdminBinController import AdminBinController
-            self.trashbin_panel = AdminBinController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.trashbin_panel.trashbin_screen)
-        self.stack.setCurrentWidget(self.trashbin_panel.trashbin_screen)
+        self.stack.navigation.goto("trashbin_panel")
 
 
     # SUBPAGES : GOTO =================
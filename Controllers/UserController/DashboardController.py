@@ -1,10 +1,14 @@
+import time
+
 from PySide6.QtWidgets import QPushButton, QMessageBox, QApplication, QTableWidgetItem, QFrame, QLineEdit, QLabel
 from PySide6.QtGui import QPixmap, QIcon, Qt
 from Controllers.BaseFileController import BaseFileController
+from Controllers.NavigationManager import NavigationManager
+from Models.DashboardModel import fetch_account_info, fetch_dashboard_data
 from Utils.util_popup import load_popup
+from Utils.util_query_executor import QueryExecutor
 from Views.DashboardView import DashboardView
 from database import Database
-from passlib.hash import bcrypt
 
 
 class DashboardController(BaseFileController):
@@ -14,15 +18,27 @@ class DashboardController(BaseFileController):
         self.user_role = user_role
         self.view = DashboardView(self)
         self.sys_user_id = sys_user_id
+        # Static info popups are built once and re-shown; form popups are not
+        # cached because they carry per-use input and signal connections.
+        self.barangayinfo_popup = None
+        self.aboutsoftware_popup = None
 
 
+        started = time.perf_counter()
+        self.account_data = None
         self.dashboard_screen = self.load_ui("Resources/UIs/MainPages/dashboard.ui")
         self.stack.addWidget(self.dashboard_screen)
         self.view.setup_dashboard_ui(self.dashboard_screen)
-        self.load_recent_citizens_data()
-        self.load_account_info()
-        self.load_account_info_dashboard()
-        self.update_registered_citizens_count()
+        self.navigation = NavigationManager(
+            self, self.stack, login_window, emp_first_name, sys_user_id, user_role
+        )
+
+        # Show the shell right away; the figures arrive from the query executor,
+        # and the usual first panels are built once the dashboard has painted.
+        self.navigation.track_first_paint(
+            "dashboard", self.dashboard_screen, started, on_painted=self.navigation.prefetch
+        )
+        self.refresh_dashboard_data()
 
         admin_buttons = [
             self.dashboard_screen.findChild(QPushButton, "nav_buttonAdminPanel"),
@@ -47,69 +63,43 @@ class DashboardController(BaseFileController):
             if admin_frame:
                 admin_frame.setVisible(False)
 
-    def update_registered_citizens_count(self):
-        """Fetches and updates the total number of registered citizens (non-deleted)."""
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
+    def refresh_dashboard_data(self):
+        """Reloads the dashboard's figures on the query executor; the shell is already on screen."""
+        self.dashboard_data_requested = time.perf_counter()
+        QueryExecutor.instance().submit(
+            "dashboard_data", fetch_dashboard_data, self.sys_user_id,
+            on_result=self.apply_dashboard_data,
+            on_error=self.show_dashboard_data_error
+        )
 
-            # SQL query to count active (non-deleted) citizens
-            cursor.execute("""
-                SELECT COUNT(*) FROM CITIZEN WHERE CTZ_IS_DELETED = FALSE;
-            """)
-            result = cursor.fetchone()
+    def apply_dashboard_data(self, data):
+        recent_rows, account_row, citizen_count = data
+        self.populate_recent_citizens(recent_rows)
+        self.set_account_data(account_row)
+        self.populate_account_info_dashboard(account_row)
+        self.populate_registered_citizens_count(citizen_count)
+        self.navigation.metrics.record(
+            "dashboard", "data", (time.perf_counter() - self.dashboard_data_requested) * 1000
+        )
 
-            if result:
-                total_citizens = result[0]
-                label = self.dashboard_screen.findChild(QLabel, "label_TotalNumberRegisteredCitizen")
-                if label:
-                    label.setText('[ ' + str(total_citizens) + ' ]')
-                else:
-                    print("Label 'label_TotalNumberRegisteredCitizen' not found!")
-            else:
-                print("No data returned from database.")
-        except Exception as e:
-            QMessageBox.critical(self.dashboard_screen, "Database Error", f"Failed to load citizen count: {str(e)}")
-        finally:
-            if connection:
-                connection.close()
+    def show_dashboard_data_error(self, error):
+        print(f"Error loading dashboard data: {error}")
+        QMessageBox.critical(self.dashboard_screen, "Database Error", f"Failed to load dashboard data: {str(error)}")
+
+    def populate_registered_citizens_count(self, total_citizens):
+        """Shows the total number of registered citizens (non-deleted)."""
+        label = self.dashboard_screen.findChild(QLabel, "label_TotalNumberRegisteredCitizen")
+        if label:
+            label.setText('[ ' + str(total_citizens) + ' ]')
+        else:
+            print("Label 'label_TotalNumberRegisteredCitizen' not found!")
 
     def load_account_info(self):
         """Fetches and stores current user's system account information."""
         connection = None
         try:
             connection = Database()
-            cursor = connection.cursor
-            cursor.execute("""
-                SELECT 
-                    SYS_USER_ID,
-                    SYS_FNAME,
-                    SYS_MNAME,
-                    SYS_LNAME,
-                    SYS_ROLE
-                FROM SYSTEM_ACCOUNT
-                WHERE SYS_USER_ID = %s AND SYS_IS_ACTIVE = TRUE;
-            """, (self.sys_user_id,))
-            result = cursor.fetchone()
-
-            if result:
-                sys_user_id, fname, mname, lname, role = result
-                self.account_data = {
-                    "id": sys_user_id,
-                    "fname": fname,
-                    "mname": mname,
-                    "lname": lname,
-                    "role": role.title() if role else "N/A"
-                }
-            else:
-                self.account_data = {
-                    "id": "N/A",
-                    "fname": "N/A",
-                    "mname": "",
-                    "lname": "N/A",
-                    "role": "N/A"
-                }
+            self.set_account_data(fetch_account_info(connection, self.sys_user_id))
         except Exception as e:
             print(f"Error fetching account info: {e}")
             self.account_data = {
@@ -122,61 +112,58 @@ class DashboardController(BaseFileController):
         finally:
             if connection:
                 connection.close()
-    def load_account_info_dashboard(self):
-        """Fetches and displays the current user's system account information."""
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
-
-            # Query the SYSTEM_ACCOUNT table for the current user
-            cursor.execute("""
-                SELECT
-                    SYS_USER_ID,
-                    SYS_FNAME,
-                    SYS_MNAME,
-                    SYS_LNAME,
-                    SYS_ROLE
-                FROM SYSTEM_ACCOUNT
-                WHERE SYS_USER_ID = %s AND SYS_IS_ACTIVE = TRUE;
-            """, (self.sys_user_id,))
-
-            result = cursor.fetchone()
-
-            if result:
-                sys_user_id, fname, mname, lname, role = result
-
-                # Format full name: First Name M.I. Last Name
-                middle_initial = f"{mname[0]}." if mname and mname.strip() else ""
-                full_name = f"{fname} {middle_initial} {lname}".strip()
-
-                # Find labels by object names
-                id_label = self.dashboard_screen.findChild(QLabel, "data_empIDAccInfo")
-                name_label = self.dashboard_screen.findChild(QLabel, "data_empNameAccInfo")
-                role_label = self.dashboard_screen.findChild(QLabel, "data_empAccessRole")
-
-                # Update labels if found
-                if id_label:
-                    id_label.setText(str(sys_user_id))
-                else:
-                    print("Label 'data_empIDAccInfo' not found!")
-
-                if name_label:
-                    name_label.setText(full_name)
-                else:
-                    print("Label 'data_empNameAccInfo' not found!")
-
-                if role_label:
-                    role_label.setText(str(role).title())
-                else:
-                    print("Label 'data_empAccessRole' not found!")
-            else:
-                print("No active account found for the current user.")
-        except Exception as e:
-            QMessageBox.critical(self.dashboard_screen, "Database Error", f"Failed to load account info: {str(e)}")
-        finally:
-            if connection:
-                connection.close()
+
+    def set_account_data(self, result):
+        if result:
+            sys_user_id, fname, mname, lname, role = result
+            self.account_data = {
+                "id": sys_user_id,
+                "fname": fname,
+                "mname": mname,
+                "lname": lname,
+                "role": role.title() if role else "N/A"
+            }
+        else:
+            self.account_data = {
+                "id": "N/A",
+                "fname": "N/A",
+                "mname": "",
+                "lname": "N/A",
+                "role": "N/A"
+            }
+
+    def populate_account_info_dashboard(self, result):
+        """Displays the current user's system account information."""
+        if not result:
+            print("No active account found for the current user.")
+            return
+
+        sys_user_id, fname, mname, lname, role = result
+
+        # Format full name: First Name M.I. Last Name
+        middle_initial = f"{mname[0]}." if mname and mname.strip() else ""
+        full_name = f"{fname} {middle_initial} {lname}".strip()
+
+        # Find labels by object names
+        id_label = self.dashboard_screen.findChild(QLabel, "data_empIDAccInfo")
+        name_label = self.dashboard_screen.findChild(QLabel, "data_empNameAccInfo")
+        role_label = self.dashboard_screen.findChild(QLabel, "data_empAccessRole")
+
+        # Update labels if found
+        if id_label:
+            id_label.setText(str(sys_user_id))
+        else:
+            print("Label 'data_empIDAccInfo' not found!")
+
+        if name_label:
+            name_label.setText(full_name)
+        else:
+            print("Label 'data_empNameAccInfo' not found!")
+
+        if role_label:
+            role_label.setText(str(role).title())
+        else:
+            print("Label 'data_empAccessRole' not found!")
 
     # def load_account_info(self):
     #     """Fetches and displays the current user's system account information."""
@@ -262,106 +249,45 @@ class DashboardController(BaseFileController):
 
     def goto_admin_panel(self):
         print("-- Navigating to Admin Panel")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'admin_panel'):
-            from Controllers.AdminController.AdminPanelController import AdminPanelController
-            self.admin_panel = AdminPanelController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.admin_panel.admin_panel_screen)
-        self.stack.setCurrentWidget(self.admin_panel.admin_panel_screen)
+        self.navigation.goto("admin_panel")
 
     def goto_trashbin_panel(self):
         print("-- Navigating to AdmiTrashhbin Panel")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'trashbin_panel'):
-            from Controllers.AdminController.AdminBinController import AdminBinController
-            self.trashbin_panel = AdminBinController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.trashbin_panel.trashbin_screen)
-        self.stack.setCurrentWidget(self.trashbin_panel.trashbin_screen)
+        self.navigation.goto("trashbin_panel")
 
     def goto_activity_logs(self):
         print("-- Navigating to Activity Logs")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'activity_logs'):
-            from Controllers.AdminController.ActivityLogsController import ActivityLogsController
-            self.activity_logs = ActivityLogsController(
-                self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack
-            )
-            self.stack.addWidget(self.activity_logs.activity_logs_screen)
-        self.stack.setCurrentWidget(self.activity_logs.activity_logs_screen)
+        self.navigation.goto("activity_logs")
 
 
     def goto_citizen_panel(self):
         """Handle navigation to Citizen Panel screen."""
         print("-- Navigating to Citizen Panel")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'citizen_panel'):
-            from Controllers.UserController.CitizenPanelController import CitizenPanelController
-            self.citizen_panel = CitizenPanelController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.citizen_panel.citizen_panel_screen)
-
-        self.stack.setCurrentWidget(self.citizen_panel.citizen_panel_screen)
+        self.navigation.goto("citizen_panel")
 
     def goto_statistics_panel(self):
         """Handle navigation to Statistics Panel screen."""
         print("-- Navigating to Statistics")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'statistics_panel'):
-            from Controllers.UserController.StatisticsController import StatisticsController
-            self.statistics_panel = StatisticsController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.statistics_panel.statistics_screen)
-
-        self.stack.setCurrentWidget(self.statistics_panel.statistics_screen)
+        self.navigation.goto("statistics_panel")
 
 
 
     def goto_institutions_panel(self):
         """Handle navigation to Institutions Panel screen."""
         print("-- Navigating to Institutions")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'institutions_panel'):
-            from Controllers.UserController.InstitutionController import InstitutionsController
-            self.institutions_panel = InstitutionsController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.institutions_panel.institutions_screen)
-
-        self.stack.setCurrentWidget(self.institutions_panel.institutions_screen)
+        self.navigation.goto("institutions_panel")
 
     def goto_transactions_panel(self):
         """Handle navigation to Transactions Panel screen."""
         print("-- Navigating to Transactions")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'transactions_panel'):
-            from Controllers.UserController.TransactionController import TransactionController
-            self.transactions_panel = TransactionController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.transactions_panel.transactions_screen)
-
-        self.stack.setCurrentWidget(self.transactions_panel.transactions_screen)
+        self.navigation.goto("transactions_panel")
 
     def goto_history_panel(self):
         """Handle navigation to History Records Panel screen."""
         print("-- Navigating to History Records")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        if not hasattr(self, 'history_panel'):
-            from Controllers.UserController.HistoryRecordsController import HistoryRecordsController
-            self.history_panel = HistoryRecordsController(self.login_window, self.emp_first_name, self.sys_user_id, self.user_role, self.stack)
-            self.stack.addWidget(self.history_panel.history_screen)
-
-        self.stack.setCurrentWidget(self.history_panel.history_screen)
+        self.navigation.goto("history_panel")
 
     def logout(self):
-        self.load_account_info()
-        self.load_recent_citizens_data()
         confirmation = QMessageBox.question(
             self,
             "Confirm Logout",
@@ -373,92 +299,63 @@ class DashboardController(BaseFileController):
             self.login_window.show()
             self.login_window.clear_fields()
 
-    def load_recent_citizens_data(self):
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
-
-            # SQL Query to fetch recently added citizens with middle name
-            cursor.execute("""
-                SELECT 
-                    C.CTZ_ID, -- 0
-                    C.HH_ID, -- 2
-                    C.CTZ_LAST_NAME, -- 1
-                    C.CTZ_FIRST_NAME, -- 3
-                    C.CTZ_MIDDLE_NAME, -- 4
-                    FLOOR(EXTRACT(YEAR FROM AGE(CURRENT_DATE, C.CTZ_DATE_OF_BIRTH))) AS CTZ_AGE, -- 5
-                    C.CTZ_SEX, -- 6
-                    S.SITIO_NAME, -- 7
-                    TO_CHAR(C.CTZ_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED_FORMATTED -- 8
-                FROM CITIZEN C
-                JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
-                WHERE C.CTZ_IS_DELETED = FALSE AND C.CTZ_IS_ALIVE = TRUE
-                ORDER BY C.CTZ_DATE_ENCODED ASC
-                LIMIT 10;
-            """)
-            rows = cursor.fetchall()
-            self.citizen_rows = rows  # Optional: store data if needed later
-
-            # Configure the dashboard table
-            table = self.dashboard_screen.table_recentlyAddedCitizensDashboard
-            table.setRowCount(len(rows))
-            table.setColumnCount(9)  # Increased to 9 columns for Middle Name
-            table.setHorizontalHeaderLabels([
-                "Citizen ID", "Household ID", "Family Name", "First Name",
-                "Middle Name", "Age", "Sex", "Sitio", "Date Encoded"
-            ])
-
-            # Set column widths (adjust as needed)
-            table.setColumnWidth(0, 80)  # CTZ ID
-            table.setColumnWidth(1, 150)  # Family Name
-            table.setColumnWidth(2, 120)  # Household ID
-            table.setColumnWidth(3, 150)  # First Name
-            table.setColumnWidth(4, 150)  # Middle Name
-            table.setColumnWidth(5, 60)  # Age
-            table.setColumnWidth(6, 60)  # Sex
-            table.setColumnWidth(7, 150)  # Sitio
-            table.setColumnWidth(8, 200)  # Date Encoded
-
-            # Populate the table with data
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, value in enumerate(row_data):
-                    item = QTableWidgetItem(str(value))
-                    table.setItem(row_idx, col_idx, item)
-
-            # Optional: Enable sorting or other features
-            table.sortByColumn(8, Qt.DescendingOrder)  # Sort by Date Encoded (descending)
-            table.setSortingEnabled(True)
-
-        except Exception as e:
-            QMessageBox.critical(self.dashboard_screen, "Database Error", str(e))
-        finally:
-            if connection:
-                connection
+    def populate_recent_citizens(self, rows):
+        self.citizen_rows = rows  # Optional: store data if needed later
+
+        # Configure the dashboard table
+        table = self.dashboard_screen.table_recentlyAddedCitizensDashboard
+        table.setSortingEnabled(False)  # so a refresh fills the rows where they are put
+        table.setRowCount(len(rows))
+        table.setColumnCount(9)  # Increased to 9 columns for Middle Name
+        table.setHorizontalHeaderLabels([
+            "Citizen ID", "Household ID", "Family Name", "First Name",
+            "Middle Name", "Age", "Sex", "Sitio", "Date Encoded"
+        ])
+
+        # Set column widths (adjust as needed)
+        table.setColumnWidth(0, 80)  # CTZ ID
+        table.setColumnWidth(1, 150)  # Family Name
+        table.setColumnWidth(2, 120)  # Household ID
+        table.setColumnWidth(3, 150)  # First Name
+        table.setColumnWidth(4, 150)  # Middle Name
+        table.setColumnWidth(5, 60)  # Age
+        table.setColumnWidth(6, 60)  # Sex
+        table.setColumnWidth(7, 150)  # Sitio
+        table.setColumnWidth(8, 200)  # Date Encoded
+
+        # Populate the table with data
+        for row_idx, row_data in enumerate(rows):
+            for col_idx, value in enumerate(row_data):
+                item = QTableWidgetItem(str(value))
+                table.setItem(row_idx, col_idx, item)
+
+        # Optional: Enable sorting or other features
+        table.sortByColumn(8, Qt.DescendingOrder)  # Sort by Date Encoded (descending)
+        table.setSortingEnabled(True)
 
     def show_barangayinfo_popup(self):
         print("-- Navigating to Dashboard > Barangay Info")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        popup = load_popup("Resources/UIs/PopUp/Screen_Dashboard/barangayinfo.ui", self)
-        popup.setWindowTitle("Barangay Information")
-        popup.brgyinfo_imageLogo.setPixmap(QPixmap("Resources/Images/General_Images/logo_brgyClear.png"))
-        popup.setWindowModality(Qt.ApplicationModal)
-        popup.setFixedSize(popup.size())
-        popup.show()
+        if self.barangayinfo_popup is None:
+            popup = load_popup("Resources/UIs/PopUp/Screen_Dashboard/barangayinfo.ui", self)
+            popup.setWindowTitle("Barangay Information")
+            popup.brgyinfo_imageLogo.setPixmap(QPixmap("Resources/Images/General_Images/logo_brgyClear.png"))
+            popup.setWindowModality(Qt.ApplicationModal)
+            popup.setFixedSize(popup.size())
+            self.barangayinfo_popup = popup
+        self.barangayinfo_popup.show()
 
     def show_aboutsoftware_popup(self):
         print("-- Navigating to Dashboard > About Software")
-        self.load_account_info()
-        self.load_recent_citizens_data()
-        popup = load_popup("Resources/UIs/PopUp/Screen_Dashboard/aboutsoftware.ui", self)
-        popup.setWindowTitle("About the Software")
-        popup.aboutsoftwareinfo_imageRavenLabs.setPixmap(QPixmap("Resources/Icons/AppIcons/icon_ravenlabs.png"))
-        popup.aboutsoftwareinfo_imageCTULOGO.setPixmap(QPixmap("Resources/Images/General_Images/img_ctulogo.png"))
-        popup.aboutsoftwareinfo_imageLogo.setPixmap(QPixmap("Resources/Images/General_Images/img_mainappicon.png"))
-        popup.setWindowModality(Qt.ApplicationModal)
-        popup.setFixedSize(popup.size())
-        popup.show()
+        if self.aboutsoftware_popup is None:
+            popup = load_popup("Resources/UIs/PopUp/Screen_Dashboard/aboutsoftware.ui", self)
+            popup.setWindowTitle("About the Software")
+            popup.aboutsoftwareinfo_imageRavenLabs.setPixmap(QPixmap("Resources/Icons/AppIcons/icon_ravenlabs.png"))
+            popup.aboutsoftwareinfo_imageCTULOGO.setPixmap(QPixmap("Resources/Images/General_Images/img_ctulogo.png"))
+            popup.aboutsoftwareinfo_imageLogo.setPixmap(QPixmap("Resources/Images/General_Images/img_mainappicon.png"))
+            popup.setWindowModality(Qt.ApplicationModal)
+            popup.setFixedSize(popup.size())
+            self.aboutsoftware_popup = popup
+        self.aboutsoftware_popup.show()
 
     def show_account_popup(self):
         print("-- Navigating to Dashboard > Your Account")
@@ -469,7 +366,6 @@ class DashboardController(BaseFileController):
         popup.employeeaccount_buttonChangePIN.setIcon(QIcon('Resources/Icons/FuncIcons/icon_changepin2.svg'))
 
         self.load_account_info()
-        self.load_recent_citizens_data()
         # Labels inside the popup
         sys_id_label = popup.findChild(QLabel, "sysacc_displaySysID")
         fname_label = popup.findChild(QLabel, "employeeacc_displayfname")
@@ -551,6 +447,8 @@ class DashboardController(BaseFileController):
         save_btn = changepin_popup.findChild(QPushButton, "acc_buttonConfirmChangePIN_SaveForm")
         if save_btn and current_pin_field and new_pin_field and confirm_pin_field:
             def confirm_and_save():
+                from passlib.hash import bcrypt
+
                 # Retrieve input values
                 current_pin = current_pin_field.text().strip()
                 new_pin = new_pin_field.text().strip()
@@ -3,6 +3,7 @@ from PySide6.QtWidgets import QMessageBox, QPushButton, QTableWidgetItem
 
 from Controllers.BaseFileController import BaseFileController
 from Models.HistoryModel import HistoryModel
+from Models.LookupCache import LookupCache
 from Utils.util_popup import load_popup
 from Views.HistoryRecords.CitizenHistoryView import CitizenHistoryView
 from database import Database
@@ -314,10 +315,7 @@ LIMIT 50;
 
     def load_history_type_into_popup(self, selected_hist_id=None):
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT hist_id, hist_type_name FROM HISTORY_TYPE ORDER BY hist_type_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("history_type")
 
             combo = self.popup.record_comboBox_citizenhistory_type
             combo.clear()
@@ -329,8 +327,6 @@ LIMIT 50;
 
         except Exception as e:
             QMessageBox.critical(self.popup, "Database Error", f"Failed to load history types: {str(e)}")
-        finally:
-            db.close()
 
     def save_updated_citizen_history(self, cihi_id):
         try:
@@ -2,6 +2,7 @@ from PySide6.QtGui import QIcon, Qt
 from PySide6.QtWidgets import QMessageBox, QPushButton, QTableWidgetItem
 
 from Controllers.BaseFileController import BaseFileController
+from Models.LookupCache import LookupCache
 from Utils.util_popup import load_popup
 from database import Database
 
@@ -312,18 +313,13 @@ class MedicalHistoryController(BaseFileController):
 
     def load_medical_history_types(self):
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT MHT_ID, MHT_TYPE_NAME FROM MEDICAL_HISTORY_TYPE ORDER BY MHT_TYPE_NAME ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("medical_history_type")
             combo = self.popup.register_citizen_comboBox_MedicalHistoryOption
             combo.clear()
             for mht_id, mht_name in results:
                 combo.addItem(mht_name, mht_id)
         except Exception as e:
             print(f"Failed to load medical history types: {e}")
-        finally:
-            db.close()
     def search_medical_history_data(self):
         search_term = self.hist_medical_history_screen.histrec_HistoryID_fieldSearch.text().strip()
 
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QMessageBox, QPushButton, QTableWidgetItem
 from Controllers.BaseFileController import BaseFileController
 from Utils.util_popup import load_popup
 from database import Database
+from Utils.util_debounced_search import DebouncedSearch
 
 
 class SettlementHistoryController(BaseFileController):
@@ -15,6 +16,13 @@ class SettlementHistoryController(BaseFileController):
         self.stack = stack
         self.hist_settlement_history_screen = self.load_ui("Resources/UIs/MainPages/HistoryRecordPages/settlement_history.ui")
         self.setup_settlement_history_ui()
+        self.settlement_history_search = DebouncedSearch(
+            self.hist_settlement_history_screen.histrec_SettlementID_fieldSearch,
+            self.fetch_settlement_history_search, self._populate_settlement_history_table,
+            key="settlement_history_search",
+            on_empty=self.load_settlement_history_data,
+            on_error=self.show_settlement_history_search_error
+        )
         self.center_on_screen()
         self.load_settlement_history_data()
 
@@ -46,64 +54,55 @@ class SettlementHistoryController(BaseFileController):
             self.search_settlement_history_data)
 
     def search_settlement_history_data(self):
-        search_term = self.hist_settlement_history_screen.histrec_SettlementID_fieldSearch.text().strip()
-
-        if not search_term:
-            self.load_settlement_history_data()
-            return
-
-        connection = None
-        try:
-            connection = Database()
-            cursor = connection.cursor
-            query = """
-                SELECT 
-                    SL.SETT_ID,
-                    C1.CTZ_ID AS COMPLAINEE_CITIZEN_ID,
-                    C1.CTZ_FIRST_NAME || ' ' || C1.CTZ_LAST_NAME AS COMPLAINEE_NAME,
-                    C2.COMP_FNAME || ' ' || C2.COMP_LNAME AS COMPLAINANT_NAME,
-                    SL.SETT_COMPLAINT_DESCRIPTION,
-                    SL.SETT_SETTLEMENT_DESCRIPTION,
-                    TO_CHAR(SL.SETT_DATE_OF_SETTLEMENT, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_OF_SETTLEMENT,
-                    TO_CHAR(SL.SETT_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED,
-                    TO_CHAR(SL.SETT_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED,
-                    CASE 
-                        WHEN SA.SYS_FNAME IS NULL THEN 'System'
-                        ELSE SA.SYS_FNAME || ' ' || 
-                             COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || 
-                             SA.SYS_LNAME
-                    END AS ENCODED_BY,
-                    CASE 
-                        WHEN SUA.SYS_FNAME IS NULL THEN 'System'
-                        ELSE SUA.SYS_FNAME || ' ' || 
-                             COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || 
-                             SUA.SYS_LNAME
-                    END AS UPDATED_BY
-                FROM SETTLEMENT_LOG SL
-                JOIN COMPLAINANT C2 ON SL.COMP_ID = C2.COMP_ID
-                JOIN CITIZEN_HISTORY CH ON SL.CIHI_ID = CH.CIHI_ID
-                JOIN CITIZEN C1 ON CH.CTZ_ID = C1.CTZ_ID
-                LEFT JOIN SYSTEM_ACCOUNT SA ON SL.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
-                LEFT JOIN SYSTEM_ACCOUNT SUA ON SL.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
-                WHERE SL.SETT_IS_DELETED = FALSE AND CAST(SL.SETT_ID AS TEXT) ILIKE %s OR
-                      C1.CTZ_FIRST_NAME ILIKE %s OR
-                      C1.CTZ_LAST_NAME ILIKE %s OR
-                      C2.COMP_FNAME ILIKE %s OR
-                      C2.COMP_LNAME ILIKE %s OR
-                      C1.CTZ_ID::TEXT ILIKE %s
-                ORDER BY SL.SETT_DATE_ENCODED DESC
-                LIMIT 50;
-            """
-            search_param = f"%{search_term}%"
-            cursor.execute(query, (search_param, search_param, search_param, search_param, search_param, search_param))
-            rows = cursor.fetchall()
-            self._populate_settlement_history_table(rows)
-
-        except Exception as e:
-            QMessageBox.critical(self.hist_settlement_history_screen, "Database Error", str(e))
-        finally:
-            if connection:
-                connection.close()
+        self.settlement_history_search.run()
+
+    @staticmethod
+    def fetch_settlement_history_search(db, search_text):
+        query = """
+            SELECT 
+                SL.SETT_ID,
+                C1.CTZ_ID AS COMPLAINEE_CITIZEN_ID,
+                C1.CTZ_FIRST_NAME || ' ' || C1.CTZ_LAST_NAME AS COMPLAINEE_NAME,
+                C2.COMP_FNAME || ' ' || C2.COMP_LNAME AS COMPLAINANT_NAME,
+                SL.SETT_COMPLAINT_DESCRIPTION,
+                SL.SETT_SETTLEMENT_DESCRIPTION,
+                TO_CHAR(SL.SETT_DATE_OF_SETTLEMENT, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_OF_SETTLEMENT,
+                TO_CHAR(SL.SETT_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED,
+                TO_CHAR(SL.SETT_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED,
+                CASE 
+                    WHEN SA.SYS_FNAME IS NULL THEN 'System'
+                    ELSE SA.SYS_FNAME || ' ' || 
+                         COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || 
+                         SA.SYS_LNAME
+                END AS ENCODED_BY,
+                CASE 
+                    WHEN SUA.SYS_FNAME IS NULL THEN 'System'
+                    ELSE SUA.SYS_FNAME || ' ' || 
+                         COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || 
+                         SUA.SYS_LNAME
+                END AS UPDATED_BY
+            FROM SETTLEMENT_LOG SL
+            JOIN COMPLAINANT C2 ON SL.COMP_ID = C2.COMP_ID
+            JOIN CITIZEN_HISTORY CH ON SL.CIHI_ID = CH.CIHI_ID
+            JOIN CITIZEN C1 ON CH.CTZ_ID = C1.CTZ_ID
+            LEFT JOIN SYSTEM_ACCOUNT SA ON SL.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
+            LEFT JOIN SYSTEM_ACCOUNT SUA ON SL.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
+            WHERE SL.SETT_IS_DELETED = FALSE AND CAST(SL.SETT_ID AS TEXT) ILIKE %s OR
+                  C1.CTZ_FIRST_NAME ILIKE %s OR
+                  C1.CTZ_LAST_NAME ILIKE %s OR
+                  C2.COMP_FNAME ILIKE %s OR
+                  C2.COMP_LNAME ILIKE %s OR
+                  C1.CTZ_ID::TEXT ILIKE %s
+            ORDER BY SL.SETT_DATE_ENCODED DESC
+            LIMIT 50;
+        """
+        cursor = db.get_cursor()
+        search_param = f"%{search_text}%"
+        cursor.execute(query, (search_param, search_param, search_param, search_param, search_param, search_param))
+        return cursor.fetchall()
+
+    def show_settlement_history_search_error(self, error):
+        QMessageBox.critical(self.hist_settlement_history_screen, "Database Error", str(error))
 
     def show_update_settlement_popup(self):
         if not getattr(self, 'selected_settlement_id', None):
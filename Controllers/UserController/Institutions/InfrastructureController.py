@@ -1,6 +1,7 @@
 from PySide6.QtGui import QIcon, Qt
 from PySide6.QtWidgets import QMessageBox, QPushButton, QButtonGroup, QRadioButton, QTableWidgetItem
 from Controllers.BaseFileController import BaseFileController
+from Models.LookupCache import LookupCache
 from Utils.util_popup import load_popup
 from database import Database
 
@@ -524,18 +525,13 @@ class InfrastructureController(BaseFileController):
 
     def load_infra_type_list(self):
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT inft_id, inft_type_name FROM infrastructure_type ORDER BY inft_type_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("infrastructure_type")
             combo = self.popup.register_comboBox_InfraType
             combo.clear()
             for inft_id, inft_type_name in results:
                 combo.addItem(inft_type_name, inft_id)
         except Exception as e:
             print(f"Failed to load infrastructure types: {e}")
-        finally:
-            db.close()
 
     def setup_radio_button_groups_infrastructure(self):
         radio_PP = QButtonGroup(self.popup)
@@ -3,7 +3,10 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QMessageBox
 
 from Controllers.BaseFileController import BaseFileController
+from Models.ExportService import export_statistics
 from Models.Statistics.DemographicModel import DemographicModel
+from Utils.util_export import start_export
+from Utils.util_query_executor import QueryExecutor
 
 
 class DemographicsController(BaseFileController):
@@ -13,7 +16,7 @@ class DemographicsController(BaseFileController):
 
         self.stack = stack
         self.view = self.load_ui("Resources/UIs/MainPages/StatisticPages/demographic.ui")
-        self.model = DemographicModel()
+        self.executor = QueryExecutor.instance()
 
         # Initialize UI and data
         self.setup_view()
@@ -30,6 +33,7 @@ class DemographicsController(BaseFileController):
         # Set icons
         icons = {
             'btn_returnToStatisticsPage': 'Resources/Icons/FuncIcons/img_return.png',
+            'btn_export': 'Resources/Icons/FuncIcons/icon_export.svg',
             'icon_male': 'Resources/Icons/FuncIcons/icon_male.png',
             'icon_female': 'Resources/Icons/FuncIcons/icon_female.png'
         }
@@ -50,27 +54,43 @@ class DemographicsController(BaseFileController):
     def setup_connections(self):
         self.view.btn_returnToStatisticsPage.clicked.connect(self.goto_statistics_panel)
         self.view.filter_stat_date_button.clicked.connect(self.refresh_statistics)
+        self.view.btn_export.clicked.connect(self.export_statistics)
 
     def refresh_statistics(self):
+        from_date, to_date = self.get_date_range()
+        self.executor.submit(
+            "demographics", self.fetch_statistics, from_date, to_date,
+            on_result=self.apply_statistics,
+            on_error=self.on_statistics_error
+        )
+
+    @staticmethod
+    def fetch_statistics(db, from_date, to_date):
+        """Runs on a query worker thread."""
+        return DemographicModel(db).get_demographic_summary(from_date, to_date)
+
+    def apply_statistics(self, data):
         try:
-            self.populate_population_overview()
-            self.populate_age_group()
-            self.populate_voter_statistics()
-            self.populate_socio_economic_distribution()
-            self.populate_civil_status_distribution()
-            self.populate_religion_distribution()
+            self.populate_population_overview(data.population)
+            self.populate_age_group(data.age_group)
+            self.populate_voter_statistics(data.voter)
+            self.populate_socio_economic_distribution(data.socio_economic)
+            self.populate_civil_status_distribution(data.civil_status)
+            self.populate_religion_distribution(data.religion)
         except Exception as e:
-            self.show_error_message(
-                "Data Loading Error",
-                "Failed to refresh statistics. Please try again later."
-            )
-            print(f"Error refreshing statistics: {e}")
+            self.on_statistics_error(e)
+
+    def on_statistics_error(self, error):
+        self.show_error_message(
+            "Data Loading Error",
+            "Failed to refresh statistics. Please try again later."
+        )
+        print(f"Error refreshing statistics: {error}")
 
     #Update population overview statistics
-    def populate_population_overview(self):
-        from_date, to_date = self.get_date_range()
+    def populate_population_overview(self, counts):
         try:
-            male, female, ip_count, deceased = self.model.get_population_counts(from_date, to_date)
+            male, female, ip_count, deceased = counts
 
             self.view.demo_TotalMale.setText(f"{male:,}")
             self.view.demo_TotalFemale.setText(f"{female:,}")
@@ -87,10 +107,8 @@ class DemographicsController(BaseFileController):
 
 
     #Update age group statistics
-    def populate_age_group(self):
-        from_date, to_date = self.get_date_range()
+    def populate_age_group(self, age_counts):
         try:
-            age_counts = self.model.get_age_group_counts(from_date, to_date)
             if not age_counts or len(age_counts) != 7:
                 raise ValueError("Unexpected result structure for age group counts.")
 
@@ -116,14 +134,11 @@ class DemographicsController(BaseFileController):
 
 
     #Update civil status distribution statistics
-    def populate_civil_status_distribution(self):
-        from_date, to_date = self.get_date_range()
-
+    def populate_civil_status_distribution(self, civil_status_data):
         # Reset all values first
         self.reset_civil_status_distribution()
 
         try:
-            civil_status_data = self.model.get_civil_status_distribution(from_date, to_date)
             if not civil_status_data:
                 return
 
@@ -164,10 +179,8 @@ class DemographicsController(BaseFileController):
 
 
     #Update voter statistics
-    def populate_voter_statistics(self):
-        from_date, to_date = self.get_date_range()
+    def populate_voter_statistics(self, stats):
         try:
-            stats = self.model.get_voter_statistics(from_date, to_date)
             if len(stats) != 9:
                 raise ValueError("Unexpected number of voter statistics returned")
 
@@ -200,13 +213,10 @@ class DemographicsController(BaseFileController):
 
 
     #Update socio-economic distribution statistics
-    def populate_socio_economic_distribution(self):
-        from_date, to_date = self.get_date_range()
-
+    def populate_socio_economic_distribution(self, data):
         self.reset_socio_economic_distribution()
 
         try:
-            data = self.model.get_socio_economic_distribution(from_date, to_date)
             if not data:
                 return
 
@@ -228,13 +238,10 @@ class DemographicsController(BaseFileController):
 
 
     #Update religion distribution statistics
-    def populate_religion_distribution(self):
-        from_date, to_date = self.get_date_range()
-
+    def populate_religion_distribution(self, data):
         self.reset_religion_distribution()
 
         try:
-            data = self.model.get_religion_distribution(from_date, to_date)
             if not data:
                 return
 
@@ -345,6 +352,11 @@ class DemographicsController(BaseFileController):
             QMessageBox.Ok
         )
 
+    def export_statistics(self):
+        from_date, to_date = self.get_date_range()
+        start_export(self, "export_demographics", "Demographics Statistics", export_statistics,
+                     DemographicModel, "Demographics", from_date, to_date)
+
     # Get and validate the selected date range
     def get_date_range(self):
         from_date = self.view.filter_date_min.date().toPython()
@@ -3,7 +3,9 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QMessageBox, QTableWidgetItem, QHeaderView
 
 from Controllers.BaseFileController import BaseFileController
+from Models.ExportService import export_statistics
 from Models.Statistics.HealthModel import HealthModel
+from Utils.util_export import start_export
 
 
 class HealthController(BaseFileController):
@@ -25,6 +27,7 @@ class HealthController(BaseFileController):
     def setup_connections(self):
         self.view.btn_returnToStatisticsPage.clicked.connect(self.goto_statistics_panel)
         self.view.filter_stat_date_button.clicked.connect(self.refresh_statistics)
+        self.view.btn_export.clicked.connect(self.export_statistics)
 
     def setup_view(self):
         self.setFixedSize(1350, 850)
@@ -33,6 +36,7 @@ class HealthController(BaseFileController):
 
         # Set images and icons
         self.view.btn_returnToStatisticsPage.setIcon(QIcon('Resources/Icons/FuncIcons/img_return.png'))
+        self.view.btn_export.setIcon(QIcon('Resources/Icons/FuncIcons/icon_export.svg'))
 
         # Initialize date filters
         today = QDate.currentDate()
@@ -228,6 +232,11 @@ class HealthController(BaseFileController):
             )
             print(f"Error refreshing statistics: {e}")
 
+    def export_statistics(self):
+        from_date, to_date = self.get_date_range()
+        start_export(self, "export_health", "Health Statistics", export_statistics,
+                     HealthModel, "Health", from_date, to_date)
+
     #Get and validate the selected date range
     def get_date_range(self):
         from_date = self.view.filter_date_min.date().toPython()
@@ -0,0 +1,335 @@
+import csv
+import datetime
+import gzip
+import os
+import re
+import sys
+
+from database import Database
+
+# Months of SYSTEM_ACTIVITY_LOG kept in the database; older monthly partitions
+# are detached, written to ARCHIVE_DIR as gzipped CSV and dropped.
+ACTIVITY_LOG_RETENTION_MONTHS = 12
+PARTITIONS_AHEAD = 2
+ARCHIVE_DIR = os.path.join("Archives", "ActivityLog")
+# How long the DETACH waits for its lock before leaving the month for the next run.
+ARCHIVE_LOCK_TIMEOUT = "2s"
+# Table comment restore_month() puts on a month it re-attaches. Retention leaves
+# such months alone until release_month() clears it.
+RESTORED_COMMENT = "restored from archive"
+
+ARCHIVE_COLUMNS = (
+    "ACT_ID", "ACT_TIMESTAMP", "ACT_ACTION_TYPE", "ACT_TABLE_NAME",
+    "ACT_ENTITY_ID", "ACT_DESCRIPTION", "SYS_USER_ID"
+)
+
+_PARTITION_NAME = re.compile(r"^system_activity_log_y(\d{4})m(\d{2})$")
+
+MONTHLY_PARTITIONS_QUERY = """
+    SELECT c.relname, obj_description(c.oid, 'pg_class')
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'system_activity_log'::regclass
+    ORDER BY c.relname;
+"""
+
+# One-off conversion of a database created before the log was partitioned.
+# Existing rows keep their ACT_IDs and the same sequence keeps numbering them.
+CONVERT_TO_PARTITIONED = [
+    "LOCK TABLE SYSTEM_ACTIVITY_LOG IN ACCESS EXCLUSIVE MODE;",
+    "ALTER TABLE SYSTEM_ACTIVITY_LOG RENAME TO SYSTEM_ACTIVITY_LOG_UNPARTITIONED;",
+    """
+    CREATE TABLE SYSTEM_ACTIVITY_LOG(
+        ACT_ID INT NOT NULL DEFAULT nextval('system_activity_log_act_id_seq'),
+        ACT_TIMESTAMP TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        ACT_ACTION_TYPE action_type_enum,
+        ACT_TABLE_NAME VARCHAR(50) NOT NULL,
+        ACT_ENTITY_ID INT,
+        ACT_DESCRIPTION TEXT,
+        SYS_USER_ID INT REFERENCES SYSTEM_ACCOUNT(SYS_USER_ID) ON DELETE RESTRICT ON UPDATE CASCADE,
+        PRIMARY KEY (ACT_ID, ACT_TIMESTAMP)
+    ) PARTITION BY RANGE (ACT_TIMESTAMP);
+    """,
+    "CREATE TABLE SYSTEM_ACTIVITY_LOG_DEFAULT PARTITION OF SYSTEM_ACTIVITY_LOG DEFAULT;",
+    "ALTER SEQUENCE system_activity_log_act_id_seq OWNED BY SYSTEM_ACTIVITY_LOG.ACT_ID;",
+    """
+    SELECT ensure_activity_log_partitions(
+        COALESCE((SELECT MIN(ACT_TIMESTAMP) FROM SYSTEM_ACTIVITY_LOG_UNPARTITIONED)::DATE, CURRENT_DATE)
+    );
+    """,
+    """
+    INSERT INTO SYSTEM_ACTIVITY_LOG
+    SELECT ACT_ID, COALESCE(ACT_TIMESTAMP, '-infinity'), ACT_ACTION_TYPE, ACT_TABLE_NAME,
+           ACT_ENTITY_ID, ACT_DESCRIPTION, SYS_USER_ID
+    FROM SYSTEM_ACTIVITY_LOG_UNPARTITIONED;
+    """,
+    "DROP TABLE SYSTEM_ACTIVITY_LOG_UNPARTITIONED;",
+    # Same as the ACTIVITY LOG indexes in mnhs_barangay_new_query.sql.
+    """
+    CREATE INDEX IF NOT EXISTS idx_activity_log_timestamp
+        ON SYSTEM_ACTIVITY_LOG (ACT_TIMESTAMP DESC, ACT_ID DESC);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_activity_log_user
+        ON SYSTEM_ACTIVITY_LOG (SYS_USER_ID, ACT_TIMESTAMP DESC, ACT_ID DESC);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_activity_log_table
+        ON SYSTEM_ACTIVITY_LOG (ACT_TABLE_NAME, ACT_TIMESTAMP DESC, ACT_ID DESC);
+    """,
+]
+
+
+def partition_name(month):
+    return f"system_activity_log_y{month.year:04d}m{month.month:02d}"
+
+
+def archive_path(month, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, f"{partition_name(month)}.csv.gz")
+
+
+def _month_of(name):
+    match = _PARTITION_NAME.match(name)
+    return datetime.date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def _months_before(day, months):
+    index = day.year * 12 + day.month - 1 - months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def _partitions(db):
+    cursor = db.get_cursor()
+    cursor.execute(MONTHLY_PARTITIONS_QUERY)
+    partitions = ((_month_of(name), comment) for name, comment in cursor.fetchall())
+    return [(month, comment) for month, comment in partitions if month]
+
+
+def monthly_partitions(db):
+    """The months that are attached as partitions, oldest first."""
+    return [month for month, _ in _partitions(db)]
+
+
+def restored_months(db):
+    """The attached months that restore_month() brought back, oldest first."""
+    return [month for month, comment in _partitions(db) if comment == RESTORED_COMMENT]
+
+
+def archived_months(archive_dir=ARCHIVE_DIR):
+    if not os.path.isdir(archive_dir):
+        return []
+    names = (file[:-len(".csv.gz")] for file in os.listdir(archive_dir) if file.endswith(".csv.gz"))
+    return sorted(month for month in map(_month_of, names) if month)
+
+
+def ensure_partitions(db, months_ahead=PARTITIONS_AHEAD):
+    cursor = db.get_cursor()
+    cursor.execute("SELECT ensure_activity_log_partitions(CURRENT_DATE, %s);", (months_ahead,))
+    created = cursor.fetchone()[0]
+    db.conn.commit()
+    return created
+
+
+def _write_archive(db, name, path):
+    """COPYs an attached month to path as gzipped CSV. Returns (rows, highest ACT_ID).
+
+    Reads the partition directly, so writers to SYSTEM_ACTIVITY_LOG are not blocked.
+    """
+    temp_path = path + ".part"
+    cursor = db.conn.cursor()
+    try:
+        cursor.execute(f"SELECT COUNT(*), MAX(ACT_ID) FROM {name};")
+        expected, last_id = cursor.fetchone()
+        with gzip.open(temp_path, "wt", encoding="utf-8", newline="") as archive:
+            cursor.copy_expert(
+                f"COPY (SELECT {', '.join(ARCHIVE_COLUMNS)} FROM {name} ORDER BY ACT_TIMESTAMP, ACT_ID) "
+                f"TO STDOUT WITH (FORMAT csv, HEADER)", archive
+            )
+        db.conn.commit()
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    with gzip.open(temp_path, "rt", encoding="utf-8", newline="") as archive:
+        rows = csv.reader(archive)
+        next(rows, None)
+        written, written_last_id = 0, None
+        for row in rows:
+            written += 1
+            written_last_id = max(written_last_id or 0, int(row[0]))
+    if (written, written_last_id) != (expected, last_id):
+        raise IOError(f"{temp_path} has {written} rows up to ACT_ID {written_last_id}, "
+                      f"expected {expected} up to {last_id}")
+    os.replace(temp_path, path)
+    return written, last_id
+
+
+def archive_partition(db, month, archive_dir=ARCHIVE_DIR):
+    """Writes one month to a gzipped CSV, then detaches and drops it.
+
+    The COPY and its verification run first, while the month is still attached:
+    an expired month no longer receives rows, and DETACH takes an ACCESS
+    EXCLUSIVE lock on SYSTEM_ACTIVITY_LOG that every audited save waits behind.
+    DETACH and DROP then run in a short transaction of their own, which gives up
+    after ARCHIVE_LOCK_TIMEOUT rather than queueing writers behind a long reader,
+    and which leaves the month attached if it gained rows since the COPY. A
+    failure anywhere leaves the month attached for the next run.
+    """
+    name = partition_name(month)
+    path = archive_path(month, archive_dir)
+    os.makedirs(archive_dir, exist_ok=True)
+    rows, last_id = _write_archive(db, name, path)
+
+    cursor = db.conn.cursor()
+    try:
+        cursor.execute("SET LOCAL lock_timeout = %s;", (ARCHIVE_LOCK_TIMEOUT,))
+        cursor.execute(f"ALTER TABLE SYSTEM_ACTIVITY_LOG DETACH PARTITION {name};")
+        # Index-only on the partition's primary key, so the lock is held briefly.
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {name} WHERE ACT_ID > %s);", (last_id or 0,))
+        if cursor.fetchone()[0]:
+            raise IOError(f"{name} gained rows after it was archived to {path}")
+        cursor.execute(f"DROP TABLE {name};")
+        db.conn.commit()
+        return rows
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def apply_retention(db, retention_months=ACTIVITY_LOG_RETENTION_MONTHS, archive_dir=ARCHIVE_DIR, today=None):
+    """Archives every attached month older than the retention window, except restored ones. Returns {month: rows}."""
+    cutoff = _months_before(today or datetime.date.today(), retention_months)
+    archived = {}
+    for month, comment in _partitions(db):
+        if month < cutoff and comment != RESTORED_COMMENT:
+            archived[month] = archive_partition(db, month, archive_dir)
+    return archived
+
+
+def maintain(db, retention_months=ACTIVITY_LOG_RETENTION_MONTHS, archive_dir=ARCHIVE_DIR):
+    """Creates upcoming partitions, then archives the expired ones. Runs on the query executor."""
+    created = ensure_partitions(db)
+    archived = apply_retention(db, retention_months, archive_dir)
+    if created or archived:
+        print(f"Activity log maintenance: {created} partitions created, "
+              f"{len(archived)} months archived ({sum(archived.values())} rows)")
+    return created, archived
+
+
+def read_archived_month(month, user_id=None, action_type=None, table_name=None, archive_dir=ARCHIVE_DIR):
+    """Streams one archived month's rows, oldest first, as dicts keyed by the lower-case column names."""
+    with gzip.open(archive_path(month, archive_dir), "rt", encoding="utf-8", newline="") as archive:
+        for row in csv.DictReader(archive):
+            if user_id is not None and row["sys_user_id"] != str(user_id):
+                continue
+            if action_type and row["act_action_type"] != action_type:
+                continue
+            if table_name and row["act_table_name"] != table_name:
+                continue
+            yield row
+
+
+def restore_month(db, month, archive_dir=ARCHIVE_DIR):
+    """Re-attaches an archived month so it can be queried (and seen in the viewer) again.
+
+    The month is marked with RESTORED_COMMENT, so retention keeps it attached
+    until release_month() is called for it.
+    """
+    name = partition_name(month)
+    start = month
+    end = _months_before(month, -1)
+    cursor = db.conn.cursor()
+    try:
+        cursor.execute(f"CREATE TABLE {name} (LIKE SYSTEM_ACTIVITY_LOG INCLUDING DEFAULTS INCLUDING CONSTRAINTS);")
+        with gzip.open(archive_path(month, archive_dir), "rt", encoding="utf-8", newline="") as archive:
+            cursor.copy_expert(f"COPY {name} ({', '.join(ARCHIVE_COLUMNS)}) FROM STDIN WITH (FORMAT csv, HEADER)",
+                               archive)
+        cursor.execute(
+            f"ALTER TABLE SYSTEM_ACTIVITY_LOG ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s);",
+            (start, end)
+        )
+        cursor.execute(f"COMMENT ON TABLE {name} IS %s;", (RESTORED_COMMENT,))
+        db.conn.commit()
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def release_month(db, month):
+    """Clears a restored month's mark, so the next retention run archives it again if it is past the window."""
+    cursor = db.conn.cursor()
+    try:
+        cursor.execute(f"COMMENT ON TABLE {partition_name(month)} IS NULL;")
+        db.conn.commit()
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def convert_to_partitioned(db):
+    """Partitions an existing unpartitioned log in one transaction. Needs ensure_activity_log_partitions()."""
+    cursor = db.conn.cursor()
+    try:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = 'system_activity_log'::regclass;")
+        if cursor.fetchone()[0] == "p":
+            return False
+        for statement in CONVERT_TO_PARTITIONED:
+            cursor.execute(statement)
+        db.conn.commit()
+        return True
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _parse_month(text):
+    return datetime.datetime.strptime(text, "%Y-%m").date()
+
+
+if __name__ == "__main__":
+    # python -m Models.AdminModels.ActivityLogArchive convert
+    # python -m Models.AdminModels.ActivityLogArchive maintain
+    # python -m Models.AdminModels.ActivityLogArchive list
+    # python -m Models.AdminModels.ActivityLogArchive query YYYY-MM [user_id] [action] [table]
+    # python -m Models.AdminModels.ActivityLogArchive restore YYYY-MM
+    # python -m Models.AdminModels.ActivityLogArchive release YYYY-MM
+    command = sys.argv[1] if len(sys.argv) > 1 else "maintain"
+
+    if command == "query":
+        args = sys.argv[2:] + [None] * 3
+        out = csv.DictWriter(sys.stdout, fieldnames=[c.lower() for c in ARCHIVE_COLUMNS])
+        out.writeheader()
+        user = int(args[1]) if args[1] else None
+        for log_row in read_archived_month(_parse_month(args[0]), user, args[2], args[3]):
+            out.writerow(log_row)
+    elif command in ("convert", "maintain", "list", "restore", "release"):
+        database = Database(pooled=False)
+        try:
+            if command == "convert":
+                print("Converted." if convert_to_partitioned(database) else "Already partitioned.")
+            elif command == "maintain":
+                maintain(database)
+            elif command == "list":
+                print("Attached:", ", ".join(m.strftime("%Y-%m") for m in monthly_partitions(database)))
+                print("Archived:", ", ".join(m.strftime("%Y-%m") for m in archived_months()))
+                print("Restored:", ", ".join(m.strftime("%Y-%m") for m in restored_months(database)))
+            elif command == "release":
+                release_month(database, _parse_month(sys.argv[2]))
+                print(f"Released {sys.argv[2]}")
+            else:
+                restore_month(database, _parse_month(sys.argv[2]))
+                print(f"Restored {sys.argv[2]}")
+        finally:
+            database.close()
+    else:
+        sys.exit(f"Unknown command '{command}'")
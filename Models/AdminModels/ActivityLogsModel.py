@@ -1,42 +1,195 @@
-from database import Database
-
-class ActivityLogsModel:
-    def __init__(self, sys_user_id=None):
-        self.connection = Database()
-        if sys_user_id is not None:
-            self.connection.set_user_id(sys_user_id)
-
-    def get_activity_logs(self):
-        try:
-            query = """
-                SELECT
-                    a.SYS_USER_ID,
-                    CONCAT_WS(' ',
-                              a.SYS_FNAME,
-                              CASE
-                                  WHEN a.SYS_MNAME IS NOT NULL AND a.SYS_MNAME <> ''
-                                      THEN LEFT(a.SYS_MNAME, 1) || '.'
-                                  END,
-                              a.SYS_LNAME
-                    ) AS FULL_NAME,
-                    l.ACT_DESCRIPTION,
-                    l.ACT_TIMESTAMP
-                FROM
-                    SYSTEM_ACTIVITY_LOG l
-                        JOIN
-                    SYSTEM_ACCOUNT a ON l.SYS_USER_ID = a.SYS_USER_ID
-                ORDER BY
-                    l.ACT_TIMESTAMP DESC;
-            """
-            self.connection.cursor.execute(query)
-            rows = self.connection.cursor.fetchall()
-
-            return {
-                'columns': ['User Id', 'Staff Name', 'Action Made', 'Timestamp of action'],
-                'data': rows
-            }
-
-        except Exception as e:
-            print(f"Failed to fetch system users: {e}")
-            return {'columns': [], 'data': []}
+import datetime
 
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from Utils.util_query_executor import QueryExecutor
+
+PAGE_SIZE = 200
+
+ACTION_TYPES = ('INSERT', 'UPDATE', 'DELETE', 'LOGIN', 'LOGOUT')
+
+# Newest first, keyset on (ACT_TIMESTAMP, ACT_ID) so a page never re-reads the
+# rows before it. Every filter combination is served by one of the
+# idx_activity_log_* indexes in mnhs_barangay_new_query.sql.
+ACTIVITY_LOG_PAGE_QUERY = """
+    SELECT
+        l.ACT_ID,
+        l.ACT_TIMESTAMP,
+        l.SYS_USER_ID,
+        CONCAT_WS(' ',
+                  a.SYS_FNAME,
+                  CASE
+                      WHEN a.SYS_MNAME IS NOT NULL AND a.SYS_MNAME <> ''
+                          THEN LEFT(a.SYS_MNAME, 1) || '.'
+                      END,
+                  a.SYS_LNAME
+        ) AS FULL_NAME,
+        l.ACT_ACTION_TYPE,
+        l.ACT_TABLE_NAME,
+        l.ACT_DESCRIPTION
+    FROM SYSTEM_ACTIVITY_LOG l
+    JOIN SYSTEM_ACCOUNT a ON l.SYS_USER_ID = a.SYS_USER_ID
+    WHERE TRUE
+    {filters}
+    ORDER BY l.ACT_TIMESTAMP DESC, l.ACT_ID DESC
+    LIMIT %(limit)s;
+"""
+
+FILTER_USERS_QUERY = """
+    SELECT SYS_USER_ID, CONCAT_WS(' ', SYS_FNAME, SYS_LNAME)
+    FROM SYSTEM_ACCOUNT
+    ORDER BY SYS_FNAME, SYS_LNAME;
+"""
+
+# DISTINCT over the whole log would read every row; this walks
+# idx_activity_log_table one table name at a time instead.
+FILTER_TABLES_QUERY = """
+    WITH RECURSIVE names AS (
+        SELECT MIN(ACT_TABLE_NAME) AS name FROM SYSTEM_ACTIVITY_LOG
+        UNION ALL
+        SELECT (SELECT MIN(ACT_TABLE_NAME) FROM SYSTEM_ACTIVITY_LOG WHERE ACT_TABLE_NAME > names.name)
+        FROM names
+        WHERE names.name IS NOT NULL
+    )
+    SELECT name FROM names WHERE name IS NOT NULL;
+"""
+
+
+class ActivityLogFilters:
+    def __init__(self, user_id=None, action_type=None, table_name=None, from_date=None, to_date=None):
+        self.user_id = user_id
+        self.action_type = action_type
+        self.table_name = table_name
+        self.from_date = from_date
+        self.to_date = to_date
+
+    def where(self, params):
+        """SQL conditions for the set filters; their values are added to params."""
+        clauses = []
+        if self.user_id is not None:
+            clauses.append("AND l.SYS_USER_ID = %(user_id)s")
+            params["user_id"] = self.user_id
+        if self.action_type:
+            clauses.append("AND l.ACT_ACTION_TYPE = %(action_type)s::action_type_enum")
+            params["action_type"] = self.action_type
+        if self.table_name:
+            clauses.append("AND l.ACT_TABLE_NAME = %(table_name)s")
+            params["table_name"] = self.table_name
+        # Half-open range on the raw column so the timestamp indexes apply.
+        if self.from_date:
+            clauses.append("AND l.ACT_TIMESTAMP >= %(from_date)s")
+            params["from_date"] = self.from_date
+        if self.to_date:
+            clauses.append("AND l.ACT_TIMESTAMP < %(to_date)s")
+            params["to_date"] = self.to_date + datetime.timedelta(days=1)
+        return clauses
+
+
+def fetch_activity_log_page(db, filters, after, limit):
+    """The next `limit` log rows older than `after` ((timestamp, act_id), or None for the newest)."""
+    params = {"limit": limit}
+    clauses = filters.where(params)
+    if after is not None:
+        clauses.append("AND (l.ACT_TIMESTAMP, l.ACT_ID) < (%(after_ts)s, %(after_id)s)")
+        params["after_ts"], params["after_id"] = after
+    cursor = db.get_cursor()
+    cursor.execute(ACTIVITY_LOG_PAGE_QUERY.format(filters="\n    ".join(clauses)), params)
+    return cursor.fetchall()
+
+
+def fetch_activity_log_filter_options(db):
+    """(users, table names) for the filter combo boxes."""
+    cursor = db.get_cursor()
+    cursor.execute(FILTER_USERS_QUERY)
+    users = cursor.fetchall()
+    cursor.execute(FILTER_TABLES_QUERY)
+    tables = [row[0] for row in cursor.fetchall()]
+    return users, tables
+
+
+class ActivityLogListModel(QAbstractTableModel):
+    HEADERS = ["Timestamp", "User Id", "Staff Name", "Action", "Table", "Action Made"]
+
+    def __init__(self, parent=None, executor_key="activity_log_page", page_size=PAGE_SIZE):
+        super().__init__(parent)
+        self.executor = QueryExecutor.instance()
+        self.executor_key = executor_key
+        self.page_size = page_size
+        self.filters = ActivityLogFilters()
+        self.rows = []
+        self.has_more = True
+        self.loading = False
+        self.on_error = None
+        self.on_loaded = None
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        # Row layout: ACT_ID, timestamp, user id, name, action, table, description
+        value = self.rows[index.row()][index.column() + 1]
+        if isinstance(value, datetime.datetime):
+            return value.strftime("%B %d, %Y | %I:%M %p")
+        return "" if value is None else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.has_more and not self.loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self.loading = True
+        after = (self.rows[-1][1], self.rows[-1][0]) if self.rows else None
+        self.executor.submit(
+            self.executor_key, fetch_activity_log_page, self.filters, after, self.page_size,
+            on_result=self._append_page,
+            on_error=self._page_failed
+        )
+
+    # --- loading ---
+
+    def set_filters(self, filters):
+        self.filters = filters
+        self.reload()
+
+    def reload(self):
+        """Drop everything and page again from the newest matching entry."""
+        self.executor.cancel(self.executor_key)
+        self.beginResetModel()
+        self.rows = []
+        self.has_more = True
+        self.loading = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def _append_page(self, page):
+        self.loading = False
+        if len(page) < self.page_size:
+            self.has_more = False
+        if page:
+            start = len(self.rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+            self.rows.extend(page)
+            self.endInsertRows()
+        if self.on_loaded:
+            self.on_loaded(len(self.rows), self.has_more)
+
+    def _page_failed(self, error):
+        self.loading = False
+        self.has_more = False
+        if self.on_error:
+            self.on_error(error)
+        else:
+            print(f"Failed to load activity log page: {error}")
@@ -1,8 +1,9 @@
+from Models.LookupCache import LookupCache
 from database import Database
 
 class AdminControlsModel:
     def __init__(self, sys_user_id=None):
-        self.connection = Database()
+        self.connection = Database(pooled=False)
         if sys_user_id is not None:
             self.connection.set_user_id(sys_user_id)
 
@@ -17,6 +18,7 @@ class AdminControlsModel:
                 account_data['sitio_name'],
             ))
             self.connection.commit()
+            LookupCache.instance().bump("sitio")
             return True
         except Exception as e:
             print("Database error:", e)
@@ -31,6 +33,7 @@ class AdminControlsModel:
             """
             self.connection.cursor.execute(query, (new_name, sitio_id))
             self.connection.commit()
+            LookupCache.instance().bump("sitio")
             return True
         except Exception as e:
             print(f"Error updating sitio name: {e}")
@@ -106,6 +109,7 @@ class AdminControlsModel:
                 infra_data['infra_name'],
             ))
             self.connection.commit()
+            LookupCache.instance().bump("infrastructure_type")
             return True
         except Exception as e:
             print("Database error:", e)
@@ -120,6 +124,7 @@ class AdminControlsModel:
             """
             self.connection.cursor.execute(query, (new_name, infra_id))
             self.connection.commit()
+            LookupCache.instance().bump("infrastructure_type")
             return True
         except Exception as e:
             print(f"Error updating Infrastructure type name: {e}")
@@ -173,6 +178,7 @@ class AdminControlsModel:
                 transaction_data['transaction_name'],
             ))
             self.connection.commit()
+            LookupCache.instance().bump("transaction_type")
             return True
         except Exception as e:
             print("Database error:", e)
@@ -187,6 +193,7 @@ class AdminControlsModel:
             """
             self.connection.cursor.execute(query, (new_name, transaction_id))
             self.connection.commit()
+            LookupCache.instance().bump("transaction_type")
             return True
         except Exception as e:
             print(f"Error updating Transaction type name: {e}")
@@ -242,6 +249,7 @@ class AdminControlsModel:
                 history_data['history_name'],
             ))
             self.connection.commit()
+            LookupCache.instance().bump("history_type")
             return True
         except Exception as e:
             print("Database error:", e)
@@ -256,6 +264,7 @@ class AdminControlsModel:
             """
             self.connection.cursor.execute(query, (new_name, history_id))
             self.connection.commit()
+            LookupCache.instance().bump("history_type")
             return True
         except Exception as e:
             print(f"Error updating History type name: {e}")
@@ -311,6 +320,7 @@ class AdminControlsModel:
                 medical_data['medical_name'],
             ))
             self.connection.commit()
+            LookupCache.instance().bump("medical_history_type")
             return True
         except Exception as e:
             print("Database error:", e)
@@ -325,6 +335,7 @@ class AdminControlsModel:
             """
             self.connection.cursor.execute(query, (new_name, medical_id))
             self.connection.commit()
+            LookupCache.instance().bump("medical_history_type")
             return True
         except Exception as e:
             print(f"Error updating Medical History type name: {e}")
@@ -356,6 +367,7 @@ class AdminControlsModel:
             """
             self.connection.execute_with_user(query, (sitio_id,))
             self.connection.commit()
+            LookupCache.instance().bump("sitio")
             return True
         except Exception as e:
             print("Database error(sitio):", e)
@@ -370,6 +382,7 @@ class AdminControlsModel:
             """
             self.connection.execute_with_user(query, (infrastructure_id,))
             self.connection.commit()
+            LookupCache.instance().bump("infrastructure_type")
             return True
         except Exception as e:
             print("Database error(Infrastructure):", e)
@@ -384,6 +397,7 @@ class AdminControlsModel:
             """
             self.connection.execute_with_user(query, (transaction_type_id,))
             self.connection.commit()
+            LookupCache.instance().bump("transaction_type")
             return True
         except Exception as e:
             print("Database error(Transaction Type):", e)
@@ -398,6 +412,7 @@ class AdminControlsModel:
             """
             self.connection.execute_with_user(query, (history_type_id,))
             self.connection.commit()
+            LookupCache.instance().bump("history_type")
             return True
         except Exception as e:
             print("Database error(History type):", e)
@@ -412,6 +427,7 @@ class AdminControlsModel:
             """
             self.connection.execute_with_user(query, (med_hist_id,))
             self.connection.commit()
+            LookupCache.instance().bump("medical_history_type")
             return True
         except Exception as e:
             print("Database error(Medical history type):", e)
@@ -0,0 +1,149 @@
+"""Per-row vs statement-level audit triggers on a bulk UPDATE.
+
+Builds a scratch table shaped like CITIZEN's audited columns, fills it with
+ROWS rows, and times one UPDATE of every row under each trigger form:
+
+    row        the former log_entity_activity(): FOR EACH ROW, one INSERT per row
+    statement  log_statement_activity() via attach_activity_log_triggers():
+               FOR EACH STATEMENT, one INSERT ... SELECT over the transition table
+
+Both write to the real SYSTEM_ACTIVITY_LOG, but every run is rolled back, so
+nothing is kept. Run from the project root:
+
+    python -m Models.AdminModels.AuditTriggerBenchmark [rows] [runs]
+"""
+import statistics
+import sys
+import time
+
+from database import Database
+
+ROWS = 10000
+RUNS = 5
+
+CREATE_BENCH_TABLE = """
+    CREATE TEMP TABLE audit_bench (
+        CTZ_ID INT PRIMARY KEY,
+        CTZ_LAST_NAME VARCHAR(50) NOT NULL
+    ) ON COMMIT DROP;
+    INSERT INTO audit_bench
+    SELECT n, 'Citizen ' || n FROM generate_series(1, %(rows)s) AS n;
+"""
+
+# The per-row trigger function every audited table used before, verbatim apart
+# from living in pg_temp.
+CREATE_ROW_TRIGGER = """
+    CREATE FUNCTION pg_temp.log_entity_activity()
+        RETURNS TRIGGER AS $$
+    DECLARE
+        v_entity_id INT;
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            v_entity_id := NEW.CTZ_ID;
+        ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
+            v_entity_id := OLD.CTZ_ID;
+        END IF;
+
+        INSERT INTO SYSTEM_ACTIVITY_LOG (
+            ACT_ACTION_TYPE,
+            ACT_TABLE_NAME,
+            ACT_ENTITY_ID,
+            SYS_USER_ID,
+            ACT_DESCRIPTION
+        )
+        VALUES (
+                   TG_OP::action_type_enum,
+                   TG_TABLE_NAME,
+                   v_entity_id,
+                   current_setting('app.current_user_id')::INT,
+                   CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
+               );
+
+        RETURN CASE
+                   WHEN TG_OP = 'DELETE' THEN OLD
+                   ELSE NEW
+            END;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER trg_log_audit_bench
+        AFTER INSERT OR UPDATE OR DELETE ON audit_bench
+        FOR EACH ROW
+    EXECUTE FUNCTION pg_temp.log_entity_activity();
+"""
+
+CREATE_STATEMENT_TRIGGER = "SELECT attach_activity_log_triggers('audit_bench', 'CTZ_ID');"
+
+BENCH_UPDATE = "UPDATE audit_bench SET CTZ_LAST_NAME = CTZ_LAST_NAME || '.';"
+
+COUNT_BENCH_LOGS = "SELECT COUNT(*) FROM SYSTEM_ACTIVITY_LOG WHERE ACT_TABLE_NAME = 'audit_bench';"
+
+MODES = {"row": CREATE_ROW_TRIGGER, "statement": CREATE_STATEMENT_TRIGGER}
+
+
+def time_update(db, mode, rows, user_id):
+    """Milliseconds for one UPDATE of `rows` rows with `mode` triggers, and the log rows it wrote."""
+    cursor = db.conn.cursor()
+    try:
+        cursor.execute("SET LOCAL app.current_user_id = %s;", (str(user_id),))
+        cursor.execute(CREATE_BENCH_TABLE, {"rows": rows})
+        cursor.execute(MODES[mode])
+        cursor.execute("ANALYZE audit_bench;")
+
+        started = time.perf_counter()
+        cursor.execute(BENCH_UPDATE)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        cursor.execute(COUNT_BENCH_LOGS)
+        logged = cursor.fetchone()[0]
+        return elapsed_ms, logged
+    finally:
+        db.conn.rollback()
+        cursor.close()
+
+
+def run_benchmark(db, rows=ROWS, runs=RUNS):
+    """{mode: {"median_ms", "min_ms", "max_ms", "logged"}} over `runs` rolled-back UPDATEs per mode."""
+    cursor = db.get_cursor()
+    cursor.execute("SELECT MIN(SYS_USER_ID) FROM SYSTEM_ACCOUNT;")
+    user_id = cursor.fetchone()[0]
+    db.conn.rollback()
+    if user_id is None:
+        raise RuntimeError("SYSTEM_ACCOUNT is empty; the log needs an existing user to reference.")
+
+    timings = {mode: [] for mode in MODES}
+    # Modes alternate within each run so cache warm-up does not favour either one.
+    for _ in range(runs):
+        for mode in MODES:
+            elapsed_ms, logged = time_update(db, mode, rows, user_id)
+            if logged != rows:
+                raise RuntimeError(f"{mode} triggers logged {logged} rows for an UPDATE of {rows}")
+            timings[mode].append(elapsed_ms)
+
+    return {
+        mode: {
+            "median_ms": statistics.median(values),
+            "min_ms": min(values),
+            "max_ms": max(values),
+            "logged": rows,
+        }
+        for mode, values in timings.items()
+    }
+
+
+if __name__ == "__main__":
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    run_count = int(sys.argv[2]) if len(sys.argv) > 2 else RUNS
+
+    database = Database(pooled=False)
+    try:
+        report = run_benchmark(database, row_count, run_count)
+    finally:
+        database.close()
+
+    print(f"UPDATE of {row_count:,} rows, {run_count} runs each")
+    for name, result in report.items():
+        print(f"  {name:<10} median {result['median_ms']:9.1f} ms"
+              f"   min {result['min_ms']:9.1f} ms   max {result['max_ms']:9.1f} ms")
+    speedup = report["row"]["median_ms"] / max(report["statement"]["median_ms"], 0.001)
+    print(f"  statement-level is {speedup:.1f}x the per-row speed")
@@ -0,0 +1,283 @@
+"""Offline search for duplicate CITIZEN records across the whole population.
+
+Comparing every citizen with every other one is O(n^2): 20 billion pairs at
+200k records. Instead, citizens are grouped into blocks that share a sitio,
+a birth year and the Soundex code of their surname, and only pairs inside a
+block are scored. Blocks are scored on every CPU core with a process pool,
+and pairs at or above the minimum score go to CITIZEN_MERGE_QUEUE for review
+(see that section of mnhs_barangay_new_query.sql). Run from the project root:
+
+    python -m Models.AdminModels.CitizenDedupe run [workers] [min_score]
+    python -m Models.AdminModels.CitizenDedupe dry-run [workers] [min_score]
+    python -m Models.AdminModels.CitizenDedupe list [limit]
+    python -m Models.AdminModels.CitizenDedupe review MQ_ID APPROVED|REJECTED SYS_USER_ID
+
+Scores use the same weights as the registration check in
+Models/DuplicateCitizenModel.py, with a trigram similarity computed the way
+pg_trgm does, so a pair scores the same in both places.
+"""
+import csv
+import io
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from Models.DuplicateCitizenModel import (WEIGHT_NAME, WEIGHT_SAME_BIRTH_DATE, WEIGHT_SAME_BIRTH_YEAR,
+                                          WEIGHT_SAME_HOUSEHOLD)
+from database import Database
+
+MIN_SCORE = 0.75
+# Both middle names given with different initials (usually a different mother).
+PENALTY_MIDDLE_INITIAL = 0.15
+FETCH_SIZE = 10000
+# Blocks handed to a worker at a time; most blocks hold two or three citizens.
+BLOCKS_PER_TASK = 500
+# Blocks this large usually mean placeholder data (e.g. a default birth date).
+LARGE_BLOCK_WARNING = 500
+
+CITIZENS_QUERY = """
+    SELECT CTZ_ID, CTZ_FIRST_NAME, CTZ_MIDDLE_NAME, CTZ_LAST_NAME,
+           CTZ_DATE_OF_BIRTH, CTZ_SEX, SITIO_ID, HH_ID
+    FROM CITIZEN
+    WHERE CTZ_IS_DELETED = FALSE;
+"""
+
+CREATE_STAGING = """
+    CREATE TEMP TABLE merge_queue_staging (
+        CTZ_ID_KEEP INT, CTZ_ID_DUPLICATE INT, MQ_SCORE NUMERIC(4, 3), MQ_REASONS TEXT
+    ) ON COMMIT DROP;
+"""
+
+INSERT_FROM_STAGING = """
+    INSERT INTO CITIZEN_MERGE_QUEUE (CTZ_ID_KEEP, CTZ_ID_DUPLICATE, MQ_SCORE, MQ_REASONS)
+    SELECT CTZ_ID_KEEP, CTZ_ID_DUPLICATE, MQ_SCORE, MQ_REASONS
+    FROM merge_queue_staging
+    ON CONFLICT (CTZ_ID_KEEP, CTZ_ID_DUPLICATE) DO NOTHING;
+"""
+
+PENDING_QUERY = """
+    SELECT Q.MQ_ID, Q.MQ_SCORE, Q.MQ_REASONS,
+           K.CTZ_ID, K.CTZ_LAST_NAME || ', ' || K.CTZ_FIRST_NAME, K.CTZ_DATE_OF_BIRTH,
+           D.CTZ_ID, D.CTZ_LAST_NAME || ', ' || D.CTZ_FIRST_NAME, D.CTZ_DATE_OF_BIRTH
+    FROM CITIZEN_MERGE_QUEUE Q
+    JOIN CITIZEN K ON K.CTZ_ID = Q.CTZ_ID_KEEP
+    JOIN CITIZEN D ON D.CTZ_ID = Q.CTZ_ID_DUPLICATE
+    WHERE Q.MQ_STATUS = 'PENDING'
+    ORDER BY Q.MQ_SCORE DESC, Q.MQ_ID
+    LIMIT %s;
+"""
+
+REVIEW_QUERY = """
+    UPDATE CITIZEN_MERGE_QUEUE
+    SET MQ_STATUS = %s, MQ_REVIEWED_BY_SYS_ID = %s, MQ_REVIEWED_AT = CURRENT_TIMESTAMP
+    WHERE MQ_ID = %s;
+"""
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("BFPV", "1"), **dict.fromkeys("CGJKQSXZ", "2"), **dict.fromkeys("DT", "3"),
+    "L": "4", **dict.fromkeys("MN", "5"), "R": "6",
+}
+_WORD = re.compile(r"[^\W_]+")  # letters and digits in any script, like pg_trgm
+
+
+def soundex(name):
+    """American Soundex of the letters in name, so "Dela Cruz" and "Delacruz" share D426."""
+    letters = [c for c in name.upper() if "A" <= c <= "Z"]
+    if not letters:
+        return ""
+    code = letters[0]
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for c in letters[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if c not in "HW":  # H and W do not separate letters with the same code
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def trigrams(text):
+    """pg_trgm's trigram set: lower-cased words, each padded with two spaces in front and one behind."""
+    grams = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a, b):
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def blocking_key(row):
+    _, _, _, last_name, birth_date, _, sitio_id, _ = row
+    return sitio_id, birth_date.year, soundex(last_name)
+
+
+def score_pair(a, b):
+    """(score, reasons) for two prepared citizens of the same block, or None if they cannot match."""
+    if a["sex"] != b["sex"]:
+        return None
+    name = similarity(a["grams"], b["grams"])
+    score = WEIGHT_NAME * name
+    reasons = [f"name {name:.2f}"]
+    if a["birth_date"] == b["birth_date"]:
+        score += WEIGHT_SAME_BIRTH_DATE
+        reasons.append("same birth date")
+    else:
+        score += WEIGHT_SAME_BIRTH_YEAR
+        reasons.append("same birth year")
+    if a["household_id"] == b["household_id"]:
+        score += WEIGHT_SAME_HOUSEHOLD
+        reasons.append("same household")
+    if a["middle_initial"] and b["middle_initial"] and a["middle_initial"] != b["middle_initial"]:
+        score -= PENALTY_MIDDLE_INITIAL
+        reasons.append("different middle initial")
+    return score, ", ".join(reasons)
+
+
+def _prepare(row):
+    ctz_id, first_name, middle_name, last_name, birth_date, sex, _, hh_id = row
+    return {
+        "id": ctz_id,
+        "grams": trigrams(f"{first_name} {last_name}"),
+        "middle_initial": (middle_name or "").strip()[:1].upper(),
+        "birth_date": birth_date,
+        "sex": sex,
+        "household_id": hh_id,
+    }
+
+
+def score_blocks(blocks, min_score=MIN_SCORE):
+    """Worker entry point: [(keep id, duplicate id, score, reasons)] for the pairs inside each block."""
+    found = []
+    for block in blocks:
+        citizens = sorted((_prepare(row) for row in block), key=lambda c: c["id"])
+        for i, a in enumerate(citizens):
+            for b in citizens[i + 1:]:
+                scored = score_pair(a, b)
+                if scored and scored[0] >= min_score:
+                    found.append((a["id"], b["id"], round(scored[0], 3), scored[1]))
+    return found
+
+
+def load_blocks(db):
+    """Citizens grouped by blocking key; blocks of one citizen are dropped. Returns (blocks, citizens read)."""
+    blocks = defaultdict(list)
+    count = 0
+    # A named cursor streams the rows instead of holding them all client-side twice.
+    cursor = db.conn.cursor(name="citizen_dedupe")
+    cursor.itersize = FETCH_SIZE
+    try:
+        cursor.execute(CITIZENS_QUERY)
+        for row in cursor:
+            blocks[blocking_key(row)].append(row)
+            count += 1
+    finally:
+        cursor.close()
+
+    candidates = [block for block in blocks.values() if len(block) > 1]
+    for key, block in blocks.items():
+        if len(block) >= LARGE_BLOCK_WARNING:
+            print(f"[WARN] Block {key} has {len(block)} citizens")
+    return candidates, count
+
+
+def find_pairs(blocks, workers=None, min_score=MIN_SCORE):
+    """Scores the blocks across a process pool. Returns the pairs, best first."""
+    batches = [blocks[i:i + BLOCKS_PER_TASK] for i in range(0, len(blocks), BLOCKS_PER_TASK)]
+    pairs = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for found in pool.map(score_blocks, batches, [min_score] * len(batches)):
+            pairs.extend(found)
+    pairs.sort(key=lambda pair: (-pair[2], pair[0], pair[1]))
+    return pairs
+
+
+def write_merge_queue(db, pairs):
+    """Adds the pairs not already queued (in any status) to CITIZEN_MERGE_QUEUE. Returns how many were new."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(pairs)
+    buffer.seek(0)
+    cursor = db.conn.cursor()
+    try:
+        cursor.execute(CREATE_STAGING)
+        cursor.copy_expert(
+            "COPY merge_queue_staging (CTZ_ID_KEEP, CTZ_ID_DUPLICATE, MQ_SCORE, MQ_REASONS) "
+            "FROM STDIN WITH (FORMAT csv)", buffer
+        )
+        cursor.execute(INSERT_FROM_STAGING)
+        added = cursor.rowcount
+        db.conn.commit()
+        return added
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def run(db, workers=None, min_score=MIN_SCORE, write=True):
+    started = time.perf_counter()
+    blocks, count = load_blocks(db)
+    loaded = time.perf_counter()
+    pair_count = sum(len(block) * (len(block) - 1) // 2 for block in blocks)
+    print(f"Read {count} citizens into {len(blocks)} blocks ({pair_count} pairs to score, "
+          f"{count * (count - 1) // 2} without blocking) in {loaded - started:.1f} s")
+
+    pairs = find_pairs(blocks, workers, min_score)
+    scored = time.perf_counter()
+    print(f"Scored on {workers or os.cpu_count()} workers: {len(pairs)} pairs at or above "
+          f"{min_score} in {scored - loaded:.1f} s")
+
+    if write:
+        added = write_merge_queue(db, pairs)
+        print(f"Merge queue: {added} new pairs in {time.perf_counter() - scored:.1f} s")
+    else:
+        for keep_id, duplicate_id, score, reasons in pairs[:20]:
+            print(f"  {score:.3f}  #{keep_id} / #{duplicate_id}  {reasons}")
+    print(f"Done in {time.perf_counter() - started:.1f} s")
+    return pairs
+
+
+def pending_pairs(db, limit=50):
+    cursor = db.get_cursor()
+    cursor.execute(PENDING_QUERY, (limit,))
+    return cursor.fetchall()
+
+
+def review_pair(db, mq_id, status, sys_user_id):
+    cursor = db.get_cursor()
+    cursor.execute(REVIEW_QUERY, (status, sys_user_id, mq_id))
+    db.conn.commit()
+    return cursor.rowcount
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "dry-run"
+    database = Database(pooled=False)
+    try:
+        if command in ("run", "dry-run"):
+            worker_count = int(sys.argv[2]) if len(sys.argv) > 2 else None
+            threshold = float(sys.argv[3]) if len(sys.argv) > 3 else MIN_SCORE
+            run(database, worker_count, threshold, write=(command == "run"))
+        elif command == "list":
+            for q_id, q_score, q_reasons, k_id, k_name, k_dob, d_id, d_name, d_dob in pending_pairs(
+                    database, int(sys.argv[2]) if len(sys.argv) > 2 else 50):
+                print(f"[{q_id}] {q_score}  #{k_id} {k_name} ({k_dob})  /  "
+                      f"#{d_id} {d_name} ({d_dob})  - {q_reasons}")
+        elif command == "review":
+            updated = review_pair(database, int(sys.argv[2]), sys.argv[3].upper(), int(sys.argv[4]))
+            print("Updated." if updated else f"No merge queue entry {sys.argv[2]}.")
+        else:
+            sys.exit(f"Unknown command '{command}'")
+    finally:
+        database.close()
@@ -2,7 +2,7 @@ from database import Database
 
 class ManageAccountsModel:
     def __init__(self, sys_user_id=None):
-        self.connection = Database()
+        self.connection = Database(pooled=False)
         if sys_user_id is not None:
             self.connection.set_user_id(sys_user_id)
 
@@ -0,0 +1,691 @@
+"""Synthetic barangay data for load and scale testing.
+
+Fills a local database (created from mnhs_barangay_new_query.sql) with N
+households spread over the seeded SITIO rows, their members and everything
+hanging off them: education, PhilHealth, contacts, employment, medical
+history, family planning, transactions, complaints and settlements, a few
+businesses and infrastructure, and the SYSTEM_ACTIVITY_LOG rows the audit
+triggers would have written for all of it, plus staff logins and logouts.
+
+Households are generated in shards of SHARD_HOUSEHOLDS on a process pool.
+Each worker opens its own connection and COPYs its shard in one transaction.
+Every shard has its own random stream derived from the seed, so the same
+seed, household count and as-of date produce the same people whatever the
+worker count. Only the ID values depend on which worker reserves them first.
+House numbers are SYN-<seed>-<shard>-<n>, so loading the same seed twice
+stops at the unique house number; use another seed to add more households.
+
+Triggers are switched off for the load with session_replication_role, so
+the account in DB_CONFIG must be a superuser. The generator writes the
+activity log rows itself, dated when each record was encoded, and rebuilds
+the statistics cubes once at the end. Run from the project root:
+
+    python -m Models.AdminModels.SyntheticData households [seed] [workers] [as_of YYYY-MM-DD]
+"""
+import csv
+import datetime
+import io
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from database import Database
+
+DEFAULT_SEED = 20250501
+SHARD_HOUSEHOLDS = 1000
+ID_CHUNK = 5000             # sequence values reserved per round trip
+YEARS_OF_RECORDS = 5        # records are encoded over this many years before as_of
+
+MALE_FIRST_NAMES = [
+    "Juan", "Jose", "Roberto", "Antonio", "Eduardo", "Ricardo", "Mark", "John Paul", "Christian", "Carlo",
+    "Miguel", "Rafael", "Joshua", "Angelo", "Jerome", "Renato", "Rodel", "Arnel", "Jericho", "Paolo",
+    "Vincent", "Kenneth", "Ramon", "Danilo", "Ernesto", "Romeo", "Francis", "Gabriel", "Nathaniel", "Rey",
+]
+FEMALE_FIRST_NAMES = [
+    "Maria", "Ana", "Rosa", "Teresa", "Lourdes", "Corazon", "Josephine", "Mary Joy", "Kristine", "Angelica",
+    "Jennifer", "Michelle", "Princess", "Nicole", "Jasmine", "Erlinda", "Gloria", "Remedios", "Marites", "Liza",
+    "Rowena", "Cristina", "Maricel", "Janice", "Sheila", "Aileen", "Gemma", "Irene", "Catherine", "Trisha",
+]
+SURNAMES = [
+    "Dela Cruz", "Garcia", "Reyes", "Ramos", "Mendoza", "Santos", "Flores", "Gonzales", "Bautista", "Villanueva",
+    "Fernandez", "Cruz", "De Guzman", "Lopez", "Perez", "Castillo", "Francisco", "Rivera", "Aquino", "Castro",
+    "Sanchez", "Torres", "De Leon", "Domingo", "Martinez", "Rodriguez", "Santiago", "Soriano", "Delos Santos",
+    "Diaz", "Hernandez", "Tolentino", "Valdez", "Ramirez", "Morales", "Mercado", "Tan", "Aguilar", "Navarro",
+    "Manalo", "Gomez", "Dizon", "Del Rosario", "Javier", "Corpuz", "Gutierrez", "Salazar", "Cabrera", "Alvarez",
+    "Pacquiao", "Abellana", "Cabahug", "Ybañez", "Alcoseba", "Bacalso", "Cañete", "Dumdum", "Lapitan", "Ouano",
+    "Sarmiento", "Tabada", "Villamor", "Yap", "Go", "Lim", "Sy", "Uy", "Pepito", "Quijano", "Rosales",
+]
+PLACES_OF_BIRTH = ["Lapu-Lapu City", "Cebu City", "Mandaue City", "Talisay City", "Danao City", "Bohol",
+                   "Leyte", "Negros Oriental", "Davao City", "Manila"]
+SCHOOLS = ["Marigondon Elementary School", "Marigondon National High School", "Lapu-Lapu City College",
+           "University of Cebu", "Cebu Technological University", "University of San Carlos"]
+OCCUPATIONS = [
+    ("Fisherman", False), ("Vendor", False), ("Driver", False), ("Construction Worker", False),
+    ("Resort Staff", False), ("Factory Worker", False), ("Sari-sari Store Owner", False), ("Teacher", True),
+    ("Barangay Health Worker", True), ("Tanod", True), ("Call Center Agent", False), ("Housekeeper", False),
+    ("Seafarer", False), ("Nurse", False), ("Guitar Maker", False), ("Security Guard", False),
+]
+MEDICAL_CONDITIONS = {
+    "Hypertension": ["Stage 1 hypertension", "Stage 2 hypertension", "Controlled hypertension"],
+    "Diabetes": ["Type 2 diabetes", "Pre-diabetes"],
+    "Tuberculosis": ["Pulmonary TB, on DOTS", "TB, completed treatment"],
+    "Surgery": ["Appendectomy", "Cesarean section", "Cataract surgery"],
+    "Others": ["Asthma", "Dengue", "Arthritis", "Kidney stones"],
+}
+TRANSACTION_PURPOSES = {
+    "Barangay Clearance": ["Employment", "Loan application", "Police clearance", "Scholarship"],
+    "Business Permit": ["New sari-sari store", "Permit renewal", "Food stall"],
+    "Complaint": ["Noise complaint", "Boundary dispute", "Unpaid debt"],
+}
+COMPLAINTS = [("Loud karaoke at night", "Agreed to stop by 10 PM"),
+              ("Boundary dispute over fence", "Fence moved after survey"),
+              ("Unpaid debt", "Payment schedule agreed"),
+              ("Stray animals damaging crops", "Owner to keep animals tied"),
+              ("Verbal altercation", "Both parties apologized")]
+BUSINESS_NAMES = ["Sari-sari Store", "Carinderia", "Water Refilling Station", "Bakery", "Vulcanizing Shop",
+                  "Computer Shop", "Laundry Shop", "Barbershop", "Pharmacy", "Hardware"]
+DEATH_REASONS = ["Cardiac arrest", "Stroke", "Pneumonia", "Old age", "Accident", "Cancer"]
+
+# Approximate age structure of Central Visayas (PSA 2020): (from, to, weight).
+# Heads, children and other relatives draw their ages from it, each within the
+# range their role allows (see _band_age); spouses follow the head.
+AGE_BANDS = [(0, 4, 9.6), (5, 9, 9.8), (10, 14, 9.9), (15, 19, 9.6), (20, 24, 9.0), (25, 29, 8.4),
+             (30, 34, 7.6), (35, 39, 6.9), (40, 44, 6.2), (45, 49, 5.5), (50, 54, 4.8), (55, 59, 4.0),
+             (60, 64, 3.2), (65, 69, 2.3), (70, 74, 1.5), (75, 90, 1.7)]
+BLOOD_TYPES = [("O+", 38), ("A+", 18), ("B+", 20), ("AB+", 5), ("O-", 0.5), ("A-", 0.3), ("B-", 0.3),
+               ("AB-", 0.1), ("Unknown", 18)]
+RELIGIONS = [("Roman Catholic", 79), ("Christian", 4), ("Iglesia ni Cristo", 3), ("Born Again Christian", 5),
+             ("Church of God", 1), ("Jehovah's Witness", 1), ("Mormon", 0.5), ("Islam", 1), ("None", 1),
+             ("Others", 4.5)]
+SOCIO_ECONOMIC = [("NHTS 4Ps", 15), ("NHTS Non-4Ps", 10), ("Non-NHTS", 75)]
+OWNERSHIP = [("Owned", 62), ("Rented", 20), ("Leased", 5), ("Informal Settler", 13)]
+ADULT_ATTAINMENT = [("No Formal Education", 2), ("Elementary Undergraduate", 8), ("Elementary Graduate", 14),
+                    ("Junior High School Undergraduate", 10), ("Junior High School Graduate", 16),
+                    ("Senior High School Undergraduate", 4), ("Senior High School Graduate", 14),
+                    ("Vocational / Technical Graduate", 8), ("College Undergraduate", 9), ("College Graduate", 13),
+                    ("Postgraduate", 2)]
+
+# Table -> (serial ID column or None, columns written by COPY), in foreign-key order.
+TABLES = {
+    "HOUSEHOLD_INFO": ("HH_ID", [
+        "HH_ID", "HH_HOUSE_NUMBER", "HH_ADDRESS", "HH_OWNERSHIP_STATUS", "HH_INTERVIEWER_NAME",
+        "HH_REVIEWER_NAME", "HH_DATE_VISIT", "HH_DATE_ENCODED", "HH_LAST_UPDATED", "WATER_ID", "TOILET_ID",
+        "SITIO_ID", "ENCODED_BY_SYS_ID", "LAST_UPDATED_BY_SYS_ID"]),
+    "SOCIO_ECONOMIC_STATUS": ("SOEC_ID", ["SOEC_ID", "SOEC_STATUS", "SOEC_NUMBER"]),
+    "EDUCATION_STATUS": ("EDU_ID", ["EDU_ID", "EDU_IS_CURRENTLY_STUDENT", "EDU_INSTITUTION_NAME", "EDAT_ID"]),
+    "PHILHEALTH": ("PHEA_ID", ["PHEA_ID", "PHEA_ID_NUMBER", "PHEA_MEMBERSHIP_TYPE", "PC_ID"]),
+    "CONTACT": ("CON_ID", ["CON_ID", "CON_PHONE", "CON_EMAIL"]),
+    "CITIZEN": ("CTZ_ID", [
+        "CTZ_ID", "CTZ_FIRST_NAME", "CTZ_MIDDLE_NAME", "CTZ_LAST_NAME", "CTZ_DATE_OF_BIRTH", "CTZ_SEX",
+        "CTZ_CIVIL_STATUS", "CTZ_BLOOD_TYPE", "CTZ_IS_ALIVE", "CTZ_DATE_OF_DEATH", "CTZ_REASON_OF_DEATH",
+        "CTZ_IS_REGISTERED_VOTER", "CTZ_IS_IP", "CTZ_PLACE_OF_BIRTH", "CTZ_DATE_ENCODED", "CTZ_LAST_UPDATED",
+        "EDU_ID", "SOEC_ID", "PHEA_ID", "REL_ID", "CLAH_ID", "RTH_ID", "HH_ID", "SITIO_ID",
+        "ENCODED_BY_SYS_ID", "LAST_UPDATED_BY_SYS_ID", "CON_ID"]),
+    "EMPLOYMENT": ("EMP_ID", ["EMP_ID", "EMP_OCCUPATION", "EMP_IS_GOV_WORKER", "ES_ID", "CTZ_ID"]),
+    "MEDICAL_HISTORY": ("MH_ID", [
+        "MH_ID", "MH_DESCRIPTION", "MH_DATE_DIAGNOSED", "MH_DATE_ENCODED", "MH_LAST_UPDATED", "MHT_ID",
+        "CTZ_ID", "ENCODED_BY_SYS_ID", "LAST_UPDATED_BY_SYS_ID"]),
+    "FAMILY_PLANNING": ("FP_ID", ["FP_ID", "FP_START_DATE", "FP_END_DATE", "CTZ_ID", "FPMS_STATUS", "FPM_METHOD"]),
+    "TRANSACTION_LOG": ("TL_ID", [
+        "TL_ID", "TL_DATE_REQUESTED", "TL_PURPOSE", "TL_STATUS", "TL_FNAME", "TL_LNAME", "TL_DATE_ENCODED",
+        "TL_LAST_UPDATED", "TT_ID", "ENCODED_BY_SYS_ID", "LAST_UPDATED_BY_SYS_ID"]),
+    "CITIZEN_HISTORY": ("CIHI_ID", [
+        "CIHI_ID", "CIHI_DESCRIPTION", "CIHI_DATE_ENCODED", "CIHI_LAST_UPDATED", "HIST_ID", "CTZ_ID",
+        "ENCODED_BY_SYS_ID", "LAST_UPDATED_BY_SYS_ID"]),
+    "COMPLAINANT": ("COMP_ID", ["COMP_ID", "COMP_FNAME", "COMP_LNAME", "COMP_MNAME"]),
+    "SETTLEMENT_LOG": ("SETT_ID", [
+        "SETT_ID", "SETT_COMPLAINT_DESCRIPTION", "SETT_SETTLEMENT_DESCRIPTION", "SETT_DATE_OF_SETTLEMENT",
+        "SETT_DATE_ENCODED", "SETT_LAST_UPDATED", "COMP_ID", "CIHI_ID", "ENCODED_BY_SYS_ID",
+        "LAST_UPDATED_BY_SYS_ID"]),
+    "INFRASTRUCTURE_OWNER": ("INFO_ID", ["INFO_ID", "INFO_LNAME", "INFO_FNAME", "INFO_MNAME"]),
+    "INFRASTRUCTURE": ("INF_ID", [
+        "INF_ID", "INF_NAME", "INF_ACCESS_TYPE", "INF_DESCRIPTION", "INF_ADDRESS_DESCRIPTION", "INF_DATE_ENCODED",
+        "INF_LAST_UPDATED", "INFT_ID", "INFO_ID", "SITIO_ID", "ENCODED_BY_SYS_ID", "LAST_UPDATED_BY_SYS_ID"]),
+    "BUSINESS_INFO": ("BS_ID", [
+        "BS_ID", "BS_NAME", "BS_DESCRIPTION", "BS_STATUS", "BS_IS_DTI", "BS_ADDRESS", "BS_DATE_ENCODED",
+        "BS_LAST_UPDATED", "BS_FNAME", "BS_LNAME", "BST_ID", "SITIO_ID", "ENCODED_BY_SYS_ID",
+        "LAST_UPDATED_BY_SYS_ID"]),
+    "SYSTEM_ACTIVITY_LOG": (None, [
+        "ACT_TIMESTAMP", "ACT_ACTION_TYPE", "ACT_TABLE_NAME", "ACT_ENTITY_ID", "ACT_DESCRIPTION", "SYS_USER_ID"]),
+}
+
+# The tables attach_activity_log_triggers() audits, with the ID column it logs.
+AUDITED_TABLES = {"HOUSEHOLD_INFO", "CITIZEN", "BUSINESS_INFO", "INFRASTRUCTURE", "TRANSACTION_LOG",
+                  "CITIZEN_HISTORY", "MEDICAL_HISTORY", "SETTLEMENT_LOG"}
+
+LOOKUP_QUERIES = {
+    "sitio": "SELECT SITIO_ID, SITIO_NAME FROM SITIO WHERE SITIO_IS_DELETED = FALSE ORDER BY SITIO_ID;",
+    "water": "SELECT WATER_ID, WATER_SOURCE_NAME FROM WATER_SOURCE ORDER BY WATER_ID;",
+    "toilet": "SELECT TOIL_ID, TOIL_TYPE_NAME FROM TOILET_TYPE ORDER BY TOIL_ID;",
+    "relationship": "SELECT RTH_ID, RTH_RELATIONSHIP_NAME FROM RELATIONSHIP_TYPE ORDER BY RTH_ID;",
+    "religion": "SELECT REL_ID, REL_NAME FROM RELIGION ORDER BY REL_ID;",
+    "health_risk": "SELECT CLAH_ID, CLAH_CLASSIFICATION_NAME FROM CLASSIFICATION_HEALTH_RISK ORDER BY CLAH_ID;",
+    "attainment": "SELECT EDAT_ID, EDAT_LEVEL FROM EDUCATIONAL_ATTAINMENT ORDER BY EDAT_ID;",
+    "philhealth_category": "SELECT PC_ID, PC_CATEGORY_NAME FROM PHILHEALTH_CATEGORY ORDER BY PC_ID;",
+    "employment_status": "SELECT ES_ID, ES_STATUS_NAME FROM EMPLOYMENT_STATUS ORDER BY ES_ID;",
+    "medical_type": "SELECT MHT_ID, MHT_TYPE_NAME FROM MEDICAL_HISTORY_TYPE WHERE MHT_IS_DELETED = FALSE;",
+    "transaction_type": "SELECT TT_ID, TT_TYPE_NAME FROM TRANSACTION_TYPE WHERE TT_IS_DELETED = FALSE;",
+    "history_type": "SELECT HIST_ID, HIST_TYPE_NAME FROM HISTORY_TYPE WHERE HIST_IS_DELETED = FALSE;",
+    "business_type": "SELECT BST_ID, BST_TYPE_NAME FROM BUSINESS_TYPE ORDER BY BST_ID;",
+    "infrastructure_type": "SELECT INFT_ID, INFT_TYPE_NAME FROM INFRASTRUCTURE_TYPE WHERE INFT_IS_DELETED = FALSE;",
+    "fp_method": "SELECT FPM_ID, FPM_METHOD FROM FAMILY_PLANNING_METHOD ORDER BY FPM_ID;",
+    "fp_status": "SELECT FPMS_ID, FPMS_STATUS_NAME FROM FPM_STATUS ORDER BY FPMS_ID;",
+    "users": "SELECT SYS_USER_ID, SYS_FNAME || ' ' || SYS_LNAME FROM SYSTEM_ACCOUNT "
+             "WHERE SYS_IS_DELETED = FALSE ORDER BY SYS_USER_ID;",
+}
+
+
+def load_lookups(db):
+    """{lookup: {name: id}} for every lookup table the generator draws from."""
+    cursor = db.get_cursor()
+    lookups = {}
+    for name, query in LOOKUP_QUERIES.items():
+        cursor.execute(query)
+        lookups[name] = {label: row_id for row_id, label in cursor.fetchall()}
+        if not lookups[name]:
+            raise ValueError(f"Lookup '{name}' is empty; load the seed data from mnhs_barangay_new_query.sql first.")
+    return lookups
+
+
+class _IdAllocator:
+    """Hands out values of a table's serial sequence, reserved ID_CHUNK at a time."""
+
+    def __init__(self, cursor, table, column):
+        self.cursor = cursor
+        cursor.execute("SELECT pg_get_serial_sequence(%s, %s);", (table.lower(), column.lower()))
+        self.sequence = cursor.fetchone()[0]
+        self.free = []
+
+    def next(self):
+        if not self.free:
+            self.cursor.execute("SELECT nextval(%s) FROM generate_series(1, %s);", (self.sequence, ID_CHUNK))
+            self.free = [value for (value,) in self.cursor.fetchall()][::-1]
+        return self.free.pop()
+
+
+def _weighted(rng, pairs):
+    return rng.choices([value for value, _ in pairs], weights=[weight for _, weight in pairs])[0]
+
+
+def _band_age(rng, low, high):
+    """An age in [low, high] drawn from AGE_BANDS, each band weighted by its share of the range."""
+    bands = [(max(start, low), min(end, high), weight * (min(end, high) - max(start, low) + 1) / (end - start + 1))
+             for start, end, weight in AGE_BANDS if start <= high and end >= low]
+    if not bands:
+        return max(0, low)
+    start, end, _ = rng.choices(bands, weights=[weight for _, _, weight in bands])[0]
+    return rng.randint(start, end)
+
+
+def _poisson(rng, mean):
+    # Knuth's method; the means used here are small.
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def _birth_date(rng, as_of, age):
+    born = as_of - datetime.timedelta(days=int(age * 365.25) + rng.randint(0, 364))
+    return min(born, as_of)
+
+
+def _age_on(birth_date, day):
+    return day.year - birth_date.year - ((day.month, day.day) < (birth_date.month, birth_date.day))
+
+
+def _random_day(rng, start, end):
+    if end <= start:
+        return start
+    return start + datetime.timedelta(days=rng.randint(0, (end - start).days))
+
+
+def _timestamp(rng, day):
+    return datetime.datetime.combine(day, datetime.time(rng.randint(8, 16), rng.randint(0, 59), rng.randint(0, 59)))
+
+
+class _ShardBuilder:
+    """Generates one shard's rows, table by table, with IDs from the database's sequences."""
+
+    def __init__(self, cursor, seed, rng, lookups, as_of):
+        self.seed = seed
+        self.rng = rng
+        self.lookups = lookups
+        self.as_of = as_of
+        self.first_day = as_of - datetime.timedelta(days=365 * YEARS_OF_RECORDS)
+        self.users = list(lookups["users"].values())
+        self.user_names = list(lookups["users"])
+        self.rows = {table: [] for table in TABLES}
+        self.ids = {table: _IdAllocator(cursor, table, id_column)
+                    for table, (id_column, _) in TABLES.items() if id_column}
+
+    def add(self, table, values, encoded=None, updated=None, user=None):
+        """Appends a row (values without the ID) and its activity log rows; returns the new ID."""
+        row_id = self.ids[table].next() if table in self.ids else None
+        self.rows[table].append([row_id] + values if row_id is not None else values)
+        if table in AUDITED_TABLES:
+            name = table.lower()
+            self.rows["SYSTEM_ACTIVITY_LOG"].append(
+                [encoded, "INSERT", name, row_id, f"Action INSERT on {name} ID = {row_id}", user])
+            if updated and updated > encoded:
+                self.rows["SYSTEM_ACTIVITY_LOG"].append(
+                    [updated, "UPDATE", name, row_id, f"Action UPDATE on {name} ID = {row_id}", user])
+        return row_id
+
+    def encoding(self, earliest=None):
+        """(encoded, last updated, encoding user) for a record first encoded after earliest."""
+        day = _random_day(self.rng, max(earliest or self.first_day, self.first_day), self.as_of)
+        encoded = _timestamp(self.rng, day)
+        updated = encoded
+        if self.rng.random() < 0.3:
+            updated = _timestamp(self.rng, _random_day(self.rng, day, self.as_of))
+        return encoded, updated, self.rng.choice(self.users)
+
+    # --- people ---
+
+    def person(self, role, sex, age, last_name, middle_name):
+        rng = self.rng
+        first_name = rng.choice(MALE_FIRST_NAMES if sex == "M" else FEMALE_FIRST_NAMES)
+        if rng.random() < 0.15:
+            first_name += " " + rng.choice(MALE_FIRST_NAMES if sex == "M" else FEMALE_FIRST_NAMES)
+        return {"role": role, "sex": sex, "age": age, "first_name": first_name,
+                "last_name": last_name, "middle_name": middle_name,
+                "birth_date": _birth_date(rng, self.as_of, age)}
+
+    def household_members(self):
+        rng = self.rng
+        head_age = _band_age(rng, 22, 90)
+        head_sex = "M" if rng.random() < 0.72 else "F"
+        family = rng.choice(SURNAMES)
+        head = self.person("Head", head_sex, head_age, family, rng.choice(SURNAMES))
+        members = [head]
+
+        married = head_age >= 20 and rng.random() < 0.68
+        if married:
+            spouse_age = max(18, head_age + int(rng.gauss(-3 if head_sex == "M" else 3, 4)))
+            spouse = self.person("Spouse", "F" if head_sex == "M" else "M", spouse_age, family, rng.choice(SURNAMES))
+            members.append(spouse)
+            head["civil_status"] = spouse["civil_status"] = "Married"
+        elif head_age >= 60 and rng.random() < 0.6:
+            head["civil_status"] = "Widowed"
+        else:
+            head["civil_status"] = _weighted(rng, [("Single", 70), ("Separated", 25), ("Divorced", 5)])
+
+        mother = next((m for m in members if m["sex"] == "F"), None)
+        mother_age = mother["age"] if mother else head_age
+        max_children = 0 if mother_age < 17 else min(9, (mother_age - 16) // 2)
+        for _ in range(min(max_children, _poisson(rng, 2.4 if married else 1.2))):
+            child_age = _band_age(rng, 0, max(0, min(mother_age - 17, 35)))
+            sex = "M" if rng.random() < 0.51 else "F"
+            child = self.person("Son" if sex == "M" else "Daughter", sex, child_age, family,
+                                mother["last_name"] if mother and mother is not head else head["middle_name"])
+            child["civil_status"] = "Single" if child_age < 25 or rng.random() < 0.6 else "Married"
+            members.append(child)
+
+        for _ in range(_poisson(rng, 0.35)):
+            age = _band_age(rng, 0, 90)
+            sex = "M" if rng.random() < 0.48 else "F"
+            relative = self.person("Other Relative", sex, age, rng.choice([family] + SURNAMES[:10]),
+                                   rng.choice(SURNAMES))
+            relative["civil_status"] = ("Single" if age < 20 else
+                                        _weighted(rng, [("Widowed", 60), ("Single", 20), ("Married", 20)])
+                                        if age >= 60 else _weighted(rng, [("Single", 55), ("Married", 40),
+                                                                          ("Separated", 5)]))
+            members.append(relative)
+        return members
+
+    # --- per-citizen records ---
+
+    def education(self, age):
+        rng = self.rng
+        if age < 3:
+            return None
+        if age < 6:
+            level, student = "Kindergarten", rng.random() < 0.6
+        elif age < 12:
+            level, student = "Elementary Undergraduate", rng.random() < 0.97
+        elif age < 18:
+            level = _weighted(rng, [("Elementary Graduate", 15), ("Junior High School Undergraduate", 55),
+                                    ("Junior High School Graduate", 20), ("Senior High School Undergraduate", 10)])
+            student = rng.random() < 0.9
+        elif age < 23:
+            level = _weighted(rng, [("Junior High School Graduate", 15), ("Senior High School Graduate", 35),
+                                    ("College Undergraduate", 40), ("Vocational / Technical Graduate", 10)])
+            student = rng.random() < 0.45
+        else:
+            level, student = _weighted(rng, ADULT_ATTAINMENT), rng.random() < 0.02
+        school = rng.choice(SCHOOLS) if student else None
+        return self.add("EDUCATION_STATUS", [student, school, self.lookups["attainment"].get(level)])
+
+    def philhealth(self, age, employed, household_status):
+        rng = self.rng
+        if rng.random() < 0.15:
+            return None
+        categories = self.lookups["philhealth_category"]
+        if age >= 60:
+            category = "Senior Citizen"
+        elif household_status == "NHTS 4Ps":
+            category = "NHTS"
+        elif employed:
+            category = _weighted(rng, [("Formal Economy Private", 60), ("Formal Economy Government", 10),
+                                       ("Informal Economy", 30)])
+        else:
+            category = _weighted(rng, [("Informal Economy", 60), ("Unknown", 40)])
+        membership = "Member" if age >= 21 and (employed or age >= 60) else ("Dependent" if age < 21 else "None")
+        number = f"{rng.randint(10, 99)}{rng.randint(0, 10 ** 10 - 1):010d}" if membership != "None" else None
+        return self.add("PHILHEALTH", [number, membership, categories.get(category, next(iter(categories.values())))])
+
+    def employment(self, citizen_id, age):
+        rng = self.rng
+        statuses = self.lookups["employment_status"]
+        if age < 15:
+            return False
+        if age >= 65 or (age < 22 and rng.random() < 0.7):
+            status = "Not in Labor Force"
+        else:
+            status = _weighted(rng, [("Employed", 52), ("Self Employed", 22), ("Unemployed", 8),
+                                     ("Not in Labor Force", 18)])
+        occupation, government = (None, False)
+        if status in ("Employed", "Self Employed"):
+            occupation, government = rng.choice(OCCUPATIONS)
+        self.add("EMPLOYMENT", [occupation, government, statuses.get(status), citizen_id])
+        return status in ("Employed", "Self Employed")
+
+    def health_risk(self, sex, age):
+        rng = self.rng
+        risks = self.lookups["health_risk"]
+        if age < 1:
+            name = "Infant"
+        elif age < 5:
+            name = "Under 5 Years Old"
+        elif sex == "F" and 15 <= age < 18 and rng.random() < 0.02:
+            name = "Adolescent Pregnant"
+        elif sex == "F" and 18 <= age < 42 and rng.random() < 0.05:
+            name = _weighted(rng, [("Pregnant", 70), ("Postpartum", 30)])
+        elif rng.random() < 0.015:
+            name = "Person With Disability"
+        else:
+            name = "None"
+        return risks.get(name, risks.get("None"))
+
+    def medical_history(self, citizen_id, birth_date, age, earliest):
+        rng = self.rng
+        types = self.lookups["medical_type"]
+        mean = 0.05 if age < 30 else (0.3 if age < 50 else 0.8)
+        for _ in range(_poisson(rng, mean)):
+            kind = _weighted(rng, [("Hypertension", 40 if age >= 40 else 5), ("Diabetes", 15 if age >= 40 else 2),
+                                   ("Tuberculosis", 4), ("Surgery", 8), ("Others", 20)])
+            if kind not in types:
+                kind = next(iter(types))
+            diagnosed = _random_day(rng, max(birth_date, self.as_of - datetime.timedelta(days=365 * 20)), self.as_of)
+            encoded, updated, user = self.encoding(earliest)
+            self.add("MEDICAL_HISTORY", [rng.choice(MEDICAL_CONDITIONS.get(kind, ["Check-up"])), diagnosed,
+                                         encoded, updated, types[kind], citizen_id, user, user],
+                     encoded, updated, user)
+
+    def family_planning(self, citizen_id):
+        rng = self.rng
+        start = _random_day(rng, self.as_of - datetime.timedelta(days=365 * 6), self.as_of)
+        ended = rng.random() < 0.3
+        end = _random_day(rng, start, self.as_of) if ended else None
+        status = self.lookups["fp_status"].get("Dropout" if ended else
+                                               _weighted(rng, [("Current User", 70), ("New Acceptor", 20),
+                                                               ("Restarter", 10)]))
+        self.add("FAMILY_PLANNING", [start, end, citizen_id, status or next(iter(self.lookups["fp_status"].values())),
+                                     rng.choice(list(self.lookups["fp_method"].values()))])
+
+    # --- households ---
+
+    def household(self, shard_index, number):
+        rng = self.rng
+        lookups = self.lookups
+        sitio_name, sitio_id = rng.choice(list(lookups["sitio"].items()))
+        encoded, updated, user = self.encoding()
+        household_id = self.add("HOUSEHOLD_INFO", [
+            f"SYN-{self.seed}-{shard_index:05d}-{number:04d}", f"Purok {rng.randint(1, 12)}, Sitio {sitio_name}, Marigondon",
+            _weighted(rng, OWNERSHIP), rng.choice(self.user_names), rng.choice(self.user_names),
+            encoded.date(), encoded, updated,
+            rng.choice(list(lookups["water"].values())), rng.choice(list(lookups["toilet"].values())),
+            sitio_id, user, user], encoded, updated, user)
+
+        status = _weighted(rng, SOCIO_ECONOMIC)
+        soec_number = f"{rng.randint(0, 10 ** 9 - 1):09d}" if status != "Non-NHTS" else None
+        soec_id = self.add("SOCIO_ECONOMIC_STATUS", [status, soec_number])
+        religion = lookups["religion"].get(_weighted(rng, RELIGIONS))
+        is_ip = rng.random() < 0.02
+
+        adults = []
+        for member in self.household_members():
+            age = member["age"]
+            citizen_encoded, citizen_updated, citizen_user = self.encoding(max(encoded.date(), member["birth_date"]))
+            alive = not (rng.random() < (0.06 if age >= 70 else 0.01 if age >= 50 else 0.002))
+            death_date = _random_day(rng, citizen_encoded.date(), self.as_of) if not alive else None
+            contact_id = None
+            if age >= 15 and rng.random() < 0.7:
+                email = (f"{member['first_name'].split()[0].lower()}.{member['last_name'].replace(' ', '').lower()}"
+                         f"{rng.randint(1, 999)}@gmail.com") if rng.random() < 0.25 else None
+                contact_id = self.add("CONTACT", [f"09{rng.randint(0, 10 ** 9 - 1):09d}", email])
+
+            citizen_id = self.ids["CITIZEN"].next()
+            employed = self.employment(citizen_id, age)
+            self.rows["CITIZEN"].append([
+                citizen_id, member["first_name"], member["middle_name"], member["last_name"], member["birth_date"],
+                member["sex"], member.get("civil_status", "Single"), _weighted(rng, BLOOD_TYPES), alive, death_date,
+                rng.choice(DEATH_REASONS) if not alive else None, age >= 18 and rng.random() < 0.82, is_ip,
+                rng.choice(PLACES_OF_BIRTH), citizen_encoded, citizen_updated,
+                self.education(age), soec_id, self.philhealth(age, employed, status), religion,
+                self.health_risk(member["sex"], age), lookups["relationship"].get(member["role"]),
+                household_id, sitio_id, citizen_user, citizen_user, contact_id,
+            ])
+            self._log_insert("CITIZEN", citizen_id, citizen_encoded, citizen_updated, citizen_user)
+
+            self.medical_history(citizen_id, member["birth_date"], age, citizen_encoded.date())
+            if (member["sex"] == "F" and 15 <= age <= 49 and member.get("civil_status") == "Married"
+                    and rng.random() < 0.45):
+                self.family_planning(citizen_id)
+            if age >= 18:
+                adults.append((citizen_id, member))
+
+        self.transactions(adults, encoded.date())
+        self.complaints(adults, encoded.date())
+        if rng.random() < 1 / 25 and adults:
+            self.business(adults[0][1], sitio_id, sitio_name, encoded.date())
+        if rng.random() < 1 / 80:
+            self.infrastructure(sitio_id, sitio_name)
+
+    def _log_insert(self, table, row_id, encoded, updated, user):
+        # add() does this for rows it creates; citizens are built by hand to know their ID early.
+        name = table.lower()
+        self.rows["SYSTEM_ACTIVITY_LOG"].append(
+            [encoded, "INSERT", name, row_id, f"Action INSERT on {name} ID = {row_id}", user])
+        if updated > encoded:
+            self.rows["SYSTEM_ACTIVITY_LOG"].append(
+                [updated, "UPDATE", name, row_id, f"Action UPDATE on {name} ID = {row_id}", user])
+
+    def transactions(self, adults, earliest):
+        rng = self.rng
+        types = self.lookups["transaction_type"]
+        if not adults:
+            return
+        for _ in range(_poisson(rng, 0.6 * YEARS_OF_RECORDS)):
+            _, member = rng.choice(adults)
+            kind = rng.choice(list(types))
+            encoded, updated, user = self.encoding(earliest)
+            recent = (self.as_of - encoded.date()).days < 14
+            status = _weighted(rng, [("Pending", 70), ("Approved", 25), ("Declined", 5)] if recent else
+                               [("Pending", 3), ("Approved", 87), ("Declined", 10)])
+            self.add("TRANSACTION_LOG", [
+                encoded.date(), rng.choice(TRANSACTION_PURPOSES.get(kind, ["Request"])), status,
+                member["first_name"], member["last_name"], encoded, updated, types[kind], user, user,
+            ], encoded, updated, user)
+
+    def complaints(self, adults, earliest):
+        rng = self.rng
+        if not adults or rng.random() >= 0.04:
+            return
+        citizen_id, _ = rng.choice(adults)
+        complaint, settlement = rng.choice(COMPLAINTS)
+        types = self.lookups["history_type"]
+        encoded, updated, user = self.encoding(earliest)
+        history_id = self.add("CITIZEN_HISTORY", [
+            complaint, encoded, updated, types.get("Complaint", next(iter(types.values()))), citizen_id, user, user,
+        ], encoded, updated, user)
+        if rng.random() < 0.7:
+            sex = rng.choice("MF")
+            complainant_id = self.add("COMPLAINANT", [
+                rng.choice(MALE_FIRST_NAMES if sex == "M" else FEMALE_FIRST_NAMES), rng.choice(SURNAMES),
+                rng.choice(SURNAMES)[0],
+            ])
+            settled = _random_day(rng, encoded.date(), min(self.as_of, encoded.date() + datetime.timedelta(days=60)))
+            settled_at = _timestamp(rng, settled)
+            self.add("SETTLEMENT_LOG", [
+                complaint, settlement, settled, settled_at, settled_at, complainant_id, history_id, user, user,
+            ], settled_at, settled_at, user)
+
+    def business(self, owner, sitio_id, sitio_name, earliest):
+        rng = self.rng
+        encoded, updated, user = self.encoding(earliest)
+        kind = rng.choice(BUSINESS_NAMES)
+        self.add("BUSINESS_INFO", [
+            f"{owner['first_name'].split()[0]}'s {kind}", kind, _weighted(rng, [("Active", 80), ("Inactive", 10),
+                                                                               ("Closed", 8), ("Suspended", 2)]),
+            rng.random() < 0.4, f"Sitio {sitio_name}, Marigondon", encoded, updated, owner["first_name"],
+            owner["last_name"], rng.choice(list(self.lookups["business_type"].values())), sitio_id, user, user,
+        ], encoded, updated, user)
+
+    def infrastructure(self, sitio_id, sitio_name):
+        rng = self.rng
+        encoded, updated, user = self.encoding()
+        kind, type_id = rng.choice(list(self.lookups["infrastructure_type"].items()))
+        owner_id = None
+        if rng.random() < 0.4:
+            sex = rng.choice("MF")
+            owner_id = self.add("INFRASTRUCTURE_OWNER", [
+                rng.choice(SURNAMES), rng.choice(MALE_FIRST_NAMES if sex == "M" else FEMALE_FIRST_NAMES),
+                rng.choice(SURNAMES)[0],
+            ])
+        self.add("INFRASTRUCTURE", [
+            f"{sitio_name} {kind}", "Private" if owner_id else "Public", kind, f"Sitio {sitio_name}",
+            encoded, updated, type_id, owner_id, sitio_id, user, user,
+        ], encoded, updated, user)
+
+
+def _copy_rows(cursor, table, columns, rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)  # None is written unquoted and empty, which COPY reads as NULL
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _disable_triggers(cursor):
+    try:
+        cursor.execute("SET LOCAL session_replication_role = replica;")
+    except Exception as e:
+        raise PermissionError("Loading synthetic data needs a superuser (session_replication_role)") from e
+
+
+def generate_shard(shard_index, households, seed, lookups, as_of):
+    """Worker entry point: generates and COPYs one shard in one transaction. Returns {table: rows}."""
+    rng = random.Random(f"{seed}:{shard_index}")
+    db = Database(pooled=False)
+    cursor = db.conn.cursor()
+    try:
+        _disable_triggers(cursor)
+        builder = _ShardBuilder(cursor, seed, rng, lookups, as_of)
+        for number in range(households):
+            builder.household(shard_index, number)
+        for table, (_, columns) in TABLES.items():
+            if builder.rows[table]:
+                _copy_rows(cursor, table, columns, builder.rows[table])
+        db.conn.commit()
+        return {table: len(rows) for table, rows in builder.rows.items()}
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        db.close()
+
+
+def staff_sessions(rng, lookups, as_of):
+    """LOGIN/LOGOUT rows for each account on most weekdays of the last year."""
+    rows = []
+    day = as_of - datetime.timedelta(days=365)
+    while day <= as_of:
+        if day.weekday() < 5:
+            for user_id in lookups["users"].values():
+                if rng.random() < 0.8:
+                    login = datetime.datetime.combine(day, datetime.time(rng.randint(7, 9), rng.randint(0, 59)))
+                    logout = datetime.datetime.combine(day, datetime.time(rng.randint(16, 18), rng.randint(0, 59)))
+                    rows.append([login, "LOGIN", "system_account", user_id, "User logged in", user_id])
+                    rows.append([logout, "LOGOUT", "system_account", user_id, "User logged out", user_id])
+        day += datetime.timedelta(days=1)
+    return rows
+
+
+def generate(db, households, seed=DEFAULT_SEED, workers=None, as_of=None):
+    """Adds `households` synthetic households (and everything under them) to the database."""
+    as_of = as_of or datetime.date.today()
+    started = time.perf_counter()
+    lookups = load_lookups(db)
+
+    cursor = db.get_cursor()
+    cursor.execute("SELECT ensure_activity_log_partitions(%s);",
+                   (as_of - datetime.timedelta(days=365 * YEARS_OF_RECORDS + 31),))
+    db.conn.commit()
+
+    shards = [(index, min(SHARD_HOUSEHOLDS, households - index * SHARD_HOUSEHOLDS))
+              for index in range(math.ceil(households / SHARD_HOUSEHOLDS))]
+    totals = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(generate_shard, index, count, seed, lookups, as_of) for index, count in shards]
+        for done, future in enumerate(futures, 1):
+            for table, count in future.result().items():
+                totals[table] = totals.get(table, 0) + count
+            print(f"  shard {done}/{len(shards)} loaded ({time.perf_counter() - started:.1f} s)")
+
+    sessions = staff_sessions(random.Random(f"{seed}:sessions"), lookups, as_of)
+    cursor = db.conn.cursor()
+    try:
+        _copy_rows(cursor, "SYSTEM_ACTIVITY_LOG", TABLES["SYSTEM_ACTIVITY_LOG"][1], sessions)
+        db.conn.commit()
+    finally:
+        cursor.close()
+    totals["SYSTEM_ACTIVITY_LOG"] = totals.get("SYSTEM_ACTIVITY_LOG", 0) + len(sessions)
+    loaded = time.perf_counter()
+
+    # Triggers were off, so the statistics cubes and planner statistics are rebuilt here.
+    cursor = db.get_cursor()
+    cursor.execute("SELECT rebuild_stat_cubes();")
+    db.conn.commit()
+    db.conn.autocommit = True
+    try:
+        cursor.execute("ANALYZE;")
+    finally:
+        db.conn.autocommit = False
+
+    for table, count in totals.items():
+        print(f"  {table:<24} {count:>10}")
+    print(f"Loaded in {loaded - started:.1f} s, cubes rebuilt and analyzed in {time.perf_counter() - loaded:.1f} s")
+    return totals
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+
+    database = Database(pooled=False)
+    try:
+        generate(
+            database,
+            int(sys.argv[1]),
+            int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SEED,
+            int(sys.argv[3]) if len(sys.argv) > 3 else None,
+            datetime.date.fromisoformat(sys.argv[4]) if len(sys.argv) > 4 else None,
+        )
+    finally:
+        database.close()
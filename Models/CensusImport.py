@@ -0,0 +1,540 @@
+import csv
+import io
+import os
+import sys
+
+from Models.CensusRules import citizen_errors, household_errors, parse_date, yes_no
+from Models.LookupCache import LookupCache
+
+IMPORT_CHUNK_SIZE = 5000  # rows per COPY + merge transaction
+
+# Spreadsheet headers are matched case-insensitively with spaces read as "_".
+HOUSEHOLD_COLUMNS = (
+    'house_number', 'home_address', 'ownership_status', 'home_google_link',
+    'interviewer_name', 'reviewer_name', 'date_of_visit', 'water_source',
+    'toilet_type', 'sitio'
+)
+
+# house_number finds the household by HH_HOUSE_NUMBER; household_id may be given instead.
+CITIZEN_COLUMNS = (
+    'first_name', 'middle_name', 'last_name', 'suffix', 'birth_date', 'sex',
+    'civil_status', 'place_of_birth', 'blood_type', 'email_address', 'contact_number',
+    'sitio', 'religion', 'socio_eco_status', 'nhts_number', 'house_number',
+    'household_id', 'relationship', 'employment_status', 'occupation', 'gov_worker',
+    'phil_category', 'phil_id', 'membership_type', 'is_student', 'school_name',
+    'educ_level', 'fam_plan_method', 'fam_plan_stat', 'fam_plan_start_date',
+    'fam_plan_end_date', 'health_class', 'is_voter', 'is_indig', 'is_deceased',
+    'reason_of_death', 'date_of_death'
+)
+
+HOUSEHOLD_STAGE = """
+    CREATE TEMP TABLE IMPORT_HOUSEHOLD (
+        ROW_NO INT,
+        HH_HOUSE_NUMBER VARCHAR(50),
+        HH_ADDRESS TEXT,
+        HH_OWNERSHIP_STATUS TEXT,
+        HH_HOME_GOOGLE_LINK TEXT,
+        HH_INTERVIEWER_NAME VARCHAR(100),
+        HH_REVIEWER_NAME VARCHAR(100),
+        HH_DATE_VISIT DATE,
+        WATER_ID INT,
+        TOILET_ID INT,
+        SITIO_ID INT
+    ) ON COMMIT DROP;
+"""
+
+HOUSEHOLD_MERGE = [
+    ("House number already exists.", """
+        DELETE FROM IMPORT_HOUSEHOLD s
+        USING HOUSEHOLD_INFO h
+        WHERE h.HH_HOUSE_NUMBER = s.HH_HOUSE_NUMBER
+        RETURNING s.ROW_NO;
+    """),
+]
+
+HOUSEHOLD_INSERT = """
+    INSERT INTO HOUSEHOLD_INFO (
+        HH_HOUSE_NUMBER, HH_ADDRESS, HH_OWNERSHIP_STATUS, HH_HOME_GOOGLE_LINK,
+        HH_INTERVIEWER_NAME, HH_REVIEWER_NAME, HH_DATE_VISIT, ENCODED_BY_SYS_ID,
+        LAST_UPDATED_BY_SYS_ID, HH_DATE_ENCODED, WATER_ID, TOILET_ID, SITIO_ID
+    )
+    SELECT
+        HH_HOUSE_NUMBER, HH_ADDRESS, HH_OWNERSHIP_STATUS::house_ownership_status, HH_HOME_GOOGLE_LINK,
+        HH_INTERVIEWER_NAME, HH_REVIEWER_NAME, HH_DATE_VISIT, %(user_id)s,
+        %(user_id)s, CURRENT_TIMESTAMP, WATER_ID, TOILET_ID, SITIO_ID
+    FROM IMPORT_HOUSEHOLD;
+"""
+
+CITIZEN_STAGE = """
+    CREATE TEMP TABLE IMPORT_CITIZEN (
+        ROW_NO INT,
+        FIRST_NAME VARCHAR(100),
+        MIDDLE_NAME VARCHAR(100),
+        LAST_NAME VARCHAR(100),
+        SUFFIX VARCHAR(10),
+        BIRTH_DATE DATE,
+        SEX CHAR(1),
+        CIVIL_STATUS TEXT,
+        PLACE_OF_BIRTH TEXT,
+        BLOOD_TYPE TEXT,
+        IS_VOTER BOOLEAN,
+        IS_IP BOOLEAN,
+        IS_ALIVE BOOLEAN,
+        DATE_OF_DEATH DATE,
+        REASON_OF_DEATH TEXT,
+        EMAIL VARCHAR(100),
+        PHONE VARCHAR(20),
+        SITIO_ID INT,
+        RELIGION VARCHAR(100),
+        SOEC_STATUS VARCHAR(100),
+        SOEC_NUMBER VARCHAR(50),
+        HOUSE_NUMBER VARCHAR(50),
+        HH_ID INT,
+        RTH_ID INT,
+        ES_ID INT,
+        OCCUPATION VARCHAR(100),
+        IS_GOV_WORKER BOOLEAN,
+        PC_ID INT,
+        PHEA_ID_NUMBER VARCHAR(50),
+        MEMBERSHIP_TYPE VARCHAR(50),
+        IS_STUDENT BOOLEAN,
+        SCHOOL_NAME VARCHAR(255),
+        EDAT_ID INT,
+        FPM_ID INT,
+        FPMS_ID INT,
+        FP_START_DATE DATE,
+        FP_END_DATE DATE,
+        CLAH_ID INT,
+        -- filled in by the merge
+        REL_ID INT,
+        CON_ID INT,
+        EDU_ID INT,
+        SOEC_ID INT,
+        PHEA_ID INT,
+        CTZ_ID INT
+    ) ON COMMIT DROP;
+"""
+
+# Each statement removes the rows it rejects and returns their ROW_NO.
+CITIZEN_MERGE = [
+    ("Household ID does not exist.", """
+        WITH found AS (
+            UPDATE IMPORT_CITIZEN s
+            SET HH_ID = h.HH_ID
+            FROM HOUSEHOLD_INFO h
+            WHERE s.HH_ID IS NULL
+              AND h.HH_HOUSE_NUMBER = s.HOUSE_NUMBER
+              AND h.HH_IS_DELETED = FALSE
+            RETURNING s.ROW_NO, h.HH_ID
+        )
+        DELETE FROM IMPORT_CITIZEN s
+        WHERE NOT EXISTS (SELECT 1 FROM found f WHERE f.ROW_NO = s.ROW_NO)
+          AND NOT EXISTS (
+              SELECT 1 FROM HOUSEHOLD_INFO h
+              WHERE h.HH_ID = s.HH_ID AND h.HH_IS_DELETED = FALSE
+          )
+        RETURNING s.ROW_NO;
+    """),
+    ("A citizen with the same name and date of birth already exists.", """
+        DELETE FROM IMPORT_CITIZEN s
+        WHERE EXISTS (
+            SELECT 1 FROM CITIZEN c
+            WHERE c.CTZ_IS_DELETED = FALSE
+              AND LOWER(c.CTZ_FIRST_NAME) = LOWER(s.FIRST_NAME)
+              AND LOWER(c.CTZ_LAST_NAME) = LOWER(s.LAST_NAME)
+              AND c.CTZ_DATE_OF_BIRTH = s.BIRTH_DATE
+        )
+        RETURNING s.ROW_NO;
+    """),
+]
+
+CITIZEN_INSERTS = [
+    """
+        INSERT INTO RELIGION (REL_NAME)
+        SELECT DISTINCT s.RELIGION
+        FROM IMPORT_CITIZEN s
+        WHERE NOT EXISTS (SELECT 1 FROM RELIGION r WHERE r.REL_NAME = s.RELIGION);
+    """,
+    # IDs are drawn up front so every child row can be inserted as one set.
+    """
+        UPDATE IMPORT_CITIZEN s SET
+            REL_ID = (SELECT MIN(r.REL_ID) FROM RELIGION r WHERE r.REL_NAME = s.RELIGION),
+            CON_ID = nextval(pg_get_serial_sequence('contact', 'con_id')),
+            EDU_ID = nextval(pg_get_serial_sequence('education_status', 'edu_id')),
+            SOEC_ID = nextval(pg_get_serial_sequence('socio_economic_status', 'soec_id')),
+            PHEA_ID = nextval(pg_get_serial_sequence('philhealth', 'phea_id')),
+            CTZ_ID = nextval(pg_get_serial_sequence('citizen', 'ctz_id'));
+    """,
+    """
+        INSERT INTO CONTACT (CON_ID, CON_EMAIL, CON_PHONE)
+        SELECT CON_ID, EMAIL, PHONE FROM IMPORT_CITIZEN;
+    """,
+    """
+        INSERT INTO EDUCATION_STATUS (EDU_ID, EDU_IS_CURRENTLY_STUDENT, EDU_INSTITUTION_NAME, EDAT_ID)
+        SELECT EDU_ID, IS_STUDENT, SCHOOL_NAME, EDAT_ID FROM IMPORT_CITIZEN;
+    """,
+    """
+        INSERT INTO SOCIO_ECONOMIC_STATUS (SOEC_ID, SOEC_STATUS, SOEC_NUMBER)
+        SELECT SOEC_ID, SOEC_STATUS, SOEC_NUMBER FROM IMPORT_CITIZEN;
+    """,
+    """
+        INSERT INTO PHILHEALTH (PHEA_ID, PHEA_ID_NUMBER, PC_ID, PHEA_MEMBERSHIP_TYPE)
+        SELECT PHEA_ID, PHEA_ID_NUMBER, PC_ID, MEMBERSHIP_TYPE FROM IMPORT_CITIZEN;
+    """,
+    """
+        INSERT INTO CITIZEN (
+            CTZ_ID, CTZ_FIRST_NAME, CTZ_MIDDLE_NAME, CTZ_LAST_NAME, CTZ_SUFFIX,
+            CTZ_DATE_OF_BIRTH, CTZ_SEX, CTZ_CIVIL_STATUS, CTZ_PLACE_OF_BIRTH,
+            CTZ_BLOOD_TYPE, CTZ_IS_REGISTERED_VOTER, CTZ_IS_IP, CTZ_IS_ALIVE, CTZ_DATE_OF_DEATH,
+            CTZ_REASON_OF_DEATH, CTZ_DATE_ENCODED, CON_ID, SITIO_ID, EDU_ID, SOEC_ID,
+            PHEA_ID, REL_ID, RTH_ID, HH_ID, ENCODED_BY_SYS_ID, LAST_UPDATED_BY_SYS_ID,
+            CLAH_ID
+        )
+        SELECT
+            CTZ_ID, FIRST_NAME, MIDDLE_NAME, LAST_NAME, SUFFIX,
+            BIRTH_DATE, SEX, CIVIL_STATUS::civil_status_type, PLACE_OF_BIRTH,
+            BLOOD_TYPE::blood_type_enum, IS_VOTER, IS_IP, IS_ALIVE, DATE_OF_DEATH,
+            REASON_OF_DEATH, CURRENT_TIMESTAMP, CON_ID, SITIO_ID, EDU_ID, SOEC_ID,
+            PHEA_ID, REL_ID, RTH_ID, HH_ID, %(user_id)s, %(user_id)s,
+            CLAH_ID
+        FROM IMPORT_CITIZEN;
+    """,
+    """
+        INSERT INTO FAMILY_PLANNING (FP_START_DATE, FP_END_DATE, CTZ_ID, FPMS_STATUS, FPM_METHOD)
+        SELECT FP_START_DATE, FP_END_DATE, CTZ_ID, FPMS_ID, FPM_ID
+        FROM IMPORT_CITIZEN
+        WHERE FPM_ID IS NOT NULL AND FPMS_ID IS NOT NULL;
+    """,
+    """
+        INSERT INTO EMPLOYMENT (EMP_OCCUPATION, EMP_IS_GOV_WORKER, ES_ID, CTZ_ID)
+        SELECT OCCUPATION, IS_GOV_WORKER, ES_ID, CTZ_ID FROM IMPORT_CITIZEN;
+    """,
+]
+
+_NO_CHOICE = ('None', '-- None --')
+
+
+class ImportReport:
+    def __init__(self, path, kind):
+        self.path = path
+        self.kind = kind
+        self.rows_read = 0
+        self.imported = 0
+        self.errors = []  # (row_number, message), row numbers as shown in the spreadsheet
+        self.cancelled = False
+
+    def add_error(self, row_number, message):
+        self.errors.append((row_number, message))
+
+    def rejected_rows(self):
+        return len({row_number for row_number, _ in self.errors})
+
+    def summary(self):
+        text = (f"{self.imported} of {self.rows_read} {self.kind} imported, "
+                f"{self.rejected_rows()} rows rejected.")
+        if self.cancelled:
+            text += " The import was cancelled; earlier batches were kept."
+        return text
+
+    def write_csv(self, path=None):
+        """Writes the per-row errors next to the source file and returns the report's path."""
+        if path is None:
+            base, _ = os.path.splitext(self.path)
+            path = f"{base}_import_errors.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["row", "error"])
+            writer.writerows(sorted(self.errors))
+        return path
+
+
+def _header_key(value):
+    return str(value or "").strip().lower().replace(" ", "_")
+
+
+def _cell(value):
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # spreadsheet numbers such as house numbers
+    text = value if hasattr(value, "year") else str(value).strip()
+    return text if text != "" else None
+
+
+def read_rows(path):
+    """Streams (row_number, row) pairs from a .csv or .xlsx file; the first row is the header."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = [_header_key(h) for h in next(reader, [])]
+            for row_number, values in enumerate(reader, start=2):
+                if any(v.strip() for v in values):
+                    yield row_number, {k: _cell(v) for k, v in zip(header, values)}
+    elif ext in (".xlsx", ".xlsm"):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportError("Reading .xlsx files needs the openpyxl package (pip install openpyxl).")
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [_header_key(h) for h in next(rows, ())]
+            for row_number, values in enumerate(rows, start=2):
+                if any(v is not None and str(v).strip() for v in values):
+                    yield row_number, {k: _cell(v) for k, v in zip(header, values)}
+        finally:
+            workbook.close()
+    else:
+        raise ValueError(f"Unsupported file type '{ext}'. Use a .csv or .xlsx file.")
+
+
+def detect_kind(row):
+    if 'first_name' in row or 'last_name' in row:
+        return "citizens"
+    if 'home_address' in row:
+        return "households"
+    raise ValueError("Could not tell households from citizens: the header needs "
+                     "'home_address' (households) or 'first_name' (citizens).")
+
+
+class CensusImport:
+    """Loads a census spreadsheet of households or citizens.
+
+    Rows are validated with CensusRules, reference names are resolved from the
+    LookupCache, and each chunk of valid rows is COPYed into a temporary staging
+    table and merged with a handful of set-based statements in one transaction.
+    app.current_user_id is set for the transaction, so the audit triggers credit
+    the encoder exactly as a popup save would.
+    """
+
+    def __init__(self, db, sys_user_id, chunk_size=IMPORT_CHUNK_SIZE, on_progress=None, is_cancelled=None):
+        self.db = db
+        self.sys_user_id = sys_user_id
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.is_cancelled = is_cancelled
+        self.lookups = LookupCache.instance()
+        self._names = {}
+
+    def run(self, path):
+        rows = read_rows(path)
+        first = next(rows, None)
+        if first is None:
+            return ImportReport(path, "rows")
+
+        kind = detect_kind(first[1])
+        report = ImportReport(path, kind)
+        prepare = self._prepare_household if kind == "households" else self._prepare_citizen
+        merge = self._merge_households if kind == "households" else self._merge_citizens
+        seen = set()
+
+        chunk = []
+        for row_number, row in self._chain(first, rows):
+            report.rows_read += 1
+            errors = (household_errors if kind == "households" else citizen_errors)(row)
+            staged = None
+            if not errors:
+                staged, errors = prepare(row_number, row, seen)
+            for message in errors:
+                report.add_error(row_number, message)
+            if staged:
+                chunk.append(staged)
+
+            if len(chunk) >= self.chunk_size:
+                merge(chunk, report)
+                chunk = []
+                if self._cancelled(report):
+                    return report
+
+        if chunk:
+            merge(chunk, report)
+        return report
+
+    @staticmethod
+    def _chain(first, rows):
+        yield first
+        yield from rows
+
+    def _cancelled(self, report):
+        if self.on_progress:
+            self.on_progress(report.rows_read, report.imported)
+        if self.is_cancelled and self.is_cancelled():
+            report.cancelled = True
+        return report.cancelled
+
+    # --- lookups ---
+
+    def _id_for(self, lookup, value):
+        """Case- and whitespace-insensitive name -> id, resolved from one cached map per table."""
+        names = self._names.get(lookup)
+        if names is None:
+            names = {str(name).strip().lower(): row_id for row_id, name in self.lookups.rows(lookup, self.db)}
+            self._names[lookup] = names
+        return names.get(str(value).strip().lower())
+
+    def _resolve(self, errors, lookup, value, label):
+        row_id = self._id_for(lookup, value)
+        if row_id is None:
+            errors.append(f"{label} '{value}' not found.")
+        return row_id
+
+    # --- households ---
+
+    def _prepare_household(self, row_number, row, seen):
+        errors = []
+        house_number = str(row['house_number'])
+        if house_number in seen:
+            errors.append("House number appears more than once in the file.")
+        seen.add(house_number)
+
+        sitio_id = self._resolve(errors, "sitio", row['sitio'], "Sitio")
+        water_id = self._resolve(errors, "water_source", row['water_source'], "Water source")
+        toilet_id = self._resolve(errors, "toilet_type", row['toilet_type'], "Toilet type")
+        if errors:
+            return None, errors
+
+        return (
+            row_number, house_number, row['home_address'], row['ownership_status'],
+            row.get('home_google_link'), row.get('interviewer_name'), row.get('reviewer_name'),
+            parse_date(row['date_of_visit']), water_id, toilet_id, sitio_id
+        ), errors
+
+    def _merge_households(self, chunk, report):
+        self._merge(chunk, report, HOUSEHOLD_STAGE, "IMPORT_HOUSEHOLD", HOUSEHOLD_MERGE, [HOUSEHOLD_INSERT])
+
+    # --- citizens ---
+
+    def _prepare_citizen(self, row_number, row, seen):
+        errors = []
+        name_key = (row['first_name'].lower(), row['last_name'].lower(), parse_date(row['birth_date']))
+        if name_key in seen:
+            errors.append("A citizen with the same name and date of birth appears more than once in the file.")
+        seen.add(name_key)
+
+        sitio_id = self._resolve(errors, "sitio", row['sitio'], "Sitio")
+        rth_id = self._resolve(errors, "relationship_type", row['relationship'], "Relationship")
+        es_id = self._resolve(errors, "employment_status", row['employment_status'], "Employment status")
+        pc_id = self._resolve(errors, "philhealth_category", row['phil_category'], "Philhealth category")
+
+        clah_id = edat_id = fpm_id = fpms_id = None
+        if row['health_class'] not in _NO_CHOICE:
+            clah_id = self._resolve(errors, "classification_health_risk", row['health_class'], "Health classification")
+        if row.get('educ_level') and row['educ_level'] not in _NO_CHOICE:
+            edat_id = self._resolve(errors, "educational_attainment", row['educ_level'], "Educational level")
+        if row['fam_plan_method'] not in _NO_CHOICE and row['fam_plan_stat'] not in _NO_CHOICE:
+            fpm_id = self._resolve(errors, "family_planning_method", row['fam_plan_method'], "Family planning method")
+            fpms_id = self._resolve(errors, "fpm_status", row['fam_plan_stat'], "Family planning status")
+
+        household_id = None
+        if row.get('household_id'):
+            try:
+                household_id = int(row['household_id'])
+            except (TypeError, ValueError):
+                errors.append(f"Household ID '{row['household_id']}' is not a number.")
+        if errors:
+            return None, errors
+
+        deceased = yes_no(row['is_deceased']) == 'Yes'
+        socio_status = row['socio_eco_status']
+        return (
+            row_number, row['first_name'], row.get('middle_name'), row['last_name'], row.get('suffix'),
+            parse_date(row['birth_date']), 'M' if row['sex'] in ('Male', 'M') else 'F',
+            row['civil_status'], row.get('place_of_birth'), row.get('blood_type'),
+            yes_no(row['is_voter']) == 'Yes', yes_no(row['is_indig']) == 'Yes', not deceased,
+            parse_date(row.get('date_of_death')) if deceased else None,
+            row.get('reason_of_death') if deceased else None,
+            row.get('email_address'), row.get('contact_number'), sitio_id, row['religion'],
+            socio_status, row.get('nhts_number') if socio_status in ('NHTS 4Ps', 'NHTS Non-4Ps') else None,
+            row.get('house_number'), household_id, rth_id, es_id, row.get('occupation'),
+            yes_no(row.get('gov_worker')) == 'Yes', pc_id, row.get('phil_id'), row['membership_type'],
+            yes_no(row['is_student']) == 'Yes', row.get('school_name'), edat_id, fpm_id, fpms_id,
+            parse_date(row.get('fam_plan_start_date')), parse_date(row.get('fam_plan_end_date')), clah_id
+        ), errors
+
+    def _merge_citizens(self, chunk, report):
+        if self._merge(chunk, report, CITIZEN_STAGE, "IMPORT_CITIZEN", CITIZEN_MERGE, CITIZEN_INSERTS):
+            self.lookups.bump("religion")  # the merge may have added religions
+            self._names.pop("religion", None)
+
+    # --- COPY + merge ---
+
+    def _merge(self, chunk, report, stage_sql, stage_table, rejects, inserts):
+        """One transaction per chunk. Returns True when any of the chunk was committed.
+
+        A chunk that fails (e.g. a value the database rejects that CensusRules does
+        not check) is retried in halves, so the report names the rows at fault
+        instead of marking the whole chunk unsaved.
+        """
+        error = self._merge_once(chunk, report, stage_sql, stage_table, rejects, inserts)
+        if error is None:
+            return True
+        if len(chunk) == 1:
+            report.add_error(chunk[0][0], f"Row not saved: {error}")
+            return False
+        middle = len(chunk) // 2
+        first = self._merge(chunk[:middle], report, stage_sql, stage_table, rejects, inserts)
+        second = self._merge(chunk[middle:], report, stage_sql, stage_table, rejects, inserts)
+        return first or second
+
+    def _merge_once(self, chunk, report, stage_sql, stage_table, rejects, inserts):
+        """Stages and merges chunk in one transaction. Returns None, or the error it rolled back on."""
+        conn = self.db.conn
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SET LOCAL app.current_user_id TO %s", (str(self.sys_user_id),))
+            cursor.execute(stage_sql)
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for staged in chunk:
+                writer.writerow("" if v is None else v for v in staged)
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {stage_table} FROM STDIN WITH (FORMAT csv)", buffer)
+
+            rejected = []
+            for message, sql in rejects:
+                cursor.execute(sql)
+                rejected.extend((row_no, message) for (row_no,) in cursor.fetchall())
+
+            cursor.execute(f"SELECT COUNT(*) FROM {stage_table};")
+            imported = cursor.fetchone()[0]
+            params = {"user_id": self.sys_user_id}
+            for sql in inserts:
+                cursor.execute(sql, params)
+
+            conn.commit()
+            report.imported += imported
+            for row_no, message in rejected:
+                report.add_error(row_no, message)
+            return None
+        except Exception as e:
+            conn.rollback()
+            print(f"[ERROR] Census import batch of {len(chunk)} rows failed: {e}")
+            return str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+        finally:
+            cursor.close()
+
+
+def run_census_import(db, path, sys_user_id, on_progress=None, is_cancelled=None):
+    """QueryExecutor entry point: imports the file and writes its error report."""
+    report = CensusImport(db, sys_user_id, on_progress=on_progress, is_cancelled=is_cancelled).run(path)
+    report.report_path = report.write_csv() if report.errors else None
+    return report
+
+
+if __name__ == "__main__":
+    # python -m Models.CensusImport <file.csv|file.xlsx> <sys_user_id>
+    from database import Database
+
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m Models.CensusImport <file.csv|file.xlsx> <sys_user_id>")
+    database = Database(pooled=False)
+    try:
+        result = run_census_import(database, sys.argv[1], int(sys.argv[2]),
+                                   on_progress=lambda read, done: print(f"{read} rows read, {done} imported"))
+        print(result.summary())
+        if result.report_path:
+            print(f"Errors written to {result.report_path}")
+    finally:
+        database.close()
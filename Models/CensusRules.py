@@ -0,0 +1,160 @@
+from datetime import date, datetime
+
+# The checks the register popups make (HouseholdController.validate_fields and
+# CitizenController.validate_part1/2/3_fields), without the widget styling, so
+# the census import can apply them to plain rows. Keep the two in step. Rows are
+# dicts keyed like the popups' get_form_data(); values are stripped strings or None.
+
+CIVIL_STATUSES = ('Single', 'Married', 'Widowed', 'Separated', 'Divorced')
+BLOOD_TYPES = ('A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-', 'Unknown')
+OWNERSHIP_STATUSES = ('Owned', 'Rented', 'Leased', 'Informal Settler')
+SOCIO_ECONOMIC_STATUSES = ('NHTS 4Ps', 'NHTS Non-4Ps', 'Non-NHTS')
+MEMBERSHIP_TYPES = ('None', 'Member', 'Dependent')
+NHTS_STATUSES = ('NHTS 4Ps', 'NHTS Non-4Ps')
+OCCUPATION_REQUIRED_FOR = ('Employed', 'Self Employed')
+NOT_WORKING = ('Unemployed', 'Not in Labor Force')
+
+# Longest text each column takes (VARCHAR sizes in mnhs_barangay_new_query.sql).
+# A longer value would fail the COPY of the whole chunk it is in.
+HOUSEHOLD_FIELD_LENGTHS = {'house_number': 50, 'interviewer_name': 100, 'reviewer_name': 100}
+CITIZEN_FIELD_LENGTHS = {
+    'first_name': 100, 'middle_name': 100, 'last_name': 100, 'suffix': 10, 'email_address': 100,
+    'contact_number': 20, 'religion': 100, 'nhts_number': 50, 'house_number': 50, 'occupation': 100,
+    'phil_id': 50, 'school_name': 255,
+}
+
+_YES = {'yes', 'y', 'true', '1'}
+_NO = {'no', 'n', 'false', '0'}
+
+
+def yes_no(value):
+    """'Yes', 'No' or None for the spellings a spreadsheet might use."""
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    if text in _YES:
+        return 'Yes'
+    if text in _NO:
+        return 'No'
+    return None
+
+
+def parse_date(value):
+    """A date from a date cell or a 'YYYY-MM-DD' / 'MM/DD/YYYY' string, else None."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(str(value).strip(), fmt).date()
+        except ValueError:
+            pass
+    return None
+
+
+def length_errors(row, lengths, end=""):
+    return [f"{key.replace('_', ' ').capitalize()} is longer than {limit} characters{end}"
+            for key, limit in lengths.items()
+            if row.get(key) is not None and len(str(row[key])) > limit]
+
+
+def household_errors(row):
+    errors = length_errors(row, HOUSEHOLD_FIELD_LENGTHS)
+    if not row.get('house_number'):
+        errors.append("House Number is required")
+    if not row.get('sitio'):
+        errors.append("Sitio is required")
+    if not row.get('ownership_status'):
+        errors.append("Ownership is required")
+    elif row['ownership_status'] not in OWNERSHIP_STATUSES:
+        errors.append(f"Ownership '{row['ownership_status']}' is not one of {', '.join(OWNERSHIP_STATUSES)}")
+    if not row.get('home_address'):
+        errors.append("Home Address is required")
+    if not row.get('water_source'):
+        errors.append("Water source is required")
+    if not row.get('toilet_type'):
+        errors.append("Toilet type is required")
+
+    visit = parse_date(row.get('date_of_visit'))
+    if visit is None:
+        errors.append("Date of visit is required (YYYY-MM-DD)")
+    elif visit > date.today():
+        errors.append("Date of visit cannot be in the future")
+    return errors
+
+
+def citizen_errors(row):
+    errors = length_errors(row, CITIZEN_FIELD_LENGTHS, ".")
+
+    # Part 1
+    if not row.get('first_name'):
+        errors.append("First name is required.")
+    if not row.get('last_name'):
+        errors.append("Last name is required.")
+    if parse_date(row.get('birth_date')) is None:
+        errors.append("Date of birth is required (YYYY-MM-DD).")
+    if not row.get('civil_status'):
+        errors.append("Civil status is required.")
+    elif row['civil_status'] not in CIVIL_STATUSES:
+        errors.append(f"Civil status '{row['civil_status']}' is not recognised.")
+    if row.get('blood_type') and row['blood_type'] not in BLOOD_TYPES:
+        errors.append(f"Blood type '{row['blood_type']}' is not recognised.")
+    if not row.get('religion'):
+        errors.append("Religion is required.")
+    if row.get('sex') not in ('Male', 'Female', 'M', 'F'):
+        errors.append("Sex is required.")
+    if not row.get('sitio'):
+        errors.append("Sitio is required.")
+
+    # Part 2
+    socio_status = row.get('socio_eco_status')
+    if not socio_status:
+        errors.append("Socio Economic Status is required.")
+    elif socio_status not in SOCIO_ECONOMIC_STATUSES:
+        errors.append(f"Socio Economic Status '{socio_status}' is not recognised.")
+    elif socio_status in NHTS_STATUSES and not row.get('nhts_number'):
+        errors.append("NHTS Number is required.")
+
+    employment_status = row.get('employment_status')
+    if not employment_status:
+        errors.append("Employment Status is required.")
+    elif employment_status in OCCUPATION_REQUIRED_FOR and not row.get('occupation'):
+        errors.append("Occupation is required.")
+
+    if not row.get('house_number') and not row.get('household_id'):
+        errors.append("Household ID is required.")
+    if not row.get('relationship'):
+        errors.append("Relationship is required.")
+    if not row.get('phil_category'):
+        errors.append("Philhealth Category is required.")
+    if not row.get('membership_type'):
+        errors.append("Membership Type is required.")
+    elif row['membership_type'] not in MEMBERSHIP_TYPES:
+        errors.append(f"Membership Type '{row['membership_type']}' is not recognised.")
+    if employment_status not in NOT_WORKING and not yes_no(row.get('gov_worker')):
+        errors.append("Government Worker is required.")
+
+    # Part 3
+    if not yes_no(row.get('is_student')):
+        errors.append("Student is required.")
+    if not row.get('fam_plan_method'):
+        errors.append("Family Method is required.")
+    if not row.get('fam_plan_stat'):
+        errors.append("Family Status is required.")
+    if not yes_no(row.get('is_voter')):
+        errors.append("Voter is required.")
+    deceased = yes_no(row.get('is_deceased'))
+    if not deceased:
+        errors.append("Deceased is required.")
+    elif deceased == 'Yes' and not row.get('reason_of_death'):
+        errors.append("Reason of Death is required.")
+    elif deceased == 'Yes' and parse_date(row.get('date_of_death')) is None:
+        errors.append("Date of Death is required (YYYY-MM-DD).")
+    if not yes_no(row.get('is_indig')):
+        errors.append("Indigenous Group is required.")
+    if not row.get('health_class'):
+        errors.append("Health Classification is required.")
+    return errors
@@ -0,0 +1,208 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from Utils.util_query_executor import QueryExecutor
+
+PAGE_SIZE = 100
+
+# Only the columns the list shows. The full profile is fetched on row click.
+CITIZEN_PAGE_QUERY = """
+    SELECT
+        C.CTZ_ID,
+        C.CTZ_LAST_NAME,
+        C.CTZ_FIRST_NAME,
+        S.SITIO_NAME,
+        TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS LAST_UPDATED
+    FROM CITIZEN C
+    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
+    WHERE C.CTZ_IS_DELETED = FALSE
+    {keyset}
+    ORDER BY C.CTZ_ID DESC
+    LIMIT %s;
+"""
+
+
+# Exact ID lookups go straight through the primary key.
+CITIZEN_ID_SEARCH_QUERY = """
+    SELECT
+        C.CTZ_ID,
+        C.CTZ_LAST_NAME,
+        C.CTZ_FIRST_NAME,
+        S.SITIO_NAME,
+        TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS LAST_UPDATED
+    FROM CITIZEN C
+    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
+    WHERE C.CTZ_ID = %(citizen_id)s
+      AND C.CTZ_IS_DELETED = FALSE;
+"""
+
+# Name matches use the pg_trgm GIN indexes on CITIZEN (see the INDEXES section
+# of mnhs_barangay_new_query.sql). Sitio matches are a separate branch so the
+# OR does not span the join and defeat the citizen indexes. Results are ranked
+# by trigram similarity, with sitio-only matches ranked below name matches.
+CITIZEN_NAME_SEARCH_QUERY = """
+    WITH MATCHES AS (
+        SELECT
+            C.CTZ_ID,
+            GREATEST(
+                similarity(C.CTZ_LAST_NAME, %(term)s),
+                similarity(C.CTZ_FIRST_NAME, %(term)s),
+                similarity(C.CTZ_FIRST_NAME || ' ' || C.CTZ_LAST_NAME, %(term)s)
+            ) AS RANK
+        FROM CITIZEN C
+        WHERE C.CTZ_IS_DELETED = FALSE
+          AND (
+              C.CTZ_LAST_NAME ILIKE %(pattern)s OR
+              C.CTZ_FIRST_NAME ILIKE %(pattern)s OR
+              (C.CTZ_FIRST_NAME || ' ' || C.CTZ_LAST_NAME) ILIKE %(pattern)s
+          )
+        UNION ALL
+        SELECT
+            C.CTZ_ID,
+            similarity(S.SITIO_NAME, %(term)s) * 0.5 AS RANK
+        FROM SITIO S
+        JOIN CITIZEN C ON C.SITIO_ID = S.SITIO_ID
+        WHERE S.SITIO_NAME ILIKE %(pattern)s
+          AND C.CTZ_IS_DELETED = FALSE
+    ),
+    RANKED AS (
+        SELECT CTZ_ID, MAX(RANK) AS RANK
+        FROM MATCHES
+        GROUP BY CTZ_ID
+        ORDER BY MAX(RANK) DESC, CTZ_ID DESC
+        LIMIT %(limit)s
+    )
+    SELECT
+        C.CTZ_ID,
+        C.CTZ_LAST_NAME,
+        C.CTZ_FIRST_NAME,
+        S.SITIO_NAME,
+        TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS LAST_UPDATED
+    FROM RANKED R
+    JOIN CITIZEN C ON C.CTZ_ID = R.CTZ_ID
+    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
+    ORDER BY R.RANK DESC, C.CTZ_ID DESC;
+"""
+
+SEARCH_LIMIT = 50
+
+
+def escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_citizens(db, search_text, limit=SEARCH_LIMIT):
+    """Ranked citizen search. Numeric input is treated as a citizen ID."""
+    cursor = db.get_cursor()
+    search_text = search_text.strip()
+    if search_text.isdigit():
+        cursor.execute(CITIZEN_ID_SEARCH_QUERY, {"citizen_id": int(search_text)})
+        return cursor.fetchall()
+
+    cursor.execute(CITIZEN_NAME_SEARCH_QUERY, {
+        "term": search_text,
+        "pattern": f"%{escape_like(search_text)}%",
+        "limit": limit
+    })
+    return cursor.fetchall()
+
+
+def fetch_citizen_page(db, after_id, limit):
+    """Keyset page on CTZ_ID: the next `limit` citizens older than `after_id`."""
+    cursor = db.get_cursor()
+    if after_id is None:
+        cursor.execute(CITIZEN_PAGE_QUERY.format(keyset=""), (limit,))
+    else:
+        cursor.execute(CITIZEN_PAGE_QUERY.format(keyset="AND C.CTZ_ID < %s"), (after_id, limit))
+    return cursor.fetchall()
+
+
+class CitizenListModel(QAbstractTableModel):
+    HEADERS = ["ID", "Family Name", "First Name", "Sitio", "Last Updated"]
+
+    def __init__(self, parent=None, executor_key="citizen_list", page_size=PAGE_SIZE):
+        super().__init__(parent)
+        self.executor = QueryExecutor.instance()
+        self.executor_key = executor_key
+        self.page_size = page_size
+        self.rows = []
+        self.has_more = True
+        self.loading = False
+        self.on_error = None
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        value = self.rows[index.row()][index.column()]
+        return "" if value is None else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.has_more and not self.loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self.loading = True
+        after_id = self.rows[-1][0] if self.rows else None
+        self.executor.submit(
+            self.executor_key, fetch_citizen_page, after_id, self.page_size,
+            on_result=self._append_page,
+            on_error=self._page_failed
+        )
+
+    # --- loading ---
+
+    def reload(self):
+        """Drop everything and start browsing again from the newest citizen."""
+        self.executor.cancel(self.executor_key)
+        self.beginResetModel()
+        self.rows = []
+        self.has_more = True
+        self.loading = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def set_rows(self, rows):
+        """Show a fixed result set (e.g. search results) with no further paging."""
+        self.executor.cancel(self.executor_key)
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.has_more = False
+        self.loading = False
+        self.endResetModel()
+
+    def citizen_id(self, row):
+        if 0 <= row < len(self.rows):
+            return self.rows[row][0]
+        return None
+
+    def _append_page(self, page):
+        self.loading = False
+        if len(page) < self.page_size:
+            self.has_more = False
+        if not page:
+            return
+        start = len(self.rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self.rows.extend(page)
+        self.endInsertRows()
+
+    def _page_failed(self, error):
+        self.loading = False
+        self.has_more = False
+        if self.on_error:
+            self.on_error(error)
+        else:
+            print(f"Failed to load citizen page: {error}")
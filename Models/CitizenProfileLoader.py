@@ -0,0 +1,177 @@
+import threading
+from collections import OrderedDict
+
+PROFILE_CACHE_SIZE = 50
+
+# Full profile of a single citizen, looked up by primary key.
+CITIZEN_PROFILE_QUERY = """
+    SELECT
+        C.CTZ_ID, --0
+        C.CTZ_LAST_NAME,
+        C.CTZ_FIRST_NAME,
+        C.CTZ_MIDDLE_NAME,
+        C.CTZ_SUFFIX,
+        S.SITIO_NAME, --5
+        TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS LAST_UPDATED,
+        C.CTZ_DATE_OF_BIRTH,
+        C.CTZ_SEX,
+        C.CTZ_CIVIL_STATUS,
+        COALESCE(CON.CON_EMAIL, '') AS EMAIL, --10
+        COALESCE(CON.CON_PHONE, '') AS CONTACT_NUM,
+        C.CTZ_PLACE_OF_BIRTH,
+        HH.HH_ADDRESS,
+        SES.SOEC_STATUS,
+        SES.SOEC_NUMBER, --15
+        ES.ES_STATUS_NAME AS EMPLOYMENT_STATUS,
+        EMP.EMP_OCCUPATION AS OCCUPATION,
+        EMP.EMP_IS_GOV_WORKER,
+        HH.HH_ID, --19
+        RT.RTH_RELATIONSHIP_NAME AS RELATIONSHIP_NAME,
+        PHC.PC_CATEGORY_NAME AS PHILHEALTH_CATEGORY_NAME,
+        PH.PHEA_MEMBERSHIP_TYPE, --22
+        R.REL_NAME AS RELIGION,
+        C.CTZ_BLOOD_TYPE,
+        EDU.EDU_IS_CURRENTLY_STUDENT AS IS_STUDENT,
+        EDU.EDU_INSTITUTION_NAME AS SCHOOL_NAME, --26
+        EDAT.EDAT_LEVEL AS EDUCATIONAL_ATTAINMENT, --27
+        CHR.CLAH_CLASSIFICATION_NAME AS CLASSIFICATION_HEALTH_RISK_NAME, --28
+        C.CTZ_IS_REGISTERED_VOTER, --29
+        NOT C.CTZ_IS_ALIVE AS IS_DECEASED, --30
+        C.CTZ_IS_IP,
+        PH.PHEA_ID_NUMBER,
+        TO_CHAR(C.CTZ_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED_FORMATTED, --33
+
+        CASE 
+            WHEN SA.SYS_FNAME IS NULL THEN 'System'
+            ELSE SA.SYS_FNAME || ' ' || COALESCE(LEFT(SA.SYS_MNAME, 1) || '. ', '') || SA.SYS_LNAME
+        END AS ENCODED_BY, --34
+
+        TO_CHAR(C.CTZ_LAST_UPDATED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_UPDATED_FORMATTED, --35
+
+        CASE 
+            WHEN SUA.SYS_FNAME IS NULL THEN 'System'
+            ELSE SUA.SYS_FNAME || ' ' || COALESCE(LEFT(SUA.SYS_MNAME, 1) || '. ', '') || SUA.SYS_LNAME
+        END AS LAST_UPDATED_BY_NAME, --36
+
+        C.CTZ_REASON_OF_DEATH, --37
+        TO_CHAR(C.CTZ_DATE_OF_DEATH, 'FMMonth FMDD, YYYY'), --38
+        FP.fp_start_date AS FAM_PLAN_START_DATE,
+        FP.fp_end_date AS FAM_PLAN_END_DATE,
+        FPM.FPM_METHOD AS FAM_PLAN_METHOD,
+        FPS.FPMS_STATUS_NAME AS FAM_PLAN_STATUS
+
+    FROM CITIZEN C
+    LEFT JOIN CONTACT CON ON C.CON_ID = CON.CON_ID
+    LEFT JOIN EMPLOYMENT EMP ON C.CTZ_ID = EMP.CTZ_ID
+    LEFT JOIN EMPLOYMENT_STATUS ES ON EMP.ES_ID = ES.ES_ID
+    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
+    JOIN HOUSEHOLD_INFO HH ON C.HH_ID = HH.HH_ID
+    LEFT JOIN SOCIO_ECONOMIC_STATUS SES ON C.SOEC_ID = SES.SOEC_ID
+    LEFT JOIN RELATIONSHIP_TYPE RT ON C.RTH_ID = RT.RTH_ID
+    LEFT JOIN PHILHEALTH PH ON C.PHEA_ID = PH.PHEA_ID
+    LEFT JOIN PHILHEALTH_CATEGORY PHC ON PH.PC_ID = PHC.PC_ID
+    LEFT JOIN RELIGION R ON C.REL_ID = R.REL_ID
+    LEFT JOIN EDUCATION_STATUS EDU ON C.EDU_ID = EDU.EDU_ID
+    LEFT JOIN EDUCATIONAL_ATTAINMENT EDAT ON EDU.EDAT_ID = EDAT.EDAT_ID
+    LEFT JOIN CLASSIFICATION_HEALTH_RISK CHR ON C.CLAH_ID = CHR.CLAH_ID
+    LEFT JOIN SYSTEM_ACCOUNT SA ON C.ENCODED_BY_SYS_ID = SA.SYS_USER_ID
+    LEFT JOIN SYSTEM_ACCOUNT SUA ON C.LAST_UPDATED_BY_SYS_ID = SUA.SYS_USER_ID
+    LEFT JOIN FAMILY_PLANNING FP ON C.CTZ_ID = FP.CTZ_ID
+    LEFT JOIN FAMILY_PLANNING_METHOD FPM ON FP.FPM_METHOD = FPM.FPM_ID
+    LEFT JOIN FPM_STATUS FPS ON FP.FPMS_STATUS = FPS.FPMS_ID
+    WHERE C.CTZ_ID = %s
+      AND C.CTZ_IS_DELETED = FALSE
+    LIMIT 1;
+
+"""
+
+# What a cached profile is checked against. Most rows the profile shows have no
+# LAST_UPDATED column and are edited without touching CTZ_LAST_UPDATED, so each
+# row's xmin (the transaction that last wrote it) stands in for one. Citizens can
+# have several EMPLOYMENT / FAMILY_PLANNING rows, so those are aggregated.
+CITIZEN_PROFILE_VERSION_QUERY = """
+    SELECT
+        C.xmin::text,
+        HH.xmin::text,
+        CON.xmin::text,
+        PH.xmin::text,
+        EDU.xmin::text,
+        SES.xmin::text,
+        (SELECT string_agg(EMP.xmin::text, ',' ORDER BY EMP.EMP_ID)
+         FROM EMPLOYMENT EMP WHERE EMP.CTZ_ID = C.CTZ_ID),
+        (SELECT string_agg(FP.xmin::text, ',' ORDER BY FP.FP_ID)
+         FROM FAMILY_PLANNING FP WHERE FP.CTZ_ID = C.CTZ_ID)
+    FROM CITIZEN C
+    LEFT JOIN HOUSEHOLD_INFO HH ON C.HH_ID = HH.HH_ID
+    LEFT JOIN CONTACT CON ON C.CON_ID = CON.CON_ID
+    LEFT JOIN PHILHEALTH PH ON C.PHEA_ID = PH.PHEA_ID
+    LEFT JOIN EDUCATION_STATUS EDU ON C.EDU_ID = EDU.EDU_ID
+    LEFT JOIN SOCIO_ECONOMIC_STATUS SES ON C.SOEC_ID = SES.SOEC_ID
+    WHERE C.CTZ_ID = %s
+      AND C.CTZ_IS_DELETED = FALSE;
+"""
+
+
+class CitizenProfileLoader:
+    """Fetches one citizen's full profile on demand and keeps the most recently
+    viewed ones in an LRU cache keyed by CTZ_ID.
+
+    A cached entry is only reused while the citizen row and every row joined
+    into it are unchanged (CITIZEN_PROFILE_VERSION_QUERY), so an edit made from
+    another workstation, to the citizen or to their contact, employment,
+    PhilHealth, family planning or household, is never shown stale.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = CitizenProfileLoader()
+        return cls._instance
+
+    def __init__(self, max_size=PROFILE_CACHE_SIZE):
+        self.max_size = max_size
+        self._cache = OrderedDict()  # ctz_id -> (version, record)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, db, citizen_id):
+        """Safe to call from a query worker thread."""
+        citizen_id = int(citizen_id)
+        cursor = db.get_cursor()
+        cursor.execute(CITIZEN_PROFILE_VERSION_QUERY, (citizen_id,))
+        version = cursor.fetchone()
+        if not version:
+            self.invalidate(citizen_id)
+            return None
+        version = tuple(version)
+
+        with self._lock:
+            cached = self._cache.get(citizen_id)
+            if cached and cached[0] == version:
+                self._cache.move_to_end(citizen_id)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        cursor.execute(CITIZEN_PROFILE_QUERY, (citizen_id,))
+        record = cursor.fetchone()
+        if record:
+            self._store(citizen_id, version, record)
+        return record
+
+    def _store(self, citizen_id, version, record):
+        with self._lock:
+            self._cache[citizen_id] = (version, record)
+            self._cache.move_to_end(citizen_id)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, citizen_id=None):
+        with self._lock:
+            if citizen_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(int(citizen_id), None)
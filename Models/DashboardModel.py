@@ -0,0 +1,48 @@
+RECENT_CITIZENS_QUERY = """
+    SELECT
+        C.CTZ_ID, -- 0
+        C.HH_ID, -- 2
+        C.CTZ_LAST_NAME, -- 1
+        C.CTZ_FIRST_NAME, -- 3
+        C.CTZ_MIDDLE_NAME, -- 4
+        FLOOR(EXTRACT(YEAR FROM AGE(CURRENT_DATE, C.CTZ_DATE_OF_BIRTH))) AS CTZ_AGE, -- 5
+        C.CTZ_SEX, -- 6
+        S.SITIO_NAME, -- 7
+        TO_CHAR(C.CTZ_DATE_ENCODED, 'FMMonth FMDD, YYYY | FMHH:MI AM') AS DATE_ENCODED_FORMATTED -- 8
+    FROM CITIZEN C
+    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
+    WHERE C.CTZ_IS_DELETED = FALSE AND C.CTZ_IS_ALIVE = TRUE
+    ORDER BY C.CTZ_DATE_ENCODED ASC
+    LIMIT 10;
+"""
+
+ACCOUNT_INFO_QUERY = """
+    SELECT
+        SYS_USER_ID,
+        SYS_FNAME,
+        SYS_MNAME,
+        SYS_LNAME,
+        SYS_ROLE
+    FROM SYSTEM_ACCOUNT
+    WHERE SYS_USER_ID = %s AND SYS_IS_ACTIVE = TRUE;
+"""
+
+REGISTERED_CITIZENS_QUERY = "SELECT COUNT(*) FROM CITIZEN WHERE CTZ_IS_DELETED = FALSE;"
+
+
+def fetch_account_info(db, sys_user_id):
+    """(id, first, middle, last, role) of an active account, or None."""
+    cursor = db.get_cursor()
+    cursor.execute(ACCOUNT_INFO_QUERY, (sys_user_id,))
+    return cursor.fetchone()
+
+
+def fetch_dashboard_data(db, sys_user_id):
+    """Everything the dashboard shows, over one connection: (recent citizens, account row, citizen count)."""
+    cursor = db.get_cursor()
+    cursor.execute(RECENT_CITIZENS_QUERY)
+    recent = cursor.fetchall()
+    account = fetch_account_info(db, sys_user_id)
+    cursor.execute(REGISTERED_CITIZENS_QUERY)
+    count = cursor.fetchone()[0]
+    return recent, account, count
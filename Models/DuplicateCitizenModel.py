@@ -0,0 +1,158 @@
+"""Duplicate-citizen detection for the registration form.
+
+find_duplicate_candidates() ranks living records that look like the citizen
+being typed in; find_exact_duplicate() is the hard check run when part 1 of
+the form is submitted. Both read only indexes on CITIZEN (see the INDEXES
+section of mnhs_barangay_new_query.sql). To time the candidate query against
+the current database, from the project root:
+
+    python -m Models.DuplicateCitizenModel first_name last_name [yyyy-mm-dd] [household_id]
+"""
+import sys
+import time
+
+from database import Database
+
+# The as-you-type check gives up after this long; a late hint is no hint.
+DUPLICATE_BUDGET_MS = 50
+DUPLICATE_LIMIT = 5
+# pg_trgm similarity a name needs before it is considered at all (default 0.3).
+NAME_SIMILARITY_THRESHOLD = 0.45
+MIN_NAME_LENGTH = 2
+
+# Score weights: name similarity is 0..1, the rest are bonuses on top of it.
+WEIGHT_NAME = 0.6
+WEIGHT_SAME_BIRTH_DATE = 0.3
+WEIGHT_SAME_BIRTH_YEAR = 0.1
+WEIGHT_SAME_HOUSEHOLD = 0.1
+
+# Candidates come from two index scans: the full-name trigram index
+# (idx_citizen_full_name_trgm) for spelling variants, and the birth-date index
+# for records born the same day whose last name is close (a nickname or a
+# different first name). `%%` is the pg_trgm similarity operator, escaped for
+# psycopg2; it is what lets the GIN index answer the query.
+DUPLICATE_CANDIDATES_QUERY = f"""
+    WITH MATCHES AS (
+        SELECT C.CTZ_ID
+        FROM CITIZEN C
+        WHERE C.CTZ_IS_DELETED = FALSE
+          AND (C.CTZ_FIRST_NAME || ' ' || C.CTZ_LAST_NAME) %% %(full_name)s
+        UNION
+        SELECT C.CTZ_ID
+        FROM CITIZEN C
+        WHERE C.CTZ_IS_DELETED = FALSE
+          AND C.CTZ_DATE_OF_BIRTH = %(birth_date)s
+          AND C.CTZ_LAST_NAME %% %(last_name)s
+    ),
+    SCORED AS (
+        SELECT
+            C.CTZ_ID,
+            {WEIGHT_NAME} * similarity(C.CTZ_FIRST_NAME || ' ' || C.CTZ_LAST_NAME, %(full_name)s)
+            + CASE
+                WHEN C.CTZ_DATE_OF_BIRTH = %(birth_date)s THEN {WEIGHT_SAME_BIRTH_DATE}
+                WHEN EXTRACT(YEAR FROM C.CTZ_DATE_OF_BIRTH) = EXTRACT(YEAR FROM %(birth_date)s::date)
+                    THEN {WEIGHT_SAME_BIRTH_YEAR}
+                ELSE 0
+              END
+            + CASE WHEN C.HH_ID = %(household_id)s THEN {WEIGHT_SAME_HOUSEHOLD} ELSE 0 END AS SCORE
+        FROM MATCHES M
+        JOIN CITIZEN C ON C.CTZ_ID = M.CTZ_ID
+    )
+    SELECT
+        C.CTZ_ID,
+        C.CTZ_LAST_NAME,
+        C.CTZ_FIRST_NAME,
+        C.CTZ_MIDDLE_NAME,
+        C.CTZ_DATE_OF_BIRTH,
+        S.SITIO_NAME,
+        C.HH_ID,
+        ROUND(SC.SCORE::numeric, 2) AS SCORE
+    FROM SCORED SC
+    JOIN CITIZEN C ON C.CTZ_ID = SC.CTZ_ID
+    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
+    ORDER BY SC.SCORE DESC, C.CTZ_ID DESC
+    LIMIT %(limit)s;
+"""
+
+# Served by idx_citizen_name_lower; the LOWER() calls must match its expressions.
+EXACT_DUPLICATE_QUERY = """
+    SELECT C.CTZ_ID
+    FROM CITIZEN C
+    WHERE C.CTZ_IS_DELETED = FALSE
+      AND LOWER(C.CTZ_LAST_NAME) = LOWER(%(last_name)s)
+      AND LOWER(C.CTZ_FIRST_NAME) = LOWER(%(first_name)s)
+      AND C.CTZ_DATE_OF_BIRTH = %(birth_date)s
+    LIMIT 1;
+"""
+
+
+def can_check(first_name, last_name):
+    return len(first_name.strip()) >= MIN_NAME_LENGTH and len(last_name.strip()) >= MIN_NAME_LENGTH
+
+
+def find_duplicate_candidates(db, first_name, last_name, birth_date=None, household_id=None,
+                              limit=DUPLICATE_LIMIT, budget_ms=DUPLICATE_BUDGET_MS):
+    """Existing citizens most likely to be the one being registered, best first.
+
+    Rows are (id, last, first, middle, birth date, sitio, household id, score).
+    The settings are SET LOCAL, so they end with the transaction; when budget_ms
+    is given the server cancels the query once it runs longer than that.
+    """
+    first_name, last_name = first_name.strip(), last_name.strip()
+    if not can_check(first_name, last_name):
+        return []
+
+    cursor = db.get_cursor()
+    cursor.execute("SELECT set_config('pg_trgm.similarity_threshold', %s, TRUE);",
+                   (str(NAME_SIMILARITY_THRESHOLD),))
+    if budget_ms:
+        cursor.execute("SELECT set_config('statement_timeout', %s, TRUE);", (str(int(budget_ms)),))
+    cursor.execute(DUPLICATE_CANDIDATES_QUERY, {
+        "full_name": f"{first_name} {last_name}",
+        "last_name": last_name,
+        "birth_date": birth_date or None,
+        "household_id": int(household_id) if str(household_id or "").isdigit() else None,
+        "limit": limit,
+    })
+    return cursor.fetchall()
+
+
+def find_exact_duplicate(db, first_name, last_name, birth_date):
+    """ID of a living record with the same first and last name (any case) and birth date, or None."""
+    cursor = db.get_cursor()
+    cursor.execute(EXACT_DUPLICATE_QUERY, {
+        "first_name": first_name.strip(),
+        "last_name": last_name.strip(),
+        "birth_date": birth_date,
+    })
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def describe_candidate(row):
+    """One line for the registration form, e.g. "#1024 Dela Cruz, Juan P. (1990-05-14, Sitio Uno)"."""
+    ctz_id, last_name, first_name, middle_name, birth_date, sitio_name, hh_id, _ = row
+    middle = f" {middle_name[0]}." if middle_name else ""
+    household = f", household {hh_id}" if hh_id else ""
+    return f"#{ctz_id} {last_name}, {first_name}{middle} ({birth_date}, {sitio_name}{household})"
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(2)
+
+    db = Database(pooled=False)
+    try:
+        started = time.perf_counter()
+        rows = find_duplicate_candidates(db, sys.argv[1], sys.argv[2],
+                                         sys.argv[3] if len(sys.argv) > 3 else None,
+                                         sys.argv[4] if len(sys.argv) > 4 else None,
+                                         budget_ms=None)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for row in rows:
+            print(f"  {row[-1]:.2f}  {describe_candidate(row)}")
+        verdict = "within" if elapsed_ms <= DUPLICATE_BUDGET_MS else "OVER"
+        print(f"{len(rows)} candidate(s) in {elapsed_ms:.1f} ms ({verdict} the {DUPLICATE_BUDGET_MS} ms budget)")
+    finally:
+        db.close()
@@ -0,0 +1,295 @@
+import csv
+import dataclasses
+import inspect
+import os
+import uuid
+
+EXPORT_CHUNK_SIZE = 2000  # rows per server-side FETCH and per write
+
+EXPORT_FILTER = "CSV (*.csv);;Excel Workbook (*.xlsx);;PDF (*.pdf)"
+
+CITIZEN_EXPORT_QUERY = """
+    SELECT
+        C.CTZ_ID AS "Citizen ID",
+        C.CTZ_LAST_NAME AS "Last Name",
+        C.CTZ_FIRST_NAME AS "First Name",
+        C.CTZ_MIDDLE_NAME AS "Middle Name",
+        C.CTZ_SUFFIX AS "Suffix",
+        C.CTZ_SEX AS "Sex",
+        C.CTZ_DATE_OF_BIRTH AS "Date of Birth",
+        C.CTZ_CIVIL_STATUS::TEXT AS "Civil Status",
+        S.SITIO_NAME AS "Sitio",
+        H.HH_HOUSE_NUMBER AS "House Number",
+        CASE WHEN C.CTZ_IS_REGISTERED_VOTER THEN 'Yes' ELSE 'No' END AS "Registered Voter",
+        CASE WHEN C.CTZ_IS_ALIVE THEN 'No' ELSE 'Yes' END AS "Deceased",
+        CON.CON_PHONE AS "Contact Number",
+        CON.CON_EMAIL AS "Email",
+        C.CTZ_DATE_ENCODED::DATE AS "Date Encoded"
+    FROM CITIZEN C
+    JOIN SITIO S ON C.SITIO_ID = S.SITIO_ID
+    JOIN HOUSEHOLD_INFO H ON C.HH_ID = H.HH_ID
+    LEFT JOIN CONTACT CON ON C.CON_ID = CON.CON_ID
+    WHERE C.CTZ_IS_DELETED = FALSE
+    ORDER BY C.CTZ_ID;
+"""
+
+HOUSEHOLD_EXPORT_QUERY = """
+    SELECT
+        H.HH_ID AS "Household ID",
+        H.HH_HOUSE_NUMBER AS "House Number",
+        H.HH_ADDRESS AS "Address",
+        H.HH_OWNERSHIP_STATUS::TEXT AS "Ownership",
+        S.SITIO_NAME AS "Sitio",
+        W.WATER_SOURCE_NAME AS "Water Source",
+        T.TOIL_TYPE_NAME AS "Toilet Type",
+        H.HH_INTERVIEWER_NAME AS "Interviewer",
+        H.HH_REVIEWER_NAME AS "Reviewer",
+        H.HH_DATE_VISIT AS "Date of Visit"
+    FROM HOUSEHOLD_INFO H
+    JOIN SITIO S ON H.SITIO_ID = S.SITIO_ID
+    JOIN WATER_SOURCE W ON H.WATER_ID = W.WATER_ID
+    JOIN TOILET_TYPE T ON H.TOILET_ID = T.TOIL_ID
+    WHERE H.HH_IS_DELETED = FALSE
+    ORDER BY H.HH_ID;
+"""
+
+# Getters that only bundle other getters' results; exporting them would repeat rows.
+STATISTICS_SKIP = {"get_demographic_summary"}
+
+
+class ExportResult:
+    def __init__(self, path, rows=0, cancelled=False):
+        self.path = path
+        self.rows = rows
+        self.cancelled = cancelled
+
+
+class CsvExportWriter:
+    def __init__(self, path, title):
+        self.file = open(path, "w", newline="", encoding="utf-8-sig")
+        self.writer = csv.writer(self.file)
+
+    def write_header(self, header):
+        self.writer.writerow(header)
+
+    def write_rows(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class XlsxExportWriter:
+    """openpyxl's write-only mode spools rows to disk, so memory stays flat."""
+
+    def __init__(self, path, title):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ImportError("Writing .xlsx files needs the openpyxl package (pip install openpyxl).")
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(title=title[:31])
+
+    def write_header(self, header):
+        self.sheet.append(list(header))
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.sheet.append(list(row))
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+class PdfExportWriter:
+    """A plain paginated table. Each page is drawn and flushed as it fills."""
+
+    MARGIN = 400        # device units at 1200 dpi
+    ROW_HEIGHT = 260
+    FONT_SIZE = 7
+
+    def __init__(self, path, title):
+        from PySide6.QtCore import QMarginsF
+        from PySide6.QtGui import QFont, QPageLayout, QPageSize, QPainter, QPdfWriter
+
+        self.writer = QPdfWriter(path)
+        self.writer.setResolution(1200)
+        self.writer.setPageLayout(QPageLayout(
+            QPageSize(QPageSize.PageSizeId.A4), QPageLayout.Orientation.Landscape, QMarginsF(0, 0, 0, 0)
+        ))
+        self.writer.setTitle(title)
+        self.painter = QPainter(self.writer)
+        self.font = QFont("Arial", self.FONT_SIZE)
+        self.bold = QFont("Arial", self.FONT_SIZE)
+        self.bold.setBold(True)
+        self.title = title
+        self.header = []
+        self.page = 0
+        self.y = 0
+
+        page = self.painter.viewport()
+        self.width = page.width() - 2 * self.MARGIN
+        self.bottom = page.height() - self.MARGIN
+
+    def write_header(self, header):
+        self.header = [str(h) for h in header]
+        self._new_page()
+
+    def write_rows(self, rows):
+        for row in rows:
+            if self.y + self.ROW_HEIGHT > self.bottom:
+                self.writer.newPage()
+                self._new_page()
+            self._draw_row(row, self.font)
+
+    def close(self):
+        self.painter.end()
+
+    def _new_page(self):
+        self.page += 1
+        self.y = self.MARGIN
+        self.painter.setFont(self.bold)
+        self.painter.drawText(self.MARGIN, self.y + self.ROW_HEIGHT, f"{self.title} - page {self.page}")
+        self.y += self.ROW_HEIGHT * 2
+        self._draw_row(self.header, self.bold)
+        self.painter.drawLine(self.MARGIN, self.y, self.MARGIN + self.width, self.y)
+
+    def _draw_row(self, row, font):
+        from PySide6.QtCore import Qt
+
+        self.painter.setFont(font)
+        metrics = self.painter.fontMetrics()
+        column_width = self.width // max(len(self.header), 1)
+        for i, value in enumerate(row):
+            text = "" if value is None else str(value)
+            text = metrics.elidedText(text, Qt.TextElideMode.ElideRight, column_width - 60)
+            self.painter.drawText(self.MARGIN + i * column_width, self.y + self.ROW_HEIGHT - 60, text)
+        self.y += self.ROW_HEIGHT
+
+
+WRITERS = {".csv": CsvExportWriter, ".xlsx": XlsxExportWriter, ".pdf": PdfExportWriter}
+
+
+def open_writer(path, title):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in WRITERS:
+        raise ValueError(f"Unsupported export type '{ext}'. Use .csv, .xlsx or .pdf.")
+    return WRITERS[ext](path, title)
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def export_query(db, path, title, query, params=None, progress=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Streams a query into path through a server-side (named) cursor.
+
+    Only chunk_size rows are held at a time. progress((done, total)) is called
+    after every chunk; when it returns False the partial file is removed. The
+    count behind total and the rows streamed come from one REPEATABLE READ
+    snapshot, so they agree.
+    """
+    total = None
+    writer = None
+    done = 0
+    try:
+        db.conn.rollback()  # so SET TRANSACTION is the first statement of a fresh transaction
+        db.cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ;")
+        if progress:
+            db.cursor.execute(f"SELECT COUNT(*) FROM ({query.strip().rstrip(';')}) AS export_rows;", params)
+            total = db.cursor.fetchone()[0]
+            if not progress((0, total)):
+                return ExportResult(path, cancelled=True)
+
+        writer = open_writer(path, title)
+        with db.conn.cursor(name=f"export_{uuid.uuid4().hex}") as cursor:
+            cursor.itersize = chunk_size
+            cursor.execute(query, params)
+            rows = cursor.fetchmany(chunk_size)
+            writer.write_header([column[0] for column in cursor.description])
+            while rows:
+                writer.write_rows(rows)
+                done += len(rows)
+                if progress and not progress((done, total)):
+                    writer.close()
+                    _remove_quietly(path)
+                    return ExportResult(path, done, cancelled=True)
+                rows = cursor.fetchmany(chunk_size)
+        writer.close()
+    except Exception:
+        # Covers a cancel that aborted the FETCH on the server, too.
+        if writer is not None:
+            try:
+                writer.close()
+            finally:
+                _remove_quietly(path)
+        raise
+    finally:
+        db.conn.rollback()  # ends the read transaction the count and the named cursor shared
+    return ExportResult(path, done)
+
+
+def export_citizens(db, path, progress=None):
+    return export_query(db, path, "Citizens", CITIZEN_EXPORT_QUERY, progress=progress)
+
+
+def export_households(db, path, progress=None):
+    return export_query(db, path, "Households", HOUSEHOLD_EXPORT_QUERY, progress=progress)
+
+
+def _section_name(getter_name):
+    return getter_name[len("get_"):].replace("_", " ").title()
+
+
+def _result_rows(result):
+    """Flattens a statistics getter's result into rows of values."""
+    if result is None or dataclasses.is_dataclass(result):
+        return []
+    if isinstance(result, dict):
+        return [(key, value) for key, value in result.items()]
+    if isinstance(result, (list, tuple)):
+        if all(isinstance(item, (list, tuple)) for item in result):
+            return [tuple(item) for item in result]
+        return [tuple(result)]
+    return [(result,)]
+
+
+def statistics_rows(model, from_date, to_date):
+    """(section, value, ...) rows from every get_* method of a statistics model."""
+    rows = []
+    dates = {"from_date": from_date, "to_date": to_date}
+    for name, method in inspect.getmembers(model, inspect.ismethod):
+        if not name.startswith("get_") or name in STATISTICS_SKIP:
+            continue
+        args = [dates[p] for p in inspect.signature(method).parameters if p in dates]
+        section = _section_name(name)
+        rows.extend((section,) + row for row in _result_rows(method(*args)))
+    return rows
+
+
+def export_statistics(db, path, model_class, title, from_date, to_date, progress=None):
+    """Writes a statistics page's figures for the date range. These are aggregates, so they fit in memory."""
+    model = model_class(db)
+    try:
+        rows = statistics_rows(model, from_date, to_date)
+    finally:
+        db.conn.rollback()
+
+    if progress and not progress((0, len(rows))):
+        return ExportResult(path, cancelled=True)
+
+    width = max((len(row) for row in rows), default=2)
+    header = ["Section"] + [f"Value {i}" for i in range(1, width)]
+    writer = open_writer(path, f"{title} {from_date} to {to_date}")
+    try:
+        writer.write_header(header)
+        writer.write_rows(row + ("",) * (width - len(row)) for row in rows)
+    finally:
+        writer.close()
+    if progress:
+        progress((len(rows), len(rows)))
+    return ExportResult(path, len(rows))
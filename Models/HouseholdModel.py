@@ -5,7 +5,7 @@ from database import Database
 
 class HouseholdModel:
     def __init__(self, sys_user_id=None):
-        self.connection = Database()
+        self.connection = Database(pooled=False)
         self.connection.set_user_id(sys_user_id)  # Set the user ID immediately
         self.sys_user_id = sys_user_id
         print(f"System ID initialized: {self.sys_user_id}")
@@ -0,0 +1,103 @@
+import threading
+import time
+
+from database import Database
+
+# Reference tables are small and change rarely, so every popup and save path
+# shares one in-memory copy. Edits made through this app bump the table's
+# version (see AdminControlsModel); the TTL picks up edits made elsewhere.
+LOOKUP_TTL = 300  # seconds
+
+# name -> query returning (id, name) rows in display order
+LOOKUP_QUERIES = {
+    "sitio": "SELECT SITIO_ID, SITIO_NAME FROM SITIO ORDER BY SITIO_NAME ASC;",
+    "religion": "SELECT REL_ID, REL_NAME FROM RELIGION ORDER BY REL_NAME ASC;",
+    "relationship_type":
+        "SELECT RTH_ID, RTH_RELATIONSHIP_NAME FROM RELATIONSHIP_TYPE ORDER BY RTH_RELATIONSHIP_NAME ASC;",
+    "classification_health_risk":
+        "SELECT CLAH_ID, CLAH_CLASSIFICATION_NAME FROM CLASSIFICATION_HEALTH_RISK ORDER BY CLAH_CLASSIFICATION_NAME ASC;",
+    "philhealth_category": "SELECT PC_ID, PC_CATEGORY_NAME FROM PHILHEALTH_CATEGORY ORDER BY PC_CATEGORY_NAME ASC;",
+    "educational_attainment": "SELECT EDAT_ID, EDAT_LEVEL FROM EDUCATIONAL_ATTAINMENT ORDER BY EDAT_LEVEL ASC;",
+    "employment_status": "SELECT ES_ID, ES_STATUS_NAME FROM EMPLOYMENT_STATUS ORDER BY ES_STATUS_NAME ASC;",
+    "family_planning_method": "SELECT FPM_ID, FPM_METHOD FROM FAMILY_PLANNING_METHOD ORDER BY FPM_METHOD ASC;",
+    "fpm_status": "SELECT FPMS_ID, FPMS_STATUS_NAME FROM FPM_STATUS ORDER BY FPMS_STATUS_NAME ASC;",
+    "water_source": "SELECT WATER_ID, WATER_SOURCE_NAME FROM WATER_SOURCE ORDER BY WATER_SOURCE_NAME ASC;",
+    "toilet_type": "SELECT TOIL_ID, TOIL_TYPE_NAME FROM TOILET_TYPE ORDER BY TOIL_TYPE_NAME ASC;",
+    # Edited from the admin controls as well.
+    "infrastructure_type": "SELECT INFT_ID, INFT_TYPE_NAME FROM INFRASTRUCTURE_TYPE ORDER BY INFT_TYPE_NAME ASC;",
+    "transaction_type": "SELECT TT_ID, TT_TYPE_NAME FROM TRANSACTION_TYPE ORDER BY TT_TYPE_NAME ASC;",
+    "history_type": "SELECT HIST_ID, HIST_TYPE_NAME FROM HISTORY_TYPE ORDER BY HIST_TYPE_NAME ASC;",
+    "medical_history_type": "SELECT MHT_ID, MHT_TYPE_NAME FROM MEDICAL_HISTORY_TYPE ORDER BY MHT_TYPE_NAME ASC;",
+}
+
+
+class _Lookup:
+    def __init__(self, version, rows):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.rows = rows
+        self.ids = {name: row_id for row_id, name in rows}
+
+
+class LookupCache:
+    """Application-wide (id, name) lists for the reference tables in LOOKUP_QUERIES."""
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = LookupCache()
+        return cls._instance
+
+    def __init__(self, ttl=LOOKUP_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._lookups = {}   # name -> _Lookup
+        self._versions = {}  # name -> int, bumped on every local edit
+
+    def rows(self, name, db=None):
+        """(id, name) rows of a reference table, in display order."""
+        return self._get(name, db).rows
+
+    def id_for(self, name, value, db=None):
+        """The id whose name is value, or None."""
+        return self._get(name, db).ids.get(value)
+
+    def bump(self, *names):
+        """Mark tables as changed so their next read goes to the database."""
+        with self._lock:
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+                self._lookups.pop(name, None)
+
+    def clear(self):
+        with self._lock:
+            self._lookups.clear()
+
+    def _get(self, name, db):
+        with self._lock:
+            version = self._versions.get(name, 0)
+            lookup = self._lookups.get(name)
+            if lookup and lookup.version == version and time.monotonic() - lookup.loaded_at < self.ttl:
+                return lookup
+
+        lookup = _Lookup(version, self._load(name, db))
+        with self._lock:
+            # A bump while loading means these rows may already be stale.
+            if self._versions.get(name, 0) == version:
+                self._lookups[name] = lookup
+        return lookup
+
+    @staticmethod
+    def _load(name, db):
+        own_db = db is None
+        if own_db:
+            db = Database()
+        try:
+            cursor = db.get_cursor()
+            cursor.execute(LOOKUP_QUERIES[name])
+            return cursor.fetchall()
+        finally:
+            if own_db:
+                db.close()
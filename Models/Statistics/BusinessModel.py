@@ -1,25 +1,27 @@
+from Models.Statistics.StatCube import refresh_stat_cubes
 from database import Database
 
 class BusinessModel:
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # Pass a borrowed Database when running on a query worker thread.
+        self.db = db or Database(pooled=False)
         self.cursor = self.db.get_cursor()
 
     def get_business_stat_per_sitio(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
                     s.SITIO_NAME AS "Sitio",
-                    COUNT(CASE WHEN bs.BS_STATUS = 'Active' THEN 1 END) AS "Active",
-                    COUNT(CASE WHEN bs.BS_STATUS = 'Inactive' THEN 1 END) AS "Inactive",
-                    COUNT(CASE WHEN bs.BS_STATUS = 'Closed' THEN 1 END) AS "Closed",
-                    COUNT(CASE WHEN bs.BS_STATUS = 'Suspended' THEN 1 END) AS "Suspended"
+                    COALESCE(SUM(bs.BUSINESS_COUNT) FILTER (WHERE bs.BS_STATUS = 'Active'), 0) AS "Active",
+                    COALESCE(SUM(bs.BUSINESS_COUNT) FILTER (WHERE bs.BS_STATUS = 'Inactive'), 0) AS "Inactive",
+                    COALESCE(SUM(bs.BUSINESS_COUNT) FILTER (WHERE bs.BS_STATUS = 'Closed'), 0) AS "Closed",
+                    COALESCE(SUM(bs.BUSINESS_COUNT) FILTER (WHERE bs.BS_STATUS = 'Suspended'), 0) AS "Suspended"
                 FROM
                     SITIO s
                         LEFT JOIN
-                    BUSINESS_INFO bs ON s.SITIO_ID = bs.SITIO_ID
-                                     AND bs.BS_IS_DELETED = FALSE
-                                     AND bs.BS_LAST_UPDATED::date BETWEEN %s AND %s
+                    STAT_BUSINESS_CUBE bs ON s.SITIO_ID = bs.SITIO_ID
+                                     AND bs.STAT_DAY BETWEEN %s AND %s
                 GROUP BY
                     s.SITIO_NAME
                 ORDER BY
@@ -38,14 +40,14 @@ class BusinessModel:
 
     def get_active_business_type(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT bt.BST_TYPE_NAME,
-                        COUNT(BS_ID) AS active_count
+                        COALESCE(SUM(bs.BUSINESS_COUNT), 0) AS active_count
                 FROM BUSINESS_TYPE bt
-                LEFT JOIN BUSINESS_INFO bs on bt.BST_ID = bs.BST_ID
-                    AND BS.BS_STATUS = 'Active'
-                    AND bs.BS_IS_DELETED = FALSE
-                    AND bs.BS_LAST_UPDATED::date BETWEEN %s AND %s
+                LEFT JOIN STAT_BUSINESS_CUBE bs on bt.BST_ID = bs.BST_ID
+                    AND bs.BS_STATUS = 'Active'
+                    AND bs.STAT_DAY BETWEEN %s AND %s
                 GROUP BY bt.BST_TYPE_NAME;
             """, (from_date, to_date))
 
@@ -1,23 +1,86 @@
+from dataclasses import dataclass, field
+
+from Models.Statistics.StatCube import refresh_stat_cubes
 from database import Database
 
+
+@dataclass
+class DemographicSummary:
+    """Everything the Demographics page shows, in the shapes the per-section getters return."""
+    population: tuple = (0, 0, 0, 0)        # male, female, ip_count, deceased
+    age_group: tuple = (0,) * 7             # Infant .. Senior
+    voter: tuple = (0,) * 9                 # 5 age bands, registered, unregistered, male, female
+    socio_economic: list = field(default_factory=list)  # (status, total)
+    civil_status: list = field(default_factory=list)    # (status, male, female, total)
+    religion: list = field(default_factory=list)        # (religion, total)
+
+
+# One pass over the citizen cube. The () grouping set carries the page totals and
+# the other sets carry one row per civil status, socio-economic status and religion.
+DEMOGRAPHIC_SUMMARY_QUERY = """
+    SELECT
+        GROUPING(c.CTZ_CIVIL_STATUS) AS by_civil_status,
+        GROUPING(s.SOEC_STATUS) AS by_socio_economic,
+        GROUPING(r.REL_NAME) AS by_religion,
+        c.CTZ_CIVIL_STATUS,
+        s.SOEC_STATUS,
+        r.REL_NAME,
+
+        -- population
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_SEX = 'M' AND c.CTZ_IS_ALIVE = TRUE), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_SEX = 'F' AND c.CTZ_IS_ALIVE = TRUE), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_IP = TRUE AND c.CTZ_IS_ALIVE = TRUE), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = FALSE), 0),
+
+        -- age groups
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.AGE_BAND BETWEEN 0 AND 2), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.AGE_BAND BETWEEN 3 AND 12), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.AGE_BAND BETWEEN 13 AND 17), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.AGE_BAND BETWEEN 18 AND 24), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.AGE_BAND BETWEEN 25 AND 39), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.AGE_BAND BETWEEN 40 AND 59), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.AGE_BAND >= 60), 0),
+
+        -- voters
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE AND c.AGE_BAND BETWEEN 15 AND 17), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE AND c.AGE_BAND BETWEEN 18 AND 25), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE AND c.AGE_BAND BETWEEN 26 AND 35), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE AND c.AGE_BAND BETWEEN 36 AND 59), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE AND c.AGE_BAND >= 60), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = FALSE), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE AND c.CTZ_SEX = 'M'), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_IS_REGISTERED_VOTER = TRUE AND c.CTZ_SEX = 'F'), 0),
+
+        -- per-group living totals (civil status also split by sex)
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_SEX = 'M'), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE AND c.CTZ_SEX = 'F'), 0),
+        COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_ALIVE = TRUE), 0)
+    FROM STAT_CITIZEN_CUBE c
+    LEFT JOIN SOCIO_ECONOMIC_STATUS s ON c.SOEC_ID = s.SOEC_ID
+    LEFT JOIN RELIGION r ON c.REL_ID = r.REL_ID
+    WHERE c.STAT_DAY BETWEEN %s AND %s
+    GROUP BY GROUPING SETS ((), (c.CTZ_CIVIL_STATUS), (s.SOEC_STATUS), (r.REL_NAME));
+"""
+
+
 class DemographicModel:
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # Pass a borrowed Database when running on a query worker thread.
+        self.db = db or Database(pooled=False)
         self.cursor = self.db.get_cursor()
 
     def get_population_counts(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
-                    COUNT(*) FILTER (WHERE CTZ_SEX = 'M' AND CTZ_IS_ALIVE = TRUE) AS male,
-                    COUNT(*) FILTER (WHERE CTZ_SEX = 'F' AND CTZ_IS_ALIVE = TRUE) AS female,
-                    COUNT(*) FILTER (WHERE CTZ_IS_IP = TRUE AND CTZ_IS_ALIVE = TRUE) as ip_count,
-                    COUNT(*) FILTER (WHERE CTZ_IS_ALIVE = FALSE) AS deceased
-                FROM (
-                    SELECT * FROM CITIZEN
-                    WHERE CTZ_LAST_UPDATED ::date BETWEEN %s AND %s
-                    AND CTZ_IS_DELETED = FALSE
-                ) AS filtered_citizens
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_SEX = 'M' AND CTZ_IS_ALIVE = TRUE), 0) AS male,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_SEX = 'F' AND CTZ_IS_ALIVE = TRUE), 0) AS female,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_IP = TRUE AND CTZ_IS_ALIVE = TRUE), 0) as ip_count,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_ALIVE = FALSE), 0) AS deceased
+                FROM STAT_CITIZEN_CUBE
+                WHERE STAT_DAY BETWEEN %s AND %s
             """, (from_date, to_date))
             return self.cursor.fetchone()
         except Exception as e:
@@ -26,19 +89,19 @@ class DemographicModel:
 
     def get_age_group_counts(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT 
-                    COUNT(*) FILTER (WHERE EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 0 AND 2) as "Infant",
-                    COUNT(*) FILTER (WHERE EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 3 AND 12) as "Child",
-                    COUNT(*) FILTER (WHERE EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 13 AND 17) as "Teen",
-                    COUNT(*) FILTER (WHERE EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 18 AND 24) as "Young Adult",
-                    COUNT(*) FILTER (WHERE EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 25 AND 39) as "Adult",
-                    COUNT(*) FILTER (WHERE EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 40 AND 59) as "Middle Aged",
-                    COUNT(*) FILTER (WHERE EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) >= 60) as "Senior"
-                FROM CITIZEN
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE AGE_BAND BETWEEN 0 AND 2), 0) as "Infant",
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE AGE_BAND BETWEEN 3 AND 12), 0) as "Child",
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE AGE_BAND BETWEEN 13 AND 17), 0) as "Teen",
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE AGE_BAND BETWEEN 18 AND 24), 0) as "Young Adult",
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE AGE_BAND BETWEEN 25 AND 39), 0) as "Adult",
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE AGE_BAND BETWEEN 40 AND 59), 0) as "Middle Aged",
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE AGE_BAND >= 60), 0) as "Senior"
+                FROM STAT_CITIZEN_CUBE
                 WHERE CTZ_IS_ALIVE = TRUE 
-                AND CTZ_LAST_UPDATED ::date BETWEEN %s AND %s 
-                AND CTZ_IS_DELETED = FALSE;
+                AND STAT_DAY BETWEEN %s AND %s;
             """, (from_date, to_date))
 
             return self.cursor.fetchone()
@@ -48,16 +111,16 @@ class DemographicModel:
 
     def get_civil_status_distribution(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
             SELECT 
                 CTZ_CIVIL_STATUS,
-                COUNT(*) FILTER (WHERE CTZ_SEX = 'M') AS male_count,
-                COUNT(*) FILTER (WHERE CTZ_SEX = 'F') AS female_count,
-                COUNT(*) AS total_count
-            FROM citizen
+                COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_SEX = 'M'), 0) AS male_count,
+                COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_SEX = 'F'), 0) AS female_count,
+                SUM(CITIZEN_COUNT) AS total_count
+            FROM STAT_CITIZEN_CUBE
             WHERE CTZ_IS_ALIVE = TRUE
-            AND CTZ_LAST_UPDATED ::date BETWEEN %s AND %s
-            AND CTZ_IS_DELETED = FALSE
+            AND STAT_DAY BETWEEN %s AND %s
             GROUP BY CTZ_CIVIL_STATUS;
             """, (from_date, to_date))
 
@@ -69,26 +132,26 @@ class DemographicModel:
 
     def get_voter_statistics(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 15 AND 17) AS age_15_17,
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 18 AND 25) AS age_18_25,
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 26 AND 35) AS age_26_35,
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) BETWEEN 36 AND 59) AS age_36_59,
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND EXTRACT(YEAR FROM AGE(current_date, CTZ_DATE_OF_BIRTH)) >= 60) AS age_60_above,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND AGE_BAND BETWEEN 15 AND 17), 0) AS age_15_17,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND AGE_BAND BETWEEN 18 AND 25), 0) AS age_18_25,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND AGE_BAND BETWEEN 26 AND 35), 0) AS age_26_35,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND AGE_BAND BETWEEN 36 AND 59), 0) AS age_36_59,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND AGE_BAND >= 60), 0) AS age_60_above,
 
                     -- Total registered & unregistered
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE) AS total_registered,
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = FALSE) AS total_unregistered,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE), 0) AS total_registered,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = FALSE), 0) AS total_unregistered,
 
                     -- Male & Female registered voters
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND CTZ_SEX = 'M') AS male_voters,
-                    COUNT(*) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND CTZ_SEX = 'F') AS female_voters
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND CTZ_SEX = 'M'), 0) AS male_voters,
+                    COALESCE(SUM(CITIZEN_COUNT) FILTER (WHERE CTZ_IS_REGISTERED_VOTER = TRUE AND CTZ_SEX = 'F'), 0) AS female_voters
 
-                FROM CITIZEN
+                FROM STAT_CITIZEN_CUBE
                 WHERE CTZ_IS_ALIVE = TRUE 
-                AND CTZ_LAST_UPDATED ::date BETWEEN %s AND %s
-                AND CTZ_IS_DELETED = FALSE;
+                AND STAT_DAY BETWEEN %s AND %s;
             """, (from_date, to_date))
             return self.cursor.fetchone()
         except Exception as e:
@@ -97,17 +160,17 @@ class DemographicModel:
 
     def get_socio_economic_distribution(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
-                    s.SOEC_STATUS, COUNT(*) AS total
+                    s.SOEC_STATUS, SUM(c.CITIZEN_COUNT) AS total
                 FROM
-                    CITIZEN c
+                    STAT_CITIZEN_CUBE c
                 LEFT JOIN
                     SOCIO_ECONOMIC_STATUS s ON c.SOEC_ID = s.SOEC_ID
                 WHERE
                     c.CTZ_IS_ALIVE = TRUE
-                AND c.CTZ_LAST_UPDATED ::date BETWEEN %s AND %s 
-                AND c.CTZ_IS_DELETED = FALSE
+                AND c.STAT_DAY BETWEEN %s AND %s 
                 GROUP BY
                     s.SOEC_STATUS;
             """, (from_date, to_date))
@@ -118,18 +181,18 @@ class DemographicModel:
 
     def get_religion_distribution(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT 
                     r.REL_NAME AS religion,
-                    COUNT(*) AS total
+                    SUM(c.CITIZEN_COUNT) AS total
                 FROM 
-                    CITIZEN c
+                    STAT_CITIZEN_CUBE c
                 JOIN
                     RELIGION r ON c.REL_ID = r.REL_ID
                 WHERE 
                     c.CTZ_IS_ALIVE = TRUE
-                AND c.CTZ_LAST_UPDATED ::date BETWEEN %s AND %s 
-                AND c.CTZ_IS_DELETED = FALSE
+                AND c.STAT_DAY BETWEEN %s AND %s 
                 GROUP BY 
                     r.REL_NAME;
             """, (from_date, to_date))
@@ -139,5 +202,33 @@ class DemographicModel:
             print(f"[ERROR] Failed to fetch religion distribution: {e}")
             return []
 
+    def get_demographic_summary(self, from_date, to_date):
+        """All six Demographics sections in one round trip."""
+        summary = DemographicSummary()
+        try:
+            refresh_stat_cubes(self.db)
+            self.cursor.execute(DEMOGRAPHIC_SUMMARY_QUERY, (from_date, to_date))
+            for row in self.cursor.fetchall():
+                by_civil_status, by_socio_economic, by_religion = row[0:3]
+                civil_status, socio_economic, religion = row[3:6]
+                alive_male, alive_female, alive_total = row[26:29]
+
+                if by_civil_status and by_socio_economic and by_religion:
+                    summary.population = tuple(row[6:10])
+                    summary.age_group = tuple(row[10:17])
+                    summary.voter = tuple(row[17:26])
+                elif alive_total == 0:
+                    continue  # the group only has deceased citizens
+                elif not by_civil_status:
+                    summary.civil_status.append((civil_status, alive_male, alive_female, alive_total))
+                elif not by_socio_economic:
+                    summary.socio_economic.append((socio_economic, alive_total))
+                elif religion is not None:
+                    summary.religion.append((religion, alive_total))
+            return summary
+        except Exception as e:
+            print(f"[ERROR] Failed to fetch demographic summary: {e}")
+            return summary
+
     def close(self):
         self.db.close()
@@ -1,21 +1,22 @@
+from Models.Statistics.StatCube import refresh_stat_cubes
 from database import Database
 
 class EducationModel:
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # Pass a borrowed Database when running on a query worker thread.
+        self.db = db or Database(pooled=False)
         self.cursor = self.db.get_cursor()
 
     def get_total_students_and_not(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
-                    SUM(CASE WHEN es.EDU_IS_CURRENTLY_STUDENT = TRUE THEN 1 ELSE 0 END) AS total_currently_studying,
-                    SUM(CASE WHEN es.EDU_IS_CURRENTLY_STUDENT = FALSE OR es.EDU_IS_CURRENTLY_STUDENT IS NULL THEN 1 ELSE 0 END) AS total_not_currently_studying
-                FROM CITIZEN c
-                    LEFT JOIN EDUCATION_STATUS es ON c.EDU_ID = es.EDU_ID
-                WHERE c.CTZ_IS_DELETED = FALSE 
-                    AND c.CTZ_IS_ALIVE = TRUE
-                    AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s;
+                    COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.EDU_IS_CURRENTLY_STUDENT = TRUE), 0) AS total_currently_studying,
+                    COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.EDU_IS_CURRENTLY_STUDENT = FALSE OR c.EDU_IS_CURRENTLY_STUDENT IS NULL), 0) AS total_not_currently_studying
+                FROM STAT_CITIZEN_CUBE c
+                WHERE c.CTZ_IS_ALIVE = TRUE
+                    AND c.STAT_DAY BETWEEN %s AND %s;
             """, (from_date, to_date))
 
             return self.cursor.fetchone()
@@ -38,7 +39,7 @@ class EducationModel:
                     CITIZEN c ON es.EDU_ID = c.EDU_ID
                         AND c.CTZ_IS_DELETED = FALSE
                         AND c.CTZ_IS_ALIVE = TRUE
-                        AND c.CTZ_DATE_OF_BIRTH::date <= %s
+                        AND c.CTZ_DATE_OF_BIRTH <= %s
                 GROUP BY 
                     ea.EDAT_ID, ea.EDAT_LEVEL
                 ORDER BY
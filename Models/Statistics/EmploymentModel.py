@@ -1,28 +1,27 @@
+from Models.Statistics.StatCube import refresh_stat_cubes
 from database import Database
 
 class EmploymentModel:
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # Pass a borrowed Database when running on a query worker thread.
+        self.db = db or Database(pooled=False)
         self.cursor = self.db.get_cursor()
 
     def get_employment_data_per_sitio(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
                     s.SITIO_NAME AS "Sitio",
-                    COUNT(CASE WHEN es.ES_STATUS_NAME = 'Employed' THEN 1 END) AS "Employed",
-                    COUNT(CASE WHEN es.ES_STATUS_NAME = 'Unemployed' THEN 1 END) AS "Unemployed",
-                    COUNT(CASE WHEN es.ES_STATUS_NAME = 'Self Employed' THEN 1 END) AS "Self Employed",
-                    COUNT(CASE WHEN es.ES_STATUS_NAME = 'Not in Labor Force' THEN 1 END) AS "Not in Labor Force"
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Employed'), 0) AS "Employed",
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Unemployed'), 0) AS "Unemployed",
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Self Employed'), 0) AS "Self Employed",
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Not in Labor Force'), 0) AS "Not in Labor Force"
                 FROM
                     SITIO s
                         LEFT JOIN
-                    CITIZEN c ON s.SITIO_ID = c.SITIO_ID
-                        AND c.CTZ_IS_DELETED = FALSE
-                        AND c.CTZ_IS_ALIVE = TRUE
-                        AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s
-                        LEFT JOIN
-                    EMPLOYMENT e ON c.CTZ_ID = e.CTZ_ID
+                    STAT_EMPLOYMENT_CUBE e ON s.SITIO_ID = e.SITIO_ID
+                        AND e.STAT_DAY BETWEEN %s AND %s
                         LEFT JOIN
                     EMPLOYMENT_STATUS es ON e.ES_ID = es.ES_ID
                 GROUP BY
@@ -41,16 +40,14 @@ class EmploymentModel:
 
     def get_total_gov_nongov_worker(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
-                    COUNT(e.EMP_ID) FILTER (WHERE e.EMP_IS_GOV_WORKER = TRUE) AS "Governement Worker",
-                    COUNT(e.EMP_ID) FILTER (WHERE e.EMP_IS_GOV_WORKER = FALSE) AS "Non-Governement Worker"
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE e.EMP_IS_GOV_WORKER = TRUE), 0) AS "Governement Worker",
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE e.EMP_IS_GOV_WORKER = FALSE), 0) AS "Non-Governement Worker"
                 FROM
-                    EMPLOYMENT e
-                        LEFT JOIN CITIZEN c ON e.CTZ_ID = c.CTZ_ID
-                WHERE c.CTZ_IS_DELETED = FALSE
-                        AND c.CTZ_IS_ALIVE = TRUE
-                        AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s;
+                    STAT_EMPLOYMENT_CUBE e
+                WHERE e.STAT_DAY BETWEEN %s AND %s;
             """, (from_date, to_date))
 
             return self.cursor.fetchone()
@@ -61,19 +58,17 @@ class EmploymentModel:
 
     def get_overall_employment_stats(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
-                    COUNT(e.EMP_ID) FILTER (WHERE es.ES_STATUS_NAME = 'Employed') AS "Employed",
-                    COUNT(e.EMP_ID) FILTER (WHERE es.ES_STATUS_NAME = 'Unemployed') AS "Unemployed",
-                    COUNT(e.EMP_ID) FILTER (WHERE es.ES_STATUS_NAME = 'Self-Employed') AS "Self-Employed",
-                    COUNT(e.EMP_ID) FILTER (WHERE es.ES_STATUS_NAME = 'Not in Labor Force') AS "Not in Labor Force"
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Employed'), 0) AS "Employed",
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Unemployed'), 0) AS "Unemployed",
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Self-Employed'), 0) AS "Self-Employed",
+                    COALESCE(SUM(e.EMPLOYMENT_COUNT) FILTER (WHERE es.ES_STATUS_NAME = 'Not in Labor Force'), 0) AS "Not in Labor Force"
                 FROM
-                    EMPLOYMENT e
-                        LEFT JOIN CITIZEN c ON e.CTZ_ID = c.CTZ_ID
+                    STAT_EMPLOYMENT_CUBE e
                         LEFT JOIN EMPLOYMENT_STATUS es ON e.ES_ID = es.ES_ID
-                WHERE       c.CTZ_IS_DELETED = FALSE
-                            AND c.CTZ_IS_ALIVE = TRUE
-                            AND C.CTZ_LAST_UPDATED::date BETWEEN %s AND %s;
+                WHERE       e.STAT_DAY BETWEEN %s AND %s;
             """, (from_date, to_date))
             return self.cursor.fetchone()
 
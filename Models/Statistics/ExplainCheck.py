@@ -0,0 +1,181 @@
+"""EXPLAIN regression check for the statistics queries.
+
+Runs every getter of every statistics model with its cursor swapped for one that
+EXPLAINs each statement instead of executing it, plus the range reads that
+refresh_stat_cubes() does on the source tables. The getters' own cube refresh is
+paused and each model's transaction is rolled back, so the check writes nothing.
+Sequential scans are disabled for the session, so a Seq Scan left in a plan means
+no index can serve the predicate (e.g. someone cast an indexed column again).
+Run from the project root:
+
+    python -m Models.Statistics.ExplainCheck [from_date] [to_date]
+
+Exits with status 1 when any plan has a sequential scan on a watched table.
+"""
+import contextlib
+import datetime
+import inspect
+import io
+import sys
+
+from Models.Statistics.BusinessModel import BusinessModel
+from Models.Statistics.DemographicModel import DemographicModel
+from Models.Statistics.EducationModel import EducationModel
+from Models.Statistics.EmploymentModel import EmploymentModel
+from Models.Statistics.HealthModel import HealthModel
+from Models.Statistics.HouseholdModel import HouseholdModel
+from Models.Statistics.InfrastructureModel import InfrastructureModel
+from Models.Statistics.NeighborhoodModel import NeighborhoodModel
+from Models.Statistics.StatCube import refresh_paused
+from database import Database
+
+MODELS = [
+    BusinessModel, DemographicModel, EducationModel, EmploymentModel,
+    HealthModel, HouseholdModel, InfrastructureModel, NeighborhoodModel
+]
+
+# Tables big enough that a full scan is a regression. Lookup tables are left out.
+WATCHED_TABLES = {
+    "stat_citizen_cube", "stat_employment_cube", "stat_household_cube",
+    "stat_business_cube", "stat_infrastructure_cube", "stat_medical_cube",
+    "citizen", "household_info", "business_info", "infrastructure",
+    "medical_history", "employment"
+}
+
+# Getters that read a whole table by design.
+ALLOWED_SEQ_SCANS = {
+    # Counts every living citizen born by to_date, not a date range of the cube.
+    "EducationModel.get_all_educational_attainment_stats": {"citizen"},
+}
+
+# The per-day reads refresh_stat_cubes() does on each source table.
+REFRESH_PROBES = {
+    "refresh: " + table: f"""
+        SELECT * FROM {table}
+        WHERE {prefix}_LAST_UPDATED >= %(day)s
+          AND {prefix}_LAST_UPDATED < %(day)s::date + 1
+          AND {prefix}_IS_DELETED = FALSE;
+    """
+    for table, prefix in (
+        ("CITIZEN", "CTZ"),
+        ("HOUSEHOLD_INFO", "HH"),
+        ("BUSINESS_INFO", "BS"),
+        ("INFRASTRUCTURE", "INF"),
+        ("MEDICAL_HISTORY", "MH"),
+    )
+}
+REFRESH_PROBES["refresh: EMPLOYMENT"] = "SELECT * FROM EMPLOYMENT WHERE CTZ_ID = %(citizen_id)s;"
+REFRESH_PROBES["refresh: household members"] = """
+    SELECT * FROM CITIZEN WHERE HH_ID = %(household_id)s AND CTZ_IS_DELETED = FALSE;
+"""
+REFRESH_PROBES["refresh: age re-banding"] = """
+    SELECT * FROM CITIZEN
+    WHERE CTZ_DATE_OF_BIRTH >= %(day)s::date - 1
+      AND CTZ_DATE_OF_BIRTH <= %(day)s::date + 1
+      AND CTZ_IS_DELETED = FALSE;
+"""
+
+
+class ExplainCursor:
+    """Stands in for a model's cursor and records a JSON plan per statement."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.plans = []
+
+    def execute(self, query, params=None):
+        self.cursor.execute("EXPLAIN (FORMAT JSON) " + query, params)
+        self.plans.append(self.cursor.fetchone()[0][0]["Plan"])
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return []
+
+
+def seq_scans(plan):
+    """Relation names of every Seq Scan node in a plan tree."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "").lower())
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def disable_seq_scans(db):
+    db.cursor.execute("SET enable_seqscan = off;")
+
+
+def check_model(model_class, from_date, to_date):
+    results = {}
+    model = model_class()
+    try:
+        disable_seq_scans(model.db)
+        for name, method in inspect.getmembers(model, inspect.ismethod):
+            if not name.startswith("get_"):
+                continue
+            label = f"{model_class.__name__}.{name}"
+            explain = ExplainCursor(model.db.cursor)
+            model.cursor = explain
+
+            dates = {"from_date": from_date, "to_date": to_date}
+            args = [dates[p] for p in inspect.signature(method).parameters if p in dates]
+            # The getters' own result handling fails on the empty stand-in rows
+            # and prints an error; that is expected here.
+            with refresh_paused(), contextlib.redirect_stdout(io.StringIO()):
+                method(*args)
+            results[label] = explain.plans
+    finally:
+        model.db.conn.rollback()
+        model.db.close()
+    return results
+
+
+def check_refresh_probes():
+    results = {}
+    db = Database(pooled=False)
+    try:
+        disable_seq_scans(db)
+        explain = ExplainCursor(db.cursor)
+        params = {"day": datetime.date.today(), "citizen_id": 1, "household_id": 1}
+        for label, query in REFRESH_PROBES.items():
+            explain.plans = []
+            explain.execute(query, params)
+            results[label] = explain.plans
+    finally:
+        db.conn.rollback()
+        db.close()
+    return results
+
+
+def run_check(from_date, to_date):
+    """Returns {label: [tables seq-scanned]} for every query that regressed."""
+    results = {}
+    for model_class in MODELS:
+        results.update(check_model(model_class, from_date, to_date))
+    results.update(check_refresh_probes())
+
+    failures = {}
+    for label, plans in results.items():
+        allowed = ALLOWED_SEQ_SCANS.get(label, set())
+        tables = sorted({
+            table for plan in plans for table in seq_scans(plan)
+            if table in WATCHED_TABLES and table not in allowed
+        })
+        if not plans:
+            print(f"[SKIP] {label}: no statement ran")
+        elif tables:
+            failures[label] = tables
+            print(f"[FAIL] {label}: sequential scan on {', '.join(tables)}")
+        else:
+            print(f"[OK]   {label}")
+    return failures
+
+
+if __name__ == "__main__":
+    today = datetime.date.today()
+    from_date = sys.argv[1] if len(sys.argv) > 1 else str(today - datetime.timedelta(days=365))
+    to_date = sys.argv[2] if len(sys.argv) > 2 else str(today)
+    sys.exit(1 if run_check(from_date, to_date) else 0)
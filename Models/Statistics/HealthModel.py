@@ -1,19 +1,21 @@
+from Models.Statistics.StatCube import refresh_stat_cubes
 from database import Database
 
 class HealthModel:
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # Pass a borrowed Database when running on a query worker thread.
+        self.db = db or Database(pooled=False)
         self.cursor = self.db.get_cursor()
 
     def get_health_risk_group_data(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
-                SELECT ch.CLAH_CLASSIFICATION_NAME, COUNT(c.CTZ_ID) AS total
+                SELECT ch.CLAH_CLASSIFICATION_NAME, COALESCE(SUM(c.CITIZEN_COUNT), 0) AS total
                 FROM CLASSIFICATION_HEALTH_RISK ch
-                         LEFT JOIN CITIZEN c ON ch.CLAH_ID = c.CLAH_ID 
-                         AND c.CTZ_IS_DELETED = FALSE
+                         LEFT JOIN STAT_CITIZEN_CUBE c ON ch.CLAH_ID = c.CLAH_ID 
                          AND c.CTZ_IS_ALIVE = TRUE
-                         AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s
+                         AND c.STAT_DAY BETWEEN %s AND %s
                 GROUP BY ch.CLAH_CLASSIFICATION_NAME
                 ORDER BY ch.CLAH_CLASSIFICATION_NAME;
             """, (from_date, to_date))
@@ -26,16 +28,16 @@ class HealthModel:
 
     def get_blood_type_distribution(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 WITH all_blood_types AS (
                     SELECT unnest(enum_range(NULL::blood_type_enum)) AS blood_type
                 )
-                SELECT bt.blood_type, COUNT(c.CTZ_ID) AS total
+                SELECT bt.blood_type, COALESCE(SUM(c.CITIZEN_COUNT), 0) AS total
                 FROM all_blood_types bt
-                         LEFT JOIN CITIZEN c ON c.CTZ_BLOOD_TYPE = bt.blood_type 
-                            AND c.CTZ_IS_DELETED = FALSE
+                         LEFT JOIN STAT_CITIZEN_CUBE c ON c.CTZ_BLOOD_TYPE = bt.blood_type 
                             AND c.CTZ_IS_ALIVE = TRUE
-                            AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s
+                            AND c.STAT_DAY BETWEEN %s AND %s
                 GROUP BY bt.blood_type
                 ORDER BY bt.blood_type;
             """, (from_date, to_date))
@@ -48,19 +50,16 @@ class HealthModel:
 
     def get_total_gender_with_med_record(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
-                SELECT sex_group.sex AS gender, COUNT(DISTINCT c.CTZ_ID) AS total
+                SELECT sex_group.sex AS gender, COALESCE(SUM(c.CITIZEN_COUNT), 0) AS total
                 FROM (VALUES ('M'), ('F')) AS sex_group(sex)
-                         LEFT JOIN CITIZEN c ON c.CTZ_SEX = sex_group.sex 
-                            AND c.CTZ_IS_DELETED = FALSE
+                         LEFT JOIN STAT_CITIZEN_CUBE c ON c.CTZ_SEX = sex_group.sex 
                             AND c.CTZ_IS_ALIVE = TRUE
-                            AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s
-                         LEFT JOIN MEDICAL_HISTORY mh ON c.CTZ_ID = mh.CTZ_ID 
-                            AND mh.MH_IS_DELETED = FALSE
-                            AND mh.MH_LAST_UPDATED::date BETWEEN %s AND %s
+                            AND c.STAT_DAY BETWEEN %s AND %s
                 GROUP BY sex_group.sex
                 ORDER BY sex_group.sex;
-            """, (from_date, to_date, from_date, to_date))
+            """, (from_date, to_date))
 
             return self.cursor.fetchall()
 
@@ -70,14 +69,13 @@ class HealthModel:
 
     def get_philhealth_categories(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
-                SELECT pc.PC_CATEGORY_NAME, COUNT(c.CTZ_ID) AS total
+                SELECT pc.PC_CATEGORY_NAME, COALESCE(SUM(c.CITIZEN_COUNT), 0) AS total
                 FROM PHILHEALTH_CATEGORY pc
-                         LEFT JOIN PHILHEALTH ph ON ph.PC_ID = pc.PC_ID
-                         LEFT JOIN CITIZEN c ON c.PHEA_ID = ph.PHEA_ID 
-                            AND c.CTZ_IS_DELETED = FALSE
+                         LEFT JOIN STAT_CITIZEN_CUBE c ON c.PC_ID = pc.PC_ID 
                             AND c.CTZ_IS_ALIVE = TRUE
-                            AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s                    
+                            AND c.STAT_DAY BETWEEN %s AND %s
                 GROUP BY pc.PC_CATEGORY_NAME
                 ORDER BY pc.PC_CATEGORY_NAME;
             """, (from_date, to_date))
@@ -90,15 +88,12 @@ class HealthModel:
 
     def get_top_5_medical_case(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
-                SELECT mht.MHT_TYPE_NAME, COUNT(mh.MHT_ID) AS total
-                FROM MEDICAL_HISTORY mh
+                SELECT mht.MHT_TYPE_NAME, SUM(mh.RECORD_COUNT) AS total
+                FROM STAT_MEDICAL_CUBE mh
                          JOIN MEDICAL_HISTORY_TYPE mht ON mh.MHT_ID = mht.MHT_ID
-                         JOIN CITIZEN c ON c.CTZ_ID = mh.CTZ_ID
-                WHERE mh.MH_IS_DELETED = FALSE
-                          AND c.CTZ_IS_DELETED = FALSE
-                          AND c.CTZ_IS_ALIVE = TRUE
-                          AND mh.MH_LAST_UPDATED::date BETWEEN %s AND %s
+                WHERE mh.STAT_DAY BETWEEN %s AND %s
                 GROUP BY mht.MHT_TYPE_NAME
                 ORDER BY total DESC
                 LIMIT 5;
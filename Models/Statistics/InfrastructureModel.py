@@ -1,23 +1,25 @@
+from Models.Statistics.StatCube import refresh_stat_cubes
 from database import Database
 
 class InfrastructureModel:
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # Pass a borrowed Database when running on a query worker thread.
+        self.db = db or Database(pooled=False)
         self.cursor = self.db.get_cursor()
 
     def get_total_sitio_infrastructure(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
                     s.SITIO_NAME AS "Sitio Name",
-                    COUNT(CASE WHEN i.INF_ACCESS_TYPE = 'Public' THEN 1 END) AS "Public",
-                    COUNT(CASE WHEN i.INF_ACCESS_TYPE = 'Private' THEN 1 END) AS "Private",
-                    COUNT(i.INF_ID) AS "Total Infrastructure"
+                    COALESCE(SUM(i.INFRASTRUCTURE_COUNT) FILTER (WHERE i.INF_ACCESS_TYPE = 'Public'), 0) AS "Public",
+                    COALESCE(SUM(i.INFRASTRUCTURE_COUNT) FILTER (WHERE i.INF_ACCESS_TYPE = 'Private'), 0) AS "Private",
+                    COALESCE(SUM(i.INFRASTRUCTURE_COUNT), 0) AS "Total Infrastructure"
                 FROM
                     SITIO s
-                LEFT JOIN INFRASTRUCTURE i ON i.SITIO_ID = s.SITIO_ID
-                        AND i.INF_IS_DELETED = FALSE
-                        AND i.INF_LAST_UPDATED::date BETWEEN %s AND %s
+                LEFT JOIN STAT_INFRASTRUCTURE_CUBE i ON i.SITIO_ID = s.SITIO_ID
+                        AND i.STAT_DAY BETWEEN %s AND %s
                 GROUP BY
                     s.SITIO_NAME
                 ORDER BY
@@ -35,17 +37,17 @@ class InfrastructureModel:
 
     def get_total_infrastructure_type(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
                     it.INFT_TYPE_NAME as "Infrastructure Type",
-                    COUNT(CASE WHEN i.INF_ACCESS_TYPE = 'Public' THEN 1 END) as "Public",
-                    COUNT(CASE WHEN i.INF_ACCESS_TYPE = 'Private' THEN 1 END) as "Private",
-                    COUNT(i.INF_ID) as "Total Infrastructure"
+                    COALESCE(SUM(i.INFRASTRUCTURE_COUNT) FILTER (WHERE i.INF_ACCESS_TYPE = 'Public'), 0) as "Public",
+                    COALESCE(SUM(i.INFRASTRUCTURE_COUNT) FILTER (WHERE i.INF_ACCESS_TYPE = 'Private'), 0) as "Private",
+                    COALESCE(SUM(i.INFRASTRUCTURE_COUNT), 0) as "Total Infrastructure"
                 
                 FROM INFRASTRUCTURE_TYPE it
-                    LEFT JOIN INFRASTRUCTURE i on it.INFT_ID = i.INFT_ID
-                        AND i.INF_IS_DELETED = FALSE
-                        AND i.INF_LAST_UPDATED::date BETWEEN %s AND %s
+                    LEFT JOIN STAT_INFRASTRUCTURE_CUBE i on it.INFT_ID = i.INFT_ID
+                        AND i.STAT_DAY BETWEEN %s AND %s
                 
                 GROUP BY it.INFT_TYPE_NAME
                 
@@ -63,14 +65,14 @@ class InfrastructureModel:
 
     def get_total_infrastructures(self,from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
-                       COUNT(CASE WHEN INF_ACCESS_TYPE = 'Public' THEN 1 END) as "Public",
-                       COUNT(CASE WHEN INF_ACCESS_TYPE = 'Private' THEN 1 END) as "Private",
-                       COUNT(INF_ID) as "Total Infrastructure"
-                FROM INFRASTRUCTURE
-                WHERE INF_IS_DELETED = FALSE
-                     AND INF_LAST_UPDATED::date BETWEEN %s AND %s;
+                       COALESCE(SUM(INFRASTRUCTURE_COUNT) FILTER (WHERE INF_ACCESS_TYPE = 'Public'), 0) as "Public",
+                       COALESCE(SUM(INFRASTRUCTURE_COUNT) FILTER (WHERE INF_ACCESS_TYPE = 'Private'), 0) as "Private",
+                       COALESCE(SUM(INFRASTRUCTURE_COUNT), 0) as "Total Infrastructure"
+                FROM STAT_INFRASTRUCTURE_CUBE
+                WHERE STAT_DAY BETWEEN %s AND %s;
 
             """, (from_date, to_date))
 
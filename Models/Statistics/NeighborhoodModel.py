@@ -1,34 +1,36 @@
+from Models.Statistics.StatCube import refresh_stat_cubes
 from database import Database
 
 
 class NeighborhoodModel:
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # Pass a borrowed Database when running on a query worker thread.
+        self.db = db or Database(pooled=False)
         self.cursor = self.db.get_cursor()
 
     def get_data_per_sitio(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 SELECT
                     s.SITIO_NAME AS "Sitio Name",
-                    COUNT(c.CTZ_ID) FILTER (WHERE c.CTZ_SEX = 'M') AS "No. of Male",
-                    COUNT(c.CTZ_ID) FILTER (WHERE c.CTZ_SEX = 'F') AS "No. of Female",
-                    COUNT(c.CTZ_ID) FILTER (
-                        WHERE EXTRACT(YEAR FROM AGE(c.CTZ_DATE_OF_BIRTH)) >= 60
-                        ) AS "No. of Seniors",
-                    COUNT(c.CTZ_ID) FILTER (
+                    COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_SEX = 'M'), 0) AS "No. of Male",
+                    COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_SEX = 'F'), 0) AS "No. of Female",
+                    COALESCE(SUM(c.CITIZEN_COUNT) FILTER (
+                        WHERE c.AGE_BAND >= 60
+                        ), 0) AS "No. of Seniors",
+                    COALESCE(SUM(c.CITIZEN_COUNT) FILTER (
                         WHERE ch.CLAH_CLASSIFICATION_NAME = 'Person With Disability'
-                        ) AS "No. of PWD",
-                    COUNT(c.CTZ_ID) FILTER (WHERE c.CTZ_IS_REGISTERED_VOTER = TRUE) AS "No. of Voters",
-                    COUNT(c.CTZ_ID) AS "Total Population"
+                        ), 0) AS "No. of PWD",
+                    COALESCE(SUM(c.CITIZEN_COUNT) FILTER (WHERE c.CTZ_IS_REGISTERED_VOTER = TRUE), 0) AS "No. of Voters",
+                    COALESCE(SUM(c.CITIZEN_COUNT), 0) AS "Total Population"
                 
                 FROM
                     SITIO s
-                        LEFT JOIN CITIZEN c
+                        LEFT JOIN STAT_CITIZEN_CUBE c
                                   ON c.SITIO_ID = s.SITIO_ID
-                                      AND c.CTZ_IS_DELETED = FALSE
                                       AND c.CTZ_IS_ALIVE = TRUE
-                                      AND c.CTZ_LAST_UPDATED ::date BETWEEN %s AND %s
+                                      AND c.STAT_DAY BETWEEN %s AND %s
                         LEFT JOIN CLASSIFICATION_HEALTH_RISK ch ON c.CLAH_ID = ch.CLAH_ID
                 GROUP BY
                     s.SITIO_NAME
@@ -53,17 +55,17 @@ class NeighborhoodModel:
 
     def get_highest_and_lowest_population_sitios(self, from_date, to_date):
         try:
+            refresh_stat_cubes(self.db)
             self.cursor.execute("""
                 WITH sitio_population AS (
                     SELECT
                         s.SITIO_NAME,
-                        COUNT(c.CTZ_ID) AS total_population
+                        COALESCE(SUM(c.CITIZEN_COUNT), 0) AS total_population
                     FROM
                         SITIO s
                             LEFT JOIN
-                        CITIZEN c ON s.SITIO_ID = c.SITIO_ID
-                            AND c.CTZ_LAST_UPDATED::date BETWEEN %s AND %s
-                            AND c.CTZ_IS_DELETED = FALSE
+                        STAT_CITIZEN_CUBE c ON s.SITIO_ID = c.SITIO_ID
+                            AND c.STAT_DAY BETWEEN %s AND %s
                             AND c.CTZ_IS_ALIVE = TRUE
                     GROUP BY
                         s.SITIO_NAME
@@ -0,0 +1,40 @@
+import contextlib
+import threading
+import time
+
+# The statistics models read from the STAT_*_CUBE tables (see the STATISTICS CUBES
+# section of mnhs_barangay_new_query.sql). Pending changes are folded in before a
+# read, at most once per interval, so one page load does a single refresh.
+CUBE_REFRESH_INTERVAL = 5  # seconds
+
+_last_refresh = 0.0
+_refresh_lock = threading.Lock()
+_paused = 0
+
+
+@contextlib.contextmanager
+def refresh_paused():
+    """Makes refresh_stat_cubes() a no-op inside the block, for read-only tools like ExplainCheck."""
+    global _paused
+    with _refresh_lock:
+        _paused += 1
+    try:
+        yield
+    finally:
+        with _refresh_lock:
+            _paused -= 1
+
+
+def refresh_stat_cubes(db, force=False):
+    global _last_refresh
+    with _refresh_lock:
+        if _paused or (not force and time.monotonic() - _last_refresh < CUBE_REFRESH_INTERVAL):
+            return
+        try:
+            db.cursor.execute("SELECT refresh_stat_cubes();")
+            db.conn.commit()
+            _last_refresh = time.monotonic()
+        except Exception as e:
+            db.conn.rollback()
+            print(f"[ERROR] Failed to refresh statistics cubes: {e}")
+
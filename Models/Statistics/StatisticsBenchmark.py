@@ -0,0 +1,313 @@
+"""Latency and plan benchmark for every statistics model method.
+
+Runs each public method of the models in ExplainCheck.MODELS, WARMUP_RUNS
+times untimed and then `runs` times timed. It records min, p50, p95, p99,
+max and mean latency. The timings include the refresh_stat_cubes() check the
+screens also pay. A final pass swaps the model's cursor for one that runs
+each SELECT under EXPLAIN (ANALYZE, BUFFERS) before running it for real. The
+JSON plans, planning and execution times and buffer counts are kept next to
+the timings. Run from the project root:
+
+    python -m Models.Statistics.StatisticsBenchmark run [report.json] [runs]
+    python -m Models.Statistics.StatisticsBenchmark scale [sizes] [report.json] [runs]
+    python -m Models.Statistics.StatisticsBenchmark compare baseline.json report.json [tolerance]
+
+run benchmarks the database as it is. scale grows the database with
+Models/AdminModels/SyntheticData.py up to each citizen count in sizes (comma
+separated, ascending, default 10000,100000,1000000) and benchmarks at each
+step. Point DB_CONFIG at a scratch database first: the synthetic rows are
+kept. compare matches two reports by dataset size and method. It exits with
+status 1 when a p95 grew by more than the tolerance (default 0.25), or when a
+plan's shape changed.
+"""
+import contextlib
+import datetime
+import inspect
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from Models.AdminModels.SyntheticData import DEFAULT_SEED, YEARS_OF_RECORDS, generate
+from Models.Statistics.ExplainCheck import MODELS
+from database import Database
+from Utils.util_query_stats import statement_key
+
+RUNS = 20
+WARMUP_RUNS = 2
+SCALE_SIZES = (10000, 100000, 1000000)
+# Household size the synthetic generator averages, to size each growth step.
+CITIZENS_PER_HOUSEHOLD = 4.0
+DEFAULT_REPORT = "statistics_benchmark.json"
+REGRESSION_TOLERANCE = 0.25
+# A p95 has to grow by at least this much as well, so sub-millisecond noise is not flagged.
+REGRESSION_FLOOR_MS = 1.0
+
+DATASET_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM CITIZEN WHERE CTZ_IS_DELETED = FALSE),
+        (SELECT COUNT(*) FROM HOUSEHOLD_INFO WHERE HH_IS_DELETED = FALSE),
+        current_setting('server_version');
+"""
+
+
+class PlanCursor:
+    """Stands in for a model's cursor: EXPLAINs each SELECT with ANALYZE and BUFFERS, then runs it."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.plans = []
+
+    def execute(self, query, params=None):
+        if query.lstrip().upper().startswith(("SELECT", "WITH")):
+            self.cursor.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query, params)
+            self.plans.append((query, self.cursor.fetchone()[0][0]))
+        # Run last, so the method's fetches (also through db.cursor) see the real rows.
+        self.cursor.execute(query, params)
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def plan_shape(plan):
+    """Node types (with their relation or index) in plan order, which is what compare diffs."""
+    node = plan.get("Node Type", "")
+    target = plan.get("Index Name") or plan.get("Relation Name")
+    shape = [f"{node} on {target}" if target else node]
+    for child in plan.get("Plans", []):
+        shape.extend(plan_shape(child))
+    return shape
+
+
+def summarize_plan(query, explained):
+    plan = explained["Plan"]
+    return {
+        "statement": statement_key(query),
+        "planning_ms": explained.get("Planning Time"),
+        "execution_ms": explained.get("Execution Time"),
+        "shared_hit_blocks": plan.get("Shared Hit Blocks"),
+        "shared_read_blocks": plan.get("Shared Read Blocks"),
+        "temp_read_blocks": plan.get("Temp Read Blocks"),
+        "temp_written_blocks": plan.get("Temp Written Blocks"),
+        "shape": plan_shape(plan),
+        "plan": plan,
+    }
+
+
+def public_methods(model):
+    return [(name, method) for name, method in inspect.getmembers(model, inspect.ismethod)
+            if not name.startswith("_") and name != "close"]
+
+
+def call(method, from_date, to_date):
+    """Calls a model method with the dates it takes. Returns the errors it raised or printed.
+
+    The models catch their own query errors and print them with no common
+    prefix ("[ERROR] ...", "ERROR: ...", "Error fetching ..."), so any printed
+    line mentioning an error counts.
+    """
+    dates = {"from_date": from_date, "to_date": to_date}
+    args = [dates[p] for p in inspect.signature(method).parameters if p in dates]
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            method(*args)
+    except Exception as e:
+        return [f"{type(e).__name__}: {e}"]
+    return [line for line in output.getvalue().splitlines() if "error" in line.lower()]
+
+
+def benchmark_model(model_class, from_date, to_date, runs=RUNS):
+    results = {}
+    model = model_class()
+    try:
+        for name, method in public_methods(model):
+            errors = []
+            for _ in range(WARMUP_RUNS):
+                errors += call(method, from_date, to_date)
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                errors += call(method, from_date, to_date)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+
+            cursor = model.cursor
+            model.cursor = PlanCursor(cursor)
+            try:
+                errors += call(method, from_date, to_date)
+                statements = [summarize_plan(query, explained) for query, explained in model.cursor.plans]
+            finally:
+                model.cursor = cursor
+
+            results[f"{model_class.__name__}.{name}"] = {
+                "runs": runs,
+                "min_ms": timings[0],
+                "p50_ms": percentile(timings, 0.50),
+                "p95_ms": percentile(timings, 0.95),
+                "p99_ms": percentile(timings, 0.99),
+                "max_ms": timings[-1],
+                "mean_ms": sum(timings) / len(timings),
+                "errors": sorted(set(errors)),
+                "statements": statements,
+            }
+    finally:
+        model.db.close()
+    return results
+
+
+def dataset_info(db):
+    cursor = db.get_cursor()
+    cursor.execute(DATASET_QUERY)
+    citizens, households, server_version = cursor.fetchone()
+    db.conn.commit()
+    return citizens, households, server_version
+
+
+def benchmark_dataset(db, from_date, to_date, runs=RUNS, target=None):
+    citizens, households, _ = dataset_info(db)
+    print(f"Benchmarking {citizens} citizens in {households} households ({runs} runs per method)")
+    methods = {}
+    for model_class in MODELS:
+        for label, result in benchmark_model(model_class, from_date, to_date, runs).items():
+            methods[label] = result
+            flag = f"  [{len(result['errors'])} errors]" if result["errors"] else ""
+            print(f"  {label:<62} p50 {result['p50_ms']:>9.1f} ms  p95 {result['p95_ms']:>9.1f} ms{flag}")
+    return {"target_citizens": target, "citizens": citizens, "households": households, "methods": methods}
+
+
+def current_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def new_report(db, from_date, to_date, runs):
+    return {
+        "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": current_commit(),
+        "server_version": dataset_info(db)[2],
+        "python_version": platform.python_version(),
+        "from_date": str(from_date),
+        "to_date": str(to_date),
+        "runs": runs,
+        "warmup_runs": WARMUP_RUNS,
+        "datasets": [],
+    }
+
+
+def write_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"Report written to {os.path.abspath(path)}")
+
+
+def run(db, path=DEFAULT_REPORT, runs=RUNS, from_date=None, to_date=None):
+    to_date = to_date or datetime.date.today()
+    from_date = from_date or to_date - datetime.timedelta(days=365 * YEARS_OF_RECORDS)
+    report = new_report(db, from_date, to_date, runs)
+    report["datasets"].append(benchmark_dataset(db, from_date, to_date, runs))
+    write_report(report, path)
+    return report
+
+
+def scale(db, sizes=SCALE_SIZES, path=DEFAULT_REPORT, runs=RUNS, seed=DEFAULT_SEED):
+    """Grows the database to each size in turn and benchmarks it; the report is rewritten after every step."""
+    to_date = datetime.date.today()
+    from_date = to_date - datetime.timedelta(days=365 * YEARS_OF_RECORDS)
+    report = new_report(db, from_date, to_date, runs)
+    for step, target in enumerate(sorted(sizes)):
+        citizens = dataset_info(db)[0]
+        if citizens > target:
+            print(f"[SKIP] {target} citizens: the database already has {citizens}")
+            continue
+        missing = target - citizens
+        if missing > 0:
+            households = math.ceil(missing / CITIZENS_PER_HOUSEHOLD)
+            print(f"Adding {households} households (about {missing} citizens) for the {target} step")
+            # One seed per step, so each step's house numbers are new.
+            generate(db, households, seed + step, as_of=to_date)
+        report["datasets"].append(benchmark_dataset(db, from_date, to_date, runs, target))
+        write_report(report, path)
+    return report
+
+
+def _dataset_key(dataset):
+    return dataset["target_citizens"] or dataset["citizens"]
+
+
+def compare(baseline, report, tolerance=REGRESSION_TOLERANCE):
+    """[(dataset, method, reason)] for each regression from baseline to report."""
+    regressions = []
+    baseline_datasets = {_dataset_key(d): d for d in baseline["datasets"]}
+    for dataset in report["datasets"]:
+        key = _dataset_key(dataset)
+        old = baseline_datasets.get(key)
+        if old is None:
+            print(f"[SKIP] {key} citizens: not in the baseline")
+            continue
+        for label, result in dataset["methods"].items():
+            before = old["methods"].get(label)
+            if before is None:
+                print(f"[NEW]  {key} {label}")
+                continue
+            change = result["p95_ms"] - before["p95_ms"]
+            line = f"{key:>8} {label:<62} p95 {before['p95_ms']:>9.1f} -> {result['p95_ms']:>9.1f} ms"
+            if change > REGRESSION_FLOOR_MS and result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                regressions.append((key, label, f"p95 {before['p95_ms']:.1f} -> {result['p95_ms']:.1f} ms"))
+                print(f"[SLOW] {line}")
+            elif [s["shape"] for s in result["statements"]] != [s["shape"] for s in before["statements"]]:
+                regressions.append((key, label, "plan changed"))
+                print(f"[PLAN] {line}")
+            elif result["errors"] and not before["errors"]:
+                regressions.append((key, label, result["errors"][0]))
+                print(f"[FAIL] {line}")
+            else:
+                print(f"[OK]   {line}")
+    return regressions
+
+
+def load_report(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "run"
+    if command == "compare":
+        if len(sys.argv) < 4:
+            print(__doc__)
+            sys.exit(2)
+        found = compare(load_report(sys.argv[2]), load_report(sys.argv[3]),
+                        float(sys.argv[4]) if len(sys.argv) > 4 else REGRESSION_TOLERANCE)
+        print(f"{len(found)} regressions")
+        sys.exit(1 if found else 0)
+
+    database = Database(pooled=False)
+    try:
+        if command == "run":
+            run(database,
+                sys.argv[2] if len(sys.argv) > 2 else DEFAULT_REPORT,
+                int(sys.argv[3]) if len(sys.argv) > 3 else RUNS)
+        elif command == "scale":
+            scale(database,
+                  [int(size) for size in sys.argv[2].split(",")] if len(sys.argv) > 2 else SCALE_SIZES,
+                  sys.argv[3] if len(sys.argv) > 3 else DEFAULT_REPORT,
+                  int(sys.argv[4]) if len(sys.argv) > 4 else RUNS)
+        else:
+            sys.exit(f"Unknown command '{command}'")
+    finally:
+        database.close()
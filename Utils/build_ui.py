@@ -0,0 +1,99 @@
+"""Compiles Resources/UIs/**/*.ui into Python modules under Resources/UICompiled.
+
+Screens and popups then skip the XML parse when they open (see
+Utils.util_ui_loader). Each module records the SHA-1 of the .ui it was built
+from, and the loader ignores a module whose .ui has changed since, so
+forgetting to rebuild only costs speed. Run from the project root after
+editing a .ui file:
+
+    python -m Utils.build_ui            # rebuild what changed
+    python -m Utils.build_ui --force    # rebuild everything
+    python -m Utils.build_ui --clean    # delete the compiled modules
+"""
+import os
+import re
+import shutil
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+
+from Utils.util_ui_loader import UI_COMPILED_DIR, UI_SOURCE_DIR, compiled_path, source_digest
+
+_UI_CLASS = re.compile(r"^class (Ui_\w+)\(", re.MULTILINE)
+_DIGEST = re.compile(r'^UI_SOURCE_SHA1 = "([0-9a-f]+)"$', re.MULTILINE)
+
+
+def find_uic():
+    uic = shutil.which("pyside6-uic")
+    if uic is None:
+        raise RuntimeError("pyside6-uic was not found on PATH; it ships with the PySide6 package.")
+    return uic
+
+
+def ui_files(source_dir=UI_SOURCE_DIR):
+    for root, _, files in os.walk(source_dir):
+        for name in sorted(files):
+            if name.endswith(".ui"):
+                yield os.path.join(root, name)
+
+
+def is_current(module_path, digest):
+    if not os.path.exists(module_path):
+        return False
+    with open(module_path, encoding="utf-8") as file:
+        match = _DIGEST.search(file.read())
+    return bool(match) and match.group(1) == digest
+
+
+def compile_ui(uic, ui_path, module_path, digest):
+    base_class = ElementTree.parse(ui_path).getroot().find("widget").get("class")
+    result = subprocess.run([uic, ui_path], capture_output=True, text=True, encoding="utf-8")
+    if result.returncode != 0:
+        raise RuntimeError(f"pyside6-uic failed on {ui_path}: {result.stderr.strip()}")
+    ui_class = _UI_CLASS.search(result.stdout)
+    if ui_class is None:
+        raise RuntimeError(f"pyside6-uic output for {ui_path} has no Ui_ class")
+
+    os.makedirs(os.path.dirname(module_path), exist_ok=True)
+    with open(module_path, "w", encoding="utf-8", newline="\n") as file:
+        file.write(result.stdout)
+        file.write("\n\n# Read by Utils.util_ui_loader\n")
+        file.write(f'UI_SOURCE_SHA1 = "{digest}"\n')
+        file.write(f'UI_BASE_CLASS = "{base_class}"\n')
+        file.write(f'UI_CLASS = "{ui_class.group(1)}"\n')
+
+
+def build(force=False, source_dir=UI_SOURCE_DIR):
+    """Compiles every .ui that has no up-to-date module. Returns (built, skipped, failed paths)."""
+    uic = find_uic()
+    built, skipped, failed = 0, 0, []
+    for ui_path in ui_files(source_dir):
+        module_path = compiled_path(ui_path)
+        digest = source_digest(ui_path)
+        if not force and is_current(module_path, digest):
+            skipped += 1
+            continue
+        try:
+            compile_ui(uic, ui_path, module_path, digest)
+            built += 1
+        except Exception as e:
+            print(f"[ERROR] {e}")
+            failed.append(ui_path)
+    return built, skipped, failed
+
+
+def clean():
+    if os.path.isdir(UI_COMPILED_DIR):
+        shutil.rmtree(UI_COMPILED_DIR)
+
+
+if __name__ == "__main__":
+    if "--clean" in sys.argv:
+        clean()
+        print(f"Removed {UI_COMPILED_DIR}")
+        sys.exit(0)
+
+    built_count, skipped_count, failed_paths = build(force="--force" in sys.argv)
+    print(f"Compiled {built_count} UI files, {skipped_count} already up to date, {len(failed_paths)} failed")
+    # A failed file still loads from XML, but say so in the exit status for build scripts.
+    sys.exit(1 if failed_paths else 0)
@@ -0,0 +1,97 @@
+"""Startup and popup-open latency: QUiLoader XML parsing vs compiled UI modules.
+
+Times the screens built before the dashboard appears and the popups opened
+while registering a citizen, once cold and then RUNS times warm, with the
+XML path the app used to take (a fresh QUiLoader per open) and with
+Utils.util_ui_loader reading the modules from `python -m Utils.build_ui`.
+Run from the project root after building:
+
+    python -m Utils.ui_benchmark [runs]
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QFile
+from PySide6.QtUiTools import QUiLoader
+from PySide6.QtWidgets import QApplication
+
+from Utils.util_ui_loader import compiled_module, load_ui_file
+
+RUNS = 20
+
+STARTUP_UIS = [
+    "Resources/UIs/AuthPages/login.ui",
+    "Resources/UIs/MainPages/dashboard.ui",
+]
+
+POPUP_UIS = [
+    "Resources/UIs/PopUp/Screen_CitizenPanel/ScreenCitizenProfile/register_citizen_part_01.ui",
+    "Resources/UIs/PopUp/Screen_CitizenPanel/ScreenCitizenProfile/register_citizen_part_02.ui",
+    "Resources/UIs/PopUp/Screen_CitizenPanel/ScreenCitizenProfile/register_citizen_part_03.ui",
+    "Resources/UIs/PopUp/Screen_CitizenPanel/ScreenHousehold/register_household.ui",
+    "Resources/UIs/PopUp/Screen_Transactions/create_transaction.ui",
+]
+
+
+def load_xml(ui_path):
+    loader = QUiLoader()
+    file = QFile(ui_path)
+    file.open(QFile.ReadOnly)
+    widget = loader.load(file, None)
+    file.close()
+    return widget
+
+
+def time_load(load, ui_path):
+    started = time.perf_counter()
+    widget = load(ui_path)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    widget.deleteLater()
+    QApplication.processEvents()
+    return elapsed_ms
+
+
+def measure(ui_paths, runs=RUNS):
+    """{ui path: {mode: (cold ms, median warm ms)}}. Cold is the first build of that file in the process."""
+    results = {}
+    for ui_path in ui_paths:
+        modes = {"xml": load_xml}
+        if compiled_module(ui_path) is not None:
+            modes["compiled"] = load_ui_file
+        results[ui_path] = {}
+        for mode, load in modes.items():
+            cold = time_load(load, ui_path)
+            warm = [time_load(load, ui_path) for _ in range(runs)]
+            results[ui_path][mode] = (cold, statistics.median(warm))
+    return results
+
+
+def print_results(title, results):
+    print(title)
+    totals = {"xml": [0.0, 0.0], "compiled": [0.0, 0.0]}
+    for ui_path, modes in results.items():
+        print(f"  {os.path.basename(ui_path)}")
+        for mode, (cold, warm) in modes.items():
+            print(f"    {mode:<9} cold {cold:8.2f} ms   warm {warm:8.2f} ms")
+            totals[mode][0] += cold
+            totals[mode][1] += warm
+    for mode, (cold, warm) in totals.items():
+        if cold:
+            print(f"  total {mode:<9} cold {cold:8.2f} ms   warm {warm:8.2f} ms")
+
+
+if __name__ == "__main__":
+    run_count = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    app = QApplication(sys.argv)
+
+    missing = [path for path in STARTUP_UIS + POPUP_UIS if compiled_module(path) is None]
+    if missing:
+        print(f"No up-to-date compiled module for {len(missing)} file(s); "
+              f"run `python -m Utils.build_ui` to compare both paths.")
+
+    print_results("Startup (login, dashboard)", measure(STARTUP_UIS, run_count))
+    print_results("Popup open", measure(POPUP_UIS, run_count))
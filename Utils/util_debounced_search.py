@@ -0,0 +1,129 @@
+import time
+
+from PySide6.QtCore import QObject, QTimer
+
+from Utils.util_query_executor import QueryExecutor
+
+SEARCH_DELAY_MS = 300       # typing pause before a query is sent
+SEARCH_LIMIT = 50           # the LIMIT every panel search uses
+PREFIX_CACHE_TTL = 30       # seconds a result set may be narrowed locally
+
+# LIKE wildcards mean something different in SQL than in the local filter.
+_WILDCARDS = ("%", "_", "\\")
+
+
+class DebouncedSearch(QObject):
+    """Search-as-you-type for a list panel's search field.
+
+    fetch(db, text) runs on the query executor and returns rows; on_results(rows)
+    shows them. Queries only go out after a typing pause, and each keystroke
+    cancels the previous query under the same key.
+
+    When the new text extends the previous one (e.g. "dela" -> "delac"), the
+    previous rows are filtered locally on match_columns and shown at once. If the
+    previous set was complete (fewer rows than limit) that is the final answer
+    and no query is sent; otherwise the query still runs and its rows replace the
+    narrowed ones when they arrive.
+
+    match_columns holds row indexes the SQL filters on. A tuple of indexes is
+    matched against those values joined by a space (e.g. first + last name).
+    Leave it as None to always query.
+    """
+
+    def __init__(self, line_edit, fetch, on_results, key, on_empty=None, on_error=None,
+                 delay_ms=SEARCH_DELAY_MS, limit=SEARCH_LIMIT, match_columns=None, can_narrow=None):
+        super().__init__(line_edit)
+        self.line_edit = line_edit
+        self.fetch = fetch
+        self.on_results = on_results
+        self.key = key
+        self.on_empty = on_empty
+        self.on_error = on_error
+        self.limit = limit
+        self.match_columns = match_columns
+        self.can_narrow = can_narrow
+        self.executor = QueryExecutor.instance()
+        self._last = None  # (text, rows, fetched_at) of the last server result
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.run)
+
+        line_edit.textChanged.connect(self._on_text_changed)
+        line_edit.returnPressed.connect(self.run)
+
+    def text(self):
+        return self.line_edit.text().strip()
+
+    def _on_text_changed(self, _text):
+        self.executor.cancel(self.key)
+        self.timer.start()
+
+    def run(self):
+        """Search now for the current text (search button, Enter, or the typing timer)."""
+        self.timer.stop()
+        text = self.text()
+
+        if not text:
+            self.executor.cancel(self.key)
+            self._last = None
+            if self.on_empty:
+                self.on_empty()
+            return
+
+        narrowed = self._narrow(text)
+        if narrowed is not None:
+            rows, complete = narrowed
+            self.on_results(rows)
+            if complete:
+                self.executor.cancel(self.key)
+                self._last = (text, rows, self._last[2])
+                return
+
+        self.executor.submit(
+            self.key, self.fetch, text,
+            on_result=lambda rows: self._deliver(text, rows),
+            on_error=self._failed
+        )
+
+    def invalidate(self):
+        """Forget the cached result set, e.g. after the panel's data changed."""
+        self._last = None
+
+    def _narrow(self, text):
+        if self._last is None or self.match_columns is None:
+            return None
+        last_text, last_rows, fetched_at = self._last
+        if time.monotonic() - fetched_at > PREFIX_CACHE_TTL:
+            return None
+        if not text.lower().startswith(last_text.lower()) or any(w in text for w in _WILDCARDS):
+            return None
+        if self.can_narrow and not (self.can_narrow(last_text) and self.can_narrow(text)):
+            return None
+
+        needle = text.lower()
+        rows = [row for row in last_rows if self._matches(row, needle)]
+        return rows, len(last_rows) < self.limit
+
+    def _matches(self, row, needle):
+        for column in self.match_columns:
+            if isinstance(column, tuple):
+                value = " ".join("" if row[c] is None else str(row[c]) for c in column)
+            else:
+                value = "" if row[column] is None else str(row[column])
+            if needle in value.lower():
+                return True
+        return False
+
+    def _deliver(self, text, rows):
+        if text != self.text():
+            return  # the field changed while this query was finishing
+        self._last = (text, rows, time.monotonic())
+        self.on_results(rows)
+
+    def _failed(self, error):
+        if self.on_error:
+            self.on_error(error)
+        else:
+            print(f"Search '{self.key}' failed: {error}")
@@ -0,0 +1,90 @@
+import os
+
+from PySide6.QtCore import QObject, Qt
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
+
+from Models.ExportService import EXPORT_FILTER
+from Utils.util_query_executor import QueryExecutor
+
+# File dialog filter -> extension added when the user leaves it off.
+_FILTER_EXTENSIONS = {"CSV": ".csv", "Excel": ".xlsx", "PDF": ".pdf"}
+
+
+class ExportRunner(QObject):
+    """Save dialog, progress dialog with Cancel, and the export job on the query executor.
+
+    job(db, path, *args, progress=...) is one of the Models.ExportService
+    exports. Cancel stops the job between chunks (or aborts its running FETCH)
+    and the partial file is removed.
+    """
+
+    def __init__(self, parent, key, title):
+        super().__init__(parent)
+        self.parent_widget = parent
+        self.key = key
+        self.title = title
+        self.executor = QueryExecutor.instance()
+        self.dialog = None
+
+    def start(self, job, *args):
+        default_name = self.title.lower().replace(" ", "_")
+        path, chosen = QFileDialog.getSaveFileName(
+            self.parent_widget, f"Export {self.title}", default_name, EXPORT_FILTER
+        )
+        if not path:
+            return
+        if not os.path.splitext(path)[1]:
+            path += next((ext for name, ext in _FILTER_EXTENSIONS.items() if chosen.startswith(name)), ".csv")
+
+        self.dialog = QProgressDialog(f"Exporting {self.title}...", "Cancel", 0, 0, self.parent_widget)
+        self.dialog.setWindowTitle(f"Export {self.title}")
+        self.dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.dialog.setAutoClose(False)
+        self.dialog.setAutoReset(False)
+        self.dialog.setMinimumDuration(0)
+        self.dialog.canceled.connect(self.cancel)
+        self.dialog.show()
+
+        self.executor.submit(
+            self.key, job, path, *args,
+            on_result=self.on_result,
+            on_error=self.on_error,
+            on_progress=self.on_progress
+        )
+
+    def on_progress(self, value):
+        done, total = value
+        if total is not None:
+            self.dialog.setMaximum(max(total, 1))
+            self.dialog.setValue(min(done, total))
+            self.dialog.setLabelText(f"Exporting {self.title}... {done:,} of {total:,} rows")
+
+    def cancel(self):
+        self.executor.cancel(self.key)
+        self._close_dialog()
+
+    def on_result(self, result):
+        self._close_dialog()
+        if result.cancelled:
+            return
+        QMessageBox.information(
+            self.parent_widget, "Export Complete",
+            f"Exported {result.rows:,} rows to:\n{result.path}"
+        )
+
+    def on_error(self, error):
+        self._close_dialog()
+        print(f"[ERROR] Export of {self.title} failed: {error}")
+        QMessageBox.critical(self.parent_widget, "Export Failed", str(error))
+
+    def _close_dialog(self):
+        if self.dialog is not None:
+            self.dialog.canceled.disconnect(self.cancel)
+            self.dialog.close()
+            self.dialog = None
+
+
+def start_export(parent, key, title, job, *args):
+    runner = ExportRunner(parent, key, title)
+    runner.start(job, *args)
+    return runner
@@ -1,11 +1,7 @@
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile
 from PySide6.QtWidgets import QWidget
 
+from Utils.util_ui_loader import load_ui_file
+
+
 def load_popup(ui_file_path: str, parent: QWidget = None):
-    loader = QUiLoader()
-    file = QFile(ui_file_path)
-    file.open(QFile.ReadOnly)
-    popup = loader.load(file, parent)
-    file.close()
-    return popup
+    return load_ui_file(ui_file_path, parent)
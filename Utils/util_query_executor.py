@@ -0,0 +1,198 @@
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from Utils.util_query_stats import query_origin
+from database import Database
+
+# Keep this at or below database.POOL_MAX_SIZE so workers never wait on the pool.
+DEFAULT_MAX_WORKERS = 4
+
+
+class _QuerySignals(QObject):
+    # Created on the UI thread, so emits from a worker are queued back to it.
+    finished = Signal(object, int, object)
+    failed = Signal(object, int, object)
+    progress = Signal(object, int, object)
+    done = Signal(object)
+
+
+class _QueryTask(QRunnable):
+    def __init__(self, key, generation, func, args, kwargs, signals):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key = key
+        self.generation = generation
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.cancelled = False
+        self.db = None
+        self._db_lock = threading.Lock()
+
+    def report_progress(self, value):
+        """Passed to long jobs as progress=. Returns False once the task is cancelled."""
+        if self.cancelled:
+            return False
+        self.signals.progress.emit(self.key, self.generation, value)
+        return True
+
+    def cancel(self):
+        self.cancelled = True
+        with self._db_lock:
+            if self.db is not None and self.db.conn is not None:
+                try:
+                    # Aborts the statement running on the server right away.
+                    self.db.conn.cancel()
+                except Exception as e:
+                    print(f"Failed to cancel query '{self.key}': {e}")
+
+    def run(self):
+        if self.cancelled:
+            self.signals.done.emit(self)
+            return
+
+        db = Database()
+        with self._db_lock:
+            self.db = db
+        try:
+            if db.conn is None:
+                raise ConnectionError("Could not get a database connection.")
+            with query_origin(self.key):
+                result = self.func(db, *self.args, **self.kwargs)
+            if not self.cancelled:
+                self.signals.finished.emit(self.key, self.generation, result)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(self.key, self.generation, e)
+        finally:
+            with self._db_lock:
+                self.db = None
+            db.close()
+            self.signals.done.emit(self)
+
+
+class QueryExecutor(QObject):
+    """Runs database work on a worker pool and hands results back on the UI thread.
+
+    Each submission has a key (e.g. "citizen_list"). Submitting again under the
+    same key cancels the previous request, so only the latest click's result is
+    ever delivered.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = QueryExecutor()
+        return cls._instance
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_workers)
+        self.signals = _QuerySignals()
+        self.signals.finished.connect(self._on_finished)
+        self.signals.failed.connect(self._on_failed)
+        self.signals.progress.connect(self._on_progress)
+        self.signals.done.connect(self._on_done)
+        self._generation = 0
+        self._pending = {}  # key -> (task, on_result, on_error)
+        self._progress = {}  # key -> on_progress
+        self._running = set()  # keeps cancelled tasks alive until their worker exits
+
+    def set_max_workers(self, max_workers):
+        self.pool.setMaxThreadCount(max_workers)
+
+    def max_workers(self):
+        return self.pool.maxThreadCount()
+
+    def submit(self, key, func, *args, on_result=None, on_error=None, on_progress=None, **kwargs):
+        """Run func(db, *args, **kwargs) on a worker with a pooled Database.
+
+        With on_progress, func also gets a progress= callable; whatever it is
+        called with is handed to on_progress on the UI thread, and it returns
+        False once the request is cancelled so the job can stop early.
+        """
+        self.cancel(key)
+
+        self._generation += 1
+        task = _QueryTask(key, self._generation, func, args, kwargs, self.signals)
+        if on_progress:
+            task.kwargs = dict(kwargs, progress=task.report_progress)
+            self._progress[key] = on_progress
+        self._pending[key] = (task, on_result, on_error)
+        self._running.add(task)
+        self.pool.start(task)
+        return self._generation
+
+    def fetch_all(self, key, query, params=None, on_result=None, on_error=None):
+        return self.submit(key, _fetch_all, query, params, on_result=on_result, on_error=on_error)
+
+    def fetch_one(self, key, query, params=None, on_result=None, on_error=None):
+        return self.submit(key, _fetch_one, query, params, on_result=on_result, on_error=on_error)
+
+    def cancel(self, key):
+        pending = self._pending.pop(key, None)
+        self._progress.pop(key, None)
+        if pending is None:
+            return
+        task = pending[0]
+        if self.pool.tryTake(task):
+            self._running.discard(task)
+        else:
+            task.cancel()
+
+    def cancel_all(self):
+        for key in list(self._pending):
+            self.cancel(key)
+
+    def is_pending(self, key):
+        return key in self._pending
+
+    def _take_current(self, key, generation):
+        pending = self._pending.get(key)
+        if pending is None or pending[0].generation != generation:
+            return None  # stale: a newer request replaced it
+        del self._pending[key]
+        self._progress.pop(key, None)
+        return pending
+
+    @Slot(object, int, object)
+    def _on_finished(self, key, generation, result):
+        pending = self._take_current(key, generation)
+        if pending and pending[1]:
+            pending[1](result)
+
+    @Slot(object, int, object)
+    def _on_progress(self, key, generation, value):
+        pending = self._pending.get(key)
+        on_progress = self._progress.get(key)
+        if pending and pending[0].generation == generation and on_progress:
+            on_progress(value)
+
+    @Slot(object)
+    def _on_done(self, task):
+        self._running.discard(task)
+
+    @Slot(object, int, object)
+    def _on_failed(self, key, generation, error):
+        pending = self._take_current(key, generation)
+        if pending is None:
+            return
+        if pending[2]:
+            pending[2](error)
+        else:
+            print(f"Background query '{key}' failed: {error}")
+
+
+def _fetch_all(db, query, params):
+    db.cursor.execute(query, params)
+    return db.cursor.fetchall()
+
+
+def _fetch_one(db, query, params):
+    db.cursor.execute(query, params)
+    return db.cursor.fetchone()
@@ -0,0 +1,212 @@
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
+
+# Statements at or above this go to SLOW_QUERY_LOG as well as the in-memory window.
+SLOW_QUERY_MS = 200
+SLOW_QUERY_LOG = os.path.join("Logs", "slow_queries.log")
+SLOW_QUERY_LOG_BYTES = 1024 * 1024
+SLOW_QUERY_LOG_BACKUPS = 5
+
+# The diagnostics screen looks at statements from the last ROLLING_WINDOW_SECONDS,
+# capped at ROLLING_MAX_SAMPLES so a bulk import cannot grow it without bound.
+ROLLING_WINDOW_SECONDS = 15 * 60
+ROLLING_MAX_SAMPLES = 20000
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open.
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+STATEMENT_PREVIEW_LENGTH = 160
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_APP_DIRS = ("Controllers", "Models", "Views", "Utils")
+# Frames in these files are plumbing, never the caller worth reporting.
+_PLUMBING_FILES = {
+    os.path.join(_PROJECT_ROOT, "database.py"),
+    os.path.join(_PROJECT_ROOT, "Utils", "util_query_stats.py"),
+    os.path.join(_PROJECT_ROOT, "Utils", "util_query_executor.py"),
+}
+_WHITESPACE = re.compile(r"\s+")
+
+_origin = threading.local()
+
+
+@contextmanager
+def query_origin(label):
+    """Tags statements run inside the block, e.g. with the query executor key that requested them."""
+    previous = getattr(_origin, "label", None)
+    _origin.label = label
+    try:
+        yield
+    finally:
+        _origin.label = previous
+
+
+@lru_cache(maxsize=1024)
+def statement_key(statement):
+    """The statement with its whitespace collapsed, which is how samples are grouped."""
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@lru_cache(maxsize=256)
+def _frame_file_kind(filename):
+    # "controller", "app" or None for files outside the project's packages.
+    path = os.path.abspath(filename)
+    if path in _PLUMBING_FILES:
+        return None
+    relative = os.path.relpath(path, _PROJECT_ROOT)
+    top = relative.split(os.sep, 1)[0]
+    if top == "Controllers":
+        return "controller"
+    return "app" if top in _APP_DIRS else None
+
+
+def calling_site():
+    """ "Class.method" of the nearest controller on the stack, else of the nearest project frame.
+
+    Work on the query executor has no controller above it, so the executor key
+    (set with query_origin) is added in brackets.
+    """
+    frame = sys._getframe(1)
+    first_app = None
+    while frame is not None:
+        code = frame.f_code
+        kind = _frame_file_kind(code.co_filename)
+        if kind == "controller":
+            first_app = code
+            break
+        if kind == "app" and first_app is None:
+            first_app = code
+        frame = frame.f_back
+
+    site = getattr(first_app, "co_qualname", first_app.co_name) if first_app else "unknown"
+    label = getattr(_origin, "label", None)
+    return f"{site} [{label}]" if label else site
+
+
+def _bucket(elapsed_ms):
+    for index, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+        if elapsed_ms < bound:
+            return index
+    return len(HISTOGRAM_BOUNDS_MS)
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class QueryStats:
+    """Per-statement timings for the whole process, fed by database.TimedCursor.
+
+    Samples are (finished at, caller, statement, ms, rows) in a rolling window.
+    deque.append is atomic, so worker threads record without taking the lock;
+    readers take it only to copy the window.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = QueryStats()
+        return cls._instance
+
+    def __init__(self, slow_query_ms=SLOW_QUERY_MS, window_seconds=ROLLING_WINDOW_SECONDS,
+                 max_samples=ROLLING_MAX_SAMPLES, slow_log_path=SLOW_QUERY_LOG):
+        self.slow_query_ms = slow_query_ms
+        self.window_seconds = window_seconds
+        self.slow_log_path = slow_log_path
+        self.started = time.time()
+        self._samples = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+        self._slow_log = None
+
+    def record(self, statement, elapsed_ms, rows, caller):
+        self._samples.append((time.time(), caller, statement_key(statement), elapsed_ms, rows))
+        if elapsed_ms >= self.slow_query_ms:
+            self._log_slow(statement, elapsed_ms, rows, caller)
+
+    def _log_slow(self, statement, elapsed_ms, rows, caller):
+        # Parameters are never logged: they carry citizens' personal data.
+        try:
+            if self._slow_log is None:
+                self._slow_log = self._open_slow_log()
+            self._slow_log.warning("%.1f ms | %s rows | %s | %s",
+                                   elapsed_ms, rows, caller, statement_key(statement))
+        except OSError as e:
+            print(f"[WARN] Could not write the slow query log: {e}")
+
+    def _open_slow_log(self):
+        os.makedirs(os.path.dirname(self.slow_log_path) or ".", exist_ok=True)
+        logger = logging.getLogger("mapro.slow_queries")
+        logger.propagate = False
+        if not logger.handlers:
+            handler = RotatingFileHandler(self.slow_log_path, maxBytes=SLOW_QUERY_LOG_BYTES,
+                                          backupCount=SLOW_QUERY_LOG_BACKUPS, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s | %(message)s"))
+            logger.addHandler(handler)
+        return logger
+
+    def samples(self):
+        """The samples still inside the window, oldest first."""
+        cutoff = time.time() - self.window_seconds
+        with self._lock:
+            samples = list(self._samples)
+        return [sample for sample in samples if sample[0] >= cutoff]
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+        self.started = time.time()
+
+    def histogram(self, samples=None):
+        """[(bucket label, count)] over the window, from "< 1 ms" to ">= 5000 ms"."""
+        counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        for sample in self.samples() if samples is None else samples:
+            counts[_bucket(sample[3])] += 1
+        labels = [f"< {bound} ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">= {HISTOGRAM_BOUNDS_MS[-1]} ms"]
+        return list(zip(labels, counts))
+
+    def top_offenders(self, limit=20, samples=None):
+        """Statements grouped by (caller, statement), most total time first.
+
+        Each is a dict with caller, statement, calls, total_ms, p50_ms, p95_ms,
+        max_ms, avg_rows and slow (calls at or above slow_query_ms).
+        """
+        groups = {}
+        for _, caller, statement, elapsed_ms, rows in self.samples() if samples is None else samples:
+            group = groups.setdefault((caller, statement), ([], []))
+            group[0].append(elapsed_ms)
+            if rows is not None and rows >= 0:
+                group[1].append(rows)
+
+        offenders = []
+        for (caller, statement), (times, rows) in groups.items():
+            times.sort()
+            offenders.append({
+                "caller": caller,
+                "statement": statement,
+                "calls": len(times),
+                "total_ms": sum(times),
+                "p50_ms": _percentile(times, 0.50),
+                "p95_ms": _percentile(times, 0.95),
+                "max_ms": times[-1],
+                "avg_rows": sum(rows) / len(rows) if rows else None,
+                "slow": sum(1 for t in times if t >= self.slow_query_ms),
+            })
+        offenders.sort(key=lambda offender: offender["total_ms"], reverse=True)
+        return offenders[:limit]
+
+    def summary(self, samples=None):
+        """(statements, total ms, p95 ms, slow statements) over the window."""
+        samples = self.samples() if samples is None else samples
+        times = sorted(sample[3] for sample in samples)
+        slow = sum(1 for t in times if t >= self.slow_query_ms)
+        return len(times), sum(times), _percentile(times, 0.95), slow
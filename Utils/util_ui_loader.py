@@ -0,0 +1,92 @@
+import hashlib
+import importlib.util
+import os
+
+from PySide6 import QtWidgets
+from PySide6.QtCore import QFile
+from PySide6.QtUiTools import QUiLoader
+
+UI_SOURCE_DIR = os.path.join("Resources", "UIs")
+# Output of `python -m Utils.build_ui`; mirrors UI_SOURCE_DIR with .py files.
+UI_COMPILED_DIR = os.path.join("Resources", "UICompiled")
+
+_loader = None
+_compiled = {}      # ui path -> (mtime_ns, size, module or None)
+
+
+def compiled_path(ui_path):
+    """Where the build step writes the module for a .ui file under UI_SOURCE_DIR, or None."""
+    relative = os.path.relpath(os.path.normpath(ui_path), UI_SOURCE_DIR)
+    if relative.startswith(os.pardir):
+        return None
+    return os.path.join(UI_COMPILED_DIR, os.path.splitext(relative)[0] + ".py")
+
+
+def source_digest(ui_path):
+    with open(ui_path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def compiled_module(ui_path):
+    """The compiled module for ui_path if it was built from the file as it is now.
+
+    A module whose recorded digest no longer matches (the .ui was edited since
+    the last build) is ignored, so a stale build never hides a change.
+    """
+    try:
+        stat = os.stat(ui_path)
+    except OSError:
+        return None
+    cached = _compiled.get(ui_path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    module = None
+    module_path = compiled_path(ui_path)
+    if module_path and os.path.exists(module_path):
+        try:
+            spec = importlib.util.spec_from_file_location(
+                "ui_compiled." + os.path.splitext(os.path.basename(module_path))[0], module_path
+            )
+            candidate = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(candidate)
+            if getattr(candidate, "UI_SOURCE_SHA1", None) == source_digest(ui_path):
+                module = candidate
+        except Exception as e:
+            print(f"[WARN] Ignoring compiled UI {module_path}: {e}")
+    _compiled[ui_path] = (stat.st_mtime_ns, stat.st_size, module)
+    return module
+
+
+def _from_compiled(module, parent):
+    widget = getattr(QtWidgets, module.UI_BASE_CLASS)(parent)
+    ui = getattr(module, module.UI_CLASS)()
+    ui.setupUi(widget)
+    # QUiLoader exposes named children as attributes of the top widget;
+    # callers rely on that (popup.register_buttonPrev, ...).
+    for name, value in vars(ui).items():
+        setattr(widget, name, value)
+    return widget
+
+
+def load_ui_file(ui_path, parent=None):
+    """Builds the widget for a .ui file, from its compiled module when one is up to date.
+
+    Falls back to parsing the XML with one shared QUiLoader. Raises IOError when
+    the file cannot be read.
+    """
+    global _loader
+
+    module = compiled_module(ui_path)
+    if module is not None:
+        return _from_compiled(module, parent)
+
+    file = QFile(ui_path)
+    if not file.open(QFile.ReadOnly):
+        raise IOError(f"Cannot open {ui_path}: {file.errorString()}")
+    try:
+        if _loader is None:
+            _loader = QUiLoader()
+        return _loader.load(file, parent)
+    finally:
+        file.close()
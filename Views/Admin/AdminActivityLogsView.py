@@ -71,4 +71,9 @@ class AdminActivityLogsView:
         self.activity_logs_screen.nav_buttonTransactions.clicked.connect(self.controller.goto_transactions_panel)
         self.activity_logs_screen.nav_buttonHistoryRecords.clicked.connect(self.controller.goto_history_panel)
         self.activity_logs_screen.nav_buttonTrashBin.clicked.connect(self.controller.goto_trashbin_panel)
-        self.activity_logs_screen.logout_buttonLogout.clicked.connect(self.controller.logout)
\ No newline at end of file
+        self.activity_logs_screen.logout_buttonLogout.clicked.connect(self.controller.logout)
+
+        # Log filters
+        self.activity_logs_screen.refresh_button.clicked.connect(self.controller.refresh)
+        self.activity_logs_screen.filter_apply_button.clicked.connect(self.controller.apply_filters)
+        self.activity_logs_screen.filter_clear_button.clicked.connect(self.controller.clear_filters)
\ No newline at end of file
@@ -68,6 +68,7 @@ class AdminPanelView:
     def _connect_buttons(self):
         self.admin_panel_screen.admn_button_ManageAccounts.clicked.connect(self.controller.goto_manage_accounts)
         self.admin_panel_screen.admn_button_AdminControls.clicked.connect(self.controller.goto_admin_controls)
+        self.admin_panel_screen.admn_button_QueryDiagnostics.clicked.connect(self.controller.show_query_diagnostics)
 
         # Navigation buttons
         self.admin_panel_screen.nav_buttonActivityLogs.clicked.connect(self.controller.goto_activity_logs)
@@ -320,13 +320,18 @@ class CitizenView:
         ui_screen.btn_returnToCitizenPanelPage.setIcon(QIcon('Resources/Icons/FuncIcons/img_return.png'))
         ui_screen.cp_CitizenName_buttonSearch.setIcon(QIcon('Resources/Icons/FuncIcons/icon_search_w.svg'))
         ui_screen.cp_citizen_button_register.setIcon(QIcon('Resources/Icons/FuncIcons/icon_add.svg'))
+        ui_screen.cp_citizen_button_import.setIcon(QIcon('Resources/Icons/FuncIcons/icon_add.svg'))
+        ui_screen.btn_export.setIcon(QIcon('Resources/Icons/FuncIcons/icon_export.svg'))
         ui_screen.cp_citizen_button_update.setIcon(QIcon('Resources/Icons/FuncIcons/icon_edit.svg'))
         ui_screen.cp_citizen_button_remove.setIcon(QIcon('Resources/Icons/FuncIcons/icon_del.svg'))
         # ui_screen.profileList_buttonFilter.setIcon(QIcon('Resources/Icons/FuncIcons/icon_filter.svg'))
         ui_screen.btn_returnToCitizenPanelPage.clicked.connect(self.controller.goto_citizen_panel)
         ui_screen.cp_citizen_button_register.clicked.connect(self.controller.show_register_citizen_part_01_initialize)
+        ui_screen.cp_citizen_button_import.clicked.connect(self.controller.import_census_file)
+        ui_screen.btn_export.clicked.connect(self.controller.export_citizens)
         ui_screen.cp_citizen_button_update.clicked.connect(self.controller.show_update_citizen_part_01_initialize)
-        ui_screen.cp_tableView_List_RegCitizens.cellClicked.connect(self.controller.handle_row_click_citizen)
+        ui_screen.cp_tableView_List_RegCitizens.clicked.connect(
+            lambda index: self.controller.handle_row_click_citizen(index.row(), index.column()))
         ui_screen.cp_CitizenName_buttonSearch.clicked.connect(self.controller.perform_citizen_search)
         ui_screen.cp_citizen_button_remove.clicked.connect(self.controller.handle_remove_citizen)
 
@@ -1,9 +1,9 @@
 from PySide6.QtGui import QPixmap, QIcon, Qt
-import cv2
 from PySide6.QtGui import QPixmap, QIcon, Qt, QImage
 from PySide6.QtWidgets import QMessageBox, QPushButton, QFileDialog, QButtonGroup, QRadioButton, QStackedWidget
 from Controllers.BaseFileController import BaseFileController
 from Models.CitizenModel import CitizenModel
+from Models.LookupCache import LookupCache
 from Views.CitizenPanel.CitizenView import CitizenView
 from Utils.util_popup import load_popup
 from database import Database
@@ -34,18 +34,13 @@ class CitizenHistoryView:
 
     def load_history_type(self):
         try:
-            db = Database()
-            cursor = db.get_cursor()
-            cursor.execute("SELECT hist_id, hist_type_name FROM HISTORY_TYPE ORDER BY hist_type_name ASC;")
-            results = cursor.fetchall()
+            results = LookupCache.instance().rows("history_type")
             combo = self.popup.record_comboBox_citizenhistory_type
             combo.clear()
             for hist_id, hist_type_name in results:
                 combo.addItem(hist_type_name, hist_id)
         except Exception as e:
             print(f"Failed to load transaction types: {e}")
-        finally:
-            db.close()
 
     def validate_citizen_hist_fields(self):
         errors = []
@@ -0,0 +1,162 @@
+"""Application startup: platform setup, Qt, the login window and --profile-startup.
+
+Only Qt and the login screen are loaded before the first window appears. The
+dashboard, the panels, OpenCV (camera capture) and passlib (PIN checks) are
+imported when they are first used.
+
+    python main.py --profile-startup
+
+prints how long each startup phase took and the slowest imports, measured
+the same way as `python -X importtime` (self and cumulative time per module).
+"""
+import importlib.abc
+import sys
+import time
+
+APP_NAME = "MaPro"
+APP_ORGANIZATION = "Barangay Marigondon"
+# Groups the app's windows under one taskbar entry on Windows.
+APP_USER_MODEL_ID = "Marigondon.MaPro.RecordsAndStatistics"
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_TOP_IMPORTS = 25
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader, profiler, name):
+        self.loader = loader
+        self.profiler = profiler
+        self.name = name
+
+    # Timed from create_module, where extension modules do their loading,
+    # to the end of exec_module.
+    def create_module(self, spec):
+        self.profiler.enter(self.name)
+        try:
+            return self.loader.create_module(spec)
+        except BaseException:
+            self.profiler.leave(self.name)
+            raise
+
+    def exec_module(self, module):
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profiler.leave(self.name)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class StartupProfiler(importlib.abc.MetaPathFinder):
+    """Times startup phases and every module imported while installed."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []        # (name, seconds since start)
+        self.imports = {}       # module -> [self seconds, cumulative seconds]
+        self._stack = []        # [module, started, seconds spent in nested imports]
+        self._finding = set()
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self, fullname)
+                    return spec
+            return None
+        finally:
+            self._finding.discard(fullname)
+
+    def enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def leave(self, name):
+        _, started, nested = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        self.imports[name] = [cumulative - nested, cumulative]
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+    def mark(self, phase):
+        self.phases.append((phase, time.perf_counter() - self.started))
+
+    def report(self, top=PROFILE_TOP_IMPORTS, out=sys.stderr):
+        print("Startup phases (ms since start):", file=out)
+        previous = 0.0
+        for phase, at in self.phases:
+            print(f"  {at * 1000:9.1f}  (+{(at - previous) * 1000:8.1f})  {phase}", file=out)
+            previous = at
+
+        total_self = sum(times[0] for times in self.imports.values())
+        print(f"Imports: {len(self.imports)} modules, {total_self * 1000:.1f} ms", file=out)
+        print(f"  {'self ms':>9}  {'cumul ms':>9}  module", file=out)
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        for name, (self_time, cumulative) in slowest:
+            print(f"  {self_time * 1000:9.1f}  {cumulative * 1000:9.1f}  {name}", file=out)
+
+
+def set_platform_identity(app):
+    app.setApplicationName(APP_NAME)
+    app.setOrganizationName(APP_ORGANIZATION)
+    if sys.platform == "win32":
+        import ctypes
+        try:
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(APP_USER_MODEL_ID)
+        except (AttributeError, OSError) as e:
+            print(f"[WARN] Could not set the Windows app ID: {e}")
+    elif sys.platform.startswith("linux"):
+        # Lets the desktop shell match windows to mapro.desktop for icon and grouping.
+        app.setDesktopFileName("mapro")
+
+
+def run(argv=None):
+    argv = list(sys.argv if argv is None else argv)
+    profiler = None
+    if PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+        profiler = StartupProfiler()
+        profiler.install()
+
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    if profiler:
+        profiler.mark("Qt imported")
+
+    app = QApplication(argv)
+    set_platform_identity(app)
+    if profiler:
+        profiler.mark("QApplication created")
+
+    from Controllers.LoginController import LoginWindow
+    if profiler:
+        profiler.mark("login modules imported")
+
+    login_window = LoginWindow()
+    login_window.show()
+
+    if profiler:
+        profiler.mark("login window shown")
+
+        def event_loop_started():
+            profiler.mark("event loop running")
+            profiler.uninstall()
+            profiler.report()
+
+        QTimer.singleShot(0, event_loop_started)
+
+    return app.exec()
@@ -1,14 +1,304 @@
+import atexit
+import threading
+import time
+
 import psycopg2
-from passlib.hash import bcrypt
+from psycopg2 import extensions
+
+from Utils.util_query_stats import QueryStats, calling_site
+
+DB_CONFIG = {
+    "host": "localhost",
+    "database": "marigondon_profiling_db",
+    "user": "postgres",
+    "password": "Ian123"
+}
+
+# Pooled mode settings. Every Database() borrows from one process-wide pool
+# instead of doing a fresh TCP + auth handshake per call.
+POOL_ENABLED = True
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 10
+POOL_CHECKOUT_TIMEOUT = 10      # seconds to wait for a free connection
+POOL_MAX_IDLE = 300             # seconds before an idle connection above min size is closed
+POOL_HEALTH_CHECK_AFTER = 30    # seconds idle before a connection is pinged on checkout
+
+# Every cursor times its statements into QueryStats (the admin Query Diagnostics
+# screen and Logs/slow_queries.log). Costs a few microseconds per statement.
+QUERY_STATS_ENABLED = True
+
+
+class TimedCursor(extensions.cursor):
+    """A cursor that records each statement's latency, row count and calling site."""
+
+    def execute(self, query, vars=None):
+        started = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            self._record(query, started)
+
+    def executemany(self, query, vars_list):
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            self._record(query, started)
+
+    def callproc(self, procname, parameters=None):
+        started = time.perf_counter()
+        try:
+            return super().callproc(procname, parameters)
+        finally:
+            self._record(f"CALL {procname}", started)
+
+    def _record(self, query, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if isinstance(query, bytes):
+            query = query.decode("utf-8", "replace")
+        elif not isinstance(query, str):
+            query = query.as_string(self)  # psycopg2.sql.Composed
+        QueryStats.instance().record(query, elapsed_ms, self.rowcount, calling_site())
+
+
+def connect(**conn_kwargs):
+    if QUERY_STATS_ENABLED:
+        conn_kwargs.setdefault("cursor_factory", TimedCursor)
+    return psycopg2.connect(**conn_kwargs)
+
+
+class PoolTimeoutError(Exception):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE,
+                 checkout_timeout=POOL_CHECKOUT_TIMEOUT, max_idle=POOL_MAX_IDLE,
+                 health_check_after=POOL_HEALTH_CHECK_AFTER, **conn_kwargs):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_idle = max_idle
+        self.health_check_after = health_check_after
+        self.conn_kwargs = conn_kwargs or dict(DB_CONFIG)
+
+        self._lock = threading.Condition()
+        self._idle = []          # list of (conn, returned_at), most recently returned last
+        self._in_use = set()
+        self._connecting = 0     # slots reserved while a connection is being opened or pinged
+        self._closed = False
+
+        self._stats = {
+            "checkouts": 0,
+            "hits": 0,
+            "misses": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "health_check_failures": 0,
+            "reaped": 0,
+            "discarded": 0,
+            "total_checkout_ms": 0.0,
+            "max_checkout_ms": 0.0
+        }
+
+        for _ in range(self.min_size):
+            self._idle.append((self._connect(), time.monotonic()))
+
+    def _connect(self):
+        return connect(**self.conn_kwargs)
+
+    def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def getconn(self):
+        """Borrow a connection, waiting up to checkout_timeout when the pool is exhausted."""
+        started = time.perf_counter()
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+
+        while True:
+            conn = None
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise psycopg2.InterfaceError("Connection pool is closed")
+
+                    if self._idle:
+                        conn, returned_at = self._idle.pop()
+                        if conn.closed:
+                            self._stats["health_check_failures"] += 1
+                            conn = None
+                            continue
+                        if time.monotonic() - returned_at <= self.health_check_after:
+                            self._stats["hits"] += 1
+                            return self._checked_out(conn, started, waited)
+                        # Ping it outside the lock; its slot stays reserved meanwhile.
+                        self._connecting += 1
+                        break
+
+                    if len(self._in_use) + self._connecting < self.max_size:
+                        # Reserve the slot before releasing the lock to connect.
+                        self._connecting += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeoutError(
+                            f"No database connection available after {self.checkout_timeout}s "
+                            f"(pool max size is {self.max_size})")
+                    if not waited:
+                        self._stats["waits"] += 1
+                        waited = True
+                    self._lock.wait(remaining)
+
+            if conn is None:
+                break
+            healthy = self._is_healthy(conn)
+            if not healthy:
+                self._close_quietly(conn)
+            with self._lock:
+                self._connecting -= 1
+                if healthy:
+                    self._stats["hits"] += 1
+                    return self._checked_out(conn, started, waited)
+                self._stats["health_check_failures"] += 1
+                self._lock.notify()
+
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._lock:
+                self._connecting -= 1
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._connecting -= 1
+            self._stats["misses"] += 1
+            return self._checked_out(conn, started, waited)
+
+    def _checked_out(self, conn, started, waited):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._in_use.add(conn)
+        self._stats["checkouts"] += 1
+        self._stats["total_checkout_ms"] += elapsed_ms
+        self._stats["max_checkout_ms"] = max(self._stats["max_checkout_ms"], elapsed_ms)
+        return conn
+
+    def putconn(self, conn, discard=False):
+        """Return a borrowed connection. Open transactions are rolled back first."""
+        if not discard and not conn.closed:
+            try:
+                if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._lock:
+            self._in_use.discard(conn)
+            if discard or conn.closed or self._closed:
+                self._stats["discarded"] += 1
+                self._close_quietly(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._reap_idle_locked()
+            self._lock.notify()
+
+    def _reap_idle_locked(self):
+        now = time.monotonic()
+        total = len(self._idle) + len(self._in_use) + self._connecting
+        keep = []
+        # Oldest first, so the most recently used connections survive.
+        for conn, returned_at in self._idle:
+            if total > self.min_size and now - returned_at > self.max_idle:
+                self._close_quietly(conn)
+                self._stats["reaped"] += 1
+                total -= 1
+            else:
+                keep.append((conn, returned_at))
+        self._idle = keep
+
+    def reap_idle(self):
+        with self._lock:
+            self._reap_idle_locked()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+            stats["in_use"] = len(self._in_use)
+            stats["avg_checkout_ms"] = (stats["total_checkout_ms"] / stats["checkouts"]
+                                        if stats["checkouts"] else 0.0)
+            return stats
+
+    def closeall(self):
+        with self._lock:
+            self._closed = True
+            for conn, _ in self._idle:
+                self._close_quietly(conn)
+            for conn in self._in_use:
+                self._close_quietly(conn)
+            self._idle = []
+            self._in_use = set()
+            self._lock.notify_all()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
+
+
+def get_pool_stats():
+    return _pool.stats() if _pool else {}
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+atexit.register(close_pool)
+
+
 class Database:
-    def __init__(self):
+    # Pass pooled=False for objects that keep their connection for their whole
+    # lifetime (the statistics/admin models), so they never pin a pool slot.
+    def __init__(self, pooled=None):
+        self.conn = None
+        self.cursor = None
+        self.pool = None
+        self.pooled = POOL_ENABLED if pooled is None else pooled
         try:
-            self.conn = psycopg2.connect(
-                host="localhost",
-                database="marigondon_profiling_db",
-                user="postgres",
-                password="Ian123"
-            )
+            if self.pooled:
+                self.pool = get_pool()
+                self.conn = self.pool.getconn()
+            else:
+                self.conn = connect(**DB_CONFIG)
             self.cursor = self.conn.cursor()
             print("Database Connected Successfully!")
         except Exception as e:
@@ -18,11 +308,29 @@ class Database:
 
     def close(self):
         if self.cursor:
-            self.cursor.close()
+            try:
+                self.cursor.close()
+            except Exception:
+                pass
+            self.cursor = None
             print("Cursor closed successfully!")
         if self.conn:
-            self.conn.close()
-            print("Database Connection Closed Successfully!")
+            if self.pooled:
+                self.pool.putconn(self.conn)
+                print("Database Connection Returned to Pool!")
+            else:
+                self.conn.close()
+                print("Database Connection Closed Successfully!")
+            self.conn = None
+
+    def __del__(self):
+        # Call sites that forget close() still hand their connection back.
+        if getattr(self, "pool", None) is not None and self.conn is not None:
+            try:
+                self.pool.putconn(self.conn)
+            except Exception:
+                pass
+            self.conn = None
 
     def commit(self):
         try:
@@ -49,6 +357,8 @@ class Database:
 
     # This is for hashing plaintext passwords in the database
     def hash_plaintext_passwords(self):
+        from passlib.hash import bcrypt
+
         try:
             # Fetch all user IDs and passwords
             self.cursor.execute("SELECT SYS_USER_ID, SYS_PASSWORD FROM SYSTEM_ACCOUNT")
@@ -78,4 +388,5 @@ class Database:
 if __name__ == "__main__":
     db = Database()
     db.hash_plaintext_passwords()
-    db.close()
\ No newline at end of file
+    db.close()
+    print(get_pool_stats())
@@ -1,26 +1,11 @@
 import sys
-import tkinter as tk
-import ctypes
-from PySide6.QtWidgets import QApplication
 
-from Controllers.LoginController import LoginWindow
-
-# Initialize Tkinter (if you need it)
-root = tk.Tk()
-
-# Set Windows App ID (for taskbar grouping)
-myappid = "mycompany.myproduct.subproduct.version"  # Arbitrary string
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-
-# Hide Tkinter window (since you're using PySide6 for Views)
-root.withdraw()
+from bootstrap import run
 
+# Startup lives in bootstrap.py: platform setup, Qt and the login window only.
+# `python main.py --profile-startup` prints the startup phase and import times.
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    login_window = LoginWindow()
-    login_window.show()
-
-    sys.exit(app.exec())
+    sys.exit(run(sys.argv))
 
 # class MainApplication(dashboard_func):
 #     def __init__(self, login_window, emp_first_name):
@@ -34,15 +34,23 @@ CREATE TYPE action_type_enum AS ENUM (
     'LOGOUT'
     );
 
+-- Partitioned by month on ACT_TIMESTAMP (see ensure_activity_log_partitions and
+-- Models/AdminModels/ActivityLogArchive.py for retention). The key has to include
+-- the partition column, hence (ACT_ID, ACT_TIMESTAMP).
 CREATE TABLE SYSTEM_ACTIVITY_LOG(
-                                    ACT_ID SERIAL PRIMARY KEY,
-                                    ACT_TIMESTAMP TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                                    ACT_ID SERIAL,
+                                    ACT_TIMESTAMP TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                                     ACT_ACTION_TYPE action_type_enum,
                                     ACT_TABLE_NAME VARCHAR(50) NOT NULL,
                                     ACT_ENTITY_ID INT,
                                     ACT_DESCRIPTION TEXT,
-                                    SYS_USER_ID INT REFERENCES SYSTEM_ACCOUNT(SYS_USER_ID) ON DELETE RESTRICT ON UPDATE CASCADE
-);
+                                    SYS_USER_ID INT REFERENCES SYSTEM_ACCOUNT(SYS_USER_ID) ON DELETE RESTRICT ON UPDATE CASCADE,
+                                    PRIMARY KEY (ACT_ID, ACT_TIMESTAMP)
+) PARTITION BY RANGE (ACT_TIMESTAMP);
+
+-- Catches rows for a month whose partition was not created in time; the next
+-- ensure_activity_log_partitions() moves them into their month.
+CREATE TABLE SYSTEM_ACTIVITY_LOG_DEFAULT PARTITION OF SYSTEM_ACTIVITY_LOG DEFAULT;
 
 
 -- Table: SITIO
@@ -632,421 +640,899 @@ CREATE TRIGGER set_settlement_last_updated
 EXECUTE FUNCTION update_last_updated_settlement();
 
 
-CREATE OR REPLACE FUNCTION log_system_account_activity()
+--AUDIT LOG
+-- One SYSTEM_ACTIVITY_LOG row per affected row, written by statement-level
+-- triggers: each INSERT/UPDATE/DELETE statement reads the session user once and
+-- logs all of its rows with a single INSERT ... SELECT over the transition table,
+-- instead of running a PL/pgSQL function and a one-row INSERT per row.
+-- TG_ARGV[0] is the audited table's ID column. TG_ARGV[1], when given, is the
+-- user recorded while app.current_user_id is unset or empty: 'null' for none,
+-- otherwise an existing SYS_USER_ID (the log's foreign key checks it). Without
+-- it the statement fails like current_setting() does.
+-- Models/AdminModels/AuditTriggerBenchmark.py times this against the per-row form.
+CREATE OR REPLACE FUNCTION log_statement_activity()
     RETURNS TRIGGER AS $$
 DECLARE
-    v_entity_id INT;
-    v_user_id INT := 0;
+    v_rows TEXT := CASE WHEN TG_OP = 'INSERT' THEN 'new_rows' ELSE 'old_rows' END;
+    v_any BOOLEAN;
+    v_user_id INT;
 BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.SYS_USER_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.SYS_USER_ID;
+    -- Statement triggers also fire for statements that touched nothing.
+    EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I)', v_rows) INTO v_any;
+    IF NOT v_any THEN
+        RETURN NULL;
     END IF;
 
-    BEGIN
-        v_user_id := current_setting('app.current_user_id', true)::INT;
-    EXCEPTION WHEN OTHERS THEN
-        -- If setting is missing or invalid, use system user
-        v_user_id := 0;
-    END;
-
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
-    )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               v_user_id,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
+    IF TG_NARGS < 2 THEN
+        v_user_id := current_setting('app.current_user_id')::INT;
+    ELSE
+        BEGIN
+            v_user_id := NULLIF(current_setting('app.current_user_id', true), '')::INT;
+        EXCEPTION WHEN OTHERS THEN
+            v_user_id := NULL;
         END;
+        IF v_user_id IS NULL THEN
+            v_user_id := NULLIF(TG_ARGV[1], 'null')::INT;
+        END IF;
+    END IF;
+
+    EXECUTE format(
+        'INSERT INTO SYSTEM_ACTIVITY_LOG (
+             ACT_ACTION_TYPE,
+             ACT_TABLE_NAME,
+             ACT_ENTITY_ID,
+             SYS_USER_ID,
+             ACT_DESCRIPTION
+         )
+         SELECT $1::action_type_enum, $2, r.%1$I, $3,
+                CONCAT(''Action '', $1, '' on '', $2, '' ID = '', r.%1$I)
+         FROM %2$I r',
+        lower(TG_ARGV[0]), v_rows
+    ) USING TG_OP, TG_TABLE_NAME, v_user_id;
+
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER trg_log_system_account_activity
-    AFTER INSERT OR UPDATE OR DELETE ON SYSTEM_ACCOUNT
-    FOR EACH ROW
-EXECUTE FUNCTION log_system_account_activity();
-
-
-
-CREATE OR REPLACE FUNCTION log_entity_activity()
-    RETURNS TRIGGER AS $$
+-- A trigger with a transition table can only cover one event, so each audited
+-- table gets trg_log_<table>_insert, _update and _delete. UPDATE and DELETE log
+-- the old ID, as the per-row triggers did.
+CREATE OR REPLACE FUNCTION attach_activity_log_triggers(
+    p_table REGCLASS,
+    p_id_column TEXT,
+    p_missing_user TEXT DEFAULT NULL
+)
+    RETURNS VOID AS $$
 DECLARE
-    v_entity_id INT;
+    v_table_name TEXT := (SELECT lower(relname) FROM pg_class WHERE oid = p_table);
+    v_args TEXT := quote_literal(p_id_column)
+        || CASE WHEN p_missing_user IS NULL THEN '' ELSE ', ' || quote_literal(p_missing_user) END;
+    v_op TEXT;
+    v_trigger TEXT;
 BEGIN
-
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.CTZ_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.CTZ_ID;
-    END IF;
-
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
-    )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               current_setting('app.current_user_id')::INT,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
+    FOREACH v_op IN ARRAY ARRAY['INSERT', 'UPDATE', 'DELETE'] LOOP
+        v_trigger := 'trg_log_' || v_table_name || '_' || lower(v_op);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %s', v_trigger, p_table);
+        EXECUTE format(
+            'CREATE TRIGGER %I
+                 AFTER %s ON %s
+                 REFERENCING %s TABLE AS %s
+                 FOR EACH STATEMENT
+             EXECUTE FUNCTION log_statement_activity(%s)',
+            v_trigger, v_op, p_table,
+            CASE WHEN v_op = 'INSERT' THEN 'NEW' ELSE 'OLD' END,
+            CASE WHEN v_op = 'INSERT' THEN 'new_rows' ELSE 'old_rows' END,
+            v_args
+        );
+    END LOOP;
 END;
 $$ LANGUAGE plpgsql;
 
--- CITIZEN
-CREATE TRIGGER trg_log_citizen
-    AFTER INSERT OR UPDATE OR DELETE ON CITIZEN
-    FOR EACH ROW
-EXECUTE FUNCTION log_entity_activity();
+-- Databases created before the statement-level triggers still have the per-row ones.
+DROP TRIGGER IF EXISTS trg_log_system_account_activity ON SYSTEM_ACCOUNT;
+DROP TRIGGER IF EXISTS trg_log_citizen ON CITIZEN;
+DROP TRIGGER IF EXISTS trg_log_household_info_activity ON HOUSEHOLD_INFO;
+DROP TRIGGER IF EXISTS trg_log_business_activity ON BUSINESS_INFO;
+DROP TRIGGER IF EXISTS trg_log_infrastructure_activity ON INFRASTRUCTURE;
+DROP TRIGGER IF EXISTS trg_log_transaction_activity ON TRANSACTION_LOG;
+DROP TRIGGER IF EXISTS trg_log_citizen_history_activity ON CITIZEN_HISTORY;
+DROP TRIGGER IF EXISTS trg_log_medical_history_activity ON MEDICAL_HISTORY;
+DROP TRIGGER IF EXISTS trg_log_settlement_activity ON SETTLEMENT_LOG;
+DROP FUNCTION IF EXISTS log_system_account_activity();
+DROP FUNCTION IF EXISTS log_entity_activity();
+DROP FUNCTION IF EXISTS log_household_info_activity();
+DROP FUNCTION IF EXISTS log_business_activity();
+DROP FUNCTION IF EXISTS log_infrastructure_activity();
+DROP FUNCTION IF EXISTS log_transaction_activity();
+DROP FUNCTION IF EXISTS log_citizen_history_activity();
+DROP FUNCTION IF EXISTS log_medical_history_activity();
+DROP FUNCTION IF EXISTS log_settlements_activity();
+
+-- Account and household changes without a session user (the seed INSERTs,
+-- database.py's password rehash) are logged without one, as before.
+SELECT attach_activity_log_triggers('SYSTEM_ACCOUNT', 'SYS_USER_ID', 'null');
+SELECT attach_activity_log_triggers('CITIZEN', 'CTZ_ID');
+SELECT attach_activity_log_triggers('HOUSEHOLD_INFO', 'HH_ID', 'null');
+SELECT attach_activity_log_triggers('BUSINESS_INFO', 'BS_ID');
+SELECT attach_activity_log_triggers('INFRASTRUCTURE', 'INF_ID');
+SELECT attach_activity_log_triggers('TRANSACTION_LOG', 'TL_ID');
+SELECT attach_activity_log_triggers('CITIZEN_HISTORY', 'CIHI_ID');
+SELECT attach_activity_log_triggers('MEDICAL_HISTORY', 'MH_ID');
+SELECT attach_activity_log_triggers('SETTLEMENT_LOG', 'SETT_ID');
 
 -- TEMPORARY ONLY, NEEDS TO BE DELETED LATER
 SET app.current_user_id = '1001';
 
+--PROCEDURES
 
-
-
-CREATE OR REPLACE FUNCTION log_household_info_activity()
-    RETURNS TRIGGER AS $$
+-- Registers one citizen with its contact, education, socio-economic, PhilHealth,
+-- family planning and employment rows in a single call, so the whole save is
+-- one round trip and one transaction (see CitizenController.confirm_and_save).
+-- Reference IDs are resolved by the caller; a religion that does not exist yet
+-- is added. Family planning is only recorded when both of its IDs are given.
+CREATE OR REPLACE FUNCTION register_citizen(p JSONB, p_sys_user_id INT)
+    RETURNS INT AS $$
 DECLARE
-    v_entity_id INT;
-    v_user_id INT;
+    v_con_id INT;
+    v_edu_id INT;
+    v_soec_id INT;
+    v_rel_id INT;
+    v_phea_id INT;
+    v_ctz_id INT;
 BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.HH_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.HH_ID;
-    END IF;
+    -- Same as SET LOCAL: the audit triggers read it until the transaction ends.
+    PERFORM set_config('app.current_user_id', p_sys_user_id::TEXT, true);
 
-    -- Safely get the user ID from session settings
-    BEGIN
-        v_user_id := current_setting('app.current_user_id')::INT;
-    EXCEPTION WHEN OTHERS THEN
-        v_user_id := NULL;
-    END;
+    INSERT INTO CONTACT (CON_EMAIL, CON_PHONE)
+    VALUES (p ->> 'email_address', p ->> 'contact_number')
+    RETURNING CON_ID INTO v_con_id;
+
+    INSERT INTO EDUCATION_STATUS (EDU_IS_CURRENTLY_STUDENT, EDU_INSTITUTION_NAME, EDAT_ID)
+    VALUES ((p ->> 'is_student')::BOOLEAN, p ->> 'school_name', (p ->> 'edat_id')::INT)
+    RETURNING EDU_ID INTO v_edu_id;
+
+    INSERT INTO SOCIO_ECONOMIC_STATUS (SOEC_STATUS, SOEC_NUMBER)
+    VALUES (p ->> 'socio_eco_status', p ->> 'nhts_number')
+    RETURNING SOEC_ID INTO v_soec_id;
+
+    SELECT REL_ID INTO v_rel_id FROM RELIGION WHERE REL_NAME = p ->> 'religion' LIMIT 1;
+    IF v_rel_id IS NULL THEN
+        INSERT INTO RELIGION (REL_NAME) VALUES (p ->> 'religion') RETURNING REL_ID INTO v_rel_id;
+    END IF;
 
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
+    INSERT INTO PHILHEALTH (PHEA_ID_NUMBER, PC_ID, PHEA_MEMBERSHIP_TYPE)
+    VALUES (p ->> 'phil_id', (p ->> 'pc_id')::INT, p ->> 'membership_type')
+    RETURNING PHEA_ID INTO v_phea_id;
+
+    INSERT INTO CITIZEN (
+        CTZ_FIRST_NAME, CTZ_MIDDLE_NAME, CTZ_LAST_NAME, CTZ_SUFFIX,
+        CTZ_DATE_OF_BIRTH, CTZ_SEX, CTZ_CIVIL_STATUS, CTZ_PLACE_OF_BIRTH,
+        CTZ_BLOOD_TYPE, CTZ_IS_REGISTERED_VOTER, CTZ_IS_ALIVE, CTZ_DATE_OF_DEATH,
+        CTZ_REASON_OF_DEATH, CTZ_DATE_ENCODED, CON_ID, SITIO_ID, EDU_ID, SOEC_ID,
+        PHEA_ID, REL_ID, RTH_ID, HH_ID, ENCODED_BY_SYS_ID, LAST_UPDATED_BY_SYS_ID,
+        CLAH_ID
     )
     VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               v_user_id,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
+        p ->> 'first_name', p ->> 'middle_name', p ->> 'last_name', p ->> 'suffix',
+        (p ->> 'birth_date')::DATE, p ->> 'sex', (p ->> 'civil_status')::civil_status_type, p ->> 'place_of_birth',
+        (p ->> 'blood_type')::blood_type_enum, (p ->> 'is_voter')::BOOLEAN, (p ->> 'is_alive')::BOOLEAN, (p ->> 'date_of_death')::DATE,
+        p ->> 'reason_of_death', CURRENT_TIMESTAMP, v_con_id, (p ->> 'sitio_id')::INT, v_edu_id, v_soec_id,
+        v_phea_id, v_rel_id, (p ->> 'rth_id')::INT, (p ->> 'household_id')::INT, p_sys_user_id, p_sys_user_id,
+        (p ->> 'clah_id')::INT
+    )
+    RETURNING CTZ_ID INTO v_ctz_id;
+
+    IF p ->> 'fpm_id' IS NOT NULL AND p ->> 'fpms_id' IS NOT NULL THEN
+        INSERT INTO FAMILY_PLANNING (FP_START_DATE, FP_END_DATE, CTZ_ID, FPMS_STATUS, FPM_METHOD)
+        VALUES ((p ->> 'fam_plan_start_date')::DATE, (p ->> 'fam_plan_end_date')::DATE, v_ctz_id,
+                (p ->> 'fpms_id')::INT, (p ->> 'fpm_id')::INT);
+    END IF;
+
+    INSERT INTO EMPLOYMENT (EMP_OCCUPATION, EMP_IS_GOV_WORKER, ES_ID, CTZ_ID)
+    VALUES (p ->> 'occupation', (p ->> 'gov_worker')::BOOLEAN, (p ->> 'es_id')::INT, v_ctz_id);
+
+    RETURN v_ctz_id;
 END;
 $$ LANGUAGE plpgsql;
 
+-- Creates the monthly SYSTEM_ACTIVITY_LOG partitions from p_from's month through
+-- p_months_ahead months past the current one, named SYSTEM_ACTIVITY_LOG_YyyyyMmm.
+-- Rows that fell into the default partition are moved into their new month.
+-- Safe to run repeatedly; ActivityLogArchive.maintain() runs it before retention.
+CREATE OR REPLACE FUNCTION ensure_activity_log_partitions(p_from DATE DEFAULT CURRENT_DATE,
+                                                          p_months_ahead INT DEFAULT 2)
+    RETURNS INT AS $$
+DECLARE
+    v_month DATE := date_trunc('month', p_from)::DATE;
+    v_last DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => p_months_ahead))::DATE;
+    v_name TEXT;
+    v_created INT := 0;
+BEGIN
+    WHILE v_month <= v_last LOOP
+        v_name := format('system_activity_log_y%sm%s', to_char(v_month, 'YYYY'), to_char(v_month, 'MM'));
+
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE SYSTEM_ACTIVITY_LOG INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', v_name);
+            EXECUTE format(
+                'WITH moved AS (
+                     DELETE FROM SYSTEM_ACTIVITY_LOG_DEFAULT
+                     WHERE ACT_TIMESTAMP >= %L AND ACT_TIMESTAMP < %L
+                     RETURNING *
+                 )
+                 INSERT INTO %I SELECT * FROM moved', v_month, v_month + INTERVAL '1 month', v_name);
+            EXECUTE format(
+                'ALTER TABLE SYSTEM_ACTIVITY_LOG ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_month, (v_month + INTERVAL '1 month')::DATE);
+            v_created := v_created + 1;
+        END IF;
+
+        v_month := (v_month + INTERVAL '1 month')::DATE;
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
 
+SELECT ensure_activity_log_partitions();
 
-CREATE TRIGGER trg_log_household_info_activity
-    AFTER INSERT OR UPDATE OR DELETE ON HOUSEHOLD_INFO
-    FOR EACH ROW
-EXECUTE FUNCTION log_household_info_activity();
 
 
+--VIEWS
 
-CREATE OR REPLACE FUNCTION log_business_activity()
-    RETURNS TRIGGER AS $$
-DECLARE
-    v_entity_id INT;
-BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.BS_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.BS_ID;
-    END IF;
+-- this view gets the age from the dob, and assigns a corresponding classification
+CREATE OR REPLACE VIEW citizen_with_age_classification AS
+SELECT
+    CTZ_ID,
+    CTZ_FIRST_NAME,
+    CTZ_MIDDLE_NAME,
+    CTZ_LAST_NAME,
+    ctz_date_of_birth,
+    ctz_is_alive,
+    CTZ_IS_DELETED,
+    a.age,
+    CASE
+        WHEN a.age BETWEEN 0 AND 2 THEN 'Infant'
+        WHEN a.age BETWEEN 3 AND 12 THEN 'Child'
+        WHEN a.age BETWEEN 13 AND 17 THEN 'Teen'
+        WHEN a.age BETWEEN 18 AND 24 THEN 'Young Adult'
+        WHEN a.age BETWEEN 25 AND 39 THEN 'Adult'
+        WHEN a.age BETWEEN 40 AND 59 THEN 'Middle Aged'
+        WHEN a.age >= 60 THEN 'Senior'
+        ELSE 'Unknown'
+        END AS age_classification
+FROM
+    citizen
+    CROSS JOIN LATERAL (SELECT EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) AS age) a
+WHERE
+    ctz_is_alive = TRUE;
 
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
-    )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               current_setting('app.current_user_id')::INT,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
-END;
-$$ LANGUAGE plpgsql;
 
-CREATE TRIGGER trg_log_business_activity
-    AFTER INSERT OR UPDATE OR DELETE ON BUSINESS_INFO
-    FOR EACH ROW
-EXECUTE FUNCTION log_business_activity();
 
+--INDEXES
+-- Every statement here uses IF NOT EXISTS, so this section can also be run
+-- on its own against an existing database as a migration.
 
+-- CITIZEN NAME SEARCH (trigram indexes serve ILIKE '%term%' and similarity ranking)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
+CREATE INDEX IF NOT EXISTS idx_citizen_last_name_trgm
+    ON CITIZEN USING GIN (CTZ_LAST_NAME gin_trgm_ops)
+    WHERE CTZ_IS_DELETED = FALSE;
 
-CREATE OR REPLACE FUNCTION log_infrastructure_activity()
-    RETURNS TRIGGER AS $$
-DECLARE
-    v_entity_id INT;
-BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.INF_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.INF_ID;
-    END IF;
+CREATE INDEX IF NOT EXISTS idx_citizen_first_name_trgm
+    ON CITIZEN USING GIN (CTZ_FIRST_NAME gin_trgm_ops)
+    WHERE CTZ_IS_DELETED = FALSE;
 
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
-    )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               current_setting('app.current_user_id')::INT,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
-END;
-$$ LANGUAGE plpgsql;
+CREATE INDEX IF NOT EXISTS idx_citizen_full_name_trgm
+    ON CITIZEN USING GIN ((CTZ_FIRST_NAME || ' ' || CTZ_LAST_NAME) gin_trgm_ops)
+    WHERE CTZ_IS_DELETED = FALSE;
 
-CREATE TRIGGER trg_log_infrastructure_activity
-    AFTER INSERT OR UPDATE OR DELETE ON INFRASTRUCTURE
-    FOR EACH ROW
-EXECUTE FUNCTION log_infrastructure_activity();
+-- DUPLICATE CHECK AT REGISTRATION (Models/DuplicateCitizenModel.py)
+-- Near-matches use idx_citizen_full_name_trgm and idx_citizen_date_of_birth;
+-- the exact check on submit is a single probe of this expression index.
+CREATE INDEX IF NOT EXISTS idx_citizen_name_lower
+    ON CITIZEN (LOWER(CTZ_LAST_NAME), LOWER(CTZ_FIRST_NAME), CTZ_DATE_OF_BIRTH)
+    WHERE CTZ_IS_DELETED = FALSE;
 
+CREATE INDEX IF NOT EXISTS idx_sitio_name_trgm
+    ON SITIO USING GIN (SITIO_NAME gin_trgm_ops);
 
+CREATE INDEX IF NOT EXISTS idx_citizen_sitio_id
+    ON CITIZEN (SITIO_ID)
+    WHERE CTZ_IS_DELETED = FALSE;
 
-CREATE OR REPLACE FUNCTION log_transaction_activity()
-    RETURNS TRIGGER AS $$
-DECLARE
-    v_entity_id INT;
-BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.TL_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.TL_ID;
-    END IF;
+-- STATISTICS REFRESH
+-- refresh_stat_cubes() re-reads each dirty day as a half-open range on the
+-- uncast *_LAST_UPDATED column, over the rows that are not deleted. These are
+-- B-tree rather than BRIN: *_LAST_UPDATED is rewritten on every edit, so the
+-- table's physical order does not follow it.
+CREATE INDEX IF NOT EXISTS idx_citizen_last_updated
+    ON CITIZEN (CTZ_LAST_UPDATED)
+    WHERE CTZ_IS_DELETED = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_household_last_updated
+    ON HOUSEHOLD_INFO (HH_LAST_UPDATED)
+    WHERE HH_IS_DELETED = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_business_last_updated
+    ON BUSINESS_INFO (BS_LAST_UPDATED)
+    WHERE BS_IS_DELETED = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_infrastructure_last_updated
+    ON INFRASTRUCTURE (INF_LAST_UPDATED)
+    WHERE INF_IS_DELETED = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_medical_history_last_updated
+    ON MEDICAL_HISTORY (MH_LAST_UPDATED)
+    WHERE MH_IS_DELETED = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_citizen_household_id
+    ON CITIZEN (HH_ID)
+    WHERE CTZ_IS_DELETED = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_employment_citizen_id
+    ON EMPLOYMENT (CTZ_ID);
+
+-- The citizen profile reads (and version-checks) family planning by citizen.
+CREATE INDEX IF NOT EXISTS idx_family_planning_citizen_id
+    ON FAMILY_PLANNING (CTZ_ID);
+
+-- Daily age re-banding finds the citizens who just crossed a band by birth date.
+CREATE INDEX IF NOT EXISTS idx_citizen_date_of_birth
+    ON CITIZEN (CTZ_DATE_OF_BIRTH)
+    WHERE CTZ_IS_DELETED = FALSE;
+
+-- ADMIN BIN (deleted rows are few, so each bin reads its newest 50 from a small partial index)
+CREATE INDEX IF NOT EXISTS idx_citizen_deleted
+    ON CITIZEN (CTZ_ID)
+    WHERE CTZ_IS_DELETED = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_household_deleted
+    ON HOUSEHOLD_INFO (HH_ID)
+    WHERE HH_IS_DELETED = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_business_deleted
+    ON BUSINESS_INFO (BS_ID)
+    WHERE BS_IS_DELETED = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_infrastructure_deleted
+    ON INFRASTRUCTURE (INF_ID)
+    WHERE INF_IS_DELETED = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_medical_history_deleted
+    ON MEDICAL_HISTORY (MH_ID)
+    WHERE MH_IS_DELETED = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_citizen_history_deleted
+    ON CITIZEN_HISTORY (CIHI_ID)
+    WHERE CIHI_IS_DELETED = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_settlement_log_deleted
+    ON SETTLEMENT_LOG (SETT_ID)
+    WHERE SETT_IS_DELETED = TRUE;
+
+-- ACTIVITY LOG (the viewer pages newest-first on (ACT_TIMESTAMP, ACT_ID), optionally
+-- narrowed to one user or one table; the action-type filter rides the timestamp index)
+CREATE INDEX IF NOT EXISTS idx_activity_log_timestamp
+    ON SYSTEM_ACTIVITY_LOG (ACT_TIMESTAMP DESC, ACT_ID DESC);
+
+CREATE INDEX IF NOT EXISTS idx_activity_log_user
+    ON SYSTEM_ACTIVITY_LOG (SYS_USER_ID, ACT_TIMESTAMP DESC, ACT_ID DESC);
+
+CREATE INDEX IF NOT EXISTS idx_activity_log_table
+    ON SYSTEM_ACTIVITY_LOG (ACT_TABLE_NAME, ACT_TIMESTAMP DESC, ACT_ID DESC);
+
+
+
+--STATISTICS CUBES
+-- Pre-aggregated counts for the Statistics pages, one row per combination of
+-- dimensions per day (the day is the source row's *_LAST_UPDATED date, which is
+-- what the pages filter on). Triggers record which days changed in
+-- STAT_DIRTY_DAY, and refresh_stat_cubes() re-aggregates only those days.
+-- Like the INDEXES section, this can be run on its own against an existing database.
+
+-- Age bands are stored as the lower bound of the finest band any page uses, so
+-- "age BETWEEN 13 AND 17" becomes "AGE_BAND BETWEEN 13 AND 17". The bounds are
+-- also listed in stat_age_band_bounds(); keep the two in step.
+CREATE OR REPLACE FUNCTION stat_age_band_bounds()
+    RETURNS SMALLINT[] AS $$
+SELECT ARRAY[0, 3, 13, 15, 18, 25, 26, 36, 40, 60]::SMALLINT[];
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION stat_age_band(p_dob DATE, p_on DATE DEFAULT CURRENT_DATE)
+    RETURNS SMALLINT AS $$
+SELECT (CASE
+            WHEN a.age < 0 THEN NULL
+            WHEN a.age < 3 THEN 0
+            WHEN a.age < 13 THEN 3
+            WHEN a.age < 15 THEN 13
+            WHEN a.age < 18 THEN 15
+            WHEN a.age < 25 THEN 18
+            WHEN a.age < 26 THEN 25
+            WHEN a.age < 36 THEN 26
+            WHEN a.age < 40 THEN 36
+            WHEN a.age < 60 THEN 40
+            ELSE 60
+    END)::SMALLINT
+FROM (SELECT EXTRACT(YEAR FROM AGE(p_on, p_dob)) AS age) a;
+$$ LANGUAGE sql STABLE;
+
+CREATE TABLE IF NOT EXISTS STAT_CITIZEN_CUBE (
+                                   STAT_DAY DATE NOT NULL,
+                                   SITIO_ID INT,
+                                   CTZ_SEX CHAR(1),
+                                   AGE_BAND SMALLINT,
+                                   CTZ_IS_ALIVE BOOLEAN,
+                                   CTZ_IS_IP BOOLEAN,
+                                   CTZ_IS_REGISTERED_VOTER BOOLEAN,
+                                   CTZ_CIVIL_STATUS civil_status_type,
+                                   CTZ_BLOOD_TYPE blood_type_enum,
+                                   SOEC_ID INT,
+                                   REL_ID INT,
+                                   CLAH_ID INT,
+                                   PC_ID INT,
+                                   EDAT_ID INT,
+                                   EDU_IS_CURRENTLY_STUDENT BOOLEAN,
+                                   CITIZEN_COUNT INT NOT NULL
+);
 
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
-    )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               current_setting('app.current_user_id')::INT,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
-END;
-$$ LANGUAGE plpgsql;
+-- One row per employment record of a living, non-deleted citizen, on the citizen's day.
+CREATE TABLE IF NOT EXISTS STAT_EMPLOYMENT_CUBE (
+                                   STAT_DAY DATE NOT NULL,
+                                   SITIO_ID INT,
+                                   ES_ID INT,
+                                   EMP_IS_GOV_WORKER BOOLEAN,
+                                   EMPLOYMENT_COUNT INT NOT NULL
+);
 
-CREATE TRIGGER trg_log_transaction_activity
-    AFTER INSERT OR UPDATE OR DELETE ON TRANSACTION_LOG
-    FOR EACH ROW
-EXECUTE FUNCTION log_transaction_activity();
+-- Member counts are of living, non-deleted citizens, on the household's day.
+CREATE TABLE IF NOT EXISTS STAT_HOUSEHOLD_CUBE (
+                                   STAT_DAY DATE NOT NULL,
+                                   SITIO_ID INT,
+                                   HH_OWNERSHIP_STATUS house_ownership_status,
+                                   WATER_ID INT,
+                                   HOUSEHOLD_COUNT INT NOT NULL,
+                                   MALE_MEMBERS INT NOT NULL,
+                                   FEMALE_MEMBERS INT NOT NULL,
+                                   TOTAL_MEMBERS INT NOT NULL
+);
 
+CREATE TABLE IF NOT EXISTS STAT_BUSINESS_CUBE (
+                                   STAT_DAY DATE NOT NULL,
+                                   SITIO_ID INT,
+                                   BST_ID INT,
+                                   BS_STATUS business_status_enum,
+                                   BUSINESS_COUNT INT NOT NULL
+);
 
+CREATE TABLE IF NOT EXISTS STAT_INFRASTRUCTURE_CUBE (
+                                   STAT_DAY DATE NOT NULL,
+                                   SITIO_ID INT,
+                                   INFT_ID INT,
+                                   INF_ACCESS_TYPE VARCHAR(10),
+                                   INFRASTRUCTURE_COUNT INT NOT NULL
+);
 
+-- Medical records of living, non-deleted citizens, on the record's day.
+CREATE TABLE IF NOT EXISTS STAT_MEDICAL_CUBE (
+                                   STAT_DAY DATE NOT NULL,
+                                   MHT_ID INT,
+                                   RECORD_COUNT INT NOT NULL
+);
 
-CREATE OR REPLACE FUNCTION log_citizen_history_activity()
-    RETURNS TRIGGER AS $$
-DECLARE
-    v_entity_id INT;
-BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.CIHI_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.CIHI_ID;
-    END IF;
+CREATE INDEX IF NOT EXISTS idx_stat_citizen_cube_day ON STAT_CITIZEN_CUBE (STAT_DAY);
+CREATE INDEX IF NOT EXISTS idx_stat_employment_cube_day ON STAT_EMPLOYMENT_CUBE (STAT_DAY);
+CREATE INDEX IF NOT EXISTS idx_stat_household_cube_day ON STAT_HOUSEHOLD_CUBE (STAT_DAY);
+CREATE INDEX IF NOT EXISTS idx_stat_business_cube_day ON STAT_BUSINESS_CUBE (STAT_DAY);
+CREATE INDEX IF NOT EXISTS idx_stat_infrastructure_cube_day ON STAT_INFRASTRUCTURE_CUBE (STAT_DAY);
+CREATE INDEX IF NOT EXISTS idx_stat_medical_cube_day ON STAT_MEDICAL_CUBE (STAT_DAY);
+
+CREATE TABLE IF NOT EXISTS STAT_DIRTY_DAY (
+                                   CUBE_NAME VARCHAR(20) NOT NULL,
+                                   STAT_DAY DATE NOT NULL,
+                                   MARKED_BY BIGINT NOT NULL DEFAULT txid_current(),
+                                   PRIMARY KEY (CUBE_NAME, STAT_DAY, MARKED_BY)
+);
 
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
-    )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               current_setting('app.current_user_id')::INT,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
-END;
-$$ LANGUAGE plpgsql;
+CREATE TABLE IF NOT EXISTS STAT_CUBE_STATE (
+                                   STATE_ID INT PRIMARY KEY DEFAULT 1 CHECK (STATE_ID = 1),
+                                   AGE_BANDS_AS_OF DATE NOT NULL DEFAULT CURRENT_DATE,
+                                   LAST_REFRESHED TIMESTAMP
+);
 
-CREATE TRIGGER trg_log_citizen_history_activity
-    AFTER INSERT OR UPDATE OR DELETE ON CITIZEN_HISTORY
-    FOR EACH ROW
-EXECUTE FUNCTION log_citizen_history_activity();
+INSERT INTO STAT_CUBE_STATE (STATE_ID) VALUES (1) ON CONFLICT DO NOTHING;
 
 
+-- Each writing transaction adds its own marks (MARKED_BY is its transaction ID),
+-- so writers never wait on one another's marks, and a refresh only claims marks
+-- whose transactions have committed. Marks added by a transaction still in flight
+-- are left for the next refresh.
+-- Databases created before MARKED_BY have one mark per cube and day.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'stat_dirty_day' AND column_name = 'marked_by'
+    ) THEN
+        ALTER TABLE STAT_DIRTY_DAY ADD COLUMN MARKED_BY BIGINT NOT NULL DEFAULT txid_current();
+        ALTER TABLE STAT_DIRTY_DAY DROP CONSTRAINT stat_dirty_day_pkey;
+        ALTER TABLE STAT_DIRTY_DAY ADD PRIMARY KEY (CUBE_NAME, STAT_DAY, MARKED_BY);
+    END IF;
+END;
+$$;
+
+-- Databases created before the statement-level triggers still have the per-row ones.
+DROP TRIGGER IF EXISTS trg_stat_citizen ON CITIZEN;
+DROP TRIGGER IF EXISTS trg_stat_employment ON EMPLOYMENT;
+DROP TRIGGER IF EXISTS trg_stat_education_status ON EDUCATION_STATUS;
+DROP TRIGGER IF EXISTS trg_stat_philhealth ON PHILHEALTH;
+DROP TRIGGER IF EXISTS trg_stat_household ON HOUSEHOLD_INFO;
+DROP TRIGGER IF EXISTS trg_stat_business ON BUSINESS_INFO;
+DROP TRIGGER IF EXISTS trg_stat_infrastructure ON INFRASTRUCTURE;
+DROP TRIGGER IF EXISTS trg_stat_medical_history ON MEDICAL_HISTORY;
+DROP FUNCTION IF EXISTS stat_mark_dirty(VARCHAR, DATE);
+
+-- The marking triggers are statement-level, like the audit log's: each statement
+-- marks all the days its rows touch with one INSERT ... SELECT DISTINCT over the
+-- transition tables. This returns the rows a statement changed, old and new.
+CREATE OR REPLACE FUNCTION stat_changed_rows(p_op TEXT)
+    RETURNS TEXT AS $$
+SELECT CASE p_op
+           WHEN 'INSERT' THEN 'SELECT * FROM new_rows'
+           WHEN 'DELETE' THEN 'SELECT * FROM old_rows'
+           ELSE 'SELECT * FROM old_rows UNION ALL SELECT * FROM new_rows'
+    END;
+$$ LANGUAGE sql IMMUTABLE;
 
-CREATE OR REPLACE FUNCTION log_medical_history_activity()
+CREATE OR REPLACE FUNCTION stat_mark_citizen_dirty()
     RETURNS TRIGGER AS $$
-DECLARE
-    v_entity_id INT;
 BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.MH_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.MH_ID;
+    EXECUTE format(
+        'INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+         SELECT DISTINCT m.CUBE_NAME, m.STAT_DAY
+         FROM (%s) r
+         LEFT JOIN HOUSEHOLD_INFO h ON h.HH_ID = r.HH_ID
+         CROSS JOIN LATERAL (VALUES (''CITIZEN'', r.CTZ_LAST_UPDATED::date),
+                                    (''EMPLOYMENT'', r.CTZ_LAST_UPDATED::date),
+                                    (''HOUSEHOLD'', h.HH_LAST_UPDATED::date)) AS m(CUBE_NAME, STAT_DAY)
+         WHERE m.STAT_DAY IS NOT NULL
+         ON CONFLICT DO NOTHING',
+        stat_changed_rows(TG_OP)
+    );
+
+    -- Medical counts only include living, non-deleted citizens.
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+        SELECT DISTINCT 'MEDICAL', MH.MH_LAST_UPDATED::date
+        FROM MEDICAL_HISTORY MH
+        JOIN old_rows o ON o.CTZ_ID = MH.CTZ_ID
+        WHERE MH.MH_LAST_UPDATED IS NOT NULL
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+        SELECT DISTINCT 'MEDICAL', MH.MH_LAST_UPDATED::date
+        FROM old_rows o
+        JOIN new_rows n ON n.CTZ_ID = o.CTZ_ID
+        JOIN MEDICAL_HISTORY MH ON MH.CTZ_ID = o.CTZ_ID
+        WHERE (o.CTZ_IS_ALIVE IS DISTINCT FROM n.CTZ_IS_ALIVE OR
+               o.CTZ_IS_DELETED IS DISTINCT FROM n.CTZ_IS_DELETED)
+          AND MH.MH_LAST_UPDATED IS NOT NULL
+        ON CONFLICT DO NOTHING;
     END IF;
 
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
-    )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               current_setting('app.current_user_id')::INT,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER trg_log_medical_history_activity
-    AFTER INSERT OR UPDATE OR DELETE ON MEDICAL_HISTORY
-    FOR EACH ROW
-EXECUTE FUNCTION log_medical_history_activity();
-
+CREATE OR REPLACE FUNCTION stat_mark_employment_dirty()
+    RETURNS TRIGGER AS $$
+BEGIN
+    EXECUTE format(
+        'INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+         SELECT DISTINCT ''EMPLOYMENT'', c.CTZ_LAST_UPDATED::date
+         FROM (%s) r
+         JOIN CITIZEN c ON c.CTZ_ID = r.CTZ_ID
+         WHERE c.CTZ_LAST_UPDATED IS NOT NULL
+         ON CONFLICT DO NOTHING',
+        stat_changed_rows(TG_OP)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
 
+-- Education and PhilHealth rows are created before their citizen and deleted
+-- with it, so only edits need to reach the citizen cube from here.
+-- TG_ARGV[0] is the column CITIZEN references them by.
+CREATE OR REPLACE FUNCTION stat_mark_citizen_detail_dirty()
+    RETURNS TRIGGER AS $$
+BEGIN
+    EXECUTE format(
+        'INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+         SELECT DISTINCT ''CITIZEN'', c.CTZ_LAST_UPDATED::date
+         FROM new_rows r
+         JOIN CITIZEN c ON c.%1$I = r.%1$I
+         WHERE c.CTZ_LAST_UPDATED IS NOT NULL
+         ON CONFLICT DO NOTHING',
+        TG_ARGV[0]
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
 
-CREATE OR REPLACE FUNCTION log_settlements_activity()
+-- HOUSEHOLD_INFO, BUSINESS_INFO, INFRASTRUCTURE and MEDICAL_HISTORY each feed one
+-- cube keyed on their own *_LAST_UPDATED day. TG_ARGV[0] is the cube name and
+-- TG_ARGV[1] the day column.
+CREATE OR REPLACE FUNCTION stat_mark_entity_dirty()
     RETURNS TRIGGER AS $$
+BEGIN
+    EXECUTE format(
+        'INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+         SELECT DISTINCT $1, r.%1$I::date
+         FROM (%2$s) r
+         WHERE r.%1$I IS NOT NULL
+         ON CONFLICT DO NOTHING',
+        TG_ARGV[1], stat_changed_rows(TG_OP)
+    ) USING TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- As with attach_activity_log_triggers, a trigger with transition tables covers
+-- one event, so each table gets trg_stat_<table>_<event> for each of p_events.
+CREATE OR REPLACE FUNCTION attach_stat_triggers(
+    p_table REGCLASS,
+    p_function TEXT,
+    p_events TEXT[] DEFAULT ARRAY['INSERT', 'UPDATE', 'DELETE'],
+    p_args TEXT DEFAULT ''
+)
+    RETURNS VOID AS $$
 DECLARE
-    v_entity_id INT;
+    v_table_name TEXT := (SELECT lower(relname) FROM pg_class WHERE oid = p_table);
+    v_op TEXT;
+    v_trigger TEXT;
 BEGIN
-    IF TG_OP = 'INSERT' THEN
-        v_entity_id := NEW.SETT_ID;
-    ELSIF TG_OP = 'UPDATE' OR TG_OP = 'DELETE' THEN
-        v_entity_id := OLD.SETT_ID;
-    END IF;
+    FOREACH v_op IN ARRAY p_events LOOP
+        v_trigger := 'trg_stat_' || v_table_name || '_' || lower(v_op);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %s', v_trigger, p_table);
+        EXECUTE format(
+            'CREATE TRIGGER %I
+                 AFTER %s ON %s
+                 REFERENCING %s
+                 FOR EACH STATEMENT
+             EXECUTE FUNCTION %I(%s)',
+            v_trigger, v_op, p_table,
+            CASE v_op
+                WHEN 'INSERT' THEN 'NEW TABLE AS new_rows'
+                WHEN 'DELETE' THEN 'OLD TABLE AS old_rows'
+                ELSE 'OLD TABLE AS old_rows NEW TABLE AS new_rows'
+            END,
+            p_function, p_args
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
 
-    INSERT INTO SYSTEM_ACTIVITY_LOG (
-        ACT_ACTION_TYPE,
-        ACT_TABLE_NAME,
-        ACT_ENTITY_ID,
-        SYS_USER_ID,
-        ACT_DESCRIPTION
+SELECT attach_stat_triggers('CITIZEN', 'stat_mark_citizen_dirty');
+SELECT attach_stat_triggers('EMPLOYMENT', 'stat_mark_employment_dirty');
+SELECT attach_stat_triggers('EDUCATION_STATUS', 'stat_mark_citizen_detail_dirty', ARRAY['UPDATE'], quote_literal('edu_id'));
+SELECT attach_stat_triggers('PHILHEALTH', 'stat_mark_citizen_detail_dirty', ARRAY['UPDATE'], quote_literal('phea_id'));
+SELECT attach_stat_triggers('HOUSEHOLD_INFO', 'stat_mark_entity_dirty', p_args => $$'HOUSEHOLD', 'hh_last_updated'$$);
+SELECT attach_stat_triggers('BUSINESS_INFO', 'stat_mark_entity_dirty', p_args => $$'BUSINESS', 'bs_last_updated'$$);
+SELECT attach_stat_triggers('INFRASTRUCTURE', 'stat_mark_entity_dirty', p_args => $$'INFRASTRUCTURE', 'inf_last_updated'$$);
+SELECT attach_stat_triggers('MEDICAL_HISTORY', 'stat_mark_entity_dirty', p_args => $$'MEDICAL', 'mh_last_updated'$$);
+
+
+-- Claims (deletes) one cube's committed dirty marks and returns their days. It is
+-- a statement of its own, so the aggregation that follows takes its snapshot after
+-- every write those marks stand for.
+CREATE OR REPLACE FUNCTION stat_claim_dirty_days(p_cube VARCHAR)
+    RETURNS DATE[] AS $$
+DECLARE
+    v_days DATE[];
+BEGIN
+    WITH claimed AS (
+        DELETE FROM STAT_DIRTY_DAY WHERE CUBE_NAME = p_cube RETURNING STAT_DAY
     )
-    VALUES (
-               TG_OP::action_type_enum,
-               TG_TABLE_NAME,
-               v_entity_id,
-               current_setting('app.current_user_id')::INT,
-               CONCAT('Action ', TG_OP, ' on ', TG_TABLE_NAME, ' ID = ', v_entity_id)
-           );
-
-    RETURN CASE
-               WHEN TG_OP = 'DELETE' THEN OLD
-               ELSE NEW
-        END;
+    SELECT COALESCE(array_agg(DISTINCT STAT_DAY), '{}') INTO v_days FROM claimed;
+    RETURN v_days;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER trg_log_settlement_activity
-    AFTER INSERT OR UPDATE OR DELETE ON SETTLEMENT_LOG
-    FOR EACH ROW
-EXECUTE FUNCTION log_settlements_activity();
-
+-- Re-aggregates every dirty day. Called by the statistics models before they
+-- read, so it is a no-op when nothing changed. For each cube: claim its dirty
+-- days, drop their old rows, then insert the new aggregates, each in its own
+-- statement (and so its own snapshot).
+CREATE OR REPLACE FUNCTION refresh_stat_cubes()
+    RETURNS VOID AS $$
+DECLARE
+    v_age_bands_as_of DATE;
+    v_days DATE[];
+BEGIN
+    -- Another session is already refreshing; its result is good enough.
+    IF NOT pg_try_advisory_xact_lock(hashtext('refresh_stat_cubes')) THEN
+        RETURN;
+    END IF;
 
+    -- Age bands are relative to today, so citizens who crossed a band boundary
+    -- since the last refresh move their day into another band. Turning N between
+    -- the two dates means being born in (as_of - N years, today - N years], so
+    -- each bound is one range read on idx_citizen_date_of_birth. The ranges are
+    -- a day wider on each side for leap-day birthdays; an extra dirty day only
+    -- costs a re-aggregation.
+    SELECT AGE_BANDS_AS_OF INTO v_age_bands_as_of FROM STAT_CUBE_STATE WHERE STATE_ID = 1;
+    IF v_age_bands_as_of < CURRENT_DATE THEN
+        INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+        SELECT DISTINCT 'CITIZEN', C.CTZ_LAST_UPDATED::date
+        FROM unnest(stat_age_band_bounds()) AS b(years)
+        JOIN CITIZEN C ON C.CTZ_DATE_OF_BIRTH >= (v_age_bands_as_of - make_interval(years => b.years))::date
+                      AND C.CTZ_DATE_OF_BIRTH <= (CURRENT_DATE - make_interval(years => b.years))::date + 1
+                      AND C.CTZ_IS_DELETED = FALSE
+        WHERE b.years > 0
+        ON CONFLICT DO NOTHING;
+
+        UPDATE STAT_CUBE_STATE SET AGE_BANDS_AS_OF = CURRENT_DATE WHERE STATE_ID = 1;
+    END IF;
 
+    v_days := stat_claim_dirty_days('CITIZEN');
+    DELETE FROM STAT_CITIZEN_CUBE WHERE STAT_DAY = ANY (v_days);
+    INSERT INTO STAT_CITIZEN_CUBE
+    SELECT
+        d.STAT_DAY,
+        C.SITIO_ID,
+        C.CTZ_SEX,
+        stat_age_band(C.CTZ_DATE_OF_BIRTH),
+        C.CTZ_IS_ALIVE,
+        C.CTZ_IS_IP,
+        C.CTZ_IS_REGISTERED_VOTER,
+        C.CTZ_CIVIL_STATUS,
+        C.CTZ_BLOOD_TYPE,
+        C.SOEC_ID,
+        C.REL_ID,
+        C.CLAH_ID,
+        PH.PC_ID,
+        ES.EDAT_ID,
+        ES.EDU_IS_CURRENTLY_STUDENT,
+        COUNT(*)
+    FROM unnest(v_days) AS d(STAT_DAY)
+    JOIN CITIZEN C ON C.CTZ_LAST_UPDATED >= d.STAT_DAY
+                  AND C.CTZ_LAST_UPDATED < d.STAT_DAY + 1
+                  AND C.CTZ_IS_DELETED = FALSE
+    LEFT JOIN PHILHEALTH PH ON C.PHEA_ID = PH.PHEA_ID
+    LEFT JOIN EDUCATION_STATUS ES ON C.EDU_ID = ES.EDU_ID
+    GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15;
+
+    v_days := stat_claim_dirty_days('EMPLOYMENT');
+    DELETE FROM STAT_EMPLOYMENT_CUBE WHERE STAT_DAY = ANY (v_days);
+    INSERT INTO STAT_EMPLOYMENT_CUBE
+    SELECT d.STAT_DAY, C.SITIO_ID, E.ES_ID, E.EMP_IS_GOV_WORKER, COUNT(*)
+    FROM unnest(v_days) AS d(STAT_DAY)
+    JOIN CITIZEN C ON C.CTZ_LAST_UPDATED >= d.STAT_DAY
+                  AND C.CTZ_LAST_UPDATED < d.STAT_DAY + 1
+                  AND C.CTZ_IS_DELETED = FALSE
+                  AND C.CTZ_IS_ALIVE = TRUE
+    JOIN EMPLOYMENT E ON E.CTZ_ID = C.CTZ_ID
+    GROUP BY 1, 2, 3, 4;
+
+    v_days := stat_claim_dirty_days('HOUSEHOLD');
+    DELETE FROM STAT_HOUSEHOLD_CUBE WHERE STAT_DAY = ANY (v_days);
+    INSERT INTO STAT_HOUSEHOLD_CUBE
+    SELECT
+        d.STAT_DAY,
+        H.SITIO_ID,
+        H.HH_OWNERSHIP_STATUS,
+        H.WATER_ID,
+        COUNT(*),
+        SUM(M.MALE_MEMBERS),
+        SUM(M.FEMALE_MEMBERS),
+        SUM(M.TOTAL_MEMBERS)
+    FROM unnest(v_days) AS d(STAT_DAY)
+    JOIN HOUSEHOLD_INFO H ON H.HH_LAST_UPDATED >= d.STAT_DAY
+                         AND H.HH_LAST_UPDATED < d.STAT_DAY + 1
+                         AND H.HH_IS_DELETED = FALSE
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) FILTER (WHERE C.CTZ_SEX = 'M') AS MALE_MEMBERS,
+            COUNT(*) FILTER (WHERE C.CTZ_SEX = 'F') AS FEMALE_MEMBERS,
+            COUNT(*) AS TOTAL_MEMBERS
+        FROM CITIZEN C
+        WHERE C.HH_ID = H.HH_ID
+          AND C.CTZ_IS_DELETED = FALSE
+          AND C.CTZ_IS_ALIVE = TRUE
+    ) M
+    GROUP BY 1, 2, 3, 4;
+
+    v_days := stat_claim_dirty_days('BUSINESS');
+    DELETE FROM STAT_BUSINESS_CUBE WHERE STAT_DAY = ANY (v_days);
+    INSERT INTO STAT_BUSINESS_CUBE
+    SELECT d.STAT_DAY, B.SITIO_ID, B.BST_ID, B.BS_STATUS, COUNT(*)
+    FROM unnest(v_days) AS d(STAT_DAY)
+    JOIN BUSINESS_INFO B ON B.BS_LAST_UPDATED >= d.STAT_DAY
+                        AND B.BS_LAST_UPDATED < d.STAT_DAY + 1
+                        AND B.BS_IS_DELETED = FALSE
+    GROUP BY 1, 2, 3, 4;
+
+    v_days := stat_claim_dirty_days('INFRASTRUCTURE');
+    DELETE FROM STAT_INFRASTRUCTURE_CUBE WHERE STAT_DAY = ANY (v_days);
+    INSERT INTO STAT_INFRASTRUCTURE_CUBE
+    SELECT d.STAT_DAY, I.SITIO_ID, I.INFT_ID, I.INF_ACCESS_TYPE, COUNT(*)
+    FROM unnest(v_days) AS d(STAT_DAY)
+    JOIN INFRASTRUCTURE I ON I.INF_LAST_UPDATED >= d.STAT_DAY
+                         AND I.INF_LAST_UPDATED < d.STAT_DAY + 1
+                         AND I.INF_IS_DELETED = FALSE
+    GROUP BY 1, 2, 3, 4;
+
+    v_days := stat_claim_dirty_days('MEDICAL');
+    DELETE FROM STAT_MEDICAL_CUBE WHERE STAT_DAY = ANY (v_days);
+    INSERT INTO STAT_MEDICAL_CUBE
+    SELECT d.STAT_DAY, MH.MHT_ID, COUNT(*)
+    FROM unnest(v_days) AS d(STAT_DAY)
+    JOIN MEDICAL_HISTORY MH ON MH.MH_LAST_UPDATED >= d.STAT_DAY
+                           AND MH.MH_LAST_UPDATED < d.STAT_DAY + 1
+                           AND MH.MH_IS_DELETED = FALSE
+    JOIN CITIZEN C ON C.CTZ_ID = MH.CTZ_ID
+                  AND C.CTZ_IS_DELETED = FALSE
+                  AND C.CTZ_IS_ALIVE = TRUE
+    GROUP BY 1, 2;
+
+    UPDATE STAT_CUBE_STATE SET LAST_REFRESHED = CURRENT_TIMESTAMP WHERE STATE_ID = 1;
+END;
+$$ LANGUAGE plpgsql;
 
+-- Marks every day of every source table dirty and rebuilds the cubes from scratch.
+-- Run once after creating this section on a database that already has data.
+CREATE OR REPLACE FUNCTION rebuild_stat_cubes()
+    RETURNS VOID AS $$
+BEGIN
+    TRUNCATE STAT_CITIZEN_CUBE, STAT_EMPLOYMENT_CUBE, STAT_HOUSEHOLD_CUBE,
+        STAT_BUSINESS_CUBE, STAT_INFRASTRUCTURE_CUBE, STAT_MEDICAL_CUBE, STAT_DIRTY_DAY;
+
+    INSERT INTO STAT_DIRTY_DAY (CUBE_NAME, STAT_DAY)
+    SELECT DISTINCT 'CITIZEN', CTZ_LAST_UPDATED::date FROM CITIZEN WHERE CTZ_LAST_UPDATED IS NOT NULL
+    UNION
+    SELECT DISTINCT 'EMPLOYMENT', CTZ_LAST_UPDATED::date FROM CITIZEN WHERE CTZ_LAST_UPDATED IS NOT NULL
+    UNION
+    SELECT DISTINCT 'HOUSEHOLD', HH_LAST_UPDATED::date FROM HOUSEHOLD_INFO WHERE HH_LAST_UPDATED IS NOT NULL
+    UNION
+    SELECT DISTINCT 'BUSINESS', BS_LAST_UPDATED::date FROM BUSINESS_INFO WHERE BS_LAST_UPDATED IS NOT NULL
+    UNION
+    SELECT DISTINCT 'INFRASTRUCTURE', INF_LAST_UPDATED::date FROM INFRASTRUCTURE WHERE INF_LAST_UPDATED IS NOT NULL
+    UNION
+    SELECT DISTINCT 'MEDICAL', MH_LAST_UPDATED::date FROM MEDICAL_HISTORY WHERE MH_LAST_UPDATED IS NOT NULL;
+
+    UPDATE STAT_CUBE_STATE SET AGE_BANDS_AS_OF = CURRENT_DATE WHERE STATE_ID = 1;
+    PERFORM refresh_stat_cubes();
+END;
+$$ LANGUAGE plpgsql;
 
---VIEWS
+SELECT rebuild_stat_cubes();
+
+
+
+--CITIZEN MERGE QUEUE
+-- Likely duplicate CITIZEN pairs found by the offline dedupe job
+-- (python -m Models.AdminModels.CitizenDedupe), waiting for a person to decide.
+-- CTZ_ID_KEEP is the older record. Re-running the job adds new pairs only, so
+-- decisions already made are kept. Can be run on its own like the INDEXES section.
+CREATE TABLE IF NOT EXISTS CITIZEN_MERGE_QUEUE (
+                                   MQ_ID SERIAL PRIMARY KEY,
+                                   CTZ_ID_KEEP INT NOT NULL REFERENCES CITIZEN(CTZ_ID) ON DELETE CASCADE,
+                                   CTZ_ID_DUPLICATE INT NOT NULL REFERENCES CITIZEN(CTZ_ID) ON DELETE CASCADE,
+                                   MQ_SCORE NUMERIC(4, 3) NOT NULL,
+                                   MQ_REASONS TEXT,
+                                   MQ_STATUS VARCHAR(10) NOT NULL DEFAULT 'PENDING'
+                                       CHECK (MQ_STATUS IN ('PENDING', 'APPROVED', 'REJECTED')),
+                                   MQ_FOUND_AT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                                   MQ_REVIEWED_BY_SYS_ID INT REFERENCES SYSTEM_ACCOUNT(SYS_USER_ID) ON DELETE SET NULL,
+                                   MQ_REVIEWED_AT TIMESTAMP,
+                                   CONSTRAINT chk_merge_pair_order CHECK (CTZ_ID_KEEP < CTZ_ID_DUPLICATE),
+                                   CONSTRAINT uq_merge_pair UNIQUE (CTZ_ID_KEEP, CTZ_ID_DUPLICATE)
+);
 
--- this view gets the age from the dob, and assigns a corresponding classification
-CREATE OR REPLACE VIEW citizen_with_age_classification AS
-SELECT
-    CTZ_ID,
-    CTZ_FIRST_NAME,
-    CTZ_MIDDLE_NAME,
-    CTZ_LAST_NAME,
-    ctz_date_of_birth,
-    ctz_is_alive,
-    CTZ_IS_DELETED,
-    EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) AS age,
-    CASE
-        WHEN EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) BETWEEN 0 AND 2 THEN 'Infant'
-        WHEN EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) BETWEEN 3 AND 12 THEN 'Child'
-        WHEN EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) BETWEEN 13 AND 17 THEN 'Teen'
-        WHEN EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) BETWEEN 18 AND 24 THEN 'Young Adult'
-        WHEN EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) BETWEEN 25 AND 39 THEN 'Adult'
-        WHEN EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) BETWEEN 40 AND 59 THEN 'Middle Aged'
-        WHEN EXTRACT(YEAR FROM AGE(CURRENT_DATE, ctz_date_of_birth)) >= 60 THEN 'Senior'
-        ELSE 'Unknown'
-        END AS age_classification
-FROM
-    citizen
-WHERE
-    ctz_is_alive = TRUE;
+-- The review list reads pending pairs best-first.
+CREATE INDEX IF NOT EXISTS idx_merge_queue_pending
+    ON CITIZEN_MERGE_QUEUE (MQ_SCORE DESC, MQ_ID)
+    WHERE MQ_STATUS = 'PENDING';
 
 
 